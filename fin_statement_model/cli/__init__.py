@@ -1,10 +1,15 @@
 """Command-line interface entry point for the *fin-statement-model* toolkit.
 
-Currently exposes a single sub-command:
+Exposes the template registry commands:
 
     $ fsm template ls
 
-which prints a table of registered template bundles.
+which prints a table of registered template bundles, and graph inspection
+commands for saved graph definitions:
+
+    $ fsm graph memory model.json
+
+which prints the graph's approximate memory footprint.
 """
 
 from __future__ import annotations
@@ -20,6 +25,7 @@ from fin_statement_model.templates.registry import TemplateRegistry
 
 # Type-checking imports ------------------------------------------------------
 if TYPE_CHECKING:  # pragma: no cover
+    from fin_statement_model.core.graph.services import MemoryReport
     from fin_statement_model.templates.models import DiffResult
 
 __all__: list[str] = ["fsm"]
@@ -306,6 +312,66 @@ def diff_templates(
     ctx.exit(1 if diff_present else 0)
 
 
+# ---------------------------------------------------------------------------
+# `fsm graph memory` command
+# ---------------------------------------------------------------------------
+
+
+@fsm.group()
+def graph() -> None:
+    """Saved graph definition commands."""
+
+
+def _render_memory_table(report: MemoryReport) -> str:
+    """Return component totals and the per node type breakdown of *report* as aligned text."""
+    totals = report.summary()
+    width = max(len(name) for name in totals)
+    lines = [f"{'COMPONENT':<{width}}  {'BYTES':>14}", "-" * (width + 16)]
+    lines.extend(f"{name:<{width}}  {size:>14,}" for name, size in totals.items())
+    frame = report.to_frame()
+    if not frame.empty:
+        lines.extend(["", frame.to_string(formatters=dict.fromkeys(frame.columns, "{:,}".format))])
+    return "\n".join(lines)
+
+
+@graph.command("memory")
+@click.argument("definition", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--recalculate",
+    is_flag=True,
+    help="Calculate every node for every period first, so cached results are included.",
+)
+@click.option(
+    "--format",
+    "out_format",
+    type=click.Choice(["table", "json"], case_sensitive=False),
+    default="table",
+    show_default=True,
+    help="Output format.",
+)
+def graph_memory(definition: str, recalculate: bool, out_format: str) -> None:
+    """Report the approximate memory footprint of a saved graph definition (JSON)."""
+    from pathlib import Path
+
+    from fin_statement_model.io import read_data
+
+    try:
+        source = json.loads(Path(definition).read_text(encoding="utf-8"))
+        loaded = read_data("graph_definition_dict", source)
+    except Exception as exc:
+        raise click.ClickException(f"Failed to read graph definition: {exc}") from exc
+
+    if recalculate:
+        loaded.recalculate_all()
+    report = loaded.memory_report()
+
+    if out_format == "json":
+        payload = {**report.model_dump(mode="json"), "total": report.total}
+        click.echo(json.dumps(payload, indent=2, sort_keys=True))
+    else:
+        click.echo(_render_memory_table(report))
+
+
 # ---------------------------------------------------------------------------
 # Support `python -m fin_statement_model.cli` execution without console script
 # ---------------------------------------------------------------------------
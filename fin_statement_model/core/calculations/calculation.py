@@ -6,8 +6,13 @@ allowing different calculation types to be encapsulated in calculation classes.
 Features:
     - Abstract base class for all calculation strategies.
     - Built-in strategies: Addition, Subtraction, Multiplication, Division, Weighted Average,
-      Custom Python function, and Formula string evaluation.
+      Custom Python function, and Formula string evaluation (compiled once per formula).
     - All calculations operate on lists of Node objects and a period string.
+    - Built-in strategies also implement ``calculate_vector`` which evaluates a
+      whole timeline (and optional batch axes) from NumPy arrays in one call,
+      reporting division by zero and similar per-cell failures as NaN.
+    - ``calculate_dual`` propagates forward-mode derivatives (:class:`Dual`
+      values) through the arithmetic strategies and formulas.
     - Designed for extensibility: users can add custom calculation types.
     - All exceptions are raised as CalculationError or StrategyError for consistency.
 
@@ -28,7 +33,13 @@ Example:
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 import logging
+from typing import Any, ClassVar
 
+import numpy as np
+
+from fin_statement_model.core.calculations.compiled_formula import CompiledFormula
+from fin_statement_model.core.calculations.dual import Dual, as_dual
+from fin_statement_model.core.calculations.vectorized import apply_elementwise, mask_non_finite, nan_divide
 from fin_statement_model.core.errors import CalculationError, StrategyError
 from fin_statement_model.core.nodes.base import Node  # Absolute
 
@@ -48,8 +59,16 @@ class Calculation(ABC):
 
     Each concrete calculation encapsulates a specific method for computing a
     financial value based on a list of input nodes and a given time period.
+
+    Attributes:
+        period_local: ``True`` if the result for a period depends only on the
+            inputs' values for that same period. The graph then confines
+            cache invalidation after an edit to the edited period(s). Defaults
+            to ``False`` (the conservative choice) for custom calculations.
     """
 
+    period_local: ClassVar[bool] = False
+
     @abstractmethod
     def calculate(self, inputs: list[Node], period: str) -> float:
         """Calculate a value based on input nodes for a specific period.
@@ -76,6 +95,50 @@ class Calculation(ABC):
         """
         # pragma: no cover
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Calculate a whole timeline at once from pre-computed input arrays.
+
+        The vectorized counterpart of :py:meth:`calculate`. *values* holds one
+        array per entry of *inputs* (same order); the last axis indexes
+        periods and any leading axes are batch dimensions. Per-cell failures
+        such as a zero denominator are reported as NaN instead of raising.
+
+        Args:
+            inputs: The input nodes, for calculations that need their metadata
+                (e.g. names). Their ``calculate`` method is not called.
+            values: Input values as float arrays, broadcastable to each other.
+
+        Returns:
+            Array broadcastable to the common shape of *values*.
+
+        Raises:
+            NotImplementedError: If the calculation has no vectorized form;
+                callers then fall back to per-period :py:meth:`calculate`.
+            CalculationError: For structural problems that affect every cell.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support vectorized evaluation")
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Calculate a whole timeline together with its forward-mode derivatives.
+
+        The differentiable counterpart of :py:meth:`calculate_vector`: each
+        entry of *values* is a :class:`~fin_statement_model.core.calculations.dual.Dual`
+        holding an input's values and their derivatives with respect to the
+        seeded graph inputs; the result carries the derivatives of the output.
+
+        Args:
+            inputs: The input nodes (see :py:meth:`calculate_vector`).
+            values: Input values with tangents.
+
+        Returns:
+            The output values with tangents.
+
+        Raises:
+            NotImplementedError: If the calculation has no derivative rule;
+                callers then fall back to finite differences.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support forward-mode differentiation")
+
     @property
     def description(self) -> str:
         """Provides a human-readable description of the calculation.
@@ -99,6 +162,8 @@ class AdditionCalculation(Calculation):
     the `calculate` method on each of the provided input nodes for a given period.
     """
 
+    period_local = True
+
     def calculate(self, inputs: list[Node], period: str) -> float:
         """Sums the calculated values from all input nodes for the specified period.
 
@@ -128,6 +193,22 @@ class AdditionCalculation(Calculation):
         # Using a generator expression for potentially better memory efficiency
         return sum(input_node.calculate(period) for input_node in inputs)
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Sum the input arrays element-wise (``0.0`` for no inputs)."""
+        _ = inputs
+        total: Any = 0.0
+        for value in values:
+            total = total + value
+        return np.asarray(total, dtype=float)
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Sum the inputs and their derivatives."""
+        _ = inputs
+        total: Any = 0.0
+        for value in values:
+            total = total + value
+        return as_dual(total)
+
     @property
     def description(self) -> str:
         """Returns a description of the addition calculation."""
@@ -142,6 +223,8 @@ class SubtractionCalculation(Calculation):
     a specific period.
     """
 
+    period_local = True
+
     def calculate(self, inputs: list[Node], period: str) -> float:
         """Calculates the difference: value of the first input minus the sum of others.
 
@@ -182,6 +265,40 @@ class SubtractionCalculation(Calculation):
         values = [node.calculate(period) for node in inputs]
         return values[0] - sum(values[1:])
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Subtract the remaining input arrays from the first one element-wise.
+
+        Raises:
+            CalculationError: If no input arrays are supplied.
+        """
+        _ = inputs
+        if not values:
+            raise CalculationError(
+                "Subtraction calculation requires at least one input node",
+                details={"strategy": "SubtractionCalculation"},
+            )
+        result: Any = values[0]
+        for value in values[1:]:
+            result = result - value
+        return np.asarray(result, dtype=float)
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Subtract the remaining inputs (and derivatives) from the first one.
+
+        Raises:
+            CalculationError: If no inputs are supplied.
+        """
+        _ = inputs
+        if not values:
+            raise CalculationError(
+                "Subtraction calculation requires at least one input node",
+                details={"strategy": "SubtractionCalculation"},
+            )
+        result = values[0]
+        for value in values[1:]:
+            result = result - value
+        return result
+
     @property
     def description(self) -> str:
         """Returns a description of the subtraction calculation."""
@@ -195,6 +312,8 @@ class MultiplicationCalculation(Calculation):
     for a given period.
     """
 
+    period_local = True
+
     def calculate(self, inputs: list[Node], period: str) -> float:
         """Calculates the product of the values from all input nodes.
 
@@ -232,6 +351,22 @@ class MultiplicationCalculation(Calculation):
             result *= input_node.calculate(period)
         return result
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Multiply the input arrays element-wise (``1.0`` for no inputs)."""
+        _ = inputs
+        product: Any = 1.0
+        for value in values:
+            product = product * value
+        return np.asarray(product, dtype=float)
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Multiply the inputs, applying the product rule to their derivatives."""
+        _ = inputs
+        product: Any = 1.0
+        for value in values:
+            product = product * value
+        return as_dual(product)
+
     @property
     def description(self) -> str:
         """Returns a description of the multiplication calculation."""
@@ -246,6 +381,8 @@ class DivisionCalculation(Calculation):
     (denominator) for a specific period.
     """
 
+    period_local = True
+
     def calculate(self, inputs: list[Node], period: str) -> float:
         """Calculates the division: first input / (product of subsequent inputs).
 
@@ -302,6 +439,42 @@ class DivisionCalculation(Calculation):
 
         return numerator / denominator
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Divide the first input array by the product of the rest element-wise.
+
+        Periods whose denominator product is zero become NaN.
+
+        Raises:
+            CalculationError: If fewer than two input arrays are supplied.
+        """
+        if len(values) < MIN_REQUIRED_INPUTS:
+            raise CalculationError(
+                "Division calculation requires at least two input nodes",
+                details={"strategy": "DivisionCalculation", "input_count": len(inputs)},
+            )
+        denominator: Any = 1.0
+        for value in values[1:]:
+            denominator = denominator * value
+        return nan_divide(values[0], denominator)
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Divide the first input by the product of the rest, with derivatives.
+
+        Periods whose denominator product is zero become NaN.
+
+        Raises:
+            CalculationError: If fewer than two inputs are supplied.
+        """
+        if len(values) < MIN_REQUIRED_INPUTS:
+            raise CalculationError(
+                "Division calculation requires at least two input nodes",
+                details={"strategy": "DivisionCalculation", "input_count": len(inputs)},
+            )
+        denominator = values[1]
+        for value in values[2:]:
+            denominator = denominator * value
+        return values[0] / denominator
+
     @property
     def description(self) -> str:
         """Returns a description of the division calculation."""
@@ -316,6 +489,8 @@ class WeightedAverageCalculation(Calculation):
     initialization, it defaults to an equal weighting (simple average).
     """
 
+    period_local = True
+
     def __init__(self, weights: list[float] | None = None):
         """Initializes the WeightedAverageCalculation.
 
@@ -375,24 +550,7 @@ class WeightedAverageCalculation(Calculation):
                 details={"strategy": "WeightedAverageCalculation"},
             )
 
-        num_inputs = len(inputs)
-        effective_weights: list[float]
-
-        if self.weights is None:
-            # Use equal weights if none provided
-            if num_inputs == 0:  # Should be caught by the check above, but defensive
-                return 0.0
-            equal_weight = 1.0 / num_inputs
-            effective_weights = [equal_weight] * num_inputs
-            logger.debug("Using equal weights for weighted average.")
-        elif len(self.weights) == num_inputs:
-            effective_weights = self.weights
-            logger.debug("Using provided weights: %s", effective_weights)
-        else:
-            raise StrategyError(
-                f"Number of weights ({len(self.weights)}) must match number of inputs ({num_inputs})",
-                strategy_type="WeightedAverageCalculation",
-            )
+        effective_weights = self._effective_weights(len(inputs))
 
         logger.debug("Applying weighted average calculation for period %s", period)
         weighted_sum = 0.0
@@ -417,6 +575,69 @@ class WeightedAverageCalculation(Calculation):
         # Normalize by total weight for a true weighted average.
         return weighted_sum / total_weight
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Compute the weighted average of the input arrays element-wise.
+
+        Raises:
+            CalculationError: If no input arrays are supplied or the weights sum to zero.
+            StrategyError: If `weights` were provided and length does not match number of inputs.
+        """
+        _ = inputs
+        if not values:
+            raise CalculationError(
+                "Weighted average calculation requires at least one input node",
+                details={"strategy": "WeightedAverageCalculation"},
+            )
+        effective_weights = self._effective_weights(len(values))
+        total_weight = sum(effective_weights)
+        if total_weight == 0.0:
+            raise CalculationError(
+                "Total weight for weighted average cannot be zero.",
+                details={"weights": effective_weights},
+            )
+        weighted_sum: Any = 0.0
+        for value, weight in zip(values, effective_weights, strict=True):
+            weighted_sum = weighted_sum + value * weight
+        return np.asarray(weighted_sum / total_weight, dtype=float)
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Compute the weighted average of the inputs and of their derivatives.
+
+        Raises:
+            CalculationError: If no inputs are supplied or the weights sum to zero.
+            StrategyError: If `weights` were provided and length does not match number of inputs.
+        """
+        _ = inputs
+        if not values:
+            raise CalculationError(
+                "Weighted average calculation requires at least one input node",
+                details={"strategy": "WeightedAverageCalculation"},
+            )
+        effective_weights = self._effective_weights(len(values))
+        total_weight = sum(effective_weights)
+        if total_weight == 0.0:
+            raise CalculationError(
+                "Total weight for weighted average cannot be zero.",
+                details={"weights": effective_weights},
+            )
+        weighted_sum: Any = 0.0
+        for value, weight in zip(values, effective_weights, strict=True):
+            weighted_sum = weighted_sum + value * weight
+        return as_dual(weighted_sum / total_weight)
+
+    def _effective_weights(self, num_inputs: int) -> list[float]:
+        """Return the configured weights, or equal weights when none were given."""
+        if self.weights is None:
+            logger.debug("Using equal weights for weighted average.")
+            return [1.0 / num_inputs] * num_inputs
+        if len(self.weights) == num_inputs:
+            logger.debug("Using provided weights: %s", self.weights)
+            return self.weights
+        raise StrategyError(
+            f"Number of weights ({len(self.weights)}) must match number of inputs ({num_inputs})",
+            strategy_type="WeightedAverageCalculation",
+        )
+
     @property
     def description(self) -> str:
         """Returns a description of the weighted average calculation."""
@@ -439,6 +660,8 @@ class CustomFormulaCalculation(Calculation):
     for the period and should return a single float result.
     """
 
+    period_local = True
+
     def __init__(self, formula_function: FormulaFunc):
         """Initializes the CustomFormulaCalculation with a calculation function.
 
@@ -497,13 +720,9 @@ class CustomFormulaCalculation(Calculation):
             30.0
         """
         # Prepare input values dictionary, using names if available
-        input_values: dict[str, float] = {}
-        for i, node in enumerate(inputs):
-            # Prefer node.name if it exists and is a non-empty string
-            key = getattr(node, "name", None)
-            if not isinstance(key, str) or not key:
-                key = f"input_{i}"
-            input_values[key] = node.calculate(period)
+        input_values: dict[str, float] = {
+            key: node.calculate(period) for key, node in zip(self._input_keys(inputs), inputs, strict=True)
+        }
 
         logger.debug("Applying custom formula calculation for period %s with inputs: %s", period, input_values)
         try:
@@ -541,6 +760,58 @@ class CustomFormulaCalculation(Calculation):
                 details={"original_error": str(e)},
             ) from e
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Apply the custom function to whole input arrays.
+
+        The function is first called once with a dictionary of arrays. If it
+        cannot handle arrays (it raises, or returns something that does not
+        broadcast to the inputs), it is called once per cell instead, with
+        failing cells reported as NaN.
+        """
+        keys = self._input_keys(inputs)
+        shape = np.broadcast_shapes(*(np.shape(value) for value in values))
+        try:
+            arrays: dict[str, Any] = dict(zip(keys, values, strict=True))
+            result: Any = self.formula_function(arrays)
+            return mask_non_finite(np.broadcast_to(np.asarray(result, dtype=float), shape))
+        except Exception as exc:  # noqa: BLE001 - arbitrary user code; retried cell by cell below
+            logger.debug(
+                "Custom formula '%s' does not accept arrays (%s); evaluating element-wise.",
+                getattr(self.formula_function, "__name__", "?"),
+                exc,
+            )
+        return apply_elementwise(
+            lambda *cell: self.formula_function(dict(zip(keys, cell, strict=True))),
+            [np.broadcast_to(value, shape) for value in values],
+        )
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Apply the custom function to dual inputs.
+
+        Functions made of plain arithmetic differentiate exactly.
+
+        Raises:
+            NotImplementedError: If the function does not return a dual (it
+                branches on values, calls NumPy functions, …).
+        """
+        try:
+            result = self.formula_function(dict(zip(self._input_keys(inputs), values, strict=True)))  # type: ignore[arg-type]
+        except Exception as exc:  # arbitrary user code; callers fall back to finite differences
+            raise NotImplementedError(f"Custom formula cannot be differentiated: {exc}") from exc
+        if not isinstance(result, Dual):
+            raise NotImplementedError("Custom formula did not propagate derivatives")
+        return result.mask_non_finite()
+
+    @staticmethod
+    def _input_keys(inputs: list[Node]) -> list[str]:
+        """Return the dictionary keys under which *inputs* are passed to the function."""
+        keys: list[str] = []
+        for i, node in enumerate(inputs):
+            # Prefer node.name if it exists and is a non-empty string
+            key = getattr(node, "name", None)
+            keys.append(key if isinstance(key, str) and key else f"input_{i}")
+        return keys
+
     @property
     def description(self) -> str:
         """Returns a description of the custom formula calculation."""
@@ -549,13 +820,15 @@ class CustomFormulaCalculation(Calculation):
 
 
 class FormulaCalculation(Calculation):
-    """Evaluates a mathematical formula string using *asteval* for safety.
+    """Evaluates a mathematical formula string compiled once at construction.
 
     The class evaluates arithmetic expressions that reference input nodes by the
-    variable names supplied in *input_variable_names*. Evaluation is delegated
-    to the ``asteval`` interpreter which executes a restricted subset of
-    Python's syntax with no access to built-ins or the filesystem, providing a
-    safer and more maintainable alternative to a hand-rolled AST walker.
+    variable names supplied in *input_variable_names*. The expression is parsed
+    a single time and validated against the same restricted operator whitelist
+    as ``asteval``'s minimal mode (see
+    :class:`~fin_statement_model.core.calculations.compiled_formula.CompiledFormula`);
+    every subsequent call only binds the input values and runs the compiled
+    function, with no access to built-ins or the filesystem.
 
     Attributes:
         formula: The expression string (e.g. ``"a + b / 2"``).
@@ -563,33 +836,27 @@ class FormulaCalculation(Calculation):
             the order of *inputs* passed to :py:meth:`calculate`.
     """
 
+    period_local = True
+
     def __init__(self, formula: str, input_variable_names: list[str]):
         """Initialise the :class:`FormulaCalculation`.
 
+        Invalid formulas do not raise here; the problem is recorded and
+        surfaced as a :class:`CalculationError` when the formula is evaluated,
+        exactly as before.
+
         Args:
             formula: Mathematical expression to evaluate.
             input_variable_names: Names that will map to the provided input
                 nodes in the same order.
-
-        Raises:
-            StrategyError: If *asteval* is not installed.
         """
-        try:
-            from asteval import (
-                Interpreter,
-            )  # local import to avoid hard dep at import time
-        except ImportError as exc:  # pragma: no cover - caught by tests if missing
-            raise StrategyError(
-                "Package 'asteval' is required for FormulaCalculation. Install it via 'pip install asteval'.",
-                strategy_type="FormulaCalculation",
-            ) from exc
-
         self.formula = formula
         self.input_variable_names = input_variable_names
-        # Prepare a locked-down interpreter: minimal built-ins, no numpy, no print
-        self._interpreter_cls = Interpreter  # store class; instance created per calculation
+        self._compiled = CompiledFormula(formula, input_variable_names)
+        if self._compiled.error is not None:
+            logger.warning("Formula '%s' failed validation: %s", formula, self._compiled.error)
         logger.info(
-            "Initialised FormulaCalculation using asteval with formula '%s' and variables %s",
+            "Initialised FormulaCalculation with formula '%s' and variables %s",
             formula,
             input_variable_names,
         )
@@ -620,30 +887,19 @@ class FormulaCalculation(Calculation):
                 strategy_type="FormulaCalculation",
             )
 
-        # Map variable names -> calculated values for the given period
-        local_vars: dict[str, float] = {
-            name: node.calculate(period) for name, node in zip(self.input_variable_names, inputs, strict=False)
-        }
-
-        # Create a fresh interpreter each call to avoid symbol leakage between periods
-        from asteval import Interpreter
-
-        ae = Interpreter(symtable={}, minimal=True, no_print=True, use_numpy=False)
-        ae.symtable.update(local_vars)
+        # Calculated input values for the given period, in variable order
+        values = [node.calculate(period) for node in inputs]
 
         logger.debug(
-            "Evaluating formula '%s' for period %s with variables %s",
+            "Evaluating formula '%s' for period %s with variables %s values %s",
             self.formula,
             period,
-            local_vars,
+            self.input_variable_names,
+            values,
         )
         try:
-            result = ae(self.formula)
-        except Exception as exc:  # pragma: no cover - generic catch to wrap
-            logger.exception(
-                "Error evaluating formula '%s'",
-                self.formula,
-            )
+            result = self._compiled.evaluate(values)
+        except Exception as exc:  # any evaluation failure is wrapped
             raise CalculationError(
                 f"Error evaluating formula: {self.formula}. Error: {exc}",
                 period=period,
@@ -659,13 +915,77 @@ class FormulaCalculation(Calculation):
 
         return float(result)
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Evaluate the compiled formula over whole input arrays.
+
+        Arithmetic is applied element-wise with NumPy semantics; division by
+        zero and overflow yield NaN cells. Expressions that need a scalar truth
+        value (``and``/``or``/``not`` and chained comparisons) are evaluated
+        cell by cell instead.
+
+        Raises:
+            StrategyError: If the number of *values* does not match
+                *input_variable_names*.
+            CalculationError: If the formula failed to compile.
+        """
+        _ = inputs
+        if len(values) != len(self.input_variable_names):
+            raise StrategyError(
+                f"Number of inputs ({len(values)}) must match number of variable names "
+                f"({len(self.input_variable_names)})",
+                strategy_type="FormulaCalculation",
+            )
+        if not self._compiled.is_valid:
+            raise CalculationError(
+                f"Error evaluating formula: {self.formula}. Error: {self._compiled.error}",
+                details={"formula": self.formula, "original_error": self._compiled.error},
+            )
+
+        arrays = [np.asarray(value, dtype=float) for value in values]
+        try:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                result = self._compiled.evaluate(arrays)
+            return mask_non_finite(result)
+        except (ValueError, TypeError, ArithmeticError, RuntimeError):
+            # e.g. "truth value of an array is ambiguous" or a guarded operator
+            return apply_elementwise(lambda *cell: self._compiled.evaluate(cell), arrays)
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Evaluate the compiled formula over dual inputs (exact derivatives).
+
+        Raises:
+            StrategyError: If the number of *values* does not match
+                *input_variable_names*.
+            CalculationError: If the formula failed to compile.
+            NotImplementedError: If the formula branches on values
+                (``and``/``or``/``not``) or uses bitwise operators.
+        """
+        _ = inputs
+        if len(values) != len(self.input_variable_names):
+            raise StrategyError(
+                f"Number of inputs ({len(values)}) must match number of variable names "
+                f"({len(self.input_variable_names)})",
+                strategy_type="FormulaCalculation",
+            )
+        if not self._compiled.is_valid:
+            raise CalculationError(
+                f"Error evaluating formula: {self.formula}. Error: {self._compiled.error}",
+                details={"formula": self.formula, "original_error": self._compiled.error},
+            )
+        try:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                result = self._compiled.evaluate(values)
+        except (ValueError, TypeError, ArithmeticError, RuntimeError) as exc:
+            raise NotImplementedError(f"Formula '{self.formula}' cannot be differentiated: {exc}") from exc
+        return as_dual(result).mask_non_finite()
+
     # ------------------------------------------------------------------
     # Misc
     # ------------------------------------------------------------------
     @property
     def description(self) -> str:
         """Return a human-readable description of the calculation."""
-        return f"Formula (evaluated via asteval): {self.formula}"
+        return f"Formula: {self.formula}"
 
 
 class MetricCalculation(Calculation):
@@ -677,6 +997,8 @@ class MetricCalculation(Calculation):
     Subsequent calls delegate directly for speed.
     """
 
+    period_local = True
+
     def __init__(self, metric_name: str):
         """Create a MetricCalculation for *metric_name*.
 
@@ -704,6 +1026,14 @@ class MetricCalculation(Calculation):
         """Delegate to internal FormulaCalculation instance."""
         return self._formula_calc.calculate(inputs, period)
 
+    def calculate_vector(self, inputs: list[Node], values: list[np.ndarray]) -> np.ndarray:
+        """Delegate to the internal FormulaCalculation's vectorized path."""
+        return self._formula_calc.calculate_vector(inputs, values)
+
+    def calculate_dual(self, inputs: list[Node], values: list[Dual]) -> Dual:
+        """Delegate to the internal FormulaCalculation's differentiable path."""
+        return self._formula_calc.calculate_dual(inputs, values)
+
     @property
     def description(self) -> str:
         """Short human-readable description used by to_dict()."""
@@ -0,0 +1,243 @@
+"""Dual numbers for forward-mode differentiation over period arrays.
+
+A :class:`Dual` carries a value array (last axis = periods, like every
+vectorized path) together with its tangents: the derivatives of that value
+with respect to ``n`` seed directions, stacked on a leading axis. Arithmetic
+on duals applies the chain rule, so one evaluation of a calculation over
+duals yields the value and all ``n`` directional derivatives at once - the
+basis of :py:meth:`Graph.gradient`.
+
+Zero tangents are stored as ``None`` so subgraphs that do not depend on any
+seed cost no more than a plain evaluation. As in the vectorized paths,
+division by zero yields NaN (for the value and its tangents) instead of
+raising.
+
+Features:
+    - ``+ - * / ** // %``, unary ``- + abs`` with duals or plain numbers/arrays
+      on either side; comparisons compare values
+    - ``Dual.seed`` builds the inputs, ``Dual.constant`` lifts plain values
+    - Truth-value tests raise TypeError (branching is not differentiable), so
+      callers can fall back to another method
+
+Example:
+    >>> import numpy as np
+    >>> from fin_statement_model.core.calculations.dual import Dual
+    >>> x = Dual.seed(np.array([2.0, 4.0]), index=0, size=2)
+    >>> y = Dual.seed(np.array([5.0, 5.0]), index=1, size=2)
+    >>> z = x * y / (x + 1.0)
+    >>> z.value.tolist()
+    [3.3333333333333335, 4.0]
+    >>> np.round(z.tangent, 4).tolist()  # dz/dx and dz/dy per period
+    [[0.5556, 0.2], [0.6667, 0.8]]
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+__all__: list[str] = ["Dual", "as_dual"]
+
+
+def _scale(tangent: np.ndarray | None, factor: Any) -> np.ndarray | None:
+    return None if tangent is None else tangent * factor
+
+
+def _combine(left: np.ndarray | None, right: np.ndarray | None) -> np.ndarray | None:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return np.asarray(left + right)
+
+
+class Dual:
+    """A value array with its derivatives along a leading tangent axis.
+
+    Attributes:
+        value: Float array of values (last axis = periods).
+        tangent: ``(n, *value.shape)`` array with one derivative per seed
+            direction, or ``None`` when every derivative is zero.
+    """
+
+    __slots__ = ("tangent", "value")
+
+    # Make NumPy defer to the reflected operators below instead of treating
+    # a Dual as an object scalar (``array * dual`` -> ``Dual.__rmul__``).
+    __array_ufunc__ = None
+
+    def __init__(self, value: Any, tangent: np.ndarray | None = None) -> None:
+        """Wrap *value* (converted to a float array) and its *tangent*."""
+        self.value = np.asarray(value, dtype=float)
+        self.tangent = tangent
+
+    @classmethod
+    def constant(cls, value: Any) -> Dual:
+        """Return a dual with zero derivatives."""
+        return cls(value)
+
+    @classmethod
+    def seed(cls, value: Any, index: int, size: int, mask: Any = None) -> Dual:
+        """Return *value* as seed direction *index* of *size* directions.
+
+        Args:
+            value: The input's values.
+            index: Tangent row that receives the unit derivative.
+            size: Number of seed directions.
+            mask: Optional boolean array selecting the cells that move with
+                the seed (default: every cell).
+        """
+        array = np.asarray(value, dtype=float)
+        tangent = np.zeros((size, *array.shape))
+        tangent[index] = 1.0 if mask is None else np.asarray(mask, dtype=float)
+        return cls(array, tangent)
+
+    def gradient(self, size: int) -> np.ndarray:
+        """Return the tangent as a dense ``(size, *value.shape)`` array."""
+        if self.tangent is None:
+            return np.zeros((size, *self.value.shape))
+        return np.broadcast_to(self.tangent, (size, *self.value.shape))
+
+    def __repr__(self) -> str:
+        """Return the value and the number of tangent directions."""
+        directions = 0 if self.tangent is None else len(self.tangent)
+        return f"Dual(value={self.value.tolist()!r}, directions={directions})"
+
+    def __bool__(self) -> bool:
+        """Refuse truth-value tests: a branch on a value is not differentiable."""
+        raise TypeError("The truth value of a Dual is not defined; branching formulas are not differentiable")
+
+    # ------------------------------------------------------------------
+    # Arithmetic
+    # ------------------------------------------------------------------
+    def __add__(self, other: Any) -> Dual:
+        """Return ``self + other``."""
+        other = as_dual(other)
+        return Dual(self.value + other.value, _combine(self.tangent, other.tangent))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> Dual:
+        """Return ``self - other``."""
+        other = as_dual(other)
+        return Dual(self.value - other.value, _combine(self.tangent, _scale(other.tangent, -1.0)))
+
+    def __rsub__(self, other: Any) -> Dual:
+        """Return ``other - self``."""
+        return as_dual(other) - self
+
+    def __mul__(self, other: Any) -> Dual:
+        """Return ``self * other`` (product rule)."""
+        other = as_dual(other)
+        return Dual(
+            self.value * other.value,
+            _combine(_scale(self.tangent, other.value), _scale(other.tangent, self.value)),
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Any) -> Dual:
+        """Return ``self / other`` (quotient rule); NaN where *other* is zero."""
+        other = as_dual(other)
+        zero = other.value == 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = np.where(zero, np.nan, self.value / other.value)
+            # d(a/b) = (da - (a/b) db) / b
+            tangent = _combine(self.tangent, _scale(other.tangent, -value))
+            if tangent is not None:
+                tangent = np.where(zero, np.nan, tangent / other.value)
+        return Dual(value, tangent)
+
+    def __rtruediv__(self, other: Any) -> Dual:
+        """Return ``other / self``."""
+        return as_dual(other) / self
+
+    def __floordiv__(self, other: Any) -> Dual:
+        """Return ``self // other``; piecewise constant, so its derivative is zero."""
+        other = as_dual(other)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return Dual(np.where(other.value == 0.0, np.nan, self.value // other.value))
+
+    def __rfloordiv__(self, other: Any) -> Dual:
+        """Return ``other // self``."""
+        return as_dual(other) // self
+
+    def __mod__(self, other: Any) -> Dual:
+        """Return ``self % other``."""
+        divisor = as_dual(other)
+        # a % b = a - b * floor(a / b); the floor is locally constant
+        return self - divisor * (self // divisor).value
+
+    def __rmod__(self, other: Any) -> Dual:
+        """Return ``other % self``."""
+        return as_dual(other) % self
+
+    def __pow__(self, other: Any) -> Dual:
+        """Return ``self ** other``."""
+        other = as_dual(other)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            value = self.value**other.value
+            # d(a^b) = b a^(b-1) da + a^b ln(a) db
+            tangent = _scale(self.tangent, other.value * self.value ** (other.value - 1.0))
+            if other.tangent is not None:
+                tangent = _combine(tangent, other.tangent * (value * np.log(self.value)))
+        return Dual(value, tangent)
+
+    def __rpow__(self, other: Any) -> Dual:
+        """Return ``other ** self``."""
+        return as_dual(other) ** self
+
+    def __neg__(self) -> Dual:
+        """Return ``-self``."""
+        return Dual(-self.value, _scale(self.tangent, -1.0))
+
+    def __pos__(self) -> Dual:
+        """Return ``self``."""
+        return self
+
+    def __abs__(self) -> Dual:
+        """Return ``abs(self)``."""
+        return Dual(np.abs(self.value), _scale(self.tangent, np.sign(self.value)))
+
+    # ------------------------------------------------------------------
+    # Comparisons compare values (their result carries no derivative)
+    # ------------------------------------------------------------------
+    def __lt__(self, other: Any) -> Any:
+        """Compare values: ``self < other``."""
+        return self.value < as_dual(other).value
+
+    def __le__(self, other: Any) -> Any:
+        """Compare values: ``self <= other``."""
+        return self.value <= as_dual(other).value
+
+    def __gt__(self, other: Any) -> Any:
+        """Compare values: ``self > other``."""
+        return self.value > as_dual(other).value
+
+    def __ge__(self, other: Any) -> Any:
+        """Compare values: ``self >= other``."""
+        return self.value >= as_dual(other).value
+
+    def __eq__(self, other: object) -> Any:
+        """Compare values: ``self == other``."""
+        return self.value == as_dual(other).value
+
+    def __ne__(self, other: object) -> Any:
+        """Compare values: ``self != other``."""
+        return self.value != as_dual(other).value
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def mask_non_finite(self) -> Dual:
+        """Return a copy with ``±inf`` values (and their tangents) replaced by NaN."""
+        infinite = np.isinf(self.value)
+        if not infinite.any():
+            return self
+        tangent = None if self.tangent is None else np.where(infinite, np.nan, self.tangent)
+        return Dual(np.where(infinite, np.nan, self.value), tangent)
+
+
+def as_dual(value: Any) -> Dual:
+    """Return *value* unchanged if it is a :class:`Dual`, else as a constant dual."""
+    return value if isinstance(value, Dual) else Dual(value)
@@ -0,0 +1,90 @@
+"""NumPy helpers shared by the vectorized (whole-timeline) calculation paths.
+
+Scalar calculations evaluate one node for one period at a time and raise on
+problems such as a zero denominator. The vectorized counterparts receive one
+array per input - the last axis indexes periods, any leading axes are batch
+dimensions (entities, scenarios, Monte Carlo paths, …) - and report per-cell
+problems as ``NaN`` so a single bad period never aborts a whole timeline.
+
+Features:
+    - ``nan_divide`` divides element-wise, masking zero denominators with NaN.
+    - ``mask_non_finite`` replaces ``±inf`` produced by overflow with NaN.
+    - ``apply_elementwise`` evaluates an arbitrary scalar callable cell by cell,
+      used as the fallback for user callables that cannot take arrays.
+
+Example:
+    >>> import numpy as np
+    >>> from fin_statement_model.core.calculations.vectorized import nan_divide
+    >>> nan_divide(np.array([10.0, 5.0]), np.array([2.0, 0.0])).tolist()
+    [5.0, nan]
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = [
+    "apply_elementwise",
+    "mask_non_finite",
+    "nan_divide",
+]
+
+
+def nan_divide(numerator: Any, denominator: Any) -> np.ndarray:
+    """Divide element-wise, returning NaN wherever *denominator* is zero.
+
+    Args:
+        numerator: Array-like dividend.
+        denominator: Array-like divisor, broadcast against *numerator*.
+
+    Returns:
+        Float array of the quotients with zero-denominator cells set to NaN.
+    """
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quotient = numerator / denominator
+    return np.where(denominator == 0.0, np.nan, quotient)
+
+
+def mask_non_finite(values: Any) -> np.ndarray:
+    """Return *values* as a float array with ``±inf`` replaced by NaN."""
+    result = np.asarray(values, dtype=float)
+    if np.isinf(result).any():
+        result = np.where(np.isinf(result), np.nan, result)
+    return result
+
+
+def apply_elementwise(func: Callable[..., Any], arrays: Sequence[Any]) -> np.ndarray:
+    """Evaluate a scalar *func* once per broadcast cell of *arrays*.
+
+    Cells for which *func* raises or returns a non-numeric result become NaN,
+    mirroring how the vectorized paths report per-period failures.
+
+    Args:
+        func: Callable taking one float per entry of *arrays*.
+        arrays: Operands, broadcast against each other.
+
+    Returns:
+        Float array with the broadcast shape of *arrays*.
+    """
+    operands = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in arrays))
+    shape = operands[0].shape if operands else ()
+    result = np.full(shape, np.nan)
+    for index in np.ndindex(shape):
+        try:
+            value = func(*(float(operand[index]) for operand in operands))
+        except Exception as exc:  # noqa: BLE001 - one failing cell must not abort the timeline
+            logger.debug("Element-wise evaluation of %r failed at %s: %s", func, index, exc)
+            continue
+        if isinstance(value, int | float | np.number):
+            result[index] = float(value)
+    return mask_non_finite(result)
@@ -11,6 +11,7 @@ Specifically, it makes the following symbols directly available:
   nodes, set values, etc.).
 * `GraphTraverser` - read-only utilities for traversal, validation, and cycle
   detection.
+* `GraphOverlay` - copy-on-write scenario view over a shared base graph.
 
 Examples:
     Basic usage::
@@ -27,6 +28,7 @@ internal file structure change in future versions.
 
 from fin_statement_model.core.graph.graph import Graph
 from fin_statement_model.core.graph.manipulator import GraphManipulator
+from fin_statement_model.core.graph.overlay import GraphOverlay
 from fin_statement_model.core.graph.traverser import GraphTraverser
 
-__all__ = ["Graph", "GraphManipulator", "GraphTraverser"]
+__all__ = ["Graph", "GraphManipulator", "GraphOverlay", "GraphTraverser"]
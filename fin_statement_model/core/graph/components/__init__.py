@@ -15,6 +15,7 @@ Each mix-in provides a distinct set of features for the Graph class:
 | AdjustmentMixin   | Discretionary adjustment API and helpers                      |
 | MergeReprMixin    | Graph merging logic and developer-friendly __repr__            |
 | TraversalMixin    | Read-only traversal, validation, and dependency inspection     |
+| CircularOpsMixin  | Declared circular groups solved by fixed-point iteration       |
 
 These mix-ins are composed together in the main `Graph` class to provide a unified,
 extensible API for financial statement graph modeling.
@@ -25,6 +26,7 @@ from __future__ import annotations
 from ._adjustment_ops import AdjustmentMixin
 from ._base import GraphBaseMixin
 from ._calc_ops import CalcOpsMixin
+from ._circular_ops import CircularOpsMixin
 from ._merge_repr import MergeReprMixin
 from ._node_ops import NodeOpsMixin
 from ._traversal_ops import TraversalMixin
@@ -32,6 +34,7 @@ from ._traversal_ops import TraversalMixin
 __all__: list[str] = [
     "AdjustmentMixin",
     "CalcOpsMixin",
+    "CircularOpsMixin",
     "GraphBaseMixin",
     "MergeReprMixin",
     "NodeOpsMixin",
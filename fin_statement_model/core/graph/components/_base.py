@@ -9,6 +9,13 @@ Key responsibilities:
     - Initialize all core state for the Graph (nodes, periods, services, caches)
     - Provide access to node and period registries
     - Delegate to service layers for calculations, adjustments, and periods
+    - Optionally back item values with a graph-wide columnar value store
+    - Maintain a reverse-dependency index for targeted cache invalidation
+    - Keep calculated values in one optionally bounded :class:`ValueCache`
+      shared by the calculation engine and the nodes' own result caches
+    - Stage node insertions during a bulk-construction batch and commit them
+      with a single validation, ordering and period-merge pass
+    - Order evaluation with declared circular groups as blocks
     - Expose helpers for cache management and full graph reset
 
 Examples:
@@ -27,23 +34,37 @@ Examples:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
+import weakref
 
 from fin_statement_model.core.adjustments.manager import AdjustmentManager
 from fin_statement_model.core.errors import CircularDependencyError, NodeError
 from fin_statement_model.core.graph.manipulator import GraphManipulator
 from fin_statement_model.core.graph.services import (
     AdjustmentService,
+    ArrayEvaluator,
+    CachedValues,
+    CacheStats,
     CalculationEngine,
+    ColumnarValueStore,
+    DependencyIndex,
+    InvalidationReport,
+    MemoryReport,
     PeriodService,
+    ValueCache,
+    block_order,
 )
 from fin_statement_model.core.graph.traverser import GraphTraverser
 from fin_statement_model.core.node_factory import NodeFactory
+from fin_statement_model.core.nodes import FinancialStatementItemNode
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, MutableMapping
 
+    from fin_statement_model.core.graph.overlay import GraphOverlay
+    from fin_statement_model.core.graph.services import CircularGroup, PeriodIndex
     from fin_statement_model.core.nodes import Node
 
 logger = logging.getLogger(__name__)
@@ -51,9 +72,33 @@ logger = logging.getLogger(__name__)
 __all__: list[str] = ["GraphBaseMixin"]
 
 
+class _BatchState:
+    """Bookkeeping for nodes staged inside :meth:`Graph.batch`."""
+
+    __slots__ = ("added", "check_cycles", "depth", "merge_periods", "replaced", "validate")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        # name -> staged node, and name -> node it displaced that existed before the batch
+        self.added: dict[str, Node] = {}
+        self.replaced: dict[str, Node] = {}
+        # names whose inputs must exist at commit, and whether any insertion asked for a cycle check
+        self.validate: set[str] = set()
+        self.check_cycles = False
+        # names whose value periods join the graph's periods at commit (if still staged then)
+        self.merge_periods: set[str] = set()
+
+
 class GraphBaseMixin:
     """Provide constructor and generic helpers shared by all graph mix-ins."""
 
+    # Provided by CircularOpsMixin; declared for static type checkers only.
+    _circular_membership: Any
+    _attach_circular: Any
+    _detach_circular: Any
+    _reset_circular: Any
+    _structural_cycle: Any
+
     # ---------------------------------------------------------------------
     # Construction & core state
     # ---------------------------------------------------------------------
@@ -64,13 +109,28 @@ class GraphBaseMixin:
         calc_engine_cls: type[CalculationEngine] = CalculationEngine,
         period_service_cls: type[PeriodService] = PeriodService,
         adjustment_service_cls: type[AdjustmentService] = AdjustmentService,
+        array_evaluator_cls: type[ArrayEvaluator] = ArrayEvaluator,
+        columnar_values: bool = False,
+        cache_max_entries: int | None = None,
     ) -> None:
         # NOTE: we do **not** call super().__init__() on purpose; this mix-in
         # owns the concrete initialisation logic.
 
         self._nodes: dict[str, Node] = {}
-
-        self._cache: dict[str, dict[str, float]] = {}
+        # Opt-in columnar storage for item values (see enable_columnar_values)
+        self._value_store: ColumnarValueStore | None = None
+        # name -> dependencies / dependents, kept in sync by the structural hooks below
+        self._dependency_index = DependencyIndex()
+        # Pending bulk insertions while inside ``with graph.batch():``
+        self._batch: _BatchState | None = None
+        # Declared circular groups by name, and the calculate shims of their members
+        self._circular_groups: dict[str, CircularGroup] = {}
+        self._circular_shims: dict[str, Callable[[str], float]] = {}
+        # Scenario overlays reading through to this graph (see Graph.overlay)
+        self._overlays: weakref.WeakSet[GraphOverlay] = weakref.WeakSet()
+
+        # The one store of calculated values; caching nodes are bound to views onto it
+        self._cache = ValueCache(max_entries=cache_max_entries)
         self._node_factory: NodeFactory = NodeFactory()
 
         # Service layer ----------------------------------------------------
@@ -86,6 +146,14 @@ class GraphBaseMixin:
             add_node_with_validation=lambda node: self._add_node_with_validation(node),
             resolve_input_nodes=self._resolve_input_nodes,
             add_periods=self.add_periods,
+            evaluation_plan=self._evaluation_plan,
+        )
+
+        self._array_evaluator = array_evaluator_cls(
+            node_resolver=self.get_node,
+            period_provider=lambda: self._period_service.periods,
+            node_names_provider=lambda: list(self._nodes.keys()),
+            circular_groups=self._circular_membership,
         )
 
         self.adjustment_manager = AdjustmentManager()
@@ -100,6 +168,9 @@ class GraphBaseMixin:
         self.manipulator = GraphManipulator(self)
         self.traverser = GraphTraverser(self)
 
+        if columnar_values:
+            self.enable_columnar_values()
+
     # ------------------------------------------------------------------
     # Simple public helpers / properties
     # ------------------------------------------------------------------
@@ -111,21 +182,476 @@ class GraphBaseMixin:
     @property
     def periods(self) -> list[str]:
         """Return the current, sorted list of period identifiers managed by the graph."""
-        return self._period_service.periods
+        return list(self._period_service.periods)
+
+    def has_period(self, period: str) -> bool:
+        """Return ``True`` if *period* is one of the graph's periods (O(1), no list copy)."""
+        return self._period_service.contains(period)
+
+    @property
+    def period_index(self) -> PeriodIndex:
+        """Return the graph's periods as an interned :class:`PeriodIndex` (label <-> integer ordinal)."""
+        return self._period_service.index
 
     # Delegation wrappers --------------------------------------------------
     def add_periods(self, periods: list[str]) -> None:
         """Add new period identifiers via :class:`~fin_statement_model.core.graph.services.PeriodService`."""
         self._period_service.add_periods(periods)
 
+    # ------------------------------------------------------------------
+    # Columnar value storage
+    # ------------------------------------------------------------------
+    @property
+    def value_store(self) -> ColumnarValueStore | None:
+        """The graph-wide :class:`ColumnarValueStore`, or ``None`` when values live in per-node dicts."""
+        return self._value_store
+
+    def enable_columnar_values(self) -> ColumnarValueStore:
+        """Move the values of all item nodes into one columnar NumPy store.
+
+        Every :class:`~fin_statement_model.core.nodes.FinancialStatementItemNode`
+        (present now or added later) gets a row in a ``nodes x periods``
+        matrix; its ``values`` attribute becomes a mapping view onto that row.
+        Calling this on a graph that already uses the store is a no-op.
+
+        Returns:
+            The active value store.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> g = Graph(periods=["2023"])
+            >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+            >>> store = g.enable_columnar_values()
+            >>> type(g.get_node("Revenue").values).__name__
+            'ColumnarValues'
+            >>> g.calculate("Revenue", "2023")
+            100.0
+        """
+        if self._value_store is None:
+            self._value_store = ColumnarValueStore(self._period_service.periods)
+            for node in self._nodes.values():
+                self._attach_values(node)
+            logger.debug("Enabled columnar value store for %d item nodes", len(self._value_store))
+        return self._value_store
+
+    def disable_columnar_values(self) -> None:
+        """Move item values back into per-node dictionaries and drop the store."""
+        if self._value_store is None:
+            return
+        for node in self._nodes.values():
+            self._detach_values(node)
+        self._value_store = None
+
+    def _attach_values(self, node: Node) -> None:
+        if (
+            self._value_store is not None
+            and isinstance(node, FinancialStatementItemNode)
+            and getattr(node.values, "store", None) is not self._value_store
+        ):
+            node.values = self._value_store.attach(node.name, node.values)
+
+    def _rename_values(self, node: Node, new_name: str) -> None:
+        """Move *node*'s columnar row to *new_name* (before the node itself is renamed)."""
+        store = self._value_store
+        if (
+            store is not None
+            and isinstance(node, FinancialStatementItemNode)
+            and node.name in store
+            and getattr(node.values, "store", None) is store
+        ):
+            store.rename(node.name, new_name)
+
+    def _detach_values(self, node: Node) -> None:
+        store = self._value_store
+        if store is None or not isinstance(node, FinancialStatementItemNode) or node.name not in store:
+            return
+        # Skip nodes whose values were reassigned to a detached mapping
+        if getattr(node.values, "store", None) is not self._value_store:
+            return
+        node.values = store.release(node.name)
+
+    # ------------------------------------------------------------------
+    # Structural change hooks
+    # ------------------------------------------------------------------
+    def _on_node_added(self, node: Node) -> None:
+        """Update graph-level indexes after *node* was registered."""
+        self._dependency_index.add(node.name, self._dependency_names(node))
+        self._bind_node_state(node)
+        self._notify_overlays()
+
+    def _on_node_removed(self, node: Node) -> None:
+        """Update graph-level indexes after *node* was unregistered."""
+        self._dependency_index.remove(node.name)
+        self._release_node_state(node)
+        self._notify_overlays()
+
+    def _rename_node(self, node: Node, new_name: str) -> None:
+        """Re-register *node* under *new_name*, moving its name-keyed state along.
+
+        A columnar value row is re-keyed in place. The cache view and
+        calculate shims are keyed by node name, so they are released under
+        the old name and bound again under the new one. Dependents keep their
+        references; only the node's own entries in the dependency index are
+        re-keyed.
+        """
+        old_name = node.name
+        self._rename_values(node, new_name)
+        self._release_node_state(node)
+        del self._nodes[old_name]
+        node.name = new_name
+        self._nodes[new_name] = node
+        self._bind_node_state(node)
+        self._dependency_index.rename(old_name, new_name)
+        self._notify_overlays()
+
+    def _bind_node_state(self, node: Node) -> None:
+        """Key *node*'s values, cache view and calculate shims to its name."""
+        self._attach_values(node)
+        self._attach_cache(node)
+        self._attach_circular(node)
+        if (profiler := self._calc_engine.profiler) is not None:
+            profiler.instrument(node)
+
+    def _release_node_state(self, node: Node) -> None:
+        """Undo :meth:`_bind_node_state` for *node* under its current name."""
+        self._detach_values(node)
+        self._detach_cache(node)
+        self._detach_circular(node)
+        if (profiler := self._calc_engine.profiler) is not None:
+            profiler.release(node)
+
+    def _attach_cache(self, node: Node) -> None:
+        """Point *node*'s own result cache at its view of the graph's value cache."""
+        view = self._cache.bind(node.name)
+        previous = node.bind_cache(view)
+        if previous is None:
+            # The node keeps no result cache; the engine caches its values directly
+            self._cache.release(node.name)
+        elif previous is not view and previous:
+            view.update(previous)
+
+    def _detach_cache(self, node: Node) -> None:
+        """Drop *node*'s cached values and hand it back a private cache."""
+        if not self._cache.is_bound(node.name):
+            self._cache.release(node.name)
+            return
+        previous = node.bind_cache(self._cache.release(node.name))
+        if not (isinstance(previous, CachedValues) and previous.cache is self._cache):
+            # Rebound elsewhere meanwhile (e.g. added to another graph): leave it there
+            node.bind_cache(cast("MutableMapping[str, float]", previous))
+
+    def _rebuild_dependency_index(self) -> None:
+        """Re-derive the dependency index from every node (after renames or re-wiring)."""
+        self._dependency_index.rebuild((name, self._dependency_names(node)) for name, node in self._nodes.items())
+        self._notify_overlays()
+
+    def _notify_overlays(self, node_name: str | None = None, periods: Iterable[str] | None = None) -> None:
+        """Tell overlays that *node_name* changed for *periods*, or (no name) that the structure did."""
+        for overlay in list(self._overlays):
+            if node_name is None:
+                overlay._base_structure_changed()
+            else:
+                overlay._base_values_changed(node_name, periods)
+
+    def _adopt_nodes(self, nodes: Mapping[str, Node], index: DependencyIndex | None = None) -> None:
+        """Register already wired *nodes* in an empty graph, with their prebuilt *index* if given.
+
+        Used by ``Graph.clone``: inputs, cycles and ordering were checked in the
+        source graph, so only the per-node hooks run here.
+        """
+        self._nodes.update(nodes)
+        if index is None:
+            self._rebuild_dependency_index()
+        else:
+            self._dependency_index = index
+        for node in nodes.values():
+            self._attach_values(node)
+            self._attach_cache(node)
+            self._attach_circular(node)
+
+    def _evaluation_plan(self) -> list[tuple[str, tuple[str, ...]]]:
+        """Return ``(name, dependencies)`` for every node, dependencies first (cycles last).
+
+        Members of a circular group are listed together, each with the
+        group's external dependencies, since the group is solved as a whole.
+        """
+        index = self._dependency_index
+        if membership := self._circular_membership():
+            try:
+                return self._block_plan(membership)
+            except CircularDependencyError:
+                logger.debug("Dependency cycle outside the circular groups; using best-effort order")
+        order = index.best_effort_order()
+        if len(order) != len(self._nodes):  # nodes registered behind the index's back
+            known = set(order)
+            order.extend(name for name in self._nodes if name not in known)
+        return [(name, index.dependencies(name)) for name in order]
+
+    def _block_plan(self, membership: dict[str, CircularGroup]) -> list[tuple[str, tuple[str, ...]]]:
+        index = self._dependency_index
+        order = block_order(self._nodes, index.dependencies, membership)
+        external: dict[str, tuple[str, ...]] = {}
+        for group in set(membership.values()):
+            inner = {name for name, other in membership.items() if other is group}
+            deps = (dep for name in group.members if name in inner for dep in index.dependencies(name))
+            external[group.name] = tuple(dict.fromkeys(dep for dep in deps if dep not in inner))
+        return [
+            (name, external[membership[name].name] if name in membership else index.dependencies(name))
+            for name in order
+        ]
+
+    @staticmethod
+    def _dependency_names(node: Node) -> list[str]:
+        """Names *node* reads from: declared dependencies plus any wired ``inputs``."""
+        names = list(node.get_dependencies())
+        inputs = getattr(node, "inputs", None)
+        if isinstance(inputs, dict):
+            inputs = list(inputs.values())
+        if isinstance(inputs, list):
+            names.extend(inp.name for inp in inputs if hasattr(inp, "name"))
+        return names
+
+    # ------------------------------------------------------------------
+    # Bulk construction (see NodeOpsMixin.batch)
+    # ------------------------------------------------------------------
+    def _begin_batch(self) -> None:
+        if self._batch is None:
+            self._batch = _BatchState()
+        self._batch.depth += 1
+
+    def _stage_node(
+        self,
+        node: Node,
+        *,
+        validate_inputs: bool = False,
+        check_cycles: bool = False,
+        merge_periods: bool = False,
+    ) -> None:
+        """Register *node* in the node map only; hooks and checks are deferred to commit."""
+        state = cast("_BatchState", self._batch)
+        previous = self._nodes.get(node.name)
+        if previous is node and node.name not in state.added:
+            return
+        if previous is not None and node.name not in state.added:
+            state.replaced[node.name] = previous
+        self._nodes[node.name] = node
+        state.added[node.name] = node
+        if validate_inputs:
+            state.validate.add(node.name)
+        else:
+            state.validate.discard(node.name)
+        state.check_cycles = state.check_cycles or check_cycles
+        if merge_periods:
+            state.merge_periods.add(node.name)
+        else:
+            state.merge_periods.discard(node.name)
+
+    def _end_batch(self, *, commit: bool) -> None:
+        """Leave one batch level; the outermost level commits or rolls back."""
+        state = cast("_BatchState", self._batch)
+        state.depth -= 1
+        if state.depth:
+            return
+        if not commit:
+            self._rollback_batch(state)
+            return
+        staged = [node for name, node in state.added.items() if self._nodes.get(name) is node]
+        try:
+            # One input-resolution pass ...
+            for node in staged:
+                if node.name in state.validate and hasattr(node, "inputs") and node.inputs:
+                    self._validate_node_inputs(node)
+            # ... one bulk index rebuild with a single topological ordering / cycle check
+            self._batch = None
+            self._rebuild_dependency_index()
+            if state.check_cycles and (cycle := self._find_cycle()) is not None:
+                raise CircularDependencyError("Batch insertion would create a cycle", cycle=cycle)
+        except Exception:
+            self._rollback_batch(state)
+            raise
+        profiler = self._calc_engine.profiler
+        for name, previous in state.replaced.items():
+            self._detach_values(previous)
+            self._detach_cache(previous)
+            self._detach_circular(previous)
+            if profiler is not None:
+                profiler.release(previous)
+            current = self._nodes.get(name)
+            if current is not None:
+                self.manipulator._rewire_dependents(current)
+        for node in staged:
+            self._attach_values(node)
+            self._attach_cache(node)
+            self._attach_circular(node)
+            if profiler is not None:
+                profiler.instrument(node)
+        if state.replaced:
+            self.clear_all_caches()
+        # ... and one period merge, over the staged nodes that survived the batch
+        periods = {
+            period
+            for node in staged
+            if node.name in state.merge_periods and isinstance(values := getattr(node, "values", None), Mapping)
+            for period in values
+        }
+        if periods:
+            self.add_periods(list(periods))
+        logger.debug("Committed batch of %d nodes (%d replaced)", len(staged), len(state.replaced))
+
+    def _find_cycle(self) -> list[str] | None:
+        """Return a dependency cycle that is not contained in one circular group, or ``None``."""
+        cycle = self._dependency_index.find_cycle()
+        if cycle is None or not self._circular_groups:
+            return cycle
+        return self._structural_cycle()
+
+    def _rollback_batch(self, state: _BatchState) -> None:
+        """Undo the node-map changes of a failed batch."""
+        self._batch = None
+        for name, node in state.added.items():
+            if self._nodes.get(name) is not node:
+                continue
+            if name in state.replaced:
+                self._nodes[name] = state.replaced[name]
+            else:
+                del self._nodes[name]
+        self._rebuild_dependency_index()
+        logger.debug("Rolled back batch of %d staged nodes", len(state.added))
+
     # ------------------------------------------------------------------
     # Cache & reset utilities
     # ------------------------------------------------------------------
     def clear_calculation_cache(self) -> None:
-        """Invalidate the central calculation cache only."""
+        """Drop every calculated value from the graph's value cache."""
         self._calc_engine.clear_all()
+        self._reset_circular()
+        for overlay in list(self._overlays):
+            overlay.clear_cache()
         logger.debug("Cleared graph calculation cache via CalculationEngine.")
 
+    def cache_stats(self) -> CacheStats:
+        """Return hit, miss and eviction counts and the size of the value cache.
+
+        Lookups by the graph and by nodes reading their own (bound) result
+        cache are both counted.
+
+        Returns:
+            A :class:`~fin_statement_model.core.graph.services.CacheStats` snapshot.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> g = Graph(periods=["2023"], cache_max_entries=1000)
+            >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+            >>> _ = g.add_calculation("Double", ["Revenue", "Revenue"], "addition")
+            >>> g.calculate("Double", "2023"), g.calculate("Double", "2023")
+            (200.0, 200.0)
+            >>> stats = g.cache_stats()
+            >>> stats.hits, stats.misses, stats.entries, stats.max_entries
+            (1, 1, 1, 1000)
+        """
+        return self._cache.stats()
+
+    def memory_report(self) -> MemoryReport:
+        """Return the approximate bytes held by the graph, by component and node type.
+
+        Node objects, item value stores (per-node dicts or the columnar
+        store), calculated values (the value cache and node-level caches),
+        adjustments and period tables are measured separately, each object
+        counted once.
+
+        Returns:
+            A :class:`~fin_statement_model.core.graph.services.MemoryReport`;
+            ``to_frame()`` gives the per node type breakdown.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> g = Graph(periods=["2023"])
+            >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+            >>> report = g.memory_report()
+            >>> report.by_node_type["FinancialStatementItemNode"].count
+            1
+            >>> report.total > 0
+            True
+        """
+        return MemoryReport.measure(
+            self._nodes.values(),
+            periods=self._period_service,
+            cache=self._cache,
+            value_store=self._value_store,
+            adjustments=self.adjustment_manager,
+            stop=(type(self),),
+        )
+
+    def set_cache_limit(self, max_entries: int | None) -> int:
+        """Bound the value cache to *max_entries* values (``None`` removes the bound).
+
+        Least recently used values are evicted first, immediately if the
+        cache is already larger than the new bound.
+
+        Returns:
+            The number of values evicted by this call.
+
+        Raises:
+            ValueError: If *max_entries* is not a positive integer or ``None``.
+        """
+        return self._cache.resize(max_entries)
+
+    def invalidate_dependents(self, node_name: str, periods: Iterable[str] | None = None) -> InvalidationReport:
+        """Drop cached results that may depend on *node_name* for *periods*.
+
+        Walks the reverse-dependency index from *node_name* and clears the
+        cached values of the node itself and its transitive dependents only.
+        While the change flows through period-local nodes only the edited
+        periods are dropped; nodes that look at other periods (and everything
+        downstream of them) lose all periods.
+
+        Args:
+            node_name: The node whose value changed.
+            periods: The changed periods, or ``None`` for all periods.
+
+        Returns:
+            An :class:`InvalidationReport` with the number of nodes touched
+            and cache entries dropped.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> g = Graph(periods=["2023", "2024"])
+            >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0, "2024": 120.0})
+            >>> _ = g.add_financial_statement_item("Other", {"2023": 1.0, "2024": 1.0})
+            >>> _ = g.add_calculation("Double", ["Revenue", "Revenue"], "addition")
+            >>> _ = [g.calculate(n, p) for n in ("Double", "Revenue", "Other") for p in g.periods]
+            >>> g.invalidate_dependents("Revenue", ["2023"]).entries_invalidated
+            2
+        """
+        edited = tuple(dict.fromkeys(periods)) if periods is not None else None
+
+        def is_period_local(name: str) -> bool:
+            node = self._nodes.get(name)
+            return node is not None and node.is_period_local()
+
+        scopes = self._dependency_index.affected(node_name, edited, is_period_local=is_period_local)
+        self._reset_circular(scopes)
+        self._notify_overlays(node_name, edited)
+        entries = 0
+        for name, scope in scopes.items():
+            entries += self._calc_engine.invalidate(name, scope)
+            node = self._nodes.get(name)
+            if node is not None:
+                entries += node.invalidate_cache(scope)
+        report = InvalidationReport(
+            node_name=node_name,
+            periods=edited,
+            nodes_invalidated=len(scopes),
+            entries_invalidated=entries,
+        )
+        logger.debug(
+            "Invalidated %d cache entries across %d nodes after change to '%s'",
+            entries,
+            len(scopes),
+            node_name,
+        )
+        return report
+
     def clear_all_caches(self) -> None:
         """Clear calculation cache **and** any per-node caches."""
         for node in self.nodes.values():
@@ -143,9 +669,15 @@ class GraphBaseMixin:
 
     def clear(self) -> None:
         """Fully reset the graph to an empty state (nodes, periods, adjustments, caches)."""
+        for node in self._nodes.values():
+            self._on_node_removed(node)
         self._nodes = {}
+        self._dependency_index.clear()
+        if self._value_store is not None:
+            self._value_store = ColumnarValueStore()
         self._period_service.clear()
         self._cache.clear()
+        self._circular_groups.clear()
         self.adjustment_manager.clear_all()
         logger.info("Graph cleared: nodes, periods, adjustments, and caches reset.")
 
@@ -162,28 +694,33 @@ class GraphBaseMixin:
         if not node.name or not isinstance(node.name, str):
             raise ValueError("Node name must be a non-empty string")
 
+        if self._batch is not None:
+            # Checks, index maintenance and period merge run once at commit
+            self._stage_node(node, validate_inputs=validate_inputs, check_cycles=check_cycles, merge_periods=True)
+            return node
+
         if node.name in self._nodes:
             logger.warning("Overwriting existing node '%s'", node.name)
 
         if validate_inputs and hasattr(node, "inputs") and node.inputs:
             self._validate_node_inputs(node)
 
-        if check_cycles and hasattr(node, "inputs") and node.inputs and self.traverser.would_create_cycle(node):
-            cycle_path = None
-            for input_node in node.inputs:
-                if hasattr(input_node, "name"):
-                    path = self.traverser.find_cycle_path(input_node.name, node.name)
-                    if path:
-                        cycle_path = path
-                        break
+        if check_cycles and (cycle_path := self.traverser.find_insertion_cycle(node)) is not None:
             raise CircularDependencyError(
                 f"Adding node '{node.name}' would create a cycle",
-                cycle=cycle_path or [node.name, "...", node.name],
+                cycle=cycle_path,
             )
 
+        previous = self._nodes.get(node.name)
+        if previous is not None and previous is not node:
+            self._on_node_removed(previous)
         self._nodes[node.name] = node
+        self._on_node_added(node)
+        if previous is not None and previous is not node:
+            # As in a batch commit, dependents now read from the new node
+            self.manipulator._rewire_dependents(node)
 
-        if hasattr(node, "values") and isinstance(node.values, dict):
+        if hasattr(node, "values") and isinstance(node.values, Mapping):
             self.add_periods(list(node.values.keys()))
 
         logger.debug("Added node '%s' to graph", node.name)
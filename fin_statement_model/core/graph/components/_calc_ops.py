@@ -7,6 +7,15 @@ Key responsibilities:
     - Add calculation nodes (formula-based, custom, or metric-based)
     - Change calculation methods for nodes
     - Execute calculations and manage calculation cache
+    - Evaluate whole timelines at once as pandas Series / DataFrames
+    - Compile the graph into a frozen evaluator (``graph.compile()``)
+    - Evaluate one structure for many entities (``graph.evaluate_entities()``)
+    - Evaluate adjustment scenarios in one batched pass (``graph.evaluate_scenarios()``)
+    - Simulate statistical forecasts as Monte Carlo paths (``graph.simulate()``)
+    - Sweep input bumps for tornado charts in one batched pass (``graph.sensitivity()``)
+    - Differentiate an output with respect to many inputs at once (``graph.gradient()``)
+    - Back-solve an input for a target value across periods (``graph.goal_seek()``)
+    - Profile evaluation per node (``with graph.profile():``)
     - Inspect available metrics and their info
 
 Examples:
@@ -27,10 +36,23 @@ Examples:
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
+from fin_statement_model.core.errors import CircularDependencyError
+from fin_statement_model.core.graph.services import CompiledGraph
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+
+    import pandas as pd
+
+    from fin_statement_model.core.graph.services import (
+        EntityResults,
+        EvaluationProfiler,
+        ScenarioResults,
+        SimulationResults,
+    )
 
 __all__: list[str] = ["CalcOpsMixin"]
 
@@ -100,6 +122,8 @@ class CalcOpsMixin:
             new_method_key,
             **kwargs,
         )
+        # Results downstream of the node were computed with the old method
+        self.invalidate_dependents(node_name)  # type: ignore[attr-defined]
 
     # ------------------------------------------------------------------
     # Calculation execution / cache interaction
@@ -107,8 +131,301 @@ class CalcOpsMixin:
     def calculate(self, node_name: str, period: str) -> Any:
         return self._calc_engine.calculate(node_name, period)  # type: ignore[attr-defined]
 
-    def recalculate_all(self, periods: list[str] | None = None) -> None:
-        self._calc_engine.recalc_all(periods)  # type: ignore[attr-defined]
+    def recalculate_all(self, periods: list[str] | None = None) -> Any:
+        """Recalculate every node for *periods* in one dependency-ordered pass.
+
+        Returns the engine's :class:`~fin_statement_model.core.graph.services.RecalcReport`
+        listing computed cells and every failure with its root cause.
+        Circular groups are solved once, when their first member is reached;
+        periods that do not converge are reported as failures of every member.
+        """
+        self._reset_circular()  # type: ignore[attr-defined]
+        return self._calc_engine.recalc_all(periods)  # type: ignore[attr-defined]
+
+    @contextmanager
+    def profile(self) -> Iterator[EvaluationProfiler]:
+        """Record per-node evaluation statistics for the duration of the block.
+
+        While the block runs, every ``calculate`` of a node in the graph
+        (top-level or as another node's input) is timed; nodes added inside
+        the block are included. Outside the block no instrumentation is
+        installed. Nested ``profile()`` blocks share the outer profiler.
+
+        Yields:
+            The :class:`~fin_statement_model.core.graph.services.EvaluationProfiler`;
+            read ``to_frame()``, ``by_calculation()`` or ``collapsed_stacks()``
+            from it during or after the block.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> g = Graph(periods=["2023", "2024"])
+            >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0, "2024": 110.0})
+            >>> _ = g.add_calculation("Double", ["Revenue", "Revenue"], "addition")
+            >>> with g.profile() as profiler:
+            ...     _ = g.recalculate_all()
+            >>> int(profiler.by_calculation().loc["AdditionCalculation", "calls"])
+            2
+        """
+        engine = self._calc_engine  # type: ignore[attr-defined]
+        owner = engine.profiler is None
+        profiler = engine.enable_profiling()
+        try:
+            yield profiler
+        finally:
+            if owner:
+                engine.disable_profiling()
+
+    # ------------------------------------------------------------------
+    # Vectorized (whole-timeline) evaluation
+    # ------------------------------------------------------------------
+    def calculate_series(self, node_name: str, periods: list[str] | None = None) -> pd.Series:
+        """Evaluate *node_name* for every period in one vectorized pass.
+
+        Missing data and division by zero show up as NaN instead of raising.
+        Defaults to all graph periods.
+        """
+        return self._array_evaluator.series(node_name, periods)  # type: ignore[attr-defined, no-any-return]
+
+    def calculate_frame(
+        self,
+        node_names: list[str] | None = None,
+        periods: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Evaluate several nodes (default: all) over *periods* (default: all).
+
+        Returns a DataFrame with node names as index and periods as columns.
+        """
+        return self._array_evaluator.frame(node_names, periods)  # type: ignore[attr-defined, no-any-return]
+
+    def compile(
+        self,
+        node_names: list[str] | None = None,
+        periods: list[str] | None = None,
+    ) -> CompiledGraph:
+        """Lower the graph (or the cone of *node_names*) into a frozen flat evaluator.
+
+        The evaluation order, period axis (default: all graph periods) and item
+        values are captured once; the returned
+        :class:`~fin_statement_model.core.graph.services.CompiledGraph`
+        recomputes every compiled node from new input vectors with the same
+        NaN semantics as :py:meth:`calculate_frame`. Later changes to the
+        graph are not reflected; compile again after editing it.
+
+        Raises:
+            NodeError: If a requested node does not exist.
+            CircularDependencyError: If the compiled nodes contain a cycle,
+                including a declared circular group (those are solved by
+                ``calculate`` / ``calculate_frame`` only).
+        """
+        evaluator = self._array_evaluator  # type: ignore[attr-defined]
+        names = list(self.nodes) if node_names is None else node_names  # type: ignore[attr-defined]
+        order = evaluator.evaluation_order(names)
+        membership = self._circular_membership()  # type: ignore[attr-defined]
+        if circular := [name for name in order if name in membership]:
+            raise CircularDependencyError(
+                f"Cannot compile circular group '{membership[circular[0]].name}'",
+                cycle=[*circular, circular[0]],
+            )
+        return CompiledGraph([self.get_node(name) for name in order], evaluator.timeline(periods))  # type: ignore[attr-defined]
+
+    def evaluate_entities(
+        self,
+        data: pd.DataFrame,
+        node_names: list[str] | None = None,
+        **columns: str,
+    ) -> EntityResults:
+        """Evaluate this graph's structure for every entity in a long DataFrame.
+
+        The graph is used as a template: it is compiled once and evaluated
+        with the entities as a batch axis instead of building one graph per
+        entity. *data* holds ``entity``, ``item``, ``period`` and ``value``
+        columns (rename them via ``entity_col``, ``item_col``, ``period_col``
+        and ``value_col`` keyword arguments); items not in *data* keep the
+        graph's own values. See :py:meth:`CompiledGraph.evaluate_entities`.
+
+        Args:
+            data: Long table of item values per entity and period.
+            node_names: Nodes to evaluate and return (default: all).
+            **columns: Column-name overrides.
+
+        Returns:
+            Results exposing ``to_array()`` (entity x node x period) and
+            ``to_frame()`` ((entity, node) MultiIndex rows, period columns).
+        """
+        return self.compile(node_names).evaluate_entities(data, node_names, **columns)
+
+    def evaluate_scenarios(
+        self,
+        scenarios: list[str] | None = None,
+        node_names: list[str] | None = None,
+        *,
+        baseline: str | None = None,
+    ) -> ScenarioResults:
+        """Evaluate the graph under several adjustment scenarios in one batched pass.
+
+        Each scenario's adjustments of item nodes are applied at the item
+        level and propagate through all downstream calculations (unlike
+        :py:meth:`get_adjusted_value`, which adjusts one node's final value).
+        See :py:meth:`CompiledGraph.evaluate_scenarios`.
+
+        Args:
+            scenarios: Scenario names (default: every scenario with adjustments).
+            node_names: Nodes to evaluate and return (default: all).
+            baseline: Optional label of an extra, unadjusted first row.
+
+        Returns:
+            Results exposing ``to_array()`` (scenario x node x period) and
+            ``to_frame()`` ((scenario, node) MultiIndex rows, period columns).
+        """
+        manager = self._adjustment_service.manager  # type: ignore[attr-defined]
+        return self.compile(node_names).evaluate_scenarios(manager, scenarios, node_names, baseline=baseline)
+
+    def simulate(
+        self,
+        n_paths: int = 1000,
+        node_names: list[str] | None = None,
+        *,
+        seed: int | None = None,
+    ) -> SimulationResults:
+        """Run a Monte Carlo simulation of every statistical growth forecast.
+
+        Growth rates for all paths are drawn as arrays from one seeded
+        generator and propagated through downstream calculations in a single
+        vectorized pass. See :py:meth:`CompiledGraph.simulate`.
+
+        Args:
+            n_paths: Number of simulated paths.
+            node_names: Nodes to evaluate and return (default: all).
+            seed: Seed for the draws (default: ``forecasting.random_seed``).
+
+        Returns:
+            Results exposing ``quantiles()`` (percentile bands per node and
+            period), ``summary()`` (mean, spread, VaR and expected shortfall)
+            and ``to_array()`` (path x node x period).
+        """
+        return self.compile(node_names).simulate(n_paths, node_names, seed=seed)
+
+    def sensitivity(
+        self,
+        outputs: list[str],
+        inputs: list[str] | None = None,
+        bumps: list[float] | tuple[float, ...] = (-0.1, 0.1),
+        *,
+        relative: bool = True,
+    ) -> pd.DataFrame:
+        """Measure how *outputs* respond to bumping each input, without mutating the graph.
+
+        Instead of ``set_value`` plus a recalculation per bump, the graph is
+        compiled once, the baseline evaluated once, and each input's bumps are
+        evaluated as one batch through only the nodes downstream of it. See
+        :py:meth:`CompiledGraph.sensitivity`.
+
+        Args:
+            outputs: Nodes whose response is reported.
+            inputs: Item (or forecast history) nodes to bump one at a time.
+                Defaults to every input feeding *outputs*.
+            bumps: Bump sizes applied to every period (``0.1`` = +10%).
+            relative: Scale inputs by ``1 + bump`` (default) or add ``bump``.
+
+        Returns:
+            Tidy DataFrame with columns ``input, bump, output, period, base,
+            value, delta, pct_change`` - e.g. pivot ``delta`` by input and bump
+            for a tornado chart.
+        """
+        return self.compile([*outputs, *(inputs or [])]).sensitivity(outputs, inputs, bumps, relative=relative)
+
+    def gradient(
+        self,
+        output: str,
+        wrt: list[str] | None = None,
+        period: str | None = None,
+        *,
+        wrt_period: str | None = None,
+    ) -> pd.Series | pd.DataFrame:
+        """Return the exact partial derivatives of *output* with respect to input items.
+
+        All partials come from one forward-mode pass over the compiled graph
+        instead of one bump-and-recalculate per input. Nodes without a
+        derivative rule are differentiated numerically. See
+        :py:meth:`CompiledGraph.gradient`.
+
+        Args:
+            output: Node to differentiate (e.g. a metric).
+            wrt: Item (or forecast history) nodes to differentiate with
+                respect to. Defaults to every input feeding *output*.
+            period: Return only the derivatives of this period's value.
+            wrt_period: Seed only this period of each input instead of a
+                parallel shift of its whole timeline.
+
+        Returns:
+            A Series indexed by input when *period* is given, otherwise an
+            ``input x period`` DataFrame.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> g = Graph(periods=["2023"])
+            >>> _ = g.add_financial_statement_item("Debt", {"2023": 300.0})
+            >>> _ = g.add_financial_statement_item("Cash", {"2023": 100.0})
+            >>> _ = g.add_financial_statement_item("EBITDA", {"2023": 50.0})
+            >>> _ = g.add_calculation("NetDebt", ["Debt", "Cash"], "subtraction")
+            >>> _ = g.add_calculation("NetLeverage", ["NetDebt", "EBITDA"], "division")
+            >>> g.gradient("NetLeverage", period="2023").to_dict()
+            {'Debt': 0.02, 'Cash': -0.02, 'EBITDA': -0.08}
+        """
+        return self.compile([output, *(wrt or [])]).gradient(output, wrt, period, wrt_period=wrt_period)
+
+    def goal_seek(
+        self,
+        target_node: str,
+        target_value: float | list[float],
+        input_node: str,
+        period: str | list[str] | None = None,
+        *,
+        input_period: str | None = None,
+        method: str = "secant",
+        bracket: tuple[Any, Any] | None = None,
+        x0: Any = None,
+        tol: float = 1e-9,
+        max_iter: int = 100,
+    ) -> float | pd.Series:
+        """Find the value of *input_node* at which *target_node* reaches *target_value*.
+
+        Replaces ``set_value`` / ``calculate`` loops: the graph is compiled
+        once and every iteration re-evaluates only the nodes between the input
+        and the target, for all requested periods at once. The graph is not
+        modified. See :py:meth:`CompiledGraph.goal_seek` for the methods and
+        tolerances.
+
+        Args:
+            target_node: Node whose value is matched (e.g. a covenant ratio).
+            target_value: Goal, as a scalar or one value per period.
+            input_node: Item (or forecast history) node solved for.
+            period: One period, a list of periods, or ``None`` for every period.
+            input_period: Vary this period of the input instead of the solved one.
+            method: ``"secant"``, ``"newton"`` or ``"bisect"``.
+            bracket: ``(lower, upper)`` bounds for ``"bisect"``.
+            x0: Starting point(s) for ``"secant"`` / ``"newton"``.
+            tol: Relative residual tolerance.
+            max_iter: Maximum number of iterations.
+
+        Returns:
+            The solved input value for a single *period*, otherwise a Series
+            indexed by period.
+        """
+        periods = [period] if isinstance(period, str) else period
+        solved = self.compile([target_node, input_node]).goal_seek(
+            target_node,
+            target_value,
+            input_node,
+            periods,
+            input_period=input_period,
+            method=method,
+            bracket=bracket,
+            x0=x0,
+            tol=tol,
+            max_iter=max_iter,
+        )
+        return float(solved.iloc[0]) if isinstance(period, str) else solved
 
     # ------------------------------------------------------------------
     # Metric inspection helpers
@@ -0,0 +1,279 @@
+"""Declared circular references solved by fixed-point iteration.
+
+CircularOpsMixin lets a graph contain intentional loops such as interest on
+average debt. The nodes of a loop are declared as a
+:class:`~fin_statement_model.core.graph.services.CircularGroup`; cycle checks
+then accept cycles that stay inside one group, and every evaluation path
+(``calculate``, ``recalculate_all``, ``calculate_frame``) solves the group as
+a block by Gauss-Seidel / Anderson iteration once its external inputs are
+known. Nodes outside the groups are still evaluated once per period.
+
+Key responsibilities:
+    - Declare and remove circular groups
+    - Route member ``calculate`` calls to the group solver (per-instance shims)
+    - Solve a group over all graph periods and cache every converged member value
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023", "2024"])
+    >>> _ = g.add_financial_statement_item("Base", {"2023": 100.0, "2024": 200.0})
+    >>> _ = g.add_financial_statement_item("Bonus", {"2023": 0.0, "2024": 0.0})  # placeholder
+    >>> _ = g.add_calculation("Profit", ["Base", "Bonus"], "subtraction")
+    >>> _ = g.declare_circular(["Bonus", "Profit"], name="bonus_loop", tolerance=1e-12)
+    >>> _ = g.add_calculation(
+    ...     "Bonus", ["Profit"], "formula", formula="0.1 * input_0", formula_variable_names=["input_0"]
+    ... )
+    >>> [round(g.calculate("Profit", p), 6) for p in g.periods]
+    [90.909091, 181.818182]
+    >>> g.circular_groups["bonus_loop"].last_report.converged
+    True
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from fin_statement_model.core.errors import CalculationError, CircularDependencyError, FinStatementModelError
+from fin_statement_model.core.graph.services import CircularGroup, block_order
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from fin_statement_model.core.graph.services import ConvergenceReport
+    from fin_statement_model.core.nodes import Node
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["CircularOpsMixin"]
+
+
+class CircularOpsMixin:
+    """Declare intentional cycles and solve them as blocks."""
+
+    # Attributes injected by "GraphBaseMixin" at runtime (for static type checkers only).
+    _nodes: dict[str, Node]
+    _circular_groups: dict[str, CircularGroup]
+    _circular_shims: dict[str, Callable[[str], float]]
+    _cache: Any
+    _calc_engine: Any
+    _dependency_index: Any
+    periods: list[str]
+
+    # ------------------------------------------------------------------
+    # Declaration
+    # ------------------------------------------------------------------
+    def declare_circular(
+        self,
+        members: list[str],
+        name: str | None = None,
+        *,
+        tolerance: float = 1e-9,
+        max_iterations: int = 100,
+        method: str = "anderson",
+        memory: int = 5,
+        initial: float = 0.0,
+    ) -> CircularGroup:
+        """Allow *members* to depend on each other and solve them by fixed-point iteration.
+
+        Declare the group before closing the loop. Because nodes reference
+        their inputs directly, a loop is closed by first adding a placeholder
+        for one member (e.g. an item node), building the other members on
+        top of it, and then adding the real node under the placeholder's name;
+        dependents are re-pointed at the new node. Cycles are only accepted
+        if they stay inside one group, and a group's external inputs may not
+        depend on the group.
+
+        Args:
+            members: Names of the nodes in the loop; they need not exist yet.
+            name: Label of the group (default ``circular_<n>``).
+            tolerance: Convergence tolerance, relative to the size of the
+                values (absolute near zero).
+            max_iterations: Maximum number of Gauss-Seidel sweeps per solve.
+            method: ``"anderson"`` (accelerated, default) or ``"gauss_seidel"``.
+            memory: Number of previous sweeps mixed by Anderson acceleration.
+            initial: Starting value of each member the first time it is solved.
+
+        Returns:
+            The new :class:`~fin_statement_model.core.graph.services.CircularGroup`;
+            its ``last_report`` holds the convergence diagnostics of the latest solve.
+
+        Raises:
+            ValueError: If the name is taken, a member already belongs to a
+                group, or a solver setting is invalid.
+        """
+        if not isinstance(members, list) or not all(isinstance(member, str) for member in members):
+            raise TypeError("members must be a list of node names")
+        name = name or f"circular_{len(self._circular_groups) + 1}"
+        if name in self._circular_groups:
+            raise ValueError(f"A circular group named '{name}' already exists")
+        taken = self._circular_membership(present_only=False)
+        if clashes := [member for member in members if member in taken]:
+            raise ValueError(f"Nodes {clashes} already belong to a circular group")
+        group = CircularGroup(
+            name,
+            members,
+            tolerance=tolerance,
+            max_iterations=max_iterations,
+            method=method,
+            memory=memory,
+            initial=initial,
+        )
+        self._circular_groups[name] = group
+        for member in group.members:
+            if (node := self._nodes.get(member)) is not None:
+                self._attach_circular(node)
+                self.invalidate_dependents(member)  # type: ignore[attr-defined]
+        logger.info("Declared circular group '%s' with members %s", name, list(group.members))
+        return group
+
+    def remove_circular(self, name: str) -> CircularGroup:
+        """Drop the circular group *name*; its members become ordinary nodes again.
+
+        Raises:
+            KeyError: If no group has that name.
+            CircularDependencyError: If the members still form a cycle.
+        """
+        group = self._circular_groups[name]
+        members = [member for member in group.members if member in self._nodes]
+        remaining = {member: other for member, other in self._circular_membership().items() if other is not group}
+        block_order(members, self._dependency_index.dependencies, remaining)
+        del self._circular_groups[name]
+        for member in members:
+            self._detach_circular(self._nodes[member])
+            self.invalidate_dependents(member)  # type: ignore[attr-defined]
+        return group
+
+    @property
+    def circular_groups(self) -> dict[str, CircularGroup]:
+        """Declared circular groups by name."""
+        return dict(self._circular_groups)
+
+    def _circular_membership(self, *, present_only: bool = True) -> dict[str, CircularGroup]:
+        """Return member name -> group, for the members present in the graph by default."""
+        return {
+            member: group
+            for group in self._circular_groups.values()
+            for member in group.members
+            if not present_only or member in self._nodes
+        }
+
+    def _reset_circular(self, names: Iterable[str] | None = None) -> None:
+        """Let groups containing *names* (all groups when ``None``) retry failed periods."""
+        if not self._circular_groups:
+            return
+        if names is None:
+            for group in self._circular_groups.values():
+                group.reset()
+            return
+        membership = self._circular_membership(present_only=False)
+        for name in names:
+            if (group := membership.get(name)) is not None:
+                group.reset()
+
+    def _structural_cycle(
+        self,
+        roots: Iterable[str] | None = None,
+        overrides: dict[str, list[str]] | None = None,
+    ) -> list[str] | None:
+        """Return a cycle that leaves every circular group, or ``None``.
+
+        Args:
+            roots: Names whose dependency cone is checked (default: all nodes).
+            overrides: Dependencies to use instead of the indexed ones (for a
+                node about to be inserted).
+        """
+        index = self._dependency_index
+        overrides = overrides or {}
+
+        def dependencies(node_name: str) -> Iterable[str]:
+            return overrides[node_name] if node_name in overrides else index.dependencies(node_name)
+
+        membership = self._circular_membership()
+        membership.update(
+            (name, group) for name in overrides for group in self._circular_groups.values() if name in group.members
+        )
+        try:
+            block_order(self._nodes if roots is None else roots, dependencies, membership)
+        except CircularDependencyError as exc:
+            return exc.cycle
+        return None
+
+    # ------------------------------------------------------------------
+    # Member shims
+    # ------------------------------------------------------------------
+    def _attach_circular(self, node: Node) -> None:
+        """Route *node*'s ``calculate`` through its group's solver if it is a member."""
+        group = next((g for g in self._circular_groups.values() if node.name in g.members), None)
+        if group is None:
+            return
+        if (profiler := self._calc_engine.profiler) is not None:
+            profiler.release(node)
+
+        def calculate(period: str) -> float:
+            return self._circular_value(group, node, period)
+
+        # The group's solver replaces any earlier shim on the member
+        node.unshim_calculate()
+        node.shim_calculate(calculate)
+        self._circular_shims[node.name] = calculate
+
+    def _detach_circular(self, node: Node) -> None:
+        """Remove the shim installed by :meth:`_attach_circular`, if any."""
+        shim = self._circular_shims.get(node.name)
+        if shim is not None and node.calculate_shim is shim:
+            del self._circular_shims[node.name]
+            node.unshim_calculate()
+
+    def _circular_value(self, group: CircularGroup, node: Node, period: str) -> float:
+        """Return a member's value for *period*, solving its group on a cache miss."""
+        if group.solving:
+            return group.current(node.name, period)
+        cached = self._cache.lookup(node.name, period)
+        if cached is not None:
+            return float(cached)
+        if not group.failed(period):
+            self._solve_circular(group)
+            cached = self._cache.peek(node.name, period)
+            if cached is not None:
+                return float(cached)
+        report = group.last_report
+        raise CalculationError(
+            f"Circular group '{group.name}' did not converge",
+            node_id=node.name,
+            period=period,
+            details={
+                "iterations": report.iterations if report else 0,
+                "residual": report.residuals.get(period, np.nan) if report else np.nan,
+                "tolerance": group.tolerance,
+            },
+        )
+
+    def _solve_circular(self, group: CircularGroup) -> ConvergenceReport:
+        """Solve *group* over all graph periods and cache its converged values."""
+        periods = list(self.periods)
+        nodes = {member: self._nodes[member] for member in group.members if member in self._nodes}
+        external: dict[str, np.ndarray] = {}
+        for node in nodes.values():
+            for dep in node.get_dependencies():
+                if dep not in nodes and dep not in external:
+                    external[dep] = self._external_values(dep, periods)
+        values, report = group.solve(nodes, external, periods)
+        unconverged = set(report.unconverged)
+        for member, row in values.items():
+            for idx, period in enumerate(periods):
+                if period not in unconverged:
+                    self._cache.put(member, period, float(row[idx]))
+        return report
+
+    def _external_values(self, name: str, periods: list[str]) -> np.ndarray:
+        """Values of a group's external input over *periods* (NaN where it fails)."""
+        values = np.full(len(periods), np.nan)
+        for idx, period in enumerate(periods):
+            try:
+                values[idx] = float(self._calc_engine.calculate(name, period))
+            except FinStatementModelError as exc:
+                logger.debug("Input '%s' of a circular group failed for period '%s': %s", name, period, exc)
+        return values
@@ -20,6 +20,7 @@ Examples:
 
 from __future__ import annotations
 
+from collections.abc import Mapping, MutableMapping
 import contextlib
 import logging
 
@@ -63,8 +64,8 @@ class MergeReprMixin:
                 if (
                     hasattr(existing_node, "values")
                     and hasattr(other_node, "values")
-                    and isinstance(existing_node.values, dict)
-                    and isinstance(other_node.values, dict)
+                    and isinstance(existing_node.values, MutableMapping)
+                    and isinstance(other_node.values, Mapping)
                 ):
                     existing_node.values.update(other_node.values)
                     nodes_updated += 1
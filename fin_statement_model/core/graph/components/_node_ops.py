@@ -5,6 +5,7 @@ This includes adding, updating, replacing, and removing nodes, as well as settin
 
 Key responsibilities:
     - Add new financial statement item nodes
+    - Bulk-insert nodes with deferred validation (``add_nodes`` / ``batch``)
     - Update values for existing nodes
     - Proxy generic manipulator operations (add, remove, replace, set value)
     - Retrieve all financial statement item nodes
@@ -17,10 +18,18 @@ Examples:
     FinancialStatementItemNode(name='Revenue', ...)
     >>> [n.name for n in g.get_financial_statement_items()]
     ['Revenue']
+    >>> with g.batch():
+    ...     _ = g.add_calculation("Double", ["Revenue", "Revenue"], "addition")
+    ...     _ = g.add_financial_statement_item("Costs", {"2024": 50.0})
+    >>> g.topological_sort()
+    ['Revenue', 'Costs', 'Double']
+    >>> g.periods
+    ['2023', '2024']
 """
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
@@ -33,7 +42,7 @@ __all__: list[str] = ["NodeOpsMixin"]
 
 
 if TYPE_CHECKING:
-    from fin_statement_model.core.nodes import Node  # pragma: no cover
+    from collections.abc import Iterable, Iterator
 
 
 class NodeOpsMixin:
@@ -43,6 +52,8 @@ class NodeOpsMixin:
     # for the benefit of static type checkers (mypy) and have **no** runtime effect.
     manipulator: Any  # provided by GraphBaseMixin
     _add_node_with_validation: Any  # provided by GraphBaseMixin
+    _begin_batch: Any  # provided by GraphBaseMixin
+    _end_batch: Any  # provided by GraphBaseMixin
     add_periods: Any
 
     # -- Simple FS item helpers -------------------------------------------------
@@ -91,7 +102,9 @@ class NodeOpsMixin:
             raise TypeError("Values must be provided as a dict[str, float]")
 
         if replace_existing:
-            node.values = values.copy()
+            # Mutate in place so columnar-store rows keep backing the node
+            node.values.clear()
+            node.values.update(values)
         else:
             node.values.update(values)
         self.add_periods(list(values.keys()))
@@ -111,6 +124,85 @@ class NodeOpsMixin:
             if isinstance(node, FinancialStatementItemNode)
         ]
 
+    # -- Bulk construction -----------------------------------------------------
+    @contextmanager
+    def batch(self) -> Iterator[Any]:
+        """Stage node insertions and validate them together when the block exits.
+
+        Inside the block, ``add_node``, ``add_financial_statement_item``,
+        ``add_calculation`` and friends only register the node by name. On a
+        clean exit the batch commits in one pass each: missing-input checks,
+        a dependency-index rebuild with a single topological ordering and
+        cycle check, columnar-value attachment and a period merge. Node
+        objects may therefore reference inputs staged later in the same
+        batch (name-based helpers such as ``add_calculation`` still need
+        their inputs to be present already). If the block raises, or the commit
+        finds missing inputs or a cycle, every node staged by the batch is
+        removed again and displaced nodes are restored.
+
+        Structural queries (traversal, cycle checks) reflect staged nodes
+        only after the commit. Nested batches commit with the outermost one.
+
+        Yields:
+            The graph itself.
+
+        Raises:
+            NodeError: If a staged node references an input that does not exist at commit.
+            CircularDependencyError: If the staged nodes close a dependency cycle.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> from fin_statement_model.core.nodes import FinancialStatementItemNode
+            >>> g = Graph(periods=["2023"])
+            >>> with g.batch():
+            ...     for i in range(3):
+            ...         g.add_node(FinancialStatementItemNode(f"item_{i}", {"2023": float(i)}))
+            >>> sorted(g.nodes)
+            ['item_0', 'item_1', 'item_2']
+        """
+        self._begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self._end_batch(commit=False)
+            raise
+        self._end_batch(commit=True)
+
+    def add_nodes(self, nodes: Iterable[Node]) -> list[Node]:
+        """Add many nodes at once with deferred, whole-batch validation.
+
+        Equivalent to calling ``add_node`` for each node inside :meth:`batch`,
+        except that input existence and cycles are validated (once, at the
+        end) as for calculations added through the graph API, and the
+        periods of any item values are merged into the graph.
+
+        Args:
+            nodes: The nodes to add; inputs may refer to nodes later in the sequence.
+
+        Returns:
+            The added nodes, in the order given.
+
+        Raises:
+            TypeError: If an element is not a :class:`Node`.
+            NodeError: If a node references an input that is not in the graph after the insertion.
+            CircularDependencyError: If the nodes close a dependency cycle.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> from fin_statement_model.core.nodes import FinancialStatementItemNode
+            >>> g = Graph()
+            >>> added = g.add_nodes([FinancialStatementItemNode("Revenue", {"2023": 1.0})])
+            >>> g.periods
+            ['2023']
+        """
+        added: list[Node] = []
+        with self.batch():
+            for node in nodes:
+                if not isinstance(node, Node):
+                    raise TypeError(f"Object {node} is not a valid Node instance.")
+                added.append(self._add_node_with_validation(node))
+        return added
+
     # -- Generic manipulator proxies -------------------------------------------
     def add_node(self, node: Node) -> Any:
         return self.manipulator.add_node(node)
@@ -121,6 +213,9 @@ class NodeOpsMixin:
     def replace_node(self, node_name: str, new_node: Node) -> Any:
         return self.manipulator.replace_node(node_name, new_node)
 
+    def rename_node(self, old_name: str, new_name: str) -> Any:
+        return self.manipulator.rename_node(old_name, new_name)
+
     def has_node(self, node_id: str) -> Any:
         return self.manipulator.has_node(node_id)
 
@@ -65,6 +65,9 @@ class TraversalMixin:
     def get_dependency_graph(self) -> Any:
         return self.traverser.get_dependency_graph()  # type: ignore[attr-defined]
 
+    def cycle_groups(self) -> Any:
+        return self.traverser.cycle_groups()  # type: ignore[attr-defined]
+
     def detect_cycles(self) -> Any:
         return self.traverser.detect_cycles()  # type: ignore[attr-defined]
 
@@ -9,6 +9,7 @@ mix-ins, each providing a coherent set of features, including:
 - Discretionary adjustment support
 - Graph merging and representation
 - Read-only traversal, validation, and dependency inspection
+- Declared circular references solved by fixed-point iteration
 
 Features:
     * Add and update financial statement items with time-series values
@@ -20,6 +21,12 @@ Features:
     * Traverse and inspect graph structure: dependencies, successors, predecessors
     * Detect cycles and validate graph integrity
     * Perform topological sorts for ordered evaluations
+    * Evaluate whole timelines at once (``calculate_series`` / ``calculate_frame``)
+    * Compile a static graph into a frozen flat evaluator over input vectors (``compile()``)
+    * Optionally store item values in one columnar NumPy matrix (``columnar_values=True``)
+    * Bound the calculated-value cache (``cache_max_entries=...``) and inspect it (``cache_stats()``)
+    * Solve intentional circular references as declared groups (``declare_circular()``)
+    * Run scenarios as copy-on-write overlays over one shared base (``overlay()``)
 
 Examples:
     >>> from fin_statement_model.core.graph import Graph
@@ -52,11 +59,14 @@ import logging
 from fin_statement_model.core.graph.components import (
     AdjustmentMixin,
     CalcOpsMixin,
+    CircularOpsMixin,
     GraphBaseMixin,
     MergeReprMixin,
     NodeOpsMixin,
     TraversalMixin,
 )
+from fin_statement_model.core.graph.overlay import GraphOverlay
+from fin_statement_model.core.graph.services import CircularGroup, copy_nodes
 
 __all__: list[str] = ["Graph"]
 
@@ -70,6 +80,7 @@ class Graph(
     AdjustmentMixin,
     MergeReprMixin,
     TraversalMixin,
+    CircularOpsMixin,
 ):
     """Unified directed-graph abstraction for financial-statement modelling.
 
@@ -81,41 +92,106 @@ class Graph(
 
     # All functionality is provided by the mix-ins.
 
-    def clone(self, *, deep: bool = True) -> Graph:
+    def clone(self, *, deep: bool = True, copy_on_write: bool = False) -> Graph:
         """Return a cloned copy of the current graph.
 
+        The deep clone copies node objects directly (nothing is serialised)
+        and re-points their input references at the copies.
+
+        Copied from this graph:
+            - nodes, periods, adjustments and circular groups
+            - the dependency index and its topological order
+            - the columnar value store and the cache bound
+
+        Skipped:
+            - calculated values (the clone starts with an empty cache)
+            - input validation and cycle checks (this graph already passed them)
+
         Args:
             deep: If ``True`` (default) a *deep* copy containing **new** node
                 instances and adjustment objects is returned. When ``False`` a
                 shallow copy is produced which **shares** node objects with the
                 original graph.  The shallow variant is primarily useful for
                 quick read-only snapshots.
+            copy_on_write: With ``deep=True``, share item values with this
+                graph until either side writes to them
+                (:class:`~fin_statement_model.core.graph.services.SharedValues`)
+                and share the (frozen) adjustment objects, instead of copying
+                both up front. A columnar value store is always copied as one
+                matrix.
 
         Returns:
             Graph: A new :class:`Graph` instance replicating the structure and
             state of *self*.
+
+        Examples:
+            >>> g = Graph(periods=["2023"])
+            >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+            >>> _ = g.add_calculation("Double", ["Revenue"], "formula", formula="2 * Revenue")
+            >>> twin = g.clone(copy_on_write=True)
+            >>> twin.set_value("Revenue", "2023", 150.0)
+            >>> twin.calculate("Double", "2023"), g.calculate("Double", "2023")
+            (300.0, 200.0)
         """
-        # Lazy imports (avoid heavy IO modules during Graph import)
         import copy
 
         if not deep:
             return copy.copy(self)
 
-        # ------------------------------------------------------------------
-        # Deep clone via IO round-trip ensures a clean Graph reconstructor and
-        # avoids the complexities of manually copying nested node references.
-        # ------------------------------------------------------------------
-        from fin_statement_model.io import read_data, write_data
-
-        # Serialise to an in-memory graph-definition dictionary
-        graph_def = write_data("graph_definition_dict", self, target=None)
+        cloned = Graph(
+            periods=list(self.periods),
+            calc_engine_cls=type(self._calc_engine),
+            period_service_cls=type(self._period_service),
+            adjustment_service_cls=type(self._adjustment_service),
+            array_evaluator_cls=type(self._array_evaluator),
+            cache_max_entries=self._cache.max_entries,
+        )
+        # Groups first, so the batch commit routes their members to the solver
+        for name, group in self._circular_groups.items():
+            cloned._circular_groups[name] = CircularGroup(
+                name,
+                group.members,
+                tolerance=group.tolerance,
+                max_iterations=group.max_iterations,
+                method=group.method,
+                memory=group.memory,
+                initial=group.initial,
+            )
+        if self._value_store is not None:
+            cloned._value_store = self._value_store.copy()
+
+        copies = copy_nodes(self._nodes, copy_on_write=copy_on_write, value_store=cloned._value_store)
+        # Names map to the same dependencies, so the source's index (and its order) can be reused
+        cloned._adopt_nodes(copies, self._dependency_index.copy() if self._batch is None else None)
+
+        adjustments = self.list_all_adjustments()
+        if not copy_on_write:
+            # Adjustments are frozen models; only their tag sets can change in place
+            adjustments = [adj.model_copy(update={"tags": set(adj.tags)}) for adj in adjustments]
+        cloned.adjustment_manager.load_adjustments(adjustments)
+        return cloned
+
+    def overlay(self, name: str) -> GraphOverlay:
+        """Return a copy-on-write scenario overlay named *name* over this graph.
+
+        The overlay stores only its own item overrides and added or replaced
+        nodes, shadows the nodes downstream of them and delegates everything
+        else - values, structure and cached results - to this graph. Many
+        scenarios over one large base therefore cost little more than the base.
 
-        # Deserialise back into a *new* Graph instance
-        cloned_graph = read_data("graph_definition_dict", graph_def)
-
-        # Copy all adjustments (if any) - these are *not* included in the
-        # serialized graph definition because they are stored separately on the
-        # adjustment manager.  We simply deep-copy to preserve immutability.
-        cloned_graph.adjustment_manager.load_adjustments([copy.deepcopy(a) for a in self.list_all_adjustments()])
+        Args:
+            name: Scenario name.
 
-        return cloned_graph
+        Returns:
+            GraphOverlay: An empty overlay; edits to it never touch this graph.
+
+        Examples:
+            >>> g = Graph(periods=["2023"])
+            >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+            >>> _ = g.add_calculation("Double", ["Revenue"], "formula", formula="2 * Revenue")
+            >>> bull = g.overlay("bull")
+            >>> bull.set_value("Revenue", "2023", 150.0)
+            >>> bull.calculate("Double", "2023"), g.calculate("Double", "2023")
+            (300.0, 200.0)
+        """
+        return GraphOverlay(self, name)
@@ -8,7 +8,8 @@ are kept up-to-date after structural changes.
 Key responsibilities:
     1. Ensure new nodes are properly registered on the graph.
     2. Keep calculation-node input references up-to-date after structure changes.
-    3. Invalidate per-node and global caches whenever something that could affect results is modified.
+    3. Invalidate per-node and global caches whenever something that could affect results is modified,
+       limited to the dependents of an edited value (see :py:meth:`GraphManipulator.set_value`).
 
 Although you *can* instantiate `GraphManipulator` directly, in normal usage you retrieve it from an
 existing graph via the `manipulator` attribute.
@@ -35,11 +36,14 @@ prefer the higher-level convenience methods on `Graph` itself whenever possible.
 """
 
 import logging
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from fin_statement_model.core.errors import NodeError
 from fin_statement_model.core.nodes import CalculationNode, Node
 
+if TYPE_CHECKING:
+    from fin_statement_model.core.graph.services import InvalidationReport
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +56,9 @@ class GraphManipulator:
 
     Attributes:
         graph: The Graph instance this manipulator operates on.
+        last_invalidation: Report of the cache entries dropped by the latest ``set_value``.
+        invalidation_totals: Running counts of ``mutations``, invalidated ``nodes``
+            and invalidated cache ``entries`` across all ``set_value`` calls.
 
     Examples:
         >>> from fin_statement_model.core.graph import Graph
@@ -74,6 +81,9 @@ class GraphManipulator:
             graph: The Graph instance to manipulate.
         """
         self.graph = graph
+        # Outcome of the most recent set_value and running totals across all of them
+        self.last_invalidation: InvalidationReport | None = None
+        self.invalidation_totals: dict[str, int] = {"mutations": 0, "nodes": 0, "entries": 0}
 
     def add_node(self, node: Node) -> None:
         """Add a node to the graph, replacing any existing node with the same name.
@@ -92,9 +102,13 @@ class GraphManipulator:
         """
         if not isinstance(node, Node):
             raise TypeError(f"Object {node} is not a valid Node instance.")
+        if self.graph._batch is not None:
+            self.graph._stage_node(node)
+            return
         if self.has_node(node.name):
             self.remove_node(node.name)
         self.graph._nodes[node.name] = node
+        self.graph._on_node_added(node)
 
     def _update_calculation_nodes(self) -> None:
         """Refresh input references for all calculation nodes after structure changes.
@@ -121,6 +135,7 @@ class GraphManipulator:
                     logger.exception("Error updating inputs for node '%s'", nd.name)
                 except AttributeError:
                     logger.warning("Node '%s' has input_names but no 'inputs' attribute to update.", nd.name)
+        self.graph._rebuild_dependency_index()
 
     def get_node(self, name: str) -> Node | None:
         """Retrieve a node from the graph by its unique name.
@@ -159,6 +174,60 @@ class GraphManipulator:
             raise ValueError("New node name must match the name of the node being replaced.")
         self.remove_node(node_name)
         self.add_node(new_node)
+        self._rewire_dependents(new_node)
+
+    def rename_node(self, old_name: str, new_name: str) -> None:
+        """Rename a node in place, keeping its wiring, values and dependents.
+
+        The node object stays the same, so calculations that read from it
+        follow the new name. Its own cached results are dropped; adjustments
+        recorded under the old name are not moved.
+
+        Args:
+            old_name: Current name of the node.
+            new_name: Name to register it under.
+
+        Returns:
+            None
+
+        Raises:
+            NodeError: If `old_name` does not exist.
+            ValueError: If another node is already named `new_name`.
+
+        Examples:
+            >>> manipulator.rename_node("GrossProfit", "GP")
+        """
+        node = self.get_node(old_name)
+        if node is None:
+            raise NodeError(f"Node '{old_name}' not found, cannot rename.", node_id=old_name)
+        if new_name == old_name:
+            return
+        if self.has_node(new_name):
+            raise ValueError(f"Target node name '{new_name}' already exists in graph.")
+        self.graph._rename_node(node, new_name)
+
+    def _rewire_dependents(self, new_node: Node) -> None:
+        """Point the direct dependents of *new_node*'s name at the new instance.
+
+        Dependents are looked up in the graph's dependency index, so only the
+        nodes that actually read from the replaced node are visited. Cached
+        results of the node and of all its transitive dependents are dropped.
+        """
+        for dependent_name in self.graph._dependency_index.dependents(new_node.name):
+            dependent = self.get_node(dependent_name)
+            if dependent is None:
+                continue
+            # Forecast and statistical nodes hold a single ``input_node``
+            if getattr(getattr(dependent, "input_node", None), "name", None) == new_node.name:
+                dependent.input_node = new_node  # type: ignore[attr-defined]
+            inputs = getattr(dependent, "inputs", None)
+            if isinstance(inputs, dict):
+                for key, inp in inputs.items():
+                    if getattr(inp, "name", None) == new_node.name:
+                        inputs[key] = new_node
+            elif isinstance(inputs, list):
+                inputs[:] = [new_node if getattr(inp, "name", None) == new_node.name else inp for inp in inputs]
+        self.graph.invalidate_dependents(new_node.name)
 
     def has_node(self, node_id: str) -> bool:
         """Check if a node with the given ID exists.
@@ -188,11 +257,17 @@ class GraphManipulator:
         """
         if not self.has_node(node_name):
             return
-        self.graph._nodes.pop(node_name, None)
+        removed = self.graph._nodes.pop(node_name)
+        self.graph._on_node_removed(removed)
         self._update_calculation_nodes()
 
     def set_value(self, node_id: str, period: str, value: float) -> None:
-        """Set the value for a specific node and period, clearing all caches.
+        """Set the value for a specific node and period, invalidating dependent caches.
+
+        Only cached results of *node_id* and its transitive dependents are
+        dropped - restricted to *period* while the change flows through
+        period-local calculations. The outcome is stored as
+        :py:attr:`last_invalidation` and added to :py:attr:`invalidation_totals`.
 
         Args:
             node_id: The name of the node.
@@ -210,7 +285,7 @@ class GraphManipulator:
         Examples:
             >>> manipulator.set_value("Revenue", "2023", 1100.0)
         """
-        if period not in self.graph.periods:
+        if not self.graph.has_period(period):
             raise ValueError(f"Period '{period}' not in graph periods")
         nd = self.get_node(node_id)
         if not nd:
@@ -218,8 +293,12 @@ class GraphManipulator:
         if not hasattr(nd, "set_value"):
             raise TypeError(f"Node '{node_id}' of type {type(nd).__name__} does not support set_value.")
         nd.set_value(period, value)
-        # Clear all caches (node-level and central) after mutation.
-        self.graph.clear_all_caches()
+        # Drop only the cached results that can depend on the edited cell.
+        report = cast("InvalidationReport", self.graph.invalidate_dependents(node_id, [period]))
+        self.last_invalidation = report
+        self.invalidation_totals["mutations"] += 1
+        self.invalidation_totals["nodes"] += report.nodes_invalidated
+        self.invalidation_totals["entries"] += report.entries_invalidated
 
     def clear_all_caches(self) -> None:
         """Clear caches associated with individual nodes in the graph.
@@ -0,0 +1,471 @@
+"""Copy-on-write scenario overlays over a shared base :class:`~fin_statement_model.core.graph.graph.Graph`.
+
+A :class:`GraphOverlay` is a lightweight "what-if" layer on top of a base graph.
+It stores only what the scenario changes - overridden item values and nodes it
+adds or replaces - and delegates every other node to the base. Nodes downstream
+of a change are *shadowed*: the overlay holds shallow copies of them whose inputs
+point at the overlay's versions, and caches their results in its own
+:class:`~fin_statement_model.core.graph.services.ValueCache`. Everything upstream
+or beside the changes is evaluated (and cached) once, by the base graph, for all
+of its overlays.
+
+Key responsibilities:
+    1. Record item overrides and added / replaced nodes without touching the base.
+    2. Shadow exactly the base nodes downstream of those changes.
+    3. Keep a private calculation cache, invalidated only for the overlay's own
+       nodes downstream of an edit - in the overlay or in the base.
+    4. Materialise the scenario into a standalone graph (:meth:`GraphOverlay.to_graph`).
+
+Overlays are created with :meth:`Graph.overlay` and stay valid while the base
+changes: value edits in the base drop the affected overlay results, and structural
+edits make the overlay re-derive its shadows on next use.
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023"])
+    >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+    >>> _ = g.add_financial_statement_item("COGS", {"2023": 60.0})
+    >>> _ = g.add_calculation("GrossProfit", ["Revenue", "COGS"], "subtraction")
+    >>> downside = g.overlay("downside")
+    >>> downside.set_value("Revenue", "2023", 80.0)
+    >>> downside.calculate("GrossProfit", "2023"), g.calculate("GrossProfit", "2023")
+    (20.0, 40.0)
+    >>> sorted(downside.owned_nodes)
+    ['GrossProfit', 'Revenue']
+"""
+
+from __future__ import annotations
+
+from collections import ChainMap
+import logging
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from fin_statement_model.core.errors import (
+    CalculationError,
+    CircularDependencyError,
+    ConfigurationError,
+    GraphError,
+    NodeError,
+)
+from fin_statement_model.core.graph.services import ValueCache, copy_nodes
+from fin_statement_model.core.node_factory import NodeFactory
+from fin_statement_model.core.nodes import FinancialStatementItemNode, Node
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from fin_statement_model.core.graph.graph import Graph
+    from fin_statement_model.core.graph.services import CacheStats
+
+__all__: list[str] = ["GraphOverlay"]
+
+logger = logging.getLogger(__name__)
+
+
+def _repoint(node: Node, target: Callable[[Node], Node | None]) -> None:
+    """Replace each input reference of *node* for which *target* returns a node."""
+    reference = getattr(node, "input_node", None)
+    if isinstance(reference, Node) and (replacement := target(reference)) is not None:
+        node.input_node = replacement  # type: ignore[attr-defined]
+    inputs = getattr(node, "inputs", None)
+    if isinstance(inputs, dict):
+        node.inputs = {key: target(inp) or inp if isinstance(inp, Node) else inp for key, inp in inputs.items()}  # type: ignore[attr-defined]
+    elif isinstance(inputs, list):
+        node.inputs = [target(inp) or inp if isinstance(inp, Node) else inp for inp in inputs]  # type: ignore[attr-defined]
+
+
+class GraphOverlay:
+    """Scenario view of a base graph that stores only its differences.
+
+    Attributes:
+        name: Scenario name.
+        base: The graph this overlay reads through to.
+
+    Examples:
+        >>> from fin_statement_model.core.graph import Graph
+        >>> g = Graph(periods=["2023"])
+        >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+        >>> upside = g.overlay("upside")
+        >>> _ = upside.add_calculation("Double", ["Revenue"], "formula", formula="2 * Revenue")
+        >>> upside.calculate("Double", "2023"), g.has_node("Double")
+        (200.0, False)
+    """
+
+    def __init__(self, base: Graph, name: str) -> None:
+        """Create an empty overlay over *base*; prefer :meth:`Graph.overlay`."""
+        self.name = name
+        self.base = base
+        # item name -> overridden period values; read before the base node's own values
+        self._overrides: dict[str, dict[str, float]] = {}
+        # Nodes added by the overlay, including replacements of base nodes
+        self._added: dict[str, Node] = {}
+        # added name -> names it reads from, and the reverse
+        self._added_dependencies: dict[str, list[str]] = {}
+        self._added_dependents: dict[str, list[str]] = {}
+        # Every node the overlay evaluates itself: shadows of affected base nodes plus added nodes
+        self._local: dict[str, Node] = {}
+        self._cache = ValueCache(max_entries=base.cache_stats().max_entries)
+        self._stale = False
+        base._overlays.add(self)
+
+    def __repr__(self) -> str:
+        """Return the scenario name and the size of its differences."""
+        return (
+            f"<GraphOverlay(name={self.name!r}, overrides={len(self._overrides)}, "
+            f"added={len(self._added)}, owned={len(self._local)})>"
+        )
+
+    # ------------------------------------------------------------------
+    # Read access
+    # ------------------------------------------------------------------
+    @property
+    def periods(self) -> list[str]:
+        """The base graph's periods."""
+        return self.base.periods
+
+    @property
+    def nodes(self) -> Mapping[str, Node]:
+        """Read-only view of every node visible in the scenario (own nodes first)."""
+        self._refresh()
+        return MappingProxyType(ChainMap(self._local, self.base.nodes))
+
+    @property
+    def owned_nodes(self) -> Mapping[str, Node]:
+        """Read-only view of the nodes the overlay evaluates itself."""
+        self._refresh()
+        return MappingProxyType(self._local)
+
+    @property
+    def overrides(self) -> dict[str, dict[str, float]]:
+        """Copy of the overridden item values, by item name and period."""
+        return {name: dict(values) for name, values in self._overrides.items()}
+
+    def get_node(self, name: str) -> Node | None:
+        """Return the scenario's node *name* (its own version if it owns one)."""
+        self._refresh()
+        node = self._local.get(name)
+        return node if node is not None else self.base.get_node(name)
+
+    def has_node(self, name: str) -> bool:
+        """Return ``True`` if *name* exists in the overlay or its base."""
+        return name in self._added or self.base.has_node(name)
+
+    def calculate(self, node_name: str, period: str) -> float:
+        """Calculate *node_name* for *period* in the scenario.
+
+        Nodes the overlay does not own are calculated (and cached) by the base graph.
+
+        Raises:
+            NodeError: If the node exists neither in the overlay nor in the base.
+            CalculationError: If the calculation fails.
+        """
+        self._refresh()
+        node = self._local.get(node_name)
+        if node is None:
+            if not self.base.has_node(node_name):
+                raise NodeError(f"Node '{node_name}' not found in overlay '{self.name}'", node_id=node_name)
+            return float(self.base.calculate(node_name, period))
+        bound = self._cache.is_bound(node_name)
+        if not bound:
+            cached = self._cache.lookup(node_name, period)
+            if cached is not None:
+                return cached
+        try:
+            value = node.calculate(period)
+        except (NodeError, ConfigurationError, CalculationError, ValueError, KeyError, ZeroDivisionError) as exc:
+            logger.exception(
+                "Error calculating node '%s' for period '%s' in overlay '%s'", node_name, period, self.name
+            )
+            raise CalculationError(
+                message=f"Failed to calculate node '{node_name}' in overlay '{self.name}'",
+                node_id=node_name,
+                period=period,
+                details={"original_error": str(exc)},
+            ) from exc
+        if not bound:
+            self._cache.put(node_name, period, value)
+        return value
+
+    def cache_stats(self) -> CacheStats:
+        """Return the statistics of the overlay's own calculation cache."""
+        return self._cache.stats()
+
+    def clear_cache(self) -> None:
+        """Drop every result calculated by the overlay."""
+        self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Scenario edits
+    # ------------------------------------------------------------------
+    def set_value(self, node_name: str, period: str, value: float) -> None:
+        """Override the value of item *node_name* for *period* in the scenario.
+
+        Raises:
+            ValueError: If *period* is not a base graph period.
+            NodeError: If the node does not exist.
+            TypeError: If the node does not support setting a value.
+        """
+        if not self.base.has_period(period):
+            raise ValueError(f"Period '{period}' not in graph periods")
+        if node_name in self._added:
+            node = self._added[node_name]
+            if not hasattr(node, "set_value"):
+                raise TypeError(f"Node '{node_name}' of type {type(node).__name__} does not support set_value.")
+            node.set_value(period, value)
+        elif node_name in self._overrides:
+            self._overrides[node_name][period] = float(value)
+        else:
+            node = self.base.get_node(node_name)
+            if node is None:
+                raise NodeError(message=f"Node '{node_name}' does not exist", node_id=node_name)
+            if not isinstance(node, FinancialStatementItemNode):
+                raise TypeError(f"Node '{node_name}' of type {type(node).__name__} does not support set_value.")
+            self._overrides[node_name] = {period: float(value)}
+            self._restructure(lambda: self._overrides.pop(node_name))
+            return
+        self._invalidate(node_name, [period])
+
+    def add_node(self, node: Node) -> Node:
+        """Add *node* to the scenario, replacing any base or overlay node of the same name.
+
+        Input references may point at base nodes or at the overlay's nodes; the
+        overlay wires them to the scenario's version of each input.
+
+        Raises:
+            TypeError: If *node* is not a :class:`Node`.
+            CircularDependencyError: If the node would close a dependency cycle.
+        """
+        if not isinstance(node, Node):
+            raise TypeError(f"Object {node} is not a valid Node instance.")
+        previous = self._added.get(node.name)
+        override = self._overrides.get(node.name)
+        self._added[node.name] = node
+        self._overrides.pop(node.name, None)
+
+        def undo() -> None:
+            if previous is None:
+                del self._added[node.name]
+            else:
+                self._added[node.name] = previous
+            if override is not None:
+                self._overrides[node.name] = override
+
+        self._restructure(undo)
+        return node
+
+    def add_financial_statement_item(self, name: str, values: dict[str, float]) -> FinancialStatementItemNode:
+        """Add (or replace) an item node holding *values* in the scenario."""
+        if not isinstance(values, dict):
+            raise TypeError("Values must be provided as a dict[str, float]")
+        node = NodeFactory().create_financial_statement_item(name=name, values=values.copy())
+        self.add_node(node)
+        return node
+
+    def add_calculation(
+        self,
+        name: str,
+        input_names: list[str],
+        operation_type: str,
+        formula_variable_names: list[str] | None = None,
+        **calculation_kwargs: Any,
+    ) -> Node:
+        """Add (or replace) a calculation node in the scenario; see :meth:`Graph.add_calculation`.
+
+        Raises:
+            NodeError: If an input exists neither in the overlay nor in the base.
+        """
+        if not isinstance(input_names, list):
+            raise TypeError("input_names must be a list of node names.")
+        if operation_type == "formula" and formula_variable_names is None:
+            formula_variable_names = input_names.copy()
+        inputs = []
+        for input_name in input_names:
+            input_node = self.get_node(input_name)
+            if input_node is None:
+                raise NodeError(f"Input node '{input_name}' not found in overlay '{self.name}'", node_id=name)
+            inputs.append(input_node)
+        node = NodeFactory().create_calculation_node(
+            name=name,
+            inputs=inputs,
+            calculation_type=operation_type,
+            formula_variable_names=formula_variable_names,
+            **calculation_kwargs,
+        )
+        return self.add_node(node)
+
+    def revert(self, node_name: str, period: str | None = None) -> None:
+        """Undo the scenario's change to *node_name* (one overridden *period*, or all of it).
+
+        Raises:
+            NodeError: If the overlay does not change *node_name*.
+        """
+        if node_name in self._added and period is None:
+            node = self._added.pop(node_name)
+            self._restructure(lambda: self._added.__setitem__(node_name, node))
+            return
+        values = self._overrides.get(node_name)
+        if values is None:
+            raise NodeError(f"Overlay '{self.name}' does not override this node", node_id=node_name)
+        if period is not None and (period not in values or len(values) > 1):
+            values.pop(period, None)
+            self._invalidate(node_name, [period])
+            return
+        del self._overrides[node_name]
+        self._restructure(lambda: self._overrides.__setitem__(node_name, values))
+
+    def to_graph(self) -> Graph:
+        """Materialise the scenario as a standalone graph (a copy-on-write clone of the base)."""
+        self._refresh()
+        graph = self.base.clone(copy_on_write=True)
+        if self._added:
+            copies = copy_nodes(self._added, copy_references=False)
+            base_nodes = self.base.nodes
+
+            def target(reference: Node) -> Node | None:
+                name = reference.name
+                if base_nodes.get(name) is reference or self._local.get(name) is reference:
+                    return graph.get_node(name)
+                return None
+
+            for node in copies.values():
+                _repoint(node, target)
+            with graph.batch():
+                for node in copies.values():
+                    graph.add_node(node)
+        for name, values in self._overrides.items():
+            for period, value in values.items():
+                graph.set_value(name, period, value)
+        return graph
+
+    # ------------------------------------------------------------------
+    # Base graph notifications
+    # ------------------------------------------------------------------
+    def _base_values_changed(self, node_name: str, periods: Iterable[str] | None) -> None:
+        """Drop own results that read *node_name* after it changed in the base."""
+        if self._local and not self._stale:
+            self._invalidate(node_name, periods)
+
+    def _base_structure_changed(self) -> None:
+        """Re-derive the shadowed nodes on next use after the base was re-wired."""
+        self._stale = True
+        self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Shadowing & invalidation
+    # ------------------------------------------------------------------
+    def _refresh(self) -> None:
+        if self._stale:
+            self._rebuild()
+
+    def _restructure(self, undo: Callable[[], Any]) -> None:
+        """Rebuild after a change of overrides or added nodes, calling *undo* if that fails."""
+        try:
+            self._rebuild()
+        except Exception:
+            undo()
+            self._rebuild()
+            raise
+
+    def _dependents(self, name: str) -> list[str]:
+        """Names reading from *name* in the scenario."""
+        added = self._added
+        names = [dependent for dependent in self.base._dependency_index.dependents(name) if dependent not in added]
+        names.extend(self._added_dependents.get(name, ()))
+        return names
+
+    def _rebuild(self) -> None:
+        """Shadow every base node downstream of an override or an added node."""
+        base_nodes = self.base.nodes
+        for name in [
+            name for name in self._overrides if not isinstance(base_nodes.get(name), FinancialStatementItemNode)
+        ]:
+            logger.warning("Dropping override of '%s' in overlay '%s': no longer an item in the base", name, self.name)
+            del self._overrides[name]
+        self._added_dependencies = {name: self.base._dependency_names(node) for name, node in self._added.items()}
+        self._added_dependents = {}
+        for name, dependencies in self._added_dependencies.items():
+            for dependency in dict.fromkeys(dependencies):
+                self._added_dependents.setdefault(dependency, []).append(name)
+
+        affected: dict[str, None] = {}
+        stack = [*self._overrides, *self._added]
+        while stack:
+            name = stack.pop()
+            if name in affected:
+                continue
+            affected[name] = None
+            stack.extend(self._dependents(name))
+        if name := next((name for name in self._added if name in self._upstream_of(name)), None):
+            raise CircularDependencyError(
+                f"Node '{name}' would depend on itself in overlay '{self.name}'", cycle=[name]
+            )
+        membership = self.base._circular_membership()
+        if looped := sorted(name for name in affected if name in membership and name not in self._added):
+            raise GraphError(f"Overlay '{self.name}' cannot shadow members of circular groups", nodes=looped)
+
+        shadows = copy_nodes(
+            {name: base_nodes[name] for name in affected if name not in self._added and name in base_nodes},
+            copy_references=False,
+        )
+        for name, values in self._overrides.items():
+            shadows[name].values = ChainMap(values, base_nodes[name].values)  # type: ignore[attr-defined]
+        previous = self._local
+        local: dict[str, Node] = {**shadows, **self._added}
+
+        def target(reference: Node) -> Node | None:
+            # Only references to the graph-level node of a name move; hidden inputs (a forecast's history) stay
+            name = reference.name
+            if base_nodes.get(name) is not reference and previous.get(name) is not reference:
+                return None
+            replacement = local.get(name, base_nodes.get(name))
+            return replacement if replacement is not reference else None
+
+        for node in local.values():
+            _repoint(node, target)
+        self._cache.clear()
+        for name, node in local.items():
+            if node.bind_cache(self._cache.bind(name)) is None:
+                self._cache.release(name)
+        self._local = local
+        self._stale = False
+        logger.debug("Overlay '%s' shadows %d of %d nodes", self.name, len(local), len(base_nodes))
+
+    def _upstream_of(self, name: str) -> set[str]:
+        """Names *name* transitively reads from in the scenario."""
+        seen: set[str] = set()
+        stack = list(self._added_dependencies.get(name, ()))
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            if current in self._added_dependencies:
+                stack.extend(self._added_dependencies[current])
+            else:
+                stack.extend(self.base._dependency_index.dependencies(current))
+        return seen
+
+    def _invalidate(self, node_name: str, periods: Iterable[str] | None) -> None:
+        """Drop own results of *node_name* and everything downstream of it for *periods*.
+
+        Scopes come from the base graph's :meth:`DependencyIndex.affected`, walked
+        over the scenario's edges: only the edited periods are dropped while the
+        change flows through period-local nodes; other nodes lose every period.
+        """
+
+        def is_period_local(name: str) -> bool:
+            node = self._local.get(name) or self.base.get_node(name)
+            return node is not None and node.is_period_local()
+
+        scopes = self.base._dependency_index.affected(
+            node_name, periods, is_period_local=is_period_local, dependents=self._dependents
+        )
+        entries = 0
+        for name, scope in scopes.items():
+            node = self._local.get(name)
+            if node is None:
+                continue
+            entries += self._cache.invalidate(name, scope)
+            entries += node.invalidate_cache(scope)
+        logger.debug("Overlay '%s' invalidated %d entries after change to '%s'", self.name, entries, node_name)
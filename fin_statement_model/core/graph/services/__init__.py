@@ -6,7 +6,22 @@ is designed to be independent of the Graph and reusable in other contexts (e.g.,
 | Service Class         | Responsibility / Features                                 |
 |----------------------|----------------------------------------------------------|
 | CalculationEngine    | Orchestrates node calculations and manages calculation cache |
+| RecalcReport         | Structured outcome (failures, counts) of a full recalculation |
+| ArrayEvaluator       | Evaluates nodes over whole timelines with NumPy arrays    |
+| CompiledGraph        | Frozen flat evaluation program over period arrays         |
+| CircularGroup        | Declared loop solved by Gauss-Seidel / Anderson iteration |
+| ConvergenceReport    | Iterations and per-period residuals of a circular solve   |
+| EntityResults        | Entity x node x period results of a multi-entity evaluation |
+| ScenarioResults      | Scenario x node x period results of adjustment scenarios  |
+| SimulationResults    | Monte Carlo path x node x period results with risk summaries |
+| ColumnarValueStore   | Optional nodes x periods matrix holding item values       |
+| SharedValues         | Copy-on-write item values shared between cloned graphs    |
+| ValueCache           | Single bounded (LRU) cache of calculated values with stats |
+| DependencyIndex      | Maintained dependency / reverse-dependency adjacency      |
+| EvaluationProfiler   | Opt-in per-node call counts, cache hits and timings       |
+| MemoryReport         | Approximate bytes by component and node type              |
 | PeriodService        | Manages unique, sorted periods and period validation      |
+| PeriodIndex          | Interned immutable period table with integer ordinals     |
 | AdjustmentService    | Encapsulates adjustment storage and application logic     |
 
 These services are composed into the Graph to provide modular, testable, and extensible support for
@@ -16,11 +31,50 @@ calculation, period, and adjustment management.
 from __future__ import annotations
 
 from .adjustment_service import AdjustmentService
-from .calculation_engine import CalculationEngine
+from .array_evaluator import ArrayEvaluator
+from .calculation_engine import CalculationEngine, RecalcFailure, RecalcReport
+from .circular import CircularGroup, ConvergenceReport, block_order
+from .compiled_graph import CompiledGraph
+from .dependency_index import DependencyIndex, InvalidationReport
+from .entity_batch import BatchResults, EntityResults
+from .graph_copy import SharedValues, copy_nodes
+from .memory_report import MemoryReport, NodeTypeMemory, deep_sizeof
+from .period_index import PeriodIndex, PeriodKey
 from .period_service import PeriodService
+from .profiler import EvaluationProfiler
+from .scenario_batch import ScenarioResults
+from .simulation import SimulationResults
+from .value_cache import CachedValues, CacheStats, ValueCache
+from .value_store import ColumnarValues, ColumnarValueStore
 
 __all__: list[str] = [
     "AdjustmentService",
+    "ArrayEvaluator",
+    "BatchResults",
+    "CacheStats",
+    "CachedValues",
     "CalculationEngine",
+    "CircularGroup",
+    "ColumnarValueStore",
+    "ColumnarValues",
+    "CompiledGraph",
+    "ConvergenceReport",
+    "DependencyIndex",
+    "EntityResults",
+    "EvaluationProfiler",
+    "InvalidationReport",
+    "MemoryReport",
+    "NodeTypeMemory",
+    "PeriodIndex",
+    "PeriodKey",
     "PeriodService",
+    "RecalcFailure",
+    "RecalcReport",
+    "ScenarioResults",
+    "SharedValues",
+    "SimulationResults",
+    "ValueCache",
+    "block_order",
+    "copy_nodes",
+    "deep_sizeof",
 ]
@@ -10,6 +10,7 @@ Key responsibilities:
     - Retrieve and filter adjustments by scenario or tags
     - Clear all adjustments
     - Check if a value was adjusted
+    - Expose the manager for scenario-batched evaluation
 
 Examples:
     >>> from fin_statement_model.core.graph.services.adjustment_service import AdjustmentService
@@ -50,6 +51,11 @@ class AdjustmentService:  # pylint: disable=too-few-public-methods
         """
         self._manager: AdjustmentManager = manager or AdjustmentManager()
 
+    @property
+    def manager(self) -> AdjustmentManager:
+        """The underlying :class:`AdjustmentManager`."""
+        return self._manager
+
     # ------------------------------------------------------------------
     # Delegate helpers (minimal implementations) -----------------------
     # ------------------------------------------------------------------
@@ -0,0 +1,267 @@
+"""Whole-timeline (vectorized) evaluation of graph nodes.
+
+ArrayEvaluator is an isolated service that evaluates nodes for *all* requested
+periods at once. Instead of recursing through ``node.calculate(period)`` for
+every node/period pair, it walks the dependency cone of the requested nodes
+once in topological order and asks each node for its whole timeline via
+:py:meth:`~fin_statement_model.core.nodes.base.Node.calculate_vector`, passing
+the already evaluated arrays of its dependencies.
+
+Key responsibilities:
+    - Resolve the dependency cone of the requested nodes in topological order
+    - Evaluate every node once over a NumPy period axis
+    - Report per-cell failures (missing data, division by zero) as NaN
+    - Fall back to per-period ``calculate`` for node types without an array kernel
+    - Solve declared circular groups as blocks over the whole timeline
+    - Present results as NumPy arrays, pandas Series or DataFrames
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023", "2024"])
+    >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0, "2024": 120.0})
+    >>> _ = g.add_financial_statement_item("COGS", {"2023": 60.0, "2024": 0.0})
+    >>> _ = g.add_calculation("Markup", ["Revenue", "COGS"], "division")
+    >>> g.calculate_series("Markup").tolist()
+    [1.6666666666666667, nan]
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from fin_statement_model.core.errors import (
+    CalculationError,
+    CircularDependencyError,
+    FinStatementModelError,
+    NodeError,
+)
+from fin_statement_model.core.graph.services.circular import block_order
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    from fin_statement_model.core.graph.services.circular import CircularGroup
+    from fin_statement_model.core.nodes import Node
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["ArrayEvaluator"]
+
+
+class ArrayEvaluator:
+    """Evaluate nodes over whole period timelines using NumPy arrays.
+
+    Args:
+        node_resolver: Callable returning the node registered under a name (or ``None``).
+        period_provider: Zero-arg callable returning the graph's sorted periods.
+        node_names_provider: Zero-arg callable returning all node names.
+        circular_groups: Optional zero-arg callable returning member name ->
+            :class:`CircularGroup` for the declared circular groups.
+    """
+
+    def __init__(
+        self,
+        *,
+        node_resolver: Callable[[str], Node | None],
+        period_provider: Callable[[], list[str]],
+        node_names_provider: Callable[[], list[str]],
+        circular_groups: Callable[[], Mapping[str, CircularGroup]] | None = None,
+    ) -> None:
+        """Instantiate an ArrayEvaluator detached from the public Graph API."""
+        self._node_resolver = node_resolver
+        self._period_provider = period_provider
+        self._node_names_provider = node_names_provider
+        self._circular_groups = circular_groups
+
+    # ------------------------------------------------------------------
+    # Ordering
+    # ------------------------------------------------------------------
+    def evaluation_order(self, node_names: Iterable[str]) -> list[str]:
+        """Return *node_names* and all their dependencies in topological order.
+
+        Args:
+            node_names: Names of the nodes to evaluate.
+
+        Members of a declared circular group are listed together, after the
+        group's external dependencies.
+
+        Returns:
+            Node names such that every node appears after its dependencies.
+
+        Raises:
+            NodeError: If a node or one of its dependencies does not exist.
+            CircularDependencyError: If the dependency cone contains a cycle
+                that is not contained in one circular group.
+        """
+        if groups := self._groups():
+            return block_order(node_names, self._dependencies, groups)
+        order: list[str] = []
+        done: set[str] = set()
+        on_path: set[str] = set()
+
+        for root in node_names:
+            if root in done:
+                continue
+            # Iterative post-order DFS: (name, dependencies, next dependency index)
+            stack: list[tuple[str, list[str], int]] = [(root, self._dependencies(root), 0)]
+            on_path.add(root)
+            while stack:
+                name, deps, pos = stack[-1]
+                if pos < len(deps):
+                    stack[-1] = (name, deps, pos + 1)
+                    dep = deps[pos]
+                    if dep in done:
+                        continue
+                    if dep in on_path:
+                        path = [entry[0] for entry in stack]
+                        cycle = [*path[path.index(dep) :], dep]
+                        raise CircularDependencyError(f"Circular dependency detected involving '{dep}'", cycle=cycle)
+                    stack.append((dep, self._dependencies(dep), 0))
+                    on_path.add(dep)
+                    continue
+                stack.pop()
+                on_path.discard(name)
+                done.add(name)
+                order.append(name)
+        return order
+
+    def _resolve(self, name: str) -> Node:
+        node = self._node_resolver(name)
+        if node is None:
+            raise NodeError(f"Node '{name}' not found", node_id=name)
+        return node
+
+    def _dependencies(self, name: str) -> list[str]:
+        return self._resolve(name).get_dependencies()
+
+    def _groups(self) -> Mapping[str, CircularGroup]:
+        return self._circular_groups() if self._circular_groups is not None else {}
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    def timeline(self, periods: Sequence[str] | None = None) -> list[str]:
+        """Return the period axis used to evaluate *periods*.
+
+        The graph's own periods are always included so nodes that look at
+        other periods (forecasts, YoY growth, …) find them; periods requested
+        in addition are merged in sorted order.
+        """
+        graph_periods = list(self._period_provider())
+        if periods is None:
+            return graph_periods
+        if isinstance(periods, str):
+            raise TypeError("periods must be a sequence of period identifiers, not a string")
+        extra = set(periods).difference(graph_periods)
+        return sorted([*graph_periods, *extra]) if extra else graph_periods
+
+    def evaluate(self, node_names: Iterable[str], periods: Sequence[str]) -> dict[str, np.ndarray]:
+        """Evaluate *node_names* (and their dependencies) over *periods*.
+
+        Args:
+            node_names: Nodes to evaluate.
+            periods: The period axis; every returned array has ``len(periods)`` cells.
+
+        Returns:
+            Mapping of every node in the dependency cone to a read-only float array.
+
+        Raises:
+            NodeError: If a node does not exist.
+            CircularDependencyError: If the dependency cone contains a cycle.
+            CalculationError: If a node cannot be evaluated at all (e.g. an
+                invalid formula). Per-period failures become NaN instead.
+        """
+        periods = list(periods)
+        shape = (len(periods),)
+        results: dict[str, np.ndarray] = {}
+        groups = self._groups()
+        for name in self.evaluation_order(node_names):
+            if name in groups:
+                if name not in results:
+                    results.update(self._solve_group(groups[name], groups, results, periods))
+                continue
+            node = self._resolve(name)
+            inputs = [results[dep] for dep in node.get_dependencies()]
+            try:
+                values = node.calculate_vector(inputs, periods)
+            except NotImplementedError:
+                values = self._calculate_per_period(node, periods)
+            except (FinStatementModelError, ValueError, TypeError, KeyError, ArithmeticError) as exc:
+                raise CalculationError(
+                    f"Failed to evaluate node '{name}' over {len(periods)} periods",
+                    node_id=name,
+                    details={"node_type": type(node).__name__, "original_error": str(exc)},
+                ) from exc
+
+            array = np.asarray(values, dtype=float)
+            if array.shape != shape:
+                array = np.array(np.broadcast_to(array, shape))
+            array.flags.writeable = False
+            results[name] = array
+        return results
+
+    def _solve_group(
+        self,
+        group: CircularGroup,
+        groups: Mapping[str, CircularGroup],
+        results: Mapping[str, np.ndarray],
+        periods: list[str],
+    ) -> dict[str, np.ndarray]:
+        """Solve a circular group from its already evaluated external inputs.
+
+        Periods that do not converge are NaN, like any other failed cell.
+        """
+        nodes = {name: self._resolve(name) for name in group.members if groups.get(name) is group}
+        external = {dep: results[dep] for node in nodes.values() for dep in node.get_dependencies() if dep not in nodes}
+        values, _ = group.solve(nodes, external, periods)
+        for array in values.values():
+            array.flags.writeable = False
+        return values
+
+    @staticmethod
+    def _calculate_per_period(node: Node, periods: Sequence[str]) -> np.ndarray:
+        """Scalar fallback for nodes without a vectorized implementation."""
+        logger.debug("Node '%s' (%s) has no array kernel; evaluating per period.", node.name, type(node).__name__)
+        values = np.full(len(periods), np.nan)
+        for idx, period in enumerate(periods):
+            try:
+                values[idx] = float(node.calculate(period))
+            except (FinStatementModelError, ValueError, TypeError, KeyError, ArithmeticError) as exc:
+                logger.debug("Node '%s' failed for period '%s': %s", node.name, period, exc)
+        return values
+
+    # ------------------------------------------------------------------
+    # pandas presentation
+    # ------------------------------------------------------------------
+    def series(self, node_name: str, periods: Sequence[str] | None = None) -> pd.Series:
+        """Evaluate one node over a timeline and return it as a Series indexed by period."""
+        return self.frame([node_name], periods).iloc[0]
+
+    def frame(
+        self,
+        node_names: Sequence[str] | None = None,
+        periods: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """Evaluate several nodes over a timeline.
+
+        Args:
+            node_names: Nodes to include as rows. Defaults to every node.
+            periods: Periods to include as columns, in the given order.
+                Defaults to all graph periods.
+
+        Returns:
+            DataFrame with node names as index and periods as columns.
+        """
+        if node_names is None:
+            node_names = self._node_names_provider()
+        names = list(node_names)
+        timeline = self.timeline(periods)
+        results = self.evaluate(names, timeline)
+        columns = timeline if periods is None else list(periods)
+        data = np.stack([results[name] for name in names]) if names else np.empty((0, len(timeline)))
+        frame = pd.DataFrame(data, index=pd.Index(names, name="node"), columns=pd.Index(timeline, name="period"))
+        return frame if columns == timeline else frame.loc[:, columns]
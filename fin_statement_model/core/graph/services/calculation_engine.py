@@ -6,7 +6,11 @@ of calculation nodes and metrics. All calculation logic is delegated here from t
 
 Key responsibilities:
     - Calculate node values for specific periods
-    - Manage a central calculation cache
+    - Recalculate the whole graph in one dependency-ordered pass and report
+      failures in a :class:`RecalcReport`
+    - Read and write the graph's single :class:`ValueCache`, shared with the
+      result caches of the nodes themselves
+    - Optionally profile evaluation per node (:class:`EvaluationProfiler`)
     - Add calculation nodes and metrics
     - Support custom calculation functions
     - Change calculation methods for nodes
@@ -41,8 +45,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from pydantic import BaseModel, ConfigDict
+
+from fin_statement_model.core.graph.services.profiler import EvaluationProfiler
+from fin_statement_model.core.graph.services.value_cache import ValueCache
+
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from fin_statement_model.core.metrics.models import MetricDefinition
     from fin_statement_model.core.node_factory import NodeFactory
@@ -50,7 +59,58 @@ if TYPE_CHECKING:  # pragma: no cover
 
 # Local imports deliberately avoid importing Graph to meet step 1.2 criteria
 
-__all__: list[str] = ["CalculationEngine"]
+__all__: list[str] = ["CalculationEngine", "RecalcFailure", "RecalcReport"]
+
+
+class RecalcFailure(BaseModel):
+    """One ``(node, period)`` cell that could not be recalculated.
+
+    Attributes:
+        node_name: The node that failed.
+        period: The period that failed.
+        error_type: Class name of the underlying exception.
+        message: The underlying error message.
+        root_cause: ``None`` if the node itself raised; otherwise the name of
+            the upstream node whose failure for this period blocked the cell
+            (the cell was then not evaluated). ``error_type`` and ``message``
+            are copied from that root failure.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    node_name: str
+    period: str
+    error_type: str
+    message: str
+    root_cause: str | None = None
+
+
+class RecalcReport(BaseModel):
+    """Immutable outcome of :meth:`CalculationEngine.recalc_all`.
+
+    Attributes:
+        periods: The recalculated periods.
+        nodes_evaluated: Number of nodes visited by the evaluation plan.
+        cells_computed: Number of ``(node, period)`` values successfully computed and cached.
+        failures: Every failed cell, in evaluation order.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    periods: tuple[str, ...] = ()
+    nodes_evaluated: int = 0
+    cells_computed: int = 0
+    failures: tuple[RecalcFailure, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        """True if every cell was computed."""
+        return not self.failures
+
+    @property
+    def root_failures(self) -> tuple[RecalcFailure, ...]:
+        """Failures raised by the node itself rather than inherited from an input."""
+        return tuple(f for f in self.failures if f.root_cause is None)
 
 
 class CalculationEngine:  # pylint: disable=too-few-public-methods
@@ -81,7 +141,8 @@ class CalculationEngine:  # pylint: disable=too-few-public-methods
         add_node_with_validation: Callable[[Node], Node],
         resolve_input_nodes: Callable[[list[str]], list[Node]],
         add_periods: Callable[[list[str]], None],
-        cache: dict[str, dict[str, float]] | None = None,
+        cache: ValueCache | None = None,
+        evaluation_plan: Callable[[], list[tuple[str, tuple[str, ...]]]] | None = None,
     ) -> None:
         """Instantiate a CalculationEngine detached from the public Graph API.
 
@@ -107,14 +168,21 @@ class CalculationEngine:  # pylint: disable=too-few-public-methods
                 node objects, leveraging the owning graph's capabilities.
             add_periods: Callable allowing the engine to add new periods to the
                 graph when calculation helpers need to expand the timeline.
-            cache: Optional pre-populated calculation cache.  When *None*, a
-                fresh empty cache is created.
+            cache: Optional shared :class:`ValueCache`.  When *None*, a
+                fresh unbounded cache is created.
+            evaluation_plan: Optional callable returning ``(node_name,
+                dependency_names)`` pairs with dependencies first (nodes on a
+                cycle last). *recalc_all* evaluates in this order; without it
+                nodes are visited in ``node_names_provider`` order.
         """
         # Internal state - no external Graph refs
         self._node_resolver = node_resolver
         self._period_provider = period_provider
         self._node_names_provider = node_names_provider
-        self._cache: dict[str, dict[str, float]] = cache or {}
+        self._evaluation_plan = evaluation_plan
+        self._cache = cache if cache is not None else ValueCache()
+        # Set only while profiling; checked once per cache hit on the fast path
+        self._profiler: EvaluationProfiler | None = None
 
         # Store builder collaborators
         self._node_factory = node_factory
@@ -151,9 +219,13 @@ class CalculationEngine:  # pylint: disable=too-few-public-methods
         logger = logging.getLogger(__name__)
 
         # Fast-path cache hit ------------------------------------------------
-        if node_name in self._cache and period in self._cache[node_name]:
+        # Nodes bound to the cache look themselves up (and store) through their view
+        bound = self._cache.is_bound(node_name)
+        if not bound and (cached := self._cache.lookup(node_name, period)) is not None:
             logger.debug("Cache hit for node '%s', period '%s'", node_name, period)
-            return self._cache[node_name][period]
+            if self._profiler is not None:
+                self._profiler.record_hit(node_name)
+            return cached
 
         # Resolve node ------------------------------------------------------
         node = self._node_resolver(node_name)
@@ -188,28 +260,48 @@ class CalculationEngine:  # pylint: disable=too-few-public-methods
             ) from exc
 
         # Cache & return ----------------------------------------------------
-        self._cache.setdefault(node_name, {})[period] = value
+        if not bound:
+            self._cache.put(node_name, period, value)
         logger.debug("Cached value for node '%s', period '%s': %s", node_name, period, value)
         return value
 
-    def recalc_all(self, periods: list[str] | None = None) -> None:
-        """Recalculate every node for *periods*.
+    def recalc_all(self, periods: list[str] | None = None) -> RecalcReport:
+        """Recalculate every node for *periods* in a single dependency-ordered pass.
 
-        Implementation mimics original ``Graph.recalculate_all`` but requires the
-        caller to iterate over all node names.  Because *CalculationEngine* does
-        not (and should not) know the graph's registry, we expose a simple
-        fallback behaviour: raise *NotImplementedError* until the graph passes
-        an explicit list of node names via ``periods`` parameter being *not*
-        `None` **and** provides a helper attribute ``_all_node_names``.
-        The Graph façade will shim this in step 1.3.
-        """
-        import logging
+        The central cache is cleared, then each node is evaluated exactly once
+        per period, after all of its inputs. Because inputs are already
+        computed (and cached by the nodes themselves) when a node runs, the
+        call depth stays constant no matter how long the dependency chains
+        are. Failures do not stop the pass; they are collected in the
+        returned report. A cell whose input already failed for the same
+        period is not evaluated again and is reported with that input's root
+        cause, and nodes on a dependency cycle are reported without being
+        evaluated.
 
-        from fin_statement_model.core.errors import FinStatementModelError
+        Args:
+            periods: Periods to recalculate (a list, a single period, or
+                ``None`` for all graph periods).
 
-        # Import only for type consistency / side-effects. NodeError is unused but
-        # kept here to mirror original Graph behaviour without altering public
-        # re-export expectations.
+        Returns:
+            A :class:`RecalcReport` describing computed cells and failures.
+
+        Raises:
+            TypeError: If *periods* is not a list, a string or ``None``.
+
+        Examples:
+            >>> from fin_statement_model.core.graph import Graph
+            >>> g = Graph(periods=["2023", "2024"])
+            >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0, "2024": 0.0})
+            >>> _ = g.add_financial_statement_item("Costs", {"2023": 50.0, "2024": 10.0})
+            >>> _ = g.add_calculation("Ratio", ["Costs", "Revenue"], "division")
+            >>> _ = g.add_calculation("Double", ["Ratio", "Ratio"], "addition")
+            >>> report = g.recalculate_all()
+            >>> report.cells_computed, len(report.failures)
+            (6, 2)
+            >>> [(f.node_name, f.period, f.root_cause) for f in report.failures]
+            [('Ratio', '2024', None), ('Double', '2024', 'Ratio')]
+        """
+        import logging
 
         logger = logging.getLogger(__name__)
 
@@ -227,30 +319,156 @@ class CalculationEngine:  # pylint: disable=too-few-public-methods
         self.clear_all()
 
         if not periods_to_use:
-            return
+            return RecalcReport()
+
+        if self._evaluation_plan is not None:
+            plan = self._evaluation_plan()
+        else:
+            plan = [(name, ()) for name in self._node_names_provider()]
+        planned = {name for name, _ in plan}
+
+        cache = self._cache
+        # node -> period -> root failure, for blocking downstream cells
+        failed: dict[str, dict[str, RecalcFailure]] = {}
+        failures: list[RecalcFailure] = []
+        computed = 0
+        visited: set[str] = set()
+        for node_name, dependencies in plan:
+            visited.add(node_name)
+            node = self._node_resolver(node_name)
+            if node is None:  # pragma: no cover - plan mirrors the node registry
+                continue
+            failed_inputs = [failed[dep] for dep in dependencies if dep in failed]
+            cyclic = next((dep for dep in dependencies if dep in planned and dep not in visited), None)
+            node_cache, node_failures = self._recalc_node(node, periods_to_use, failed_inputs, cyclic)
+            failures.extend(node_failures.values())
+            computed += len(node_cache)
+            if not cache.is_bound(node_name):
+                for period, value in node_cache.items():
+                    cache.put(node_name, period, value)
+            if node_failures:
+                failed[node_name] = node_failures
+
+        report = RecalcReport(
+            periods=tuple(periods_to_use),
+            nodes_evaluated=len(visited),
+            cells_computed=computed,
+            failures=tuple(failures),
+        )
+        if failures:
+            roots = report.root_failures
+            logger.warning(
+                "Recalculation left %d cells uncomputed (%d root failures across %d nodes); first: '%s' for '%s': %s",
+                len(failures),
+                len(roots),
+                len(failed),
+                failures[0].node_name,
+                failures[0].period,
+                failures[0].message,
+            )
+        return report
+
+    @staticmethod
+    def _recalc_node(
+        node: Node,
+        periods: list[str],
+        failed_inputs: list[dict[str, RecalcFailure]],
+        cyclic: str | None,
+    ) -> tuple[dict[str, float], dict[str, RecalcFailure]]:
+        """Evaluate one node for *periods* on behalf of :meth:`recalc_all`.
+
+        Returns the computed values and the failed cells, keyed by period.
+        Cells blocked by a failed input or by a cycle are not evaluated.
+        """
+        from fin_statement_model.core.errors import FinStatementModelError
 
-        for node_name in list(self._node_names_provider()):
-            for period in periods_to_use:
+        values: dict[str, float] = {}
+        failures: dict[str, RecalcFailure] = {}
+        for period in periods:
+            blocker = next((inp[period] for inp in failed_inputs if period in inp), None)
+            if blocker is not None:
+                failures[period] = RecalcFailure(
+                    node_name=node.name,
+                    period=period,
+                    error_type=blocker.error_type,
+                    message=blocker.message,
+                    root_cause=blocker.root_cause or blocker.node_name,
+                )
+            elif cyclic is not None:
+                failures[period] = RecalcFailure(
+                    node_name=node.name,
+                    period=period,
+                    error_type="CircularDependencyError",
+                    message=f"Node '{node.name}' depends on '{cyclic}', which is part of a dependency cycle",
+                )
+            else:
                 try:
-                    self.calculate(node_name, period)
-                except FinStatementModelError as exc:
-                    # Match Graph behaviour: log & continue
-                    logger.warning(
-                        "Error recalculating node '%s' for period '%s': %s",
-                        node_name,
-                        period,
-                        exc,
+                    values[period] = node.calculate(period)
+                except (FinStatementModelError, ValueError, KeyError, ZeroDivisionError) as exc:
+                    failures[period] = RecalcFailure(
+                        node_name=node.name,
+                        period=period,
+                        error_type=type(exc).__name__,
+                        message=str(exc),
                     )
+        return values, failures
 
     # Cache-management helpers ------------------------------------------------
     def clear_all(self) -> None:
-        """Clear the internal calculation cache (stub)."""
+        """Drop every cached value (hit/miss statistics are kept)."""
         self._cache.clear()
 
+    def invalidate(self, node_name: str, periods: Iterable[str] | None = None) -> int:
+        """Drop cached values of *node_name* for *periods* (all when ``None``).
+
+        Returns:
+            The number of cached ``(node, period)`` entries removed.
+        """
+        return self._cache.invalidate(node_name, periods)
+
+    # Profiling ---------------------------------------------------------------
+    @property
+    def profiler(self) -> EvaluationProfiler | None:
+        """The active profiler, or ``None`` when profiling is off."""
+        return self._profiler
+
+    def enable_profiling(self, profiler: EvaluationProfiler | None = None) -> EvaluationProfiler:
+        """Start recording per-node evaluation statistics.
+
+        Installs timing shims on every registered node (see
+        :class:`EvaluationProfiler`). Calling this while profiling is already
+        on returns the active profiler unchanged.
+
+        Args:
+            profiler: Optional profiler to record into; a fresh one probing
+                this engine's cache for hits is created by default.
+
+        Returns:
+            The active profiler.
+        """
+        if self._profiler is not None:
+            return self._profiler
+        cache = self._cache
+        if profiler is None:
+            # Only nodes reading their own (bound) cache can answer a call from it
+            profiler = EvaluationProfiler(
+                is_cached=lambda name, period: cache.is_bound(name) and cache.peek(name, period) is not None
+            )
+        profiler.instrument_all(self._nodes.values())
+        self._profiler = profiler
+        return profiler
+
+    def disable_profiling(self) -> EvaluationProfiler | None:
+        """Stop profiling, remove the shims and return the profiler with its results."""
+        profiler, self._profiler = self._profiler, None
+        if profiler is not None:
+            profiler.release_all()
+        return profiler
+
     # Convenience: expose cache for future injection/tests -------------------
     @property
-    def cache(self) -> dict[str, dict[str, float]]:
-        """Return the underlying two-level cache mapping."""
+    def cache(self) -> ValueCache:
+        """Return the shared :class:`ValueCache` (a ``node -> period -> value`` mapping)."""
         return self._cache
 
     # ------------------------------------------------------------------
@@ -541,8 +759,7 @@ class CalculationEngine:  # pylint: disable=too-few-public-methods
         node.set_calculation(calculation_instance)
 
         # Clear cached calculations for this node
-        if node_name in self._cache:
-            del self._cache[node_name]
+        self._cache.invalidate(node_name)
 
     # ---------------- Metric query helpers -------------------------------
 
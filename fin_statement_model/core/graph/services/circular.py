@@ -0,0 +1,448 @@
+"""Declared circular groups solved by fixed-point iteration.
+
+Some models are circular on purpose: in an LBO, interest depends on average
+debt, which depends on the cash sweep, which depends on interest. The graph
+rejects cycles, so such loops used to be unrolled by hand. A
+:class:`CircularGroup` names the nodes that may form a cycle among
+themselves; the graph then treats the group as one *block*. Everything
+outside the block is still ordered and evaluated once per period, and the
+block itself is solved over the whole timeline by Gauss-Seidel sweeps
+(members updated in dependency order, with the loop torn at its back
+edges), optionally accelerated with Anderson mixing.
+
+Key responsibilities:
+    - Hold the members and solver settings of a circular group
+    - Solve the group from the values of its external inputs (``solve``) and
+      report convergence per period (:class:`ConvergenceReport`)
+    - Order nodes with every group as one block and report cycles that
+      leave a group (``block_order``)
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2024"])
+    >>> for item, value in {"Rate": 0.1, "OpeningDebt": 1000.0, "CFADS": 200.0}.items():
+    ...     _ = g.add_financial_statement_item(item, {"2024": value})
+    >>> _ = g.add_financial_statement_item("Interest", {"2024": 0.0})  # placeholder, replaced below
+    >>> _ = g.add_calculation("Sweep", ["CFADS", "Interest"], "subtraction")
+    >>> _ = g.add_calculation("ClosingDebt", ["OpeningDebt", "Sweep"], "subtraction")
+    >>> _ = g.add_calculation(
+    ...     "AvgDebt", ["OpeningDebt", "ClosingDebt"], "formula", formula="(OpeningDebt + ClosingDebt) / 2"
+    ... )
+    >>> group = g.declare_circular(["Interest", "AvgDebt", "ClosingDebt", "Sweep"], name="debt_loop")
+    >>> _ = g.add_calculation("Interest", ["Rate", "AvgDebt"], "multiplication")
+    >>> round(g.calculate("Interest", "2024"), 6)
+    94.736842
+    >>> group.last_report.converged
+    True
+"""
+
+from __future__ import annotations
+
+from itertools import pairwise
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from fin_statement_model.core.errors import CalculationError, CircularDependencyError, FinStatementModelError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    from fin_statement_model.core.nodes import Node
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["METHODS", "CircularGroup", "ConvergenceReport", "block_order"]
+
+#: Iteration schemes accepted by :class:`CircularGroup`
+METHODS: tuple[str, ...] = ("anderson", "gauss_seidel")
+
+_EVALUATION_ERRORS = (FinStatementModelError, ValueError, TypeError, KeyError, ArithmeticError)
+
+
+class ConvergenceReport(BaseModel):
+    """Immutable outcome of one :meth:`CircularGroup.solve`.
+
+    Attributes:
+        group: Name of the solved group.
+        method: The iteration scheme used.
+        periods: The solved period axis.
+        iterations: Gauss-Seidel sweeps performed.
+        tolerance: The convergence tolerance.
+        residuals: Largest scaled change of any member in the final sweep,
+            per period (NaN where an input was missing or the iteration diverged).
+        unconverged: Periods whose residual is above *tolerance* or not finite.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    group: str
+    method: str
+    periods: tuple[str, ...] = ()
+    iterations: int = 0
+    tolerance: float = 0.0
+    residuals: dict[str, float] = {}
+    unconverged: tuple[str, ...] = ()
+
+    @property
+    def converged(self) -> bool:
+        """True if every period converged."""
+        return not self.unconverged
+
+    @property
+    def max_residual(self) -> float:
+        """The largest finite residual over all periods (0.0 if there is none)."""
+        finite = [value for value in self.residuals.values() if np.isfinite(value)]
+        return max(finite, default=0.0)
+
+
+class CircularGroup:
+    """Nodes allowed to depend on each other, solved together by fixed-point iteration.
+
+    Instances are created by :py:meth:`Graph.declare_circular`. The group
+    only records member *names*; members that are not (yet) in the graph are
+    ignored until they are added.
+
+    A member's value counts as converged in a period once one more sweep
+    changes it by at most ``tolerance * (1 + |value|)``. The last solution is
+    kept and used as the starting point of the next solve, so re-solving
+    after a small edit usually takes a few sweeps only.
+
+    Args:
+        name: Label of the group.
+        members: Names of the nodes in the loop.
+        tolerance: Convergence tolerance, relative to the size of the values
+            (absolute near zero).
+        max_iterations: Maximum number of Gauss-Seidel sweeps.
+        method: ``"anderson"`` (Gauss-Seidel sweeps with Anderson
+            acceleration) or ``"gauss_seidel"`` (plain sweeps).
+        memory: Number of previous sweeps mixed by Anderson acceleration.
+        initial: Starting value of every member cell without a previous solution.
+
+    Raises:
+        ValueError: If *members* is empty or a setting is out of range.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        members: Iterable[str],
+        *,
+        tolerance: float = 1e-9,
+        max_iterations: int = 100,
+        method: str = "anderson",
+        memory: int = 5,
+        initial: float = 0.0,
+    ) -> None:
+        """Validate the settings and record the members."""
+        self.name = name
+        self.members: tuple[str, ...] = tuple(dict.fromkeys(members))
+        if not self.members:
+            raise ValueError(f"Circular group '{name}' needs at least one member")
+        if method not in METHODS:
+            raise ValueError(f"Unknown fixed-point method '{method}'; expected one of {METHODS}")
+        if not tolerance > 0:
+            raise ValueError("tolerance must be positive")
+        if max_iterations < 1:
+            raise ValueError("max_iterations must be at least 1")
+        if memory < 0:
+            raise ValueError("memory must not be negative")
+        self.tolerance = float(tolerance)
+        self.max_iterations = int(max_iterations)
+        self.method = method
+        self.memory = int(memory)
+        self.initial = float(initial)
+        #: Report of the most recent solve, or ``None`` before the first one
+        self.last_report: ConvergenceReport | None = None
+        # member -> period -> last converged value (warm start)
+        self._solution: dict[str, dict[str, float]] = {}
+        # Periods the last solve left unconverged; cleared when the graph invalidates the group
+        self._failed: set[str] = set()
+        # Current iterate while solving: member -> array over the solved periods
+        self._iterate: dict[str, np.ndarray] | None = None
+        self._period_index: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        """Return a concise representation."""
+        return f"CircularGroup(name={self.name!r}, members={list(self.members)!r}, method={self.method!r})"
+
+    # ------------------------------------------------------------------
+    # State consulted by member shims
+    # ------------------------------------------------------------------
+    @property
+    def solving(self) -> bool:
+        """True while :meth:`solve` is iterating."""
+        return self._iterate is not None
+
+    def current(self, member: str, period: str) -> float:
+        """Return *member*'s value for *period* in the iterate being solved.
+
+        Raises:
+            CalculationError: If no solve is running or *period* is not on the solved axis.
+        """
+        if self._iterate is None or period not in self._period_index:
+            raise CalculationError(
+                f"Circular group '{self.name}' is not being solved for this period",
+                node_id=member,
+                period=period,
+            )
+        return float(self._iterate[member][self._period_index[period]])
+
+    def failed(self, period: str) -> bool:
+        """True if the last solve did not converge for *period* (and nothing changed since)."""
+        return period in self._failed
+
+    def reset(self) -> None:
+        """Forget which periods failed, so the next request solves them again."""
+        self._failed.clear()
+
+    # ------------------------------------------------------------------
+    # Solving
+    # ------------------------------------------------------------------
+    def sweep_order(self, nodes: Mapping[str, Node]) -> list[str]:
+        """Return the members in *nodes* with intra-group dependencies first where possible.
+
+        Members are visited in declaration order and the loop is torn at the
+        first dependency that leads back to a member still being visited.
+        """
+        order: list[str] = []
+        done: set[str] = set()
+        for root in self.members:
+            if root not in nodes or root in done:
+                continue
+            stack: list[tuple[str, list[str], int]] = [(root, nodes[root].get_dependencies(), 0)]
+            done.add(root)
+            while stack:
+                name, deps, pos = stack[-1]
+                if pos < len(deps):
+                    stack[-1] = (name, deps, pos + 1)
+                    dep = deps[pos]
+                    if dep in nodes and dep not in done:
+                        done.add(dep)
+                        stack.append((dep, nodes[dep].get_dependencies(), 0))
+                    continue
+                stack.pop()
+                order.append(name)
+        return order
+
+    def solve(
+        self,
+        nodes: Mapping[str, Node],
+        external: Mapping[str, np.ndarray],
+        periods: Sequence[str],
+    ) -> tuple[dict[str, np.ndarray], ConvergenceReport]:
+        """Iterate the members in *nodes* to a fixed point over *periods*.
+
+        Args:
+            nodes: The members present in the graph, by name.
+            external: Values of every dependency outside the group, one
+                array over *periods* each (NaN where unavailable).
+            periods: The period axis.
+
+        Returns:
+            The members' values (NaN in unconverged periods) and the
+            convergence report, which is also stored as :py:attr:`last_report`.
+
+        Raises:
+            CalculationError: If a member cannot be evaluated at all.
+        """
+        periods = list(periods)
+        order = self.sweep_order(nodes)
+        args = {name: nodes[name].get_dependencies() for name in order}
+        x = np.array(
+            [[self._solution.get(name, {}).get(period, self.initial) for period in periods] for name in order],
+            dtype=float,
+        ).reshape(len(order), len(periods))
+
+        def sweep(start: np.ndarray) -> np.ndarray:
+            # Gauss-Seidel: later members already see this sweep's values of earlier ones
+            values = start.copy()
+            self._iterate = {name: values[row] for row, name in enumerate(order)}
+            for row, name in enumerate(order):
+                inputs = [self._iterate[dep] if dep in self._iterate else external[dep] for dep in args[name]]
+                values[row] = self._evaluate(nodes[name], inputs, periods)
+            return values
+
+        self._period_index = {period: idx for idx, period in enumerate(periods)}
+        residual = np.full(len(periods), np.nan)
+        iterations = 0
+        history: list[tuple[np.ndarray, np.ndarray]] = []
+        try:
+            for iterations in range(1, self.max_iterations + 1):  # noqa: B007 - count is reported below
+                g = sweep(x)
+                f = g - x
+                with np.errstate(invalid="ignore"):
+                    residual = np.max(np.abs(f) / (1.0 + np.abs(g)), axis=0, initial=0.0)
+                finite = np.isfinite(g).all(axis=0) & np.isfinite(x).all(axis=0)
+                residual[~finite] = np.nan
+                if not (residual[finite] > self.tolerance).any():
+                    x = g
+                    break
+                x = self._accelerate(g, f, finite, history) if self.method == "anderson" else g
+        finally:
+            self._iterate = None
+
+        unconverged = ~(residual <= self.tolerance)
+        x[:, unconverged] = np.nan
+        for row, name in enumerate(order):
+            solved = self._solution.setdefault(name, {})
+            solved.update((period, float(x[row, idx])) for idx, period in enumerate(periods) if not unconverged[idx])
+        self._failed = {period for idx, period in enumerate(periods) if unconverged[idx]}
+        report = ConvergenceReport(
+            group=self.name,
+            method=self.method,
+            periods=tuple(periods),
+            iterations=iterations,
+            tolerance=self.tolerance,
+            residuals={period: float(residual[idx]) for idx, period in enumerate(periods)},
+            unconverged=tuple(period for idx, period in enumerate(periods) if unconverged[idx]),
+        )
+        self.last_report = report
+        if report.unconverged:
+            logger.warning(
+                "Circular group '%s' did not converge for %d of %d periods after %d sweeps (max residual %.3g)",
+                self.name,
+                len(report.unconverged),
+                len(periods),
+                iterations,
+                report.max_residual,
+            )
+        else:
+            logger.debug("Circular group '%s' converged in %d sweeps", self.name, iterations)
+        return {name: x[row] for row, name in enumerate(order)}, report
+
+    def _accelerate(
+        self,
+        g: np.ndarray,
+        f: np.ndarray,
+        finite: np.ndarray,
+        history: list[tuple[np.ndarray, np.ndarray]],
+    ) -> np.ndarray:
+        """Return the Anderson-mixed next iterate from sweep output *g* and residual *f*.
+
+        Mixing uses the differences of the last ``memory`` sweeps over the
+        periods that are finite; other periods take the plain sweep.
+        """
+        entry = (g[:, finite].ravel(), f[:, finite].ravel())
+        if history and history[-1][0].size != entry[0].size:
+            history.clear()  # the set of finite periods changed
+        history.append(entry)
+        del history[: -(self.memory + 1)]
+        if len(history) == 1:
+            return g
+        d_g = np.stack([new[0] - old[0] for old, new in pairwise(history)], axis=1)
+        d_f = np.stack([new[1] - old[1] for old, new in pairwise(history)], axis=1)
+        gamma = np.linalg.lstsq(d_f, history[-1][1], rcond=None)[0]
+        mixed = history[-1][0] - d_g @ gamma
+        if not np.isfinite(mixed).all():
+            history[:] = history[-1:]
+            return g
+        result = g.copy()
+        result[:, finite] = mixed.reshape(g.shape[0], -1)
+        return result
+
+    @staticmethod
+    def _evaluate(node: Node, inputs: list[np.ndarray], periods: Sequence[str]) -> np.ndarray:
+        """Evaluate one member over *periods*, per period when it has no array kernel."""
+        try:
+            values = node.calculate_vector(inputs, periods)
+        except NotImplementedError:
+            # Scalar inputs of members are answered from the iterate by their shims;
+            # a scratch cache keeps intermediate values out of the node's own cache.
+            previous = node.bind_cache({})
+            try:
+                values = np.full(len(periods), np.nan)
+                for idx, period in enumerate(periods):
+                    try:
+                        values[idx] = float(node.node_class.calculate(node, period))
+                    except _EVALUATION_ERRORS as exc:
+                        logger.debug("Member '%s' failed for period '%s': %s", node.name, period, exc)
+            finally:
+                if previous is not None:
+                    node.bind_cache(previous)
+        except _EVALUATION_ERRORS as exc:
+            raise CalculationError(
+                f"Failed to evaluate circular member '{node.name}' over {len(periods)} periods",
+                node_id=node.name,
+                details={"node_type": type(node).__name__, "original_error": str(exc)},
+            ) from exc
+        array = np.asarray(values, dtype=float)
+        return np.array(np.broadcast_to(array, (len(periods),))) if array.shape != (len(periods),) else array
+
+
+def block_order(
+    roots: Iterable[str],
+    dependencies: Callable[[str], Iterable[str]],
+    groups: Mapping[str, CircularGroup],
+) -> list[str]:
+    """Return *roots* and their dependencies in evaluation order, with circular groups as blocks.
+
+    Every node appears after its dependencies, except that the members of a
+    group (the names mapped to it in *groups*) are emitted together, after
+    all of the group's external dependencies, in declaration order.
+
+    Args:
+        roots: Names to order.
+        dependencies: Callable returning the dependency names of a node.
+        groups: Member name -> its group, for the members present in the graph.
+
+    Returns:
+        The ordered names.
+
+    Raises:
+        CircularDependencyError: If the dependencies form a cycle that is not
+            contained in one group. Groups appear in the cycle by name.
+    """
+    members: dict[str, list[str]] = {}
+    for name, group in groups.items():
+        members.setdefault(group.name, []).append(name)
+
+    # A plain node is its own block; a group is the block ``(group name,)``
+    def block(name: str) -> str | tuple[str]:
+        group = groups.get(name)
+        return name if group is None else (group.name,)
+
+    def block_dependencies(key: str | tuple[str]) -> list[str | tuple[str]]:
+        if isinstance(key, str):
+            return list(dict.fromkeys(block(dep) for dep in dependencies(key)))
+        inner = members[key[0]]
+        return list(dict.fromkeys(block(dep) for name in inner for dep in dependencies(name) if dep not in inner))
+
+    def label(key: str | tuple[str]) -> str:
+        return key if isinstance(key, str) else key[0]
+
+    order: list[str] = []
+    done: set[str | tuple[str]] = set()
+    on_path: set[str | tuple[str]] = set()
+    for root in roots:
+        start = block(root)
+        if start in done:
+            continue
+        # Iterative post-order DFS over blocks: (block, dependencies, next dependency index)
+        stack: list[tuple[str | tuple[str], list[str | tuple[str]], int]] = [(start, block_dependencies(start), 0)]
+        on_path.add(start)
+        while stack:
+            key, deps, pos = stack[-1]
+            if pos < len(deps):
+                stack[-1] = (key, deps, pos + 1)
+                dep = deps[pos]
+                if dep in done:
+                    continue
+                if dep in on_path:
+                    path = [entry[0] for entry in stack]
+                    cycle = [label(entry) for entry in (*path[path.index(dep) :], dep)]
+                    raise CircularDependencyError(f"Circular dependency detected involving '{label(dep)}'", cycle=cycle)
+                stack.append((dep, block_dependencies(dep), 0))
+                on_path.add(dep)
+                continue
+            stack.pop()
+            on_path.discard(key)
+            done.add(key)
+            if isinstance(key, str):
+                order.append(key)
+            else:
+                present = members[key[0]]
+                order.extend(name for name in groups[present[0]].members if name in present)
+    return order
@@ -0,0 +1,929 @@
+"""Frozen, flat evaluation programs compiled from a graph.
+
+Graphs used for serving are structurally static once built, yet every
+evaluation still resolves nodes by name, asks them for their dependencies,
+dispatches through calculation objects and wraps errors node by node.
+CompiledGraph does that work once: it lowers the dependency cone of the
+compiled nodes into a flat list of ``(slot, kernel, argument slots)``
+instructions over period-indexed NumPy arrays and then only runs that list.
+
+Lowering rules:
+    - Item nodes become *inputs*; their stored values are the defaults.
+    - Forecast nodes read their historical values from an input of the same
+      name (defaulting to the node's own history) and project them forward.
+      Statistical growth forecasts also get a hidden slot for pre-drawn
+      growth paths, filled by :py:meth:`CompiledGraph.simulate`.
+    - Addition, subtraction, multiplication and division calculations become
+      direct NumPy kernels; other calculations call their calculation's
+      ``calculate_vector`` without going through the node.
+    - Any other node is evaluated through its own ``calculate_vector``. A
+      node without an array kernel is evaluated per period through the graph
+      (``calculate``), which only sees the compile-time inputs; running it
+      downstream of overridden, batched or simulated inputs raises instead.
+
+Key responsibilities:
+    - Snapshot the evaluation order, period axis and input values at compile time
+    - Recompute every output from new input vectors, including leading batch axes
+    - Report per-cell failures as NaN, exactly as ``calculate_frame`` does
+    - Simulate statistical forecasts as a ``path`` batch axis (Monte Carlo)
+    - Re-run only the instructions downstream of a bumped input (sensitivity)
+    - Propagate forward-mode derivatives of an output with respect to many
+      inputs in one pass (gradients)
+    - Back-solve an input for a target value in every period at once (goal seek)
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023", "2024"])
+    >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0, "2024": 120.0})
+    >>> _ = g.add_financial_statement_item("COGS", {"2023": 60.0, "2024": 0.0})
+    >>> _ = g.add_calculation("GrossProfit", ["Revenue", "COGS"], "subtraction")
+    >>> program = g.compile()
+    >>> program.input_names
+    ('Revenue', 'COGS')
+    >>> program.evaluate()["GrossProfit"].tolist()
+    [40.0, 120.0]
+    >>> program.evaluate({"COGS": [[50.0, 60.0], [70.0, 80.0]]})["GrossProfit"].tolist()
+    [[50.0, 60.0], [30.0, 40.0]]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from fin_statement_model.core.calculations import (
+    AdditionCalculation,
+    DivisionCalculation,
+    MultiplicationCalculation,
+    SubtractionCalculation,
+)
+from fin_statement_model.core.calculations.dual import Dual
+from fin_statement_model.core.errors import CalculationError, FinStatementModelError, NodeError, PeriodError
+from fin_statement_model.core.graph.services.entity_batch import EntityResults, entity_inputs
+from fin_statement_model.core.graph.services.goal_seek import METHODS, bisect, newton, secant
+from fin_statement_model.core.graph.services.period_index import PeriodIndex
+from fin_statement_model.core.graph.services.scenario_batch import ScenarioResults, scenario_inputs
+from fin_statement_model.core.graph.services.sensitivity import bumped_values, sensitivity_frame
+from fin_statement_model.core.graph.services.simulation import SimulationResults
+from fin_statement_model.core.nodes import (
+    CalculationNode,
+    FinancialStatementItemNode,
+    ForecastNode,
+    StatisticalGrowthForecastNode,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping, Sequence
+
+    from fin_statement_model.core.adjustments.manager import AdjustmentManager
+    from fin_statement_model.core.nodes import Node
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["CompiledGraph"]
+
+Kernel = Callable[[list[np.ndarray]], Any]
+Instruction = tuple[str, int, Kernel, list[int]]
+
+_EVALUATION_ERRORS = (FinStatementModelError, ValueError, TypeError, KeyError, ArithmeticError)
+
+# Default of a growth-path slot: project with the node's own scalar draws
+_NO_DRAWS = np.empty(0)
+_NO_DRAWS.flags.writeable = False
+
+
+# ----------------------------------------------------------------------
+# Arithmetic kernels
+# ----------------------------------------------------------------------
+def _add(args: list[np.ndarray]) -> Any:
+    total = args[0]
+    for value in args[1:]:
+        total = total + value
+    return total
+
+
+def _subtract(args: list[np.ndarray]) -> Any:
+    result = args[0]
+    for value in args[1:]:
+        result = result - value
+    return result
+
+
+def _multiply(args: list[np.ndarray]) -> Any:
+    product = args[0]
+    for value in args[1:]:
+        product = product * value
+    return product
+
+
+def _divide(args: list[np.ndarray]) -> np.ndarray:
+    # Same result as nan_divide; the program runs under one np.errstate instead of one per call
+    denominator = args[1]
+    for value in args[2:]:
+        denominator = denominator * value
+    return np.where(denominator == 0.0, np.nan, args[0] / denominator)
+
+
+# Exact types only: subclasses may change the arithmetic and keep their own kernel
+_ARITHMETIC_KERNELS: dict[type, tuple[Kernel, int]] = {
+    AdditionCalculation: (_add, 1),
+    SubtractionCalculation: (_subtract, 1),
+    MultiplicationCalculation: (_multiply, 1),
+    DivisionCalculation: (_divide, 2),
+}
+
+
+class _FallbackKernel:
+    """Array kernel that evaluates its node per period once it reports NotImplementedError.
+
+    The per-period path calls the node's scalar ``calculate``, which reads the
+    node's inputs from the graph instead of the kernel's arguments. It is
+    therefore only used while every argument still has its compile-time
+    value; :py:meth:`live` is the kernel for arguments derived from
+    overridden inputs.
+    """
+
+    __slots__ = ("_node", "_periods", "_vector", "_vectorized")
+
+    def __init__(self, node: Node, vector: Kernel, periods: PeriodIndex) -> None:
+        self._node = node
+        self._vector = vector
+        self._periods = periods
+        self._vectorized = True
+
+    def _try_vector(self, args: list[np.ndarray]) -> Any:
+        """Return the array kernel's result, or ``None`` once the node has none."""
+        if self._vectorized:
+            try:
+                return self._vector(args)
+            except NotImplementedError:
+                logger.debug("Node '%s' has no array kernel; compiled per period.", self._node.name)
+                self._vectorized = False
+        return None
+
+    def __call__(self, args: list[np.ndarray]) -> Any:
+        """Evaluate compile-time arguments, per period through the graph if necessary."""
+        result = self._try_vector(args)
+        if result is not None:
+            return result
+        values = np.full(len(self._periods), np.nan)
+        for idx, period in enumerate(self._periods):
+            try:
+                values[idx] = float(self._node.calculate(period))
+            except _EVALUATION_ERRORS as exc:
+                logger.debug("Node '%s' failed for period '%s': %s", self._node.name, period, exc)
+        return values
+
+    def live(self, args: list[np.ndarray]) -> Any:
+        """Evaluate arguments derived from overridden inputs; requires an array kernel.
+
+        Raises:
+            CalculationError: If the node has no array kernel.
+        """
+        result = self._try_vector(args)
+        if result is None:
+            raise CalculationError(
+                f"Node '{self._node.name}' has no array kernel and is evaluated through the graph, "
+                "so it cannot follow overridden, batched or simulated inputs",
+                node_id=self._node.name,
+            )
+        return result
+
+
+class CompiledGraph:
+    """A read-only evaluator for a fixed set of nodes over a fixed period axis.
+
+    Instances are created by :py:meth:`Graph.compile`. The structure, the
+    period axis and the default input values are captured at compile time;
+    later changes to the graph are not seen. Calculation parameters (weights,
+    formulas, growth rates, …) are read from the compiled nodes. Nodes
+    without an array kernel are evaluated through their scalar ``calculate``,
+    which reads the graph rather than the program's inputs, so they can only
+    be evaluated from the compile-time input values.
+
+    Args:
+        nodes: Nodes to compile, every node after its dependencies.
+        periods: The period axis; every array has ``len(periods)`` cells in its last axis.
+    """
+
+    __slots__ = ("_defaults", "_draws", "_inputs", "_names", "_nodes", "_outputs", "_periods", "_program")
+
+    def __init__(self, nodes: Sequence[Node], periods: Sequence[str]) -> None:
+        """Lower *nodes* into a flat instruction list."""
+        # Shared ordinal table: period -> column lookups are O(1)
+        self._periods = PeriodIndex.of(periods)
+        self._names: tuple[str, ...] = tuple(node.name for node in nodes)
+        self._inputs: dict[str, int] = {}
+        self._outputs: dict[str, int] = {}
+        self._defaults: list[np.ndarray] = []
+        self._program: list[Instruction] = []
+        self._draws: dict[str, tuple[StatisticalGrowthForecastNode, int]] = {}
+        self._nodes: dict[str, Node] = {}
+
+        for node in nodes:
+            if isinstance(node, FinancialStatementItemNode):
+                self._outputs[node.name] = self._add_input(node.name, node.calculate_vector([], self._periods))
+                continue
+            if isinstance(node, ForecastNode):
+                args = [self._add_input(node.name, node.history_vector(self._periods))]
+                if isinstance(node, StatisticalGrowthForecastNode):
+                    self._draws[node.name] = (node, len(self._defaults))
+                    args.append(len(self._defaults))
+                    self._defaults.append(_NO_DRAWS)
+            else:
+                args = [self._outputs[dep] for dep in node.get_dependencies()]
+            slot = len(self._defaults)
+            self._defaults.append(np.full(len(self._periods), np.nan))
+            self._program.append((node.name, slot, self._lower(node, len(args)), args))
+            self._nodes[node.name] = node
+            self._outputs[node.name] = slot
+
+    def _add_input(self, name: str, values: Any) -> int:
+        array = np.array(values, dtype=float)
+        array.flags.writeable = False
+        self._inputs[name] = len(self._defaults)
+        self._defaults.append(array)
+        return self._inputs[name]
+
+    def _lower(self, node: Node, arg_count: int) -> Kernel:
+        """Return the kernel computing *node* from its argument arrays."""
+        periods = self._periods
+        if isinstance(node, StatisticalGrowthForecastNode):
+            return lambda args: (
+                node._project_vector(args[0], periods)
+                if args[1] is _NO_DRAWS
+                else node.project_paths(args[0], periods, args[1])
+            )
+        if isinstance(node, ForecastNode):
+            return lambda args: node._project_vector(args[0], periods)
+        if isinstance(node, CalculationNode):
+            calculation = node.calculation
+            kernel, min_args = _ARITHMETIC_KERNELS.get(type(calculation), (None, 0))
+            if kernel is not None and arg_count >= min_args:
+                return kernel
+            calculate_vector = getattr(calculation, "calculate_vector", None)
+            if calculate_vector is not None:
+                inputs = list(node.inputs)
+                return self._with_fallback(node, lambda args: calculate_vector(inputs, args))
+        return self._with_fallback(node, lambda args: node.calculate_vector(args, periods))
+
+    def _with_fallback(self, node: Node, vector: Kernel) -> Kernel:
+        """Wrap the array kernel *vector* in a :class:`_FallbackKernel` for *node*."""
+        return _FallbackKernel(node, vector, self._periods)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    @property
+    def periods(self) -> tuple[str, ...]:
+        """The period axis of every input and output array."""
+        return self._periods.labels
+
+    @property
+    def period_index(self) -> PeriodIndex:
+        """The period axis as an interned :class:`PeriodIndex` (label <-> column)."""
+        return self._periods
+
+    @property
+    def node_names(self) -> tuple[str, ...]:
+        """Names of the compiled nodes, in evaluation order."""
+        return self._names
+
+    @property
+    def input_names(self) -> tuple[str, ...]:
+        """Names accepted by :py:meth:`evaluate` as input overrides."""
+        return tuple(self._inputs)
+
+    @property
+    def stochastic_nodes(self) -> tuple[str, ...]:
+        """Names of the statistical forecast nodes drawn by :py:meth:`simulate`."""
+        return tuple(self._draws)
+
+    @property
+    def input_values(self) -> dict[str, np.ndarray]:
+        """The default (compile-time) value of every input as read-only arrays."""
+        return {name: self._defaults[slot] for name, slot in self._inputs.items()}
+
+    def __len__(self) -> int:
+        """Return the number of instructions (non-input nodes) in the program."""
+        return len(self._program)
+
+    def __repr__(self) -> str:
+        """Return a short summary of the program's size."""
+        return (
+            f"CompiledGraph(nodes={len(self._names)}, inputs={len(self._inputs)}, "
+            f"instructions={len(self._program)}, periods={len(self._periods)})"
+        )
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    def _bind_inputs(self, inputs: Mapping[str, Any] | None) -> tuple[list[np.ndarray], tuple[int, ...]]:
+        slots = list(self._defaults)
+        shape: tuple[int, ...] = (len(self._periods),)
+        for name, values in (inputs or {}).items():
+            slot = self._inputs.get(name)
+            if slot is None:
+                raise NodeError(f"'{name}' is not an input of the compiled graph", node_id=name)
+            array = np.array(values, dtype=float)
+            if array.ndim == 0:
+                array = np.full(shape, float(array))
+            elif array.shape[-1] != len(self._periods):
+                raise ValueError(
+                    f"Input '{name}' has {array.shape[-1]} cells in its last axis; expected {len(self._periods)}"
+                )
+            array.flags.writeable = False
+            slots[slot] = array
+            shape = np.broadcast_shapes(shape, array.shape)
+        return slots, shape
+
+    def evaluate(
+        self,
+        inputs: Mapping[str, Any] | None = None,
+        outputs: Sequence[str] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Run the program and return the value of every requested node.
+
+        Args:
+            inputs: Optional overrides ``{input name: values}``. Values are
+                scalars or arrays whose last axis is aligned with
+                :py:attr:`periods`; leading axes are batch dimensions and are
+                broadcast across all inputs.
+            outputs: Nodes to return. Defaults to every compiled node.
+
+        Returns:
+            Mapping of node name to a read-only float array of shape
+            ``batch_shape + (len(periods),)``.
+
+        Raises:
+            NodeError: If an input or output name is not part of the program.
+            ValueError: If an input's last axis does not match the period axis.
+            CalculationError: If a node cannot be evaluated at all. Per-cell
+                failures become NaN instead.
+        """
+        values, shape = self._bind_inputs(inputs)
+        return self._run(values, shape, outputs)
+
+    def _run(
+        self, values: list[np.ndarray], shape: tuple[int, ...], outputs: Sequence[str] | None
+    ) -> dict[str, np.ndarray]:
+        """Execute the program over bound slot *values* and collect *outputs* broadcast to *shape*."""
+        self._execute(values, self._program)
+        return self._collect(values, shape, outputs)
+
+    def _live_slots(self, values: list[np.ndarray]) -> set[int]:
+        """Return the input and draw slots of *values* that no longer hold their compile-time default."""
+        roots = [*self._inputs.values(), *(slot for _, slot in self._draws.values())]
+        return {slot for slot in roots if values[slot] is not self._defaults[slot]}
+
+    def _execute(self, values: list[np.ndarray], program: Sequence[Instruction]) -> None:
+        """Run *program* (a subsequence of the instructions) in place over slot *values*."""
+        tail = (len(self._periods),)
+        live = self._live_slots(values)
+        name = ""
+        try:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                for name, slot, kernel, args in program:  # noqa: B007 - named in the error below
+                    run = kernel
+                    if live and not live.isdisjoint(args):
+                        live.add(slot)
+                        if isinstance(kernel, _FallbackKernel):
+                            run = kernel.live
+                    result = np.asarray(run([values[i] for i in args]), dtype=float)
+                    # Keep batch axes only where inputs introduced them: nodes that do not
+                    # depend on a batched input are computed once and broadcast on output
+                    if result.shape[-1:] != tail:
+                        result = np.broadcast_to(result, (*result.shape[:-1], *tail))
+                    values[slot] = result
+        except _EVALUATION_ERRORS as exc:
+            raise CalculationError(
+                f"Failed to evaluate node '{name}' in the compiled graph",
+                node_id=name,
+                details={"original_error": str(exc)},
+            ) from exc
+
+    def _collect(
+        self, values: list[np.ndarray], shape: tuple[int, ...], outputs: Sequence[str] | None
+    ) -> dict[str, np.ndarray]:
+        """Return the read-only slot values of *outputs* broadcast to *shape*."""
+        names = self._names if outputs is None else outputs
+        results: dict[str, np.ndarray] = {}
+        for name in names:
+            index = self._outputs.get(name)
+            if index is None:
+                raise NodeError(f"Node '{name}' is not part of the compiled graph", node_id=name)
+            array = values[index]
+            if array.shape != shape:
+                array = np.broadcast_to(array, shape)
+            elif array.flags.writeable:
+                array.flags.writeable = False
+            results[name] = array
+        return results
+
+    def evaluate_entities(
+        self,
+        data: pd.DataFrame,
+        outputs: Sequence[str] | None = None,
+        *,
+        entity_col: str = "entity",
+        item_col: str = "item",
+        period_col: str = "period",
+        value_col: str = "value",
+    ) -> EntityResults:
+        """Evaluate the program once for every entity in a long input table.
+
+        The entities form a leading batch axis, so all of them are computed
+        in a single pass. Inputs that appear in *data* take their values from
+        it (NaN where an entity has no row); inputs absent from *data* keep
+        their compiled defaults for every entity.
+
+        Args:
+            data: Long table with entity, item, period and value columns.
+            outputs: Nodes to return. Defaults to every compiled node.
+            entity_col: Column holding entity identifiers.
+            item_col: Column holding input names.
+            period_col: Column holding period identifiers.
+            value_col: Column holding numeric values.
+
+        Returns:
+            :class:`~fin_statement_model.core.graph.services.EntityResults`
+            with one ``entity x period`` array per requested node.
+        """
+        entities, inputs = entity_inputs(
+            data,
+            input_names=self.input_names,
+            periods=self._periods.labels,
+            entity_col=entity_col,
+            item_col=item_col,
+            period_col=period_col,
+            value_col=value_col,
+        )
+        batch_shape = (len(entities), len(self._periods))
+        results = self.evaluate(inputs, outputs)
+        return EntityResults(
+            entities,
+            self._periods.labels,
+            {name: np.broadcast_to(values, batch_shape) for name, values in results.items()},
+        )
+
+    def evaluate_scenarios(
+        self,
+        manager: AdjustmentManager,
+        scenarios: Sequence[str] | None = None,
+        outputs: Sequence[str] | None = None,
+        *,
+        baseline: str | None = None,
+    ) -> ScenarioResults:
+        """Evaluate the program once for every adjustment scenario of *manager*.
+
+        Each scenario's adjustments are applied to the inputs they target and
+        propagated through every downstream node; the scenarios form a
+        leading batch axis, and nodes unaffected by any adjustment are
+        computed once. Adjustments of non-input nodes are skipped (and
+        logged).
+
+        Args:
+            manager: Source of the adjustments.
+            scenarios: Scenario names to evaluate. Defaults to every scenario
+                that has adjustments, sorted by name.
+            outputs: Nodes to return. Defaults to every compiled node.
+            baseline: Optional label of an extra, unadjusted first row.
+
+        Returns:
+            :class:`~fin_statement_model.core.graph.services.ScenarioResults`
+            with one ``scenario x period`` array per requested node.
+
+        Raises:
+            ValueError: If *baseline* is also the name of an evaluated scenario.
+        """
+        if scenarios is None:
+            scenarios = sorted({adj.scenario for adj in manager.get_all_adjustments()})
+        labels = list(scenarios)
+        if baseline is not None:
+            if baseline in labels:
+                raise ValueError(f"Baseline label '{baseline}' is also a scenario name")
+            labels.insert(0, baseline)
+        inputs, _ = scenario_inputs(manager, labels, self.input_values, self._periods.labels)
+        batch_shape = (len(labels), len(self._periods))
+        results = self.evaluate(inputs, outputs)
+        return ScenarioResults(
+            labels,
+            self._periods.labels,
+            {name: np.broadcast_to(values, batch_shape) for name, values in results.items()},
+        )
+
+    def simulate(
+        self,
+        n_paths: int,
+        outputs: Sequence[str] | None = None,
+        *,
+        seed: int | np.random.Generator | None = None,
+        inputs: Mapping[str, Any] | None = None,
+    ) -> SimulationResults:
+        """Evaluate *n_paths* Monte Carlo paths of every statistical forecast at once.
+
+        Each stochastic node draws a ``path x forecast period`` array of
+        growth rates from one shared generator, and the paths form a leading
+        batch axis that is propagated through every downstream node. Nodes
+        that do not depend on a stochastic forecast are computed once.
+
+        Args:
+            n_paths: Number of simulated paths.
+            outputs: Nodes to return. Defaults to every compiled node.
+            seed: Seed or generator for the draws. Defaults to the
+                ``forecasting.random_seed`` setting (fresh entropy when unset).
+            inputs: Optional unbatched input overrides, as in :py:meth:`evaluate`.
+
+        Returns:
+            :class:`~fin_statement_model.core.graph.services.SimulationResults`
+            with one ``path x period`` array per requested node.
+
+        Raises:
+            ValueError: If *n_paths* is not positive or *inputs* are batched.
+        """
+        if n_paths < 1:
+            raise ValueError(f"n_paths must be positive, got {n_paths}")
+        if seed is None:
+            from fin_statement_model.config.access import cfg
+
+            seed = cfg("forecasting.random_seed")
+        rng = np.random.default_rng(seed)
+        values, shape = self._bind_inputs(inputs)
+        if len(shape) != 1:
+            raise ValueError("simulate() requires unbatched inputs; the paths are the batch axis")
+        for node, slot in self._draws.values():
+            values[slot] = node.draw_growth_rates(rng, n_paths)
+        batch_shape = (n_paths, len(self._periods))
+        if not self._draws:
+            logger.info("Compiled graph has no statistical forecasts; every path is identical")
+        results = self._run(values, batch_shape, outputs)
+        return SimulationResults(range(n_paths), self._periods.labels, results)
+
+    def _instructions_for(self, outputs: Sequence[str]) -> list[Instruction]:
+        """Return the instructions needed to compute *outputs*, in program order."""
+        needed: set[int] = set()
+        for name in outputs:
+            slot = self._outputs.get(name)
+            if slot is None:
+                raise NodeError(f"Node '{name}' is not part of the compiled graph", node_id=name)
+            needed.add(slot)
+        program = []
+        for instruction in reversed(self._program):
+            if instruction[1] in needed:
+                needed.update(instruction[3])
+                program.append(instruction)
+        program.reverse()
+        return program
+
+    @staticmethod
+    def _instructions_reading(slot: int, program: Sequence[Instruction]) -> list[Instruction]:
+        """Return the instructions of *program* that depend (transitively) on *slot*."""
+        dirty = {slot}
+        affected = []
+        for instruction in program:
+            if not dirty.isdisjoint(instruction[3]):
+                dirty.add(instruction[1])
+                affected.append(instruction)
+        return affected
+
+    def _resolve_inputs(
+        self, inputs: Sequence[str] | None, program: Sequence[Instruction], outputs: Sequence[str]
+    ) -> list[str]:
+        """Validate *inputs*, defaulting to every input that *program* reads to compute *outputs*."""
+        if inputs is None:
+            feeding = {slot for instruction in program for slot in instruction[3]}
+            feeding.update(self._outputs[name] for name in outputs)
+            return [name for name, slot in self._inputs.items() if slot in feeding]
+        for name in inputs:
+            if name not in self._inputs:
+                raise NodeError(f"'{name}' is not an input of the compiled graph", node_id=name)
+        return list(inputs)
+
+    def sensitivity(
+        self,
+        outputs: Sequence[str],
+        inputs: Sequence[str] | None = None,
+        bumps: Sequence[float] = (-0.1, 0.1),
+        *,
+        relative: bool = True,
+    ) -> pd.DataFrame:
+        """Measure how *outputs* respond to bumping each input in every period.
+
+        The baseline is evaluated once. Each input is then bumped on its own
+        with all *bumps* as one batch axis, and only the instructions that
+        depend on that input (and feed an output) are re-run; every other node
+        keeps its baseline value.
+
+        Args:
+            outputs: Nodes whose response is reported.
+            inputs: Inputs to bump one at a time. Defaults to every input
+                that feeds *outputs*.
+            bumps: Bump sizes, applied to every period of the input.
+            relative: Scale inputs by ``1 + bump`` (default) or add ``bump``.
+
+        Returns:
+            Tidy DataFrame with one row per input, bump, output and period and
+            the columns ``input, bump, output, period, base, value, delta,
+            pct_change`` (see
+            :py:func:`~fin_statement_model.core.graph.services.sensitivity.sensitivity_frame`).
+
+        Raises:
+            NodeError: If an output is not compiled or an input is not an input.
+            ValueError: If *outputs* is empty or *bumps* is not one-dimensional.
+            CalculationError: If a node cannot be evaluated at all.
+        """
+        names = list(outputs)
+        if not names:
+            raise ValueError("sensitivity() requires at least one output")
+        program = self._instructions_for(names)
+        steps = np.asarray(bumps, dtype=float)
+        if steps.ndim != 1:
+            raise ValueError(f"bumps must be a flat sequence of numbers, got shape {steps.shape}")
+        inputs = self._resolve_inputs(inputs, program, names)
+
+        baseline = list(self._defaults)
+        self._execute(baseline, program)
+        base = np.stack(list(self._collect(baseline, (len(self._periods),), names).values()))
+        bumped_shape = (len(steps), len(self._periods))
+        blocks = []
+        for name in inputs:
+            slot = self._inputs[name]
+            values = list(baseline)
+            values[slot] = bumped_values(baseline[slot], steps, relative=relative)
+            self._execute(values, self._instructions_reading(slot, program))
+            collected = self._collect(values, bumped_shape, names)
+            blocks.append(np.stack(list(collected.values()), axis=1))
+        cube = np.stack(blocks) if blocks else np.empty((0, len(steps), len(names), len(self._periods)))
+        return sensitivity_frame(
+            base, cube, inputs=list(inputs), bumps=steps.tolist(), outputs=names, periods=self._periods.labels
+        )
+
+    def gradient(
+        self,
+        output: str,
+        wrt: Sequence[str] | None = None,
+        period: str | None = None,
+        *,
+        wrt_period: str | None = None,
+    ) -> pd.Series | pd.DataFrame:
+        """Return the partial derivatives of *output* with respect to inputs.
+
+        Forward-mode differentiation: every input in *wrt* is seeded as one
+        tangent direction and all directions are propagated together through
+        the instructions feeding *output*, so one pass yields every partial.
+        Arithmetic calculations, formulas, metrics and growth forecasts with
+        history-independent rates have exact derivative rules; any other node
+        (or a formula that branches on values) is differentiated by a central
+        finite difference over its array kernel with all directions as one
+        batch. Instructions that do not depend on a seeded input run their
+        regular kernel.
+
+        Args:
+            output: Node to differentiate.
+            wrt: Inputs to differentiate with respect to. Defaults to every
+                input that feeds *output*.
+            period: Return the derivatives of this period's value only.
+            wrt_period: Seed only this period of each input. By default every
+                period is seeded, i.e. the derivative is taken with respect to
+                a parallel shift of the input's whole timeline.
+
+        Returns:
+            A Series indexed by input (named after *output*) when *period* is
+            given, otherwise an ``input x period`` DataFrame. Cells whose value
+            is NaN (e.g. division by zero) have NaN derivatives.
+
+        Raises:
+            NodeError: If *output* is not compiled or a name in *wrt* is not an input.
+            PeriodError: If *period* or *wrt_period* is not on the period axis.
+            ValueError: If *wrt* names an input twice.
+            CalculationError: If a node cannot be evaluated at all.
+        """
+        program = self._instructions_for([output])
+        names = self._resolve_inputs(wrt, program, [output])
+        if len(set(names)) != len(names):
+            raise ValueError("gradient() requires distinct inputs in wrt")
+        for label in (period, wrt_period):
+            if label is not None and label not in self._periods:
+                raise PeriodError(
+                    "Period not found in the compiled graph", period=label, available_periods=list(self._periods)
+                )
+        mask = None if wrt_period is None else np.array([p == wrt_period for p in self._periods])
+
+        values = [Dual(default) for default in self._defaults]
+        for direction, name in enumerate(names):
+            slot = self._inputs[name]
+            values[slot] = Dual.seed(self._defaults[slot], direction, len(names), mask)
+        self._execute_dual(values, program, len(names))
+
+        gradients = values[self._outputs[output]].gradient(len(names))
+        index = pd.Index(names, name="input")
+        if period is not None:
+            return pd.Series(gradients[:, self._periods.index(period)], index=index, name=output)
+        return pd.DataFrame(gradients, index=index, columns=pd.Index(self._periods.labels, name="period"))
+
+    def _execute_dual(self, values: list[Dual], program: Sequence[Instruction], size: int) -> None:
+        """Run *program* in place over dual slot *values* with *size* tangent directions."""
+        tail = (len(self._periods),)
+        name = ""
+        try:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                for name, slot, kernel, args in program:
+                    operands = [values[i] for i in args]
+                    if all(operand.tangent is None for operand in operands):
+                        result = Dual(kernel([operand.value for operand in operands]))
+                    else:
+                        live = kernel.live if isinstance(kernel, _FallbackKernel) else kernel
+                        result = self._differentiate(self._nodes[name], live, operands, size)
+                    if result.value.shape[-1:] != tail:
+                        result = Dual(np.broadcast_to(result.value, (*result.value.shape[:-1], *tail)), result.tangent)
+                    values[slot] = result
+        except _EVALUATION_ERRORS as exc:
+            raise CalculationError(
+                f"Failed to differentiate node '{name}' in the compiled graph",
+                node_id=name,
+                details={"original_error": str(exc)},
+            ) from exc
+
+    def _differentiate(self, node: Node, kernel: Kernel, operands: list[Dual], size: int) -> Dual:
+        """Apply *node*'s derivative rule, falling back to finite differences over *kernel*."""
+        try:
+            if isinstance(node, ForecastNode):
+                return node.project_dual(operands[0], self._periods)
+            if isinstance(node, CalculationNode):
+                calculate_dual = getattr(node.calculation, "calculate_dual", None)
+                if calculate_dual is not None:
+                    return calculate_dual(list(node.inputs), operands)
+        except NotImplementedError as exc:
+            logger.debug("Node '%s' has no derivative rule (%s); using finite differences.", node.name, exc)
+        return self._finite_difference(kernel, operands, size)
+
+    @staticmethod
+    def _finite_difference(kernel: Kernel, operands: list[Dual], size: int) -> Dual:
+        """Differentiate *kernel* along every tangent direction by central differences.
+
+        All ``2 * size`` perturbed evaluations run as one batched kernel call.
+        """
+        value = np.asarray(kernel([operand.value for operand in operands]), dtype=float)
+        moving = [operand for operand in operands if operand.tangent is not None]
+        shape = np.broadcast_shapes(value.shape, *(operand.value.shape for operand in moving))
+        magnitude = max(float(np.nanmax(np.abs(operand.value), initial=0.0)) for operand in moving)
+        slope = max(float(np.nanmax(np.abs(operand.tangent), initial=0.0)) for operand in moving)  # type: ignore[arg-type]
+        step = 1e-6 * max(1.0, magnitude) / max(1.0, slope)
+        signs = np.repeat([step, -step], size).reshape(-1, *(1,) * len(shape))
+        shifted = [
+            operand.value
+            if operand.tangent is None
+            else operand.value + signs * np.concatenate([operand.gradient(size)] * 2)
+            for operand in operands
+        ]
+        perturbed = np.broadcast_to(np.asarray(kernel(shifted), dtype=float), (2 * size, *shape))
+        return Dual(value, (perturbed[:size] - perturbed[size:]) / (2.0 * step))
+
+    def goal_seek(
+        self,
+        target: str,
+        target_value: float | Sequence[float],
+        input_name: str,
+        periods: Sequence[str] | None = None,
+        *,
+        input_period: str | None = None,
+        method: str = "secant",
+        bracket: tuple[Any, Any] | None = None,
+        x0: Any = None,
+        tol: float = 1e-9,
+        max_iter: int = 100,
+    ) -> pd.Series:
+        """Find the value of *input_name* at which *target* equals *target_value*.
+
+        Each period is an independent problem: only the input's cell in that
+        period (or in *input_period*) is varied and only the target's value in
+        that period is matched. All problems are solved together as one batch
+        axis, the rest of the graph is evaluated once, and every iteration
+        re-runs only the instructions between the input and the target.
+
+        Methods:
+            - ``"secant"`` (default): starts from *x0*.
+            - ``"newton"``: starts from *x0*; slopes come from the
+              forward-mode derivatives used by :py:meth:`gradient`.
+            - ``"bisect"``: requires a sign-changing *bracket*.
+
+        Args:
+            target: Node whose value is matched.
+            target_value: Goal, as a scalar or one value per period.
+            input_name: Input that is solved for.
+            periods: Periods to solve. Defaults to the whole period axis.
+            input_period: Vary this cell of the input for every period
+                instead of the solved period's own cell (e.g. the base period
+                of a forecast).
+            method: One of ``"secant"``, ``"newton"`` or ``"bisect"``.
+            bracket: ``(lower, upper)`` bounds for ``"bisect"``, as scalars or
+                one value per period.
+            x0: Starting point(s). Defaults to the input's current values
+                (zero where missing).
+            tol: Relative tolerance: a problem is solved once
+                ``|target - target_value| <= tol * max(1, |target_value|)``.
+            max_iter: Maximum number of iterations.
+
+        Returns:
+            The solved input values indexed by period (named after the input).
+            The compiled graph and its defaults are not changed.
+
+        Raises:
+            NodeError: If *target* is not compiled or *input_name* is not an input.
+            PeriodError: If a period is not on the period axis.
+            ValueError: If *method* is unknown, ``"bisect"`` has no bracket or
+                the bracket does not enclose a sign change.
+            CalculationError: If some period does not converge; ``details``
+                lists the periods and their residuals.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown goal seek method '{method}'; expected one of {METHODS}")
+        if method == "bisect" and bracket is None:
+            raise ValueError("The bisect method requires a bracket=(lower, upper)")
+        slot = self._inputs.get(input_name)
+        if slot is None:
+            raise NodeError(f"'{input_name}' is not an input of the compiled graph", node_id=input_name)
+        needed = self._instructions_for([target])
+        labels = list(self._periods if periods is None else periods)
+        for label in [*labels, *([] if input_period is None else [input_period])]:
+            if label not in self._periods:
+                raise PeriodError(
+                    "Period not found in the compiled graph", period=label, available_periods=list(self._periods)
+                )
+        rows = np.arange(len(labels))
+        out_cols = np.array([self._periods.index(label) for label in labels], dtype=int)
+        in_cols = out_cols if input_period is None else np.full(len(labels), self._periods.index(input_period))
+        goal = np.broadcast_to(np.asarray(target_value, dtype=float), rows.shape)
+        batch_shape = (len(labels), len(self._periods))
+        target_slot = self._outputs[target]
+
+        baseline = list(self._defaults)
+        self._execute(baseline, needed)
+        program = self._instructions_reading(slot, needed)
+
+        def candidates(x: np.ndarray) -> np.ndarray:
+            batch = np.repeat(self._defaults[slot][np.newaxis], len(labels), axis=0)
+            batch[rows, in_cols] = x
+            return batch
+
+        def objective(x: np.ndarray) -> np.ndarray:
+            values = list(baseline)
+            values[slot] = candidates(x)
+            self._execute(values, program)
+            return np.asarray(np.broadcast_to(values[target_slot], batch_shape)[rows, out_cols] - goal)
+
+        def objective_and_slope(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            values = [Dual(value) for value in baseline]
+            seed = np.zeros((1, *batch_shape))
+            seed[0, rows, in_cols] = 1.0
+            values[slot] = Dual(candidates(x), seed)
+            self._execute_dual(values, program, 1)
+            result = values[target_slot]
+            value = np.broadcast_to(result.value, batch_shape)[rows, out_cols] - goal
+            return value, np.broadcast_to(result.gradient(1)[0], batch_shape)[rows, out_cols]
+
+        current = self._defaults[slot][in_cols]
+        start = np.where(np.isfinite(current), current, 0.0) if x0 is None else x0
+        start = np.broadcast_to(np.asarray(start, dtype=float), rows.shape)
+        tolerance = tol * np.maximum(1.0, np.abs(goal))
+        if method == "bisect":
+            lower, upper = (np.broadcast_to(np.asarray(bound, dtype=float), rows.shape) for bound in bracket)  # type: ignore[union-attr]
+            result = bisect(objective, lower, upper, tol=tolerance, max_iter=max_iter)
+        elif method == "newton":
+            result = newton(objective_and_slope, start, tol=tolerance, max_iter=max_iter)
+        else:
+            result = secant(objective, start, tol=tolerance, max_iter=max_iter)
+
+        if not result.converged.all():
+            failed = np.flatnonzero(~result.converged)
+            raise CalculationError(
+                f"Goal seek of '{target}' via '{input_name}' did not converge",
+                node_id=target,
+                details={
+                    "method": method,
+                    "periods": [labels[idx] for idx in failed],
+                    "residuals": result.residual[failed].tolist(),
+                },
+            )
+        return pd.Series(result.x, index=pd.Index(labels, name="period"), name=input_name)
+
+    def frame(self, inputs: Mapping[str, Any] | None = None, outputs: Sequence[str] | None = None) -> pd.DataFrame:
+        """Run the program for unbatched inputs and return nodes x periods as a DataFrame.
+
+        Raises:
+            ValueError: If *inputs* carry batch axes; use :py:meth:`evaluate` instead.
+        """
+        results = self.evaluate(inputs, outputs)
+        names = list(results)
+        if names and results[names[0]].ndim != 1:
+            raise ValueError("frame() requires unbatched inputs; use evaluate() for batched evaluation")
+        data = np.stack([results[name] for name in names]) if names else np.empty((0, len(self._periods)))
+        return pd.DataFrame(
+            data,
+            index=pd.Index(names, name="node"),
+            columns=pd.Index(self._periods.labels, name="period"),
+        )
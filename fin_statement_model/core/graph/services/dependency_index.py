@@ -0,0 +1,489 @@
+"""Maintained dependency / reverse-dependency index for graph nodes.
+
+DependencyIndex is an isolated service that records, for every registered
+node, the names it depends on and - in the opposite direction - the names of
+the nodes that depend on it. The owning graph keeps the index in sync as
+nodes are added, removed or replaced, so "who reads from X?" is a dictionary
+lookup instead of a scan over every node.
+
+Key responsibilities:
+    - Maintain forward (dependencies) and reverse (dependents) adjacency
+    - Answer successor, reachability and path queries in time proportional
+      to the edges visited
+    - Maintain a dynamic topological order (Pearce-Kelly) so inserting an
+      edge only reorders - and only searches - the affected region, and a
+      topological sort is a read of the stored order
+    - Compute the transitive dependents of an edited node, narrowed to the
+      edited periods for period-local calculations
+    - Describe cache invalidations through :class:`InvalidationReport`
+
+Examples:
+    >>> from fin_statement_model.core.graph.services.dependency_index import DependencyIndex
+    >>> index = DependencyIndex()
+    >>> index.add("GrossProfit", ["Revenue", "COGS"])
+    >>> index.add("Margin", ["GrossProfit", "Revenue"])
+    >>> index.dependents("Revenue")
+    ['GrossProfit', 'Margin']
+    >>> index.path("COGS", "Margin")
+    ['COGS', 'GrossProfit', 'Margin']
+    >>> index.topological_order()
+    ['GrossProfit', 'Margin']
+    >>> index.cycle_path("Revenue", ["Margin"])
+    ['Revenue', 'Margin', 'Revenue']
+    >>> scopes = index.affected("COGS", ["2023"], is_period_local=lambda name: True)
+    >>> {name: sorted(periods) for name, periods in scopes.items()}
+    {'COGS': ['2023'], 'GrossProfit': ['2023'], 'Margin': ['2023']}
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import logging
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ConfigDict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["DependencyIndex", "InvalidationReport"]
+
+
+class InvalidationReport(BaseModel):
+    """Immutable summary of the cache entries dropped by one mutation.
+
+    Attributes:
+        node_name: The node whose value was changed.
+        periods: The edited periods, or ``None`` when every period was affected.
+        nodes_invalidated: Number of nodes (including *node_name*) whose caches were touched.
+        entries_invalidated: Number of cached ``(node, period)`` values that were dropped.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    node_name: str
+    periods: tuple[str, ...] | None = None
+    nodes_invalidated: int = 0
+    entries_invalidated: int = 0
+
+
+class DependencyIndex:
+    """Forward and reverse adjacency of a dependency graph keyed by node name.
+
+    Edges may point at names that are not (or no longer) registered; they
+    become live again as soon as a node with that name is added.
+
+    Every name taking part in an edge also carries a position in a
+    topological order (dependencies before dependents) that is repaired
+    incrementally on each edge insertion, following Pearce & Kelly's dynamic
+    topological sort: only nodes whose position lies between the two
+    endpoints are searched and renumbered. If an insertion closes a cycle
+    (possible through unvalidated inserts) the order is marked stale and
+    rebuilt from scratch by the next query once the cycle is gone.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._dependencies: dict[str, tuple[str, ...]] = {}
+        # dict-as-ordered-set: dependents keep their registration order
+        self._dependents: dict[str, dict[str, None]] = {}
+        # Dynamic topological order: position per name, next free position,
+        # cached name list sorted by position, and whether the order is valid
+        self._position: dict[str, int] = {}
+        self._next_position = 0
+        self._sorted: list[str] | None = []
+        self._acyclic = True
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def add(self, name: str, dependencies: Iterable[str]) -> None:
+        """Register *name* with its *dependencies*, replacing any previous entry."""
+        self.remove(name)
+        self._register(name, dependencies)
+
+    def _register(self, name: str, dependencies: Iterable[str]) -> None:
+        """Record the edges of a name that currently has none."""
+        deps = tuple(dict.fromkeys(dependencies))
+        self._dependencies[name] = deps
+        self._assign_position(name)
+        for dep in deps:
+            self._dependents.setdefault(dep, {})[name] = None
+            self._assign_position(dep)
+            if self._acyclic:
+                self._insert_edge(dep, name)
+
+    def remove(self, name: str) -> None:
+        """Drop the outgoing edges of *name* (edges pointing at it are kept)."""
+        for dep in self._dependencies.pop(name, ()):
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.pop(name, None)
+                if not dependents:
+                    del self._dependents[dep]
+                    self._release_position(dep)
+        self._release_position(name)
+
+    def rename(self, old: str, new: str) -> None:
+        """Move the edges and topological position of *old* to *new*.
+
+        Only *old*'s own entries and those of its direct neighbours are
+        re-keyed, so a rename costs O(edges touched) instead of a rebuild.
+        Edges already pointing at the unregistered name *new* are merged with
+        *old*'s; the order is then recomputed by the next query.
+
+        Raises:
+            ValueError: If *new* is already registered.
+        """
+        if new in self._dependencies:
+            raise ValueError(f"Name '{new}' is already registered")
+        if old == new or old not in self._position:
+            return
+
+        def swap(name: str) -> str:
+            return new if name == old else name
+
+        deps = self._dependencies.pop(old, None)
+        if deps is not None:
+            for dep in deps:
+                if dep != old:
+                    self._dependents[dep] = {swap(user): None for user in self._dependents[dep]}
+            self._dependencies[new] = tuple(swap(dep) for dep in deps)
+        users = self._dependents.pop(old, None)
+        if users is not None:
+            for user in users:
+                name = swap(user)
+                self._dependencies[name] = tuple(swap(dep) for dep in self._dependencies[name])
+            merged = self._dependents.get(new, {})
+            merged.update((swap(user), None) for user in users)
+            self._dependents[new] = merged
+        position = self._position.pop(old)
+        if new in self._position:
+            self._acyclic = False  # two positions for one name; reorder on the next query
+        else:
+            self._position[new] = position
+        self._sorted = None
+
+    def rebuild(self, dependencies: Iterable[tuple[str, Iterable[str]]]) -> None:
+        """Replace the whole index with ``(name, dependencies)`` pairs.
+
+        Edges are registered without incremental reordering and the
+        topological order is then computed in a single pass, so bulk loads
+        cost O(nodes + edges). A cyclic result leaves the order stale.
+        """
+        self.clear()
+        self._acyclic = False  # defer ordering to one pass below
+        for name, deps in dependencies:
+            self._register(name, deps)
+        try:
+            self._reorder_from_scratch()
+        except ValueError:
+            logger.debug("Rebuilt dependency index contains a cycle; topological order left stale")
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._dependencies.clear()
+        self._dependents.clear()
+        self._position.clear()
+        self._next_position = 0
+        self._sorted = []
+        self._acyclic = True
+
+    def copy(self) -> DependencyIndex:
+        """Return an independent index with the same edges and topological order."""
+        clone = DependencyIndex()
+        clone._dependencies = dict(self._dependencies)
+        clone._dependents = {name: dict(dependents) for name, dependents in self._dependents.items()}
+        clone._position = dict(self._position)
+        clone._next_position = self._next_position
+        clone._sorted = None if self._sorted is None else list(self._sorted)
+        clone._acyclic = self._acyclic
+        return clone
+
+    def __contains__(self, name: object) -> bool:
+        """Return True if *name* is registered."""
+        return name in self._dependencies
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def dependencies(self, name: str) -> tuple[str, ...]:
+        """Return the names *name* depends on (empty if unknown)."""
+        return self._dependencies.get(name, ())
+
+    def dependents(self, name: str) -> list[str]:
+        """Return the names of nodes that directly depend on *name*, in registration order."""
+        return list(self._dependents.get(name, ()))
+
+    def is_reachable(self, source: str, target: str) -> bool:
+        """Return True if *target* can be reached from *source* by following dependents.
+
+        Runs in time proportional to the edges visited.
+        """
+        if source == target:
+            return True
+        seen = {source}
+        stack = [source]
+        while stack:
+            for dependent in self._dependents.get(stack.pop(), ()):
+                if dependent == target:
+                    return True
+                if dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        return False
+
+    def path(self, source: str, target: str) -> list[str] | None:
+        """Return a shortest dependents path ``[source, ..., target]``, or ``None``.
+
+        With ``source == target`` the result is the shortest cycle through it.
+        """
+        parents: dict[str, str | None] = {source: None}
+        queue: deque[str] = deque([source])
+        while queue:
+            current = queue.popleft()
+            for dependent in self._dependents.get(current, ()):
+                if dependent == target:
+                    path = [current]
+                    while (step := parents[path[-1]]) is not None:
+                        path.append(step)
+                    return [*reversed(path), target]
+                if dependent not in parents:
+                    parents[dependent] = current
+                    queue.append(dependent)
+        return None
+
+    def cycle_path(self, name: str, dependencies: Iterable[str]) -> list[str] | None:
+        """Return the cycle that registering *name* with *dependencies* would close.
+
+        A dependency closes a cycle when it is already reachable from *name*.
+        While the order is valid a dependency positioned before *name* is
+        ruled out immediately, and otherwise the search never leaves the
+        positions between the two endpoints.
+
+        Returns:
+            ``[name, ..., dependency, name]`` for the first offending
+            dependency, or ``None`` if the insertion keeps the graph acyclic.
+        """
+        for dep in dependencies:
+            if dep == name:
+                return [name, name]
+            if name not in self._dependents or dep not in self._position:
+                continue
+            if self._acyclic:
+                bound = self._position[dep]
+                if self._position[name] > bound:
+                    continue
+                found = self._bounded_path(name, dep, bound)
+            else:
+                found = self.path(name, dep)
+            if found is not None:
+                return [*found, name]
+        return None
+
+    def find_cycle(self) -> list[str] | None:
+        """Return one cycle ``[a, b, ..., a]`` (each name a dependent of the previous), or ``None``."""
+        if self._acyclic:
+            return None
+        order, in_degree = self._kahn()
+        if len(order) == len(in_degree):
+            return None
+        # Every name Kahn could not emit still has an unemitted dependency: walk those until one repeats
+        remaining = {name for name, degree in in_degree.items() if degree > 0}
+        current = next(iter(remaining))
+        trail: dict[str, int] = {}
+        while current not in trail:
+            trail[current] = len(trail)
+            current = next(dep for dep in self._dependencies[current] if dep in remaining)
+        walk = list(trail)[trail[current] :]
+        return [*reversed(walk), walk[-1]]
+
+    def best_effort_order(self) -> list[str]:
+        """Return every registered name, dependencies first, tolerating cycles.
+
+        Names that lie on a cycle, or downstream of one, cannot be ordered;
+        they are appended after all orderable names.
+        """
+        try:
+            return self.topological_order()
+        except ValueError:
+            order, _ = self._kahn()
+            placed = set(order)
+            ordered = [name for name in order if name in self._dependencies]
+            return ordered + [name for name in self._dependencies if name not in placed]
+
+    def topological_order(self) -> list[str]:
+        """Return the registered names with every dependency before its dependents.
+
+        Raises:
+            ValueError: If the registered edges contain a cycle.
+        """
+        if not self._acyclic:
+            self._reorder_from_scratch()
+        if self._sorted is None:
+            self._sorted = sorted(self._position, key=self._position.__getitem__)
+        return [name for name in self._sorted if name in self._dependencies]
+
+    def affected(
+        self,
+        name: str,
+        periods: Iterable[str] | None,
+        *,
+        is_period_local: Callable[[str], bool],
+        dependents: Callable[[str], Iterable[str]] | None = None,
+    ) -> dict[str, frozenset[str] | None]:
+        """Return every node whose results may change when *name* changes.
+
+        The scope of a node is the set of periods whose results may change, or
+        ``None`` for "all periods". A change to *periods* stays confined to
+        those periods while it flows through period-local nodes; as soon as
+        it reaches a node that looks at other periods (growth rates, forecasts,
+        multi-period statistics, …) that node and everything downstream of it
+        are widened to all periods.
+
+        Args:
+            name: The edited node.
+            periods: The edited periods, or ``None`` for all.
+            is_period_local: Callable telling whether a node's result for a
+                period depends only on its inputs for that same period.
+            dependents: Callable returning the direct dependents of a name,
+                for callers (scenario overlays) whose edges differ from the
+                index. Defaults to the indexed dependents.
+
+        Returns:
+            Mapping of node name to affected periods (``None`` = all), always
+            including *name* itself.
+        """
+        dependents_of = dependents if dependents is not None else (lambda node: self._dependents.get(node, ()))
+        edited = frozenset(periods) if periods is not None else None
+        scopes: dict[str, frozenset[str] | None] = {name: edited if edited is None or is_period_local(name) else None}
+        queue: deque[str] = deque([name])
+        while queue:
+            current = queue.popleft()
+            scope = scopes[current]
+            for dependent in dependents_of(current):
+                narrowed = scope if scope is not None and is_period_local(dependent) else None
+                if dependent in scopes:
+                    known = scopes[dependent]
+                    if known is None or (narrowed is not None and narrowed <= known):
+                        continue
+                    narrowed = None if narrowed is None else known | narrowed
+                scopes[dependent] = narrowed
+                queue.append(dependent)
+        return scopes
+
+    # ------------------------------------------------------------------
+    # Dynamic topological order (Pearce-Kelly)
+    # ------------------------------------------------------------------
+    def _assign_position(self, name: str) -> None:
+        """Give *name* the next free position if it has none yet."""
+        if name in self._position:
+            return
+        self._position[name] = self._next_position
+        self._next_position += 1
+        if self._sorted is not None:
+            self._sorted.append(name)
+
+    def _release_position(self, name: str) -> None:
+        """Forget the position of *name* once it no longer takes part in any edge."""
+        if name in self._dependencies or name in self._dependents or name not in self._position:
+            return
+        del self._position[name]
+        self._sorted = None
+
+    def _insert_edge(self, source: str, target: str) -> None:
+        """Restore ``position[source] < position[target]`` after adding that edge."""
+        lower = self._position[target]
+        upper = self._position[source]
+        if lower > upper:
+            return
+        # Forward search from target, confined to positions <= upper
+        forward = self._collect(target, upper, forward=True)
+        if forward is None:
+            logger.debug("Edge %s -> %s closes a cycle; topological order marked stale", source, target)
+            self._acyclic = False
+            self._sorted = None
+            return
+        # Backward search from source, confined to positions >= lower (never meets a cycle)
+        backward = self._collect(source, lower, forward=False) or []
+        position = self._position
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+        slots = sorted(position[node] for node in (*backward, *forward))
+        for node, slot in zip((*backward, *forward), slots, strict=True):
+            position[node] = slot
+        self._sorted = None
+
+    def _collect(self, start: str, bound: int, *, forward: bool) -> list[str] | None:
+        """Return the nodes reachable from *start* whose position stays within *bound*.
+
+        Forward searches follow dependents through positions ``<= bound`` and
+        return ``None`` if they reach the node at *bound* (a cycle); backward
+        searches follow dependencies through positions ``>= bound``.
+        """
+        position = self._position
+        seen = {start}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            neighbours = self._dependents.get(current, ()) if forward else self._dependencies.get(current, ())
+            for neighbour in neighbours:
+                slot = position[neighbour]
+                if forward and slot == bound:
+                    return None
+                if neighbour in seen or (slot > bound if forward else slot < bound):
+                    continue
+                seen.add(neighbour)
+                stack.append(neighbour)
+        return list(seen)
+
+    def _bounded_path(self, source: str, target: str, bound: int) -> list[str] | None:
+        """Shortest dependents path from *source* to *target* within positions ``<= bound``."""
+        parents: dict[str, str | None] = {source: None}
+        queue: deque[str] = deque([source])
+        position = self._position
+        while queue:
+            current = queue.popleft()
+            for dependent in self._dependents.get(current, ()):
+                if dependent in parents or position[dependent] > bound:
+                    continue
+                parents[dependent] = current
+                if dependent == target:
+                    path = [dependent]
+                    while (step := parents[path[-1]]) is not None:
+                        path.append(step)
+                    return path[::-1]
+                queue.append(dependent)
+        return None
+
+    def _reorder_from_scratch(self) -> None:
+        """Recompute every position with Kahn's algorithm after a cycle was recorded.
+
+        Raises:
+            ValueError: If the edges still contain a cycle.
+        """
+        order, in_degree = self._kahn()
+        if len(order) != len(in_degree):
+            raise ValueError("Cycle detected in graph, can't do a valid topological sort.")
+        self._position = {name: slot for slot, name in enumerate(order)}
+        self._next_position = len(order)
+        self._sorted = order
+        self._acyclic = True
+
+    def _kahn(self) -> tuple[list[str], dict[str, int]]:
+        """Run Kahn's algorithm; return the emitted order and the residual in-degrees."""
+        in_degree = dict.fromkeys(self._position, 0)
+        for name, deps in self._dependencies.items():
+            in_degree[name] = len(deps)
+        queue: deque[str] = deque(name for name, degree in in_degree.items() if degree == 0)
+        order: list[str] = []
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for dependent in self._dependents.get(current, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+        return order, in_degree
@@ -0,0 +1,192 @@
+"""Evaluate one graph structure for many entities at once.
+
+Running the same template over a portfolio used to mean one graph per
+company. Because every array kernel accepts leading batch axes, a
+:class:`~fin_statement_model.core.graph.services.CompiledGraph` can instead
+evaluate all companies in one pass with the entity as the batch axis. This
+module converts long input tables (``entity, item, period, value``) into
+``entity x period`` input arrays and wraps the results.
+
+Key responsibilities:
+    - Pivot a long DataFrame into one ``entity x period`` array per graph input
+    - Hold ``entity x node x period`` results and present them as a 3-D array
+      or a ``(entity, node)`` MultiIndex DataFrame (``BatchResults`` is shared
+      with other batch axes such as scenarios)
+
+Examples:
+    >>> import pandas as pd
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023", "2024"])
+    >>> _ = g.add_financial_statement_item("Revenue", {})
+    >>> _ = g.add_financial_statement_item("COGS", {})
+    >>> _ = g.add_calculation("GrossProfit", ["Revenue", "COGS"], "subtraction")
+    >>> data = pd.DataFrame({
+    ...     "entity": ["A", "A", "B", "B"],
+    ...     "item": ["Revenue", "COGS", "Revenue", "COGS"],
+    ...     "period": ["2023", "2023", "2023", "2023"],
+    ...     "value": [100.0, 60.0, 80.0, 20.0],
+    ... })
+    >>> results = g.evaluate_entities(data)
+    >>> results.to_array().shape
+    (2, 3, 2)
+    >>> results["GrossProfit"]["2023"].to_dict()
+    {'A': 40.0, 'B': 60.0}
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Hashable, Mapping, Sequence
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["BatchResults", "EntityResults", "entity_inputs"]
+
+
+def entity_inputs(
+    data: pd.DataFrame,
+    *,
+    input_names: Sequence[str],
+    periods: Sequence[str],
+    entity_col: str = "entity",
+    item_col: str = "item",
+    period_col: str = "period",
+    value_col: str = "value",
+) -> tuple[list[str], dict[str, np.ndarray]]:
+    """Pivot a long table into one ``entity x period`` array per input.
+
+    Entities keep their order of first appearance. Cells without a row are
+    NaN. Items that do not name an input and periods outside *periods* are
+    ignored (and logged).
+
+    Args:
+        data: Long table with one row per entity, item and period.
+        input_names: Inputs of the compiled graph.
+        periods: The compiled period axis.
+        entity_col: Column holding entity identifiers.
+        item_col: Column holding item (input node) names.
+        period_col: Column holding period identifiers (compared as strings).
+        value_col: Column holding numeric values.
+
+    Returns:
+        The entity identifiers and a mapping of every input found in *data*
+        to a float array of shape ``(len(entities), len(periods))``.
+
+    Raises:
+        ValueError: If a column is missing, a value is not numeric, or an
+            ``(entity, item, period)`` combination appears more than once.
+    """
+    missing = [col for col in (entity_col, item_col, period_col, value_col) if col not in data.columns]
+    if missing:
+        raise ValueError(f"Entity data is missing columns: {missing}")
+
+    entity_codes, entities = pd.factorize(data[entity_col], sort=False)
+    item_index = pd.Index(list(input_names))
+    period_index = pd.Index(list(periods))
+    item_codes = item_index.get_indexer(pd.Index(data[item_col]))
+    period_codes = period_index.get_indexer(pd.Index(data[period_col].astype(str)))
+    values = pd.to_numeric(data[value_col], errors="raise").to_numpy(dtype=float)
+
+    keep = (item_codes >= 0) & (period_codes >= 0)
+    if not keep.all():
+        skipped = data.loc[~keep, item_col].unique().tolist()
+        logger.info("Ignoring %d entity rows for unknown inputs or periods (items: %s)", int((~keep).sum()), skipped)
+    entity_codes, item_codes, period_codes = entity_codes[keep], item_codes[keep], period_codes[keep]
+    values = values[keep]
+
+    flat = (item_codes * len(entities) + entity_codes) * len(periods) + period_codes
+    if len(np.unique(flat)) != len(flat):
+        raise ValueError("Entity data contains duplicate (entity, item, period) rows")
+
+    cube = np.full((len(item_index), len(entities), len(periods)), np.nan)
+    cube[item_codes, entity_codes, period_codes] = values
+    found = np.unique(item_codes)
+    return [str(entity) for entity in entities], {item_index[code]: cube[code] for code in found}
+
+
+class BatchResults:
+    """Node values evaluated along a labelled batch axis (entities, scenarios, paths, …).
+
+    Args:
+        labels: Labels of the batch axis (first axis).
+        periods: Period identifiers (last axis).
+        values: Mapping of node name to a ``label x period`` array.
+    """
+
+    __slots__ = ("_labels", "_periods", "_values")
+
+    #: Name of the batch axis in DataFrame indexes
+    axis_name: ClassVar[str] = "label"
+
+    def __init__(self, labels: Sequence[Hashable], periods: Sequence[str], values: Mapping[str, np.ndarray]) -> None:
+        """Wrap evaluated ``label x period`` arrays."""
+        self._labels: tuple[Any, ...] = tuple(labels)
+        self._periods = tuple(periods)
+        self._values = dict(values)
+
+    @property
+    def labels(self) -> tuple[Hashable, ...]:
+        """Labels of the batch axis, in evaluation order."""
+        return self._labels
+
+    @property
+    def periods(self) -> tuple[str, ...]:
+        """Period identifiers of the last axis."""
+        return self._periods
+
+    @property
+    def node_names(self) -> tuple[str, ...]:
+        """Names of the evaluated nodes."""
+        return tuple(self._values)
+
+    def __getitem__(self, node_name: str) -> pd.DataFrame:
+        """Return one node's values as a ``label x period`` DataFrame."""
+        return pd.DataFrame(
+            self._values[node_name],
+            index=pd.Index(self._labels, name=self.axis_name),
+            columns=pd.Index(self._periods, name="period"),
+        )
+
+    def __repr__(self) -> str:
+        """Return the result dimensions."""
+        return (
+            f"{type(self).__name__}({self.axis_name}s={len(self._labels)}, nodes={len(self._values)}, "
+            f"periods={len(self._periods)})"
+        )
+
+    def to_array(self, node_names: Sequence[str] | None = None) -> np.ndarray:
+        """Return values as a ``label x node x period`` array (default: all nodes)."""
+        names = self.node_names if node_names is None else node_names
+        if not names:
+            return np.empty((len(self._labels), 0, len(self._periods)))
+        return np.stack([self._values[name] for name in names], axis=1)
+
+    def to_frame(self, node_names: Sequence[str] | None = None) -> pd.DataFrame:
+        """Return values with a ``(label, node)`` MultiIndex and periods as columns."""
+        names = list(self.node_names if node_names is None else node_names)
+        array = self.to_array(names)
+        index = pd.MultiIndex.from_product([self._labels, names], names=[self.axis_name, "node"])
+        return pd.DataFrame(
+            array.reshape(len(self._labels) * len(names), len(self._periods)),
+            index=index,
+            columns=pd.Index(self._periods, name="period"),
+        )
+
+
+class EntityResults(BatchResults):
+    """Node values for many entities evaluated against one graph structure."""
+
+    __slots__ = ()
+
+    axis_name: ClassVar[str] = "entity"
+
+    @property
+    def entities(self) -> tuple[str, ...]:
+        """Entity identifiers, in evaluation order."""
+        return self._labels
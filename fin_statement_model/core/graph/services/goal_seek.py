@@ -0,0 +1,186 @@
+"""Vectorized one-dimensional root finders for goal seeking.
+
+Back-solving an input ("which revenue gives a 1.25x DSCR?") used to be an
+external loop around ``set_value`` and ``calculate`` that cleared every
+cache on each iteration. A
+:class:`~fin_statement_model.core.graph.services.CompiledGraph` instead
+turns the question into an objective over a vector of candidate inputs -
+one independent problem per period, solved together as a batch axis - and
+hands it to one of the root finders below. Each call of the objective
+re-runs only the instructions between the input and the target.
+
+Every solver works on all problems at once and stops updating a problem as
+soon as its residual is within tolerance.
+
+Key responsibilities:
+    - Bracketing (``bisect``), ``secant`` and ``newton`` iterations over arrays
+    - Report the solution, residual, iteration count and convergence per problem
+
+Examples:
+    >>> import numpy as np
+    >>> from fin_statement_model.core.graph.services.goal_seek import secant
+    >>> result = secant(lambda x: x**2 - np.array([4.0, 9.0]), np.array([1.0, 1.0]))
+    >>> result.x.round(12).tolist(), result.converged.tolist()
+    ([2.0, 3.0], [True, True])
+
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023", "2024"])
+    >>> _ = g.add_financial_statement_item("EBITDA", {"2023": 100.0, "2024": 120.0})
+    >>> _ = g.add_financial_statement_item("DebtService", {"2023": 80.0, "2024": 80.0})
+    >>> _ = g.add_calculation("DSCR", ["EBITDA", "DebtService"], "division")
+    >>> g.goal_seek("DSCR", 1.25, "EBITDA", ["2023", "2024"]).round(6).tolist()
+    [100.0, 100.0]
+    >>> round(g.goal_seek("DSCR", 1.25, "DebtService", "2024", method="bisect", bracket=(1.0, 500.0)), 6)
+    96.0
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+__all__: list[str] = ["METHODS", "RootResult", "bisect", "newton", "secant"]
+
+#: Method names accepted by :py:meth:`CompiledGraph.goal_seek`
+METHODS: tuple[str, ...] = ("bisect", "secant", "newton")
+
+
+@dataclass(frozen=True)
+class RootResult:
+    """Solutions of a batch of root-finding problems.
+
+    Attributes:
+        x: Final estimate per problem.
+        residual: Objective value at *x*.
+        converged: Whether ``|residual| <= tol`` was reached.
+        iterations: Objective evaluations used per problem.
+    """
+
+    x: np.ndarray
+    residual: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+
+
+def _done(residual: np.ndarray, tol: np.ndarray) -> np.ndarray:
+    return np.asarray(np.abs(residual) <= tol)
+
+
+def bisect(
+    f: Callable[[np.ndarray], np.ndarray],
+    lower: np.ndarray,
+    upper: np.ndarray,
+    *,
+    tol: float | np.ndarray = 1e-9,
+    max_iter: int = 200,
+) -> RootResult:
+    """Halve a sign-changing bracket until the residual is within *tol*.
+
+    Args:
+        f: Objective evaluated for every problem at once.
+        lower: Lower end of each bracket.
+        upper: Upper end of each bracket.
+        tol: Absolute residual tolerance (scalar or per problem).
+        max_iter: Maximum number of halvings.
+
+    Raises:
+        ValueError: If ``f`` has the same sign at both ends of a bracket;
+            the message lists the offending problem indices.
+    """
+    lo, hi = np.array(lower, dtype=float), np.array(upper, dtype=float)
+    f_lo, f_hi = f(lo), f(hi)
+    tol = np.broadcast_to(np.asarray(tol, dtype=float), lo.shape)
+    bad = np.flatnonzero(~(np.sign(f_lo) * np.sign(f_hi) <= 0))
+    if bad.size:
+        raise ValueError(f"Bracket does not contain a sign change for problems {bad.tolist()}")
+    at_lo = np.abs(f_lo) <= np.abs(f_hi)
+    x, residual = np.where(at_lo, lo, hi), np.where(at_lo, f_lo, f_hi)
+    iterations = np.full(lo.shape, 2)
+    for _ in range(max_iter):
+        active = ~_done(residual, tol)
+        if not active.any():
+            break
+        mid = np.where(active, 0.5 * (lo + hi), x)
+        f_mid = f(mid)
+        x, residual = np.where(active, mid, x), np.where(active, f_mid, residual)
+        iterations += active
+        left = active & (np.sign(f_mid) == np.sign(f_lo))
+        lo, f_lo = np.where(left, mid, lo), np.where(left, f_mid, f_lo)
+        hi = np.where(active & ~left, mid, hi)
+    return RootResult(x, residual, _done(residual, tol), iterations)
+
+
+def secant(
+    f: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    x1: np.ndarray | None = None,
+    *,
+    tol: float | np.ndarray = 1e-9,
+    max_iter: int = 100,
+) -> RootResult:
+    """Find roots with the secant method from two starting points.
+
+    Args:
+        f: Objective evaluated for every problem at once.
+        x0: First starting point.
+        x1: Second starting point. Defaults to *x0* moved by
+            ``1e-4 * max(1, |x0|)``.
+        tol: Absolute residual tolerance (scalar or per problem).
+        max_iter: Maximum number of secant steps.
+    """
+    prev = np.array(x0, dtype=float)
+    x = prev + 1e-4 * np.maximum(1.0, np.abs(prev)) if x1 is None else np.array(x1, dtype=float)
+    f_prev, residual = f(prev), f(x)
+    tol = np.broadcast_to(np.asarray(tol, dtype=float), x.shape)
+    iterations = np.full(x.shape, 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iter):
+            step = residual * (x - prev) / (residual - f_prev)
+            active = ~_done(residual, tol) & np.isfinite(step)
+            if not active.any():
+                break
+            candidate = np.where(active, x - step, x)
+            f_candidate = f(candidate)
+            prev, f_prev = np.where(active, x, prev), np.where(active, residual, f_prev)
+            x, residual = candidate, np.where(active, f_candidate, residual)
+            iterations += active
+    return RootResult(x, residual, _done(residual, tol), iterations)
+
+
+def newton(
+    f: Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]],
+    x0: np.ndarray,
+    *,
+    tol: float | np.ndarray = 1e-9,
+    max_iter: int = 50,
+) -> RootResult:
+    """Find roots with Newton's method.
+
+    Args:
+        f: Returns the objective and its derivative for every problem at once.
+        x0: Starting point.
+        tol: Absolute residual tolerance (scalar or per problem).
+        max_iter: Maximum number of Newton steps.
+    """
+    x = np.array(x0, dtype=float)
+    residual, slope = f(x)
+    tol = np.broadcast_to(np.asarray(tol, dtype=float), x.shape)
+    iterations = np.ones(x.shape, dtype=int)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iter):
+            step = residual / slope
+            active = ~_done(residual, tol) & np.isfinite(step)
+            if not active.any():
+                break
+            candidate = np.where(active, x - step, x)
+            f_candidate, slope_candidate = f(candidate)
+            x = candidate
+            residual = np.where(active, f_candidate, residual)
+            slope = np.where(active, slope_candidate, slope)
+            iterations += active
+    return RootResult(x, residual, _done(residual, tol), iterations)
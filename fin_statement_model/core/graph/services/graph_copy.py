@@ -0,0 +1,232 @@
+"""Structural copies of graph nodes without serialisation.
+
+``Graph.clone`` used to write the graph to a definition dict and read it
+back, re-running node factories, input validation and topological sorting
+for every node. :func:`copy_nodes` copies the node objects directly instead:
+each node's attributes are copied onto a new instance of its class, references to other nodes (``inputs`` lists and
+dicts, ``input_node``) are re-pointed at the copies through an
+``id(original) -> copy`` map, and mutable containers held by a node (value
+dicts, growth-rate and period lists) are copied one level deep. Calculation
+strategies and user callables are immutable once built and are shared.
+
+With ``copy_on_write=True`` the values of item nodes are not copied at all:
+the original and the copy read one dict through :class:`SharedValues` views,
+and whichever side writes first takes a private copy of it.
+
+Key responsibilities:
+    - Copy a name -> node mapping with inter-node references rewired
+    - Drop per-instance ``calculate`` shims and bound result caches from the copies
+    - Share item values copy-on-write between graphs (:class:`SharedValues`)
+
+Examples:
+    >>> from fin_statement_model.core.graph.services.graph_copy import copy_nodes
+    >>> from fin_statement_model.core.nodes import CalculationNode, FinancialStatementItemNode
+    >>> from fin_statement_model.core.calculations import AdditionCalculation
+    >>> a = FinancialStatementItemNode("A", {"2023": 1.0})
+    >>> total = CalculationNode("Total", [a], AdditionCalculation())
+    >>> copies = copy_nodes({"A": a, "Total": total}, copy_on_write=True)
+    >>> copies["Total"].inputs[0] is copies["A"]
+    True
+    >>> copies["A"].values["2023"] = 5.0
+    >>> a.values["2023"], copies["Total"].calculate("2023")
+    (1.0, 5.0)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+import logging
+from typing import TYPE_CHECKING, Any
+
+from fin_statement_model.core.graph.services.value_store import ColumnarValues
+from fin_statement_model.core.nodes import FinancialStatementItemNode, Node
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from fin_statement_model.core.graph.services.value_store import ColumnarValueStore
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["SharedValues", "copy_nodes"]
+
+# ``calculate`` shims (profiling, circular groups) are not copied
+_SKIPPED = frozenset({"calculate", "_calculate_shim"})
+_SLOTS: dict[type, tuple[str, ...]] = {}
+
+
+class SharedValues(MutableMapping[str, float]):
+    """Copy-on-write ``period -> value`` mapping over a dict shared with other views.
+
+    Reads go to the shared dict. The first write through a view replaces its
+    reference with a private copy, so the other views keep seeing the data
+    as it was when they were shared.
+    """
+
+    __slots__ = ("_data", "_owned")
+
+    def __init__(self, data: dict[str, float], *, owned: bool = False) -> None:
+        """Wrap *data*; ``owned=False`` means another view may read it too."""
+        self._data = data
+        self._owned = owned
+
+    @classmethod
+    def share(cls, values: Mapping[str, float]) -> tuple[SharedValues, SharedValues]:
+        """Return two views over *values*: one to keep in place of it and one for the copy."""
+        if isinstance(values, SharedValues):
+            values._owned = False
+            return values, cls(values._data)
+        data = values if type(values) is dict else dict(values)
+        return cls(data), cls(data)
+
+    @property
+    def shared(self) -> bool:
+        """True until this view has written to (and so copied) the shared data."""
+        return not self._owned
+
+    def _writable(self) -> dict[str, float]:
+        if not self._owned:
+            self._data = dict(self._data)
+            self._owned = True
+        return self._data
+
+    def __getitem__(self, period: str) -> float:
+        """Return the value for *period*."""
+        return self._data[period]
+
+    def get(self, period: str, default: Any = None) -> Any:
+        """Return the value for *period*, or *default* if there is none."""
+        return self._data.get(period, default)
+
+    def __contains__(self, period: object) -> bool:
+        """Return True if *period* has a value."""
+        return period in self._data
+
+    def __setitem__(self, period: str, value: float) -> None:
+        """Store *value* for *period*, copying the shared data first if needed."""
+        self._writable()[period] = value
+
+    def __delitem__(self, period: str) -> None:
+        """Remove the value for *period*, copying the shared data first if needed."""
+        if period not in self._data:
+            raise KeyError(period)
+        del self._writable()[period]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over periods with a value."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of periods with a value."""
+        return len(self._data)
+
+    def copy(self) -> dict[str, float]:
+        """Return a detached ``dict`` snapshot."""
+        return dict(self._data)
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation."""
+        return f"SharedValues({self._data!r})"
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Names of the ``__slots__`` declared along *cls*'s MRO (cached per class)."""
+    names = _SLOTS.get(cls)
+    if names is None:
+        declared: list[str] = []
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            declared.extend([slots] if isinstance(slots, str) else slots)
+        names = _SLOTS[cls] = tuple(name for name in dict.fromkeys(declared) if name not in {"__dict__", "__weakref__"})
+    return names
+
+
+def _remap(value: Any, copy_of: Callable[[Node], Node]) -> Any:
+    """Return *value* with node references replaced by their copies and containers copied."""
+    if isinstance(value, Node):
+        return copy_of(value)
+    if type(value) is list:
+        return [copy_of(item) if isinstance(item, Node) else item for item in value]
+    if type(value) is dict:
+        return {key: copy_of(item) if isinstance(item, Node) else item for key, item in value.items()}
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def copy_nodes(
+    nodes: Mapping[str, Node],
+    *,
+    copy_on_write: bool = False,
+    value_store: ColumnarValueStore | None = None,
+    copy_references: bool = True,
+) -> dict[str, Node]:
+    """Copy *nodes*, re-pointing references between them at the copies.
+
+    Nodes referenced from *nodes* but not part of it (such as the history
+    node a forecast replaced under the same name) are copied as well unless
+    *copy_references* is ``False``, in which case the copies keep pointing
+    at them. The
+    copies have no per-instance ``calculate`` shims (profiling, circular
+    groups) and an empty result cache; the graph they are added to binds
+    its own.
+
+    Args:
+        nodes: The nodes to copy, by name.
+        copy_on_write: Share item values with the originals through
+            :class:`SharedValues` instead of copying them. The originals'
+            ``values`` are wrapped as well, so writes on either side stay private.
+        value_store: The copy of the originals' columnar store, if their item
+            values live in one; copied item nodes then get views onto it.
+        copy_references: Copy nodes that are referenced but not in *nodes*
+            (default) instead of sharing them.
+
+    Returns:
+        The copies, by name, in the order of *nodes*.
+    """
+    copies: dict[int, Node] = {}
+    queue: list[Node] = []
+
+    def copy_of(node: Node, *, new: bool = copy_references) -> Node:
+        clone = copies.get(id(node))
+        if clone is None:
+            if not new:
+                return node
+            cls = node.node_class
+            clone = copies[id(node)] = cls.__new__(cls)
+            queue.append(node)
+        return clone
+
+    for node in nodes.values():
+        copy_of(node, new=True)
+    while queue:
+        original = queue.pop()
+        clone = copies[id(original)]
+        is_item = isinstance(original, FinancialStatementItemNode)
+        state = getattr(original, "__dict__", None)
+        if state is not None:
+            clone.__dict__.update(
+                (attr, _remap(value, copy_of))
+                for attr, value in state.items()
+                if attr not in _SKIPPED and not (is_item and attr == "values")
+            )
+        for attr in _slot_names(type(clone)):
+            if attr in _SKIPPED or (is_item and attr == "values"):
+                continue
+            try:
+                value = getattr(original, attr)
+            except AttributeError:  # unset slot
+                continue
+            setattr(clone, attr, _remap(value, copy_of))
+        # Result caches were copied by reference; hand each copy an empty one of its own
+        clone.bind_cache({})
+        if is_item:
+            values = original.values
+            if value_store is not None and isinstance(values, ColumnarValues) and original.name in value_store:
+                clone.values = value_store.view(original.name)
+            elif copy_on_write:
+                original.values, clone.values = SharedValues.share(values)
+            else:
+                clone.values = dict(values)
+    logger.debug("Copied %d nodes (copy_on_write=%s)", len(copies), copy_on_write)
+    return {name: copies[id(node)] for name, node in nodes.items()}
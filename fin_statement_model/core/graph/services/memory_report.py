@@ -0,0 +1,268 @@
+"""Approximate memory footprint of a graph, by component and node type.
+
+MemoryReport answers "where do the bytes of this graph go?". It walks the
+objects reachable from each part of a graph with :func:`sys.getsizeof` and
+attributes every object to the first part that reaches it, so nothing is
+counted twice. Parts are measured in a fixed order:
+
+1. **periods** - the period service (sorted list, membership set, tuple
+   snapshot and :class:`PeriodIndex`), which also claims the period labels
+   shared by value and cache dicts;
+2. per node, its **caches** (bound :class:`CachedValues` views and the
+   :class:`ValueCache` slots holding its results, or a private result
+   dict), its **values** (the ``period -> value`` store of item and forecast
+   nodes) and then the **node** object itself (name, inputs, calculation
+   strategy, ...; other nodes are never followed);
+3. the graph-wide stores: the rest of the value cache (indexes, recency
+   order) under **caches**, a columnar value store under **values**;
+4. the adjustment manager under **adjustments**.
+
+Per-node bytes are grouped by node type; graph-wide store overhead only
+appears in the totals. The numbers are approximate (interpreter-internal
+allocations, interned strings and shared constants are not exact), but they
+are stable enough to compare graphs and to set budgets.
+
+Key responsibilities:
+    - Measure the deep size of objects, counting shared objects once
+    - Attribute bytes to nodes, values, caches, adjustments and periods
+    - Group per-node bytes by node type and report them as a pandas DataFrame
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023", "2024"])
+    >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0, "2024": 110.0})
+    >>> _ = g.add_calculation("Double", ["Revenue", "Revenue"], "addition")
+    >>> _ = g.calculate("Double", "2023")
+    >>> report = g.memory_report()
+    >>> sorted(report.by_node_type)
+    ['CalculationNode', 'FinancialStatementItemNode']
+    >>> report.by_node_type["FinancialStatementItemNode"].values > 0
+    True
+    >>> report.total == report.nodes + report.values + report.caches + report.adjustments + report.periods
+    True
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import gc
+import logging
+import sys
+from types import BuiltinFunctionType, FunctionType, MappingProxyType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, Field
+
+from fin_statement_model.core.graph.services.graph_copy import _slot_names
+from fin_statement_model.core.graph.services.value_cache import ValueCache
+from fin_statement_model.core.graph.services.value_store import ColumnarValueStore
+from fin_statement_model.core.nodes import Node
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["MemoryReport", "NodeTypeMemory", "deep_sizeof"]
+
+_COLUMNS = ["count", "nodes", "values", "caches", "total"]
+
+# Counted but never followed: immutable leaves, and callables (their globals / closures belong elsewhere)
+_LEAVES = (str, bytes, int, float, complex, bool, type(None), FunctionType, BuiltinFunctionType, MethodType)
+# Attributes holding a node's own result cache (CalculationNode / CustomCalculationNode, ForecastNode)
+_NODE_CACHE_ATTRS = ("_values", "_cache")
+# Graph-wide stores a node may point at; measured once on their own
+_SHARED_STORES: tuple[type, ...] = (Node, ValueCache, ColumnarValueStore)
+
+
+def deep_sizeof(root: object, seen: set[int] | None = None, *, stop: tuple[type, ...] = ()) -> int:
+    """Return the approximate bytes of *root* and every object it reaches.
+
+    Containers (and the mappings behind read-only proxies), instance
+    ``__dict__``/``__slots__`` attributes and NumPy array bases are followed;
+    functions are counted without their globals, and classes and modules are
+    not counted. Objects whose id is in *seen* are
+    skipped and every counted object is added to it, so sizing several roots
+    with one *seen* set counts shared objects once.
+
+    Args:
+        root: The object to measure (always measured, even if it is a *stop* type).
+        seen: Ids of objects already counted elsewhere; updated in place.
+        stop: Types whose instances below *root* are neither counted nor followed.
+
+    Returns:
+        The number of bytes.
+
+    Examples:
+        >>> seen: set[int] = set()
+        >>> shared = list(range(100))
+        >>> deep_sizeof({"a": shared}, seen) > deep_sizeof({"b": shared}, seen)
+        True
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack: list[Any] = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type | ModuleType) or (obj is not root and isinstance(obj, stop)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, _LEAVES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif isinstance(obj, MappingProxyType):
+            # A read-only view counts the mapping it wraps
+            stack.extend(gc.get_referents(obj))
+        elif isinstance(obj, np.ndarray):
+            # getsizeof includes the buffer of arrays that own their data; views count their base
+            if obj.base is not None:
+                stack.append(obj.base)
+        else:
+            state = getattr(obj, "__dict__", None)
+            if state is not None:
+                stack.append(state)
+            for attr in _slot_names(type(obj)):
+                value = getattr(obj, attr, None)
+                if value is not None:
+                    stack.append(value)
+    return total
+
+
+class NodeTypeMemory(BaseModel):
+    """Bytes held by the nodes of one type.
+
+    Attributes:
+        count: Number of nodes of this type.
+        nodes: Bytes of the node objects (name, inputs, calculation strategy, ...).
+        values: Bytes of their ``period -> value`` stores.
+        caches: Bytes of their calculated results.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    count: int = 0
+    nodes: int = 0
+    values: int = 0
+    caches: int = 0
+
+    @property
+    def total(self) -> int:
+        """Bytes of nodes, values and caches together."""
+        return self.nodes + self.values + self.caches
+
+
+class MemoryReport(BaseModel):
+    """Immutable snapshot of a graph's approximate memory footprint in bytes.
+
+    The component totals include graph-wide structures (value cache indexes,
+    a columnar value store) that are not attributed to a node type, so
+    e.g. ``caches`` can exceed the sum of the per-type ``caches``.
+
+    Attributes:
+        nodes: Bytes of the node objects.
+        values: Bytes of item value stores (per-node dicts or the columnar store).
+        caches: Bytes of calculated values (value cache and node-level caches).
+        adjustments: Bytes of the adjustment manager and its adjustments.
+        periods: Bytes of the period tables.
+        by_node_type: Per node type breakdown, keyed by class name.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    nodes: int = 0
+    values: int = 0
+    caches: int = 0
+    adjustments: int = 0
+    periods: int = 0
+    by_node_type: dict[str, NodeTypeMemory] = Field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """Bytes of all components together."""
+        return self.nodes + self.values + self.caches + self.adjustments + self.periods
+
+    @classmethod
+    def measure(
+        cls,
+        nodes: Iterable[Node],
+        *,
+        periods: object = None,
+        cache: ValueCache | None = None,
+        value_store: ColumnarValueStore | None = None,
+        adjustments: object = None,
+        stop: tuple[type, ...] = (),
+    ) -> MemoryReport:
+        """Measure *nodes* and the graph-wide stores they use.
+
+        Args:
+            nodes: The graph's nodes.
+            periods: The period tables (e.g. a ``PeriodService``).
+            cache: The value cache holding calculated results.
+            value_store: The columnar item value store, if enabled.
+            adjustments: The adjustment storage (e.g. an ``AdjustmentManager``).
+            stop: Further types never to follow, such as the owning graph class.
+
+        Returns:
+            The report.
+        """
+        seen: set[int] = set()
+        stop = (*_SHARED_STORES, *stop)
+        period_bytes = deep_sizeof(periods, seen, stop=stop) if periods is not None else 0
+        rows: dict[str, dict[str, int]] = {}
+        for node in nodes:
+            row = rows.setdefault(node.node_class.__name__, dict.fromkeys(("count", "nodes", "values", "caches"), 0))
+            row["count"] += 1
+            if cache is not None:
+                row["caches"] += deep_sizeof(cache.slot(node.name), seen, stop=stop)
+            for attr in _NODE_CACHE_ATTRS:
+                own = getattr(node, attr, None)
+                if isinstance(own, Mapping):
+                    row["caches"] += deep_sizeof(own, seen, stop=stop)
+            values = getattr(node, "values", None)
+            if isinstance(values, Mapping):
+                row["values"] += deep_sizeof(values, seen, stop=stop)
+            row["nodes"] += deep_sizeof(node, seen, stop=stop)
+        by_type = {name: NodeTypeMemory(**row) for name, row in sorted(rows.items())}
+        shared_values = deep_sizeof(value_store, seen, stop=stop) if value_store is not None else 0
+        shared_caches = deep_sizeof(cache, seen, stop=stop) if cache is not None else 0
+        report = cls(
+            nodes=sum(row.nodes for row in by_type.values()),
+            values=sum(row.values for row in by_type.values()) + shared_values,
+            caches=sum(row.caches for row in by_type.values()) + shared_caches,
+            adjustments=deep_sizeof(adjustments, seen, stop=stop) if adjustments is not None else 0,
+            periods=period_bytes,
+            by_node_type=by_type,
+        )
+        logger.debug("Measured %d bytes over %d node types", report.total, len(by_type))
+        return report
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return one row per node type, largest total first.
+
+        Columns: ``count``, ``nodes``, ``values``, ``caches`` and ``total`` (bytes),
+        indexed by node type.
+        """
+        frame = pd.DataFrame(
+            [(row.count, row.nodes, row.values, row.caches, row.total) for row in self.by_node_type.values()],
+            index=pd.Index(list(self.by_node_type), name="node_type"),
+            columns=_COLUMNS,
+        )
+        return frame.sort_values("total", ascending=False, kind="stable")
+
+    def summary(self) -> dict[str, int]:
+        """Return the component totals (and ``total``) as a plain dict."""
+        return {
+            "nodes": self.nodes,
+            "values": self.values,
+            "caches": self.caches,
+            "adjustments": self.adjustments,
+            "periods": self.periods,
+            "total": self.total,
+        }
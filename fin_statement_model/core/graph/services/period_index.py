@@ -0,0 +1,229 @@
+"""Interned, ordered and immutable period tables with integer ordinals.
+
+A :class:`PeriodIndex` maps each period label of a timeline to its position
+(its *ordinal*) and back. Tables are immutable and interned: building one for
+the same labels twice returns the same object, and the labels themselves are
+interned strings, so a graph, its clones, overlays and compiled evaluators all
+share one table. Ordinal lookups, lag/lead and range queries are O(1) (ranges
+are one slice), replacing repeated ``sorted(...)`` / ``list.index(...)`` scans
+and lexicographic label comparisons.
+
+String period labels remain the public currency of the graph API; the index is
+the thin translation layer between them and integer positions.
+
+Key responsibilities:
+    - Assign stable integer ordinals (:data:`PeriodKey`) to ordered period labels
+    - Translate labels to ordinals and back, and answer lag/lead/range queries
+    - Share one immutable table per distinct timeline
+
+Examples:
+    >>> from fin_statement_model.core.graph.services.period_index import PeriodIndex
+    >>> index = PeriodIndex.of(["2022", "2023", "2024"])
+    >>> index.ordinal("2023")
+    1
+    >>> index.shift("2023", -1), index.shift("2023", 2)
+    ('2022', None)
+    >>> index.span("2023", "2024")
+    ('2023', '2024')
+    >>> PeriodIndex.of(["2022", "2023", "2024"]) is index
+    True
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+import logging
+import sys
+from typing import NewType, overload
+import weakref
+
+from fin_statement_model.core.errors import PeriodError
+
+__all__: list[str] = ["PeriodIndex", "PeriodKey"]
+
+logger = logging.getLogger(__name__)
+
+#: Integer position of a period within a :class:`PeriodIndex`.
+PeriodKey = NewType("PeriodKey", int)
+
+# Longest timeline whose labels are all listed by ``repr``
+_REPR_LIMIT = 6
+
+
+class PeriodIndex(Sequence[str]):
+    """Immutable ordered table of period labels with integer ordinals.
+
+    Build tables with :meth:`of`, which keeps the labels in the given order and
+    returns the interned table for them; ordinals never depend on how the
+    labels would sort as strings. As a :class:`~collections.abc.Sequence` the
+    index behaves like the tuple of its labels.
+
+    Attributes:
+        labels: The period labels in order.
+
+    Examples:
+        >>> index = PeriodIndex.of(["FY9", "FY10", "FY11"])
+        >>> index.labels
+        ('FY9', 'FY10', 'FY11')
+        >>> index.previous("FY9") is None, index.next("FY9")
+        (True, 'FY10')
+        >>> index.ordinals(["FY11", "FY9"])
+        [2, 0]
+    """
+
+    __slots__ = ("__weakref__", "_ordinals", "labels")
+
+    _interned: weakref.WeakValueDictionary[tuple[str, ...], PeriodIndex] = weakref.WeakValueDictionary()
+
+    labels: tuple[str, ...]
+    _ordinals: dict[str, PeriodKey]
+
+    def __init__(self, labels: Iterable[str]) -> None:
+        """Build a table for *labels* in order; prefer the interning :meth:`of`.
+
+        Raises:
+            ValueError: If a label occurs twice.
+        """
+        self.labels = tuple(sys.intern(str(label)) for label in labels)
+        self._ordinals = {label: PeriodKey(pos) for pos, label in enumerate(self.labels)}
+        if len(self._ordinals) != len(self.labels):
+            raise ValueError("Period labels must be unique")
+
+    @classmethod
+    def of(cls, labels: Iterable[str]) -> PeriodIndex:
+        """Return the shared table for *labels* in the given order.
+
+        Raises:
+            ValueError: If a label occurs twice.
+        """
+        key = tuple(labels)
+        index = cls._interned.get(key)
+        if index is None:
+            index = cls._interned[key] = cls(key)
+        return index
+
+    # ------------------------------------------------------------------
+    # Translation
+    # ------------------------------------------------------------------
+    def ordinal(self, period: str) -> PeriodKey:
+        """Return the ordinal of *period*.
+
+        Raises:
+            PeriodError: If *period* is not in the index.
+        """
+        try:
+            return self._ordinals[period]
+        except KeyError:
+            raise PeriodError("Period not found", period=period, available_periods=list(self.labels)) from None
+
+    def get(self, period: str) -> PeriodKey | None:
+        """Return the ordinal of *period*, or ``None`` if it is not in the index."""
+        return self._ordinals.get(period)
+
+    def ordinals(self, periods: Iterable[str]) -> list[PeriodKey]:
+        """Return the ordinal of each of *periods*.
+
+        Raises:
+            PeriodError: If a period is not in the index.
+        """
+        return [self.ordinal(period) for period in periods]
+
+    def label(self, ordinal: int) -> str:
+        """Return the label at *ordinal* (negative ordinals are not wrapped).
+
+        Raises:
+            PeriodError: If *ordinal* is out of range.
+        """
+        if not 0 <= ordinal < len(self.labels):
+            raise PeriodError(f"Period ordinal {ordinal} out of range for {len(self.labels)} periods")
+        return self.labels[ordinal]
+
+    # ------------------------------------------------------------------
+    # Lag / lead / ranges
+    # ------------------------------------------------------------------
+    def shift(self, period: str, offset: int) -> str | None:
+        """Return the period *offset* steps after *period* (before it when negative), or ``None``.
+
+        Raises:
+            PeriodError: If *period* is not in the index.
+        """
+        target = self.ordinal(period) + offset
+        return self.labels[target] if 0 <= target < len(self.labels) else None
+
+    def previous(self, period: str) -> str | None:
+        """Return the period before *period*, or ``None`` for the first one."""
+        return self.shift(period, -1)
+
+    def next(self, period: str) -> str | None:
+        """Return the period after *period*, or ``None`` for the last one."""
+        return self.shift(period, 1)
+
+    def span(self, start: str | None = None, end: str | None = None) -> tuple[str, ...]:
+        """Return the periods from *start* to *end*, both inclusive (open ends when ``None``).
+
+        Raises:
+            PeriodError: If *start* or *end* is not in the index.
+        """
+        first = 0 if start is None else self.ordinal(start)
+        last = len(self.labels) - 1 if end is None else self.ordinal(end)
+        return self.labels[first : last + 1]
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+    @overload
+    def __getitem__(self, position: int) -> str: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> tuple[str, ...]: ...
+
+    def __getitem__(self, position: int | slice) -> str | tuple[str, ...]:
+        """Return the label(s) at *position*, like indexing :attr:`labels`."""
+        return self.labels[position]
+
+    def __len__(self) -> int:
+        """Return the number of periods."""
+        return len(self.labels)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the labels in order."""
+        return iter(self.labels)
+
+    def __contains__(self, period: object) -> bool:
+        """Return ``True`` if *period* is in the index (O(1))."""
+        return period in self._ordinals
+
+    def __reversed__(self) -> Iterator[str]:
+        """Iterate over the labels in reverse order."""
+        return reversed(self.labels)
+
+    def index(self, period: str, start: int = 0, stop: int | None = None) -> int:
+        """Return the ordinal of *period* (O(1)), as :meth:`tuple.index` would.
+
+        Raises:
+            ValueError: If *period* is not in the index (or not within *start*:*stop*).
+        """
+        ordinal = self._ordinals.get(period)
+        if ordinal is None or ordinal < start or (stop is not None and ordinal >= stop):
+            raise ValueError(f"{period!r} is not in the period index")
+        return ordinal
+
+    def count(self, period: str) -> int:
+        """Return 1 if *period* is in the index, else 0."""
+        return int(period in self._ordinals)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equal to tables with the same labels."""
+        if isinstance(other, PeriodIndex):
+            return self.labels == other.labels
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash by labels, consistently with :meth:`__eq__`."""
+        return hash(self.labels)
+
+    def __repr__(self) -> str:
+        """Return the labels, abbreviated for long timelines."""
+        if len(self.labels) <= _REPR_LIMIT:
+            return f"PeriodIndex({list(self.labels)!r})"
+        return f"PeriodIndex([{self.labels[0]!r}, ..., {self.labels[-1]!r}], n={len(self.labels)})"
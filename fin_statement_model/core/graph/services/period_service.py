@@ -1,69 +1,132 @@
-"""Simple PeriodService stub - manages the list of unique, sorted periods.
+"""PeriodService - manages the sorted set of unique period identifiers.
 
 PeriodService is responsible for managing the list of unique, sorted period identifiers used in the graph.
 It provides methods for adding, validating, and clearing periods, ensuring that all period operations are
 consistent and deduplicated.
 
+Periods are kept in a sorted list next to a membership set: adding periods
+that are already known costs one set lookup each, a few new periods are
+placed with binary search (:func:`bisect.insort`) instead of re-sorting, and
+readers get one cached immutable tuple (and :class:`PeriodIndex`) snapshot
+that is only rebuilt after the periods change.
+
 Key responsibilities:
     - Maintain a sorted, unique list of period identifiers
     - Add new periods and ensure uniqueness
-    - Validate and clear periods
+    - Validate (O(1) membership) and clear periods
+    - Expose the periods as an interned :class:`PeriodIndex` with integer ordinals
 
 Examples:
     >>> from fin_statement_model.core.graph.services.period_service import PeriodService
     >>> ps = PeriodService()
     >>> ps.add_periods(["2023", "2022"])
     >>> ps.periods
-    ['2022', '2023']
+    ('2022', '2023')
+    >>> ps.periods is ps.periods
+    True
+    >>> "2023" in ps, len(ps)
+    (True, 2)
+    >>> ps.index.ordinal("2023")
+    1
     >>> ps.clear()
     >>> ps.periods
-    []
+    ()
 """
 
 from __future__ import annotations
 
+import bisect
+from typing import TYPE_CHECKING
+
+from fin_statement_model.core.graph.services.period_index import PeriodIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 __all__: list[str] = ["PeriodService"]
 
+# Up to this many new periods per call are inserted one by one; more are merged with one sort
+_INSORT_LIMIT = 8
 
-class PeriodService:  # pylint: disable=too-few-public-methods
+
+class PeriodService:
     """Encapsulate period management helpers.
 
-    The service now owns its internal list of period identifiers.  Call-sites
-    should interact exclusively via the public API - direct mutation of the
-    underlying list is no longer supported (removed legacy shim).
+    The service owns a sorted list of period identifiers and a set of the
+    same identifiers. Call-sites interact exclusively via the public API;
+    :attr:`periods` is an immutable snapshot.
     """
 
     def __init__(self) -> None:
         """Create an empty PeriodService with no registered periods."""
-        # Internal, sorted list of unique period identifiers.
+        # Internal, sorted list of unique period identifiers, and the same as a set
         self._periods: list[str] = []
+        self._members: set[str] = set()
+        # Snapshots handed to readers; dropped whenever the periods change
+        self._snapshot: tuple[str, ...] | None = ()
+        self._index: PeriodIndex | None = None
 
     # ------------------------------------------------------------------
     # Public API --------------------------------------------------------
     # ------------------------------------------------------------------
     @property
-    def periods(self) -> list[str]:
-        """Return an immutable **sorted** list of period identifiers."""
-        # Return a shallow copy to prevent accidental mutation
-        return list(self._periods)
-
-    def add_periods(self, periods: list[str]) -> None:
-        """Add *periods* ensuring uniqueness & sorted order."""
-        if not isinstance(periods, list):  # defensive - mirroring existing Graph.guards
+    def periods(self) -> tuple[str, ...]:
+        """Return the sorted period identifiers as an immutable (cached) tuple."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._periods)
+        return self._snapshot
+
+    @property
+    def index(self) -> PeriodIndex:
+        """Return the periods as an immutable :class:`PeriodIndex` (label <-> ordinal)."""
+        if self._index is None:
+            self._index = PeriodIndex.of(self.periods)
+        return self._index
+
+    def add_periods(self, periods: Iterable[str]) -> None:
+        """Add *periods* ensuring uniqueness & sorted order.
+
+        Known periods are skipped in O(1) each; only new ones touch the
+        sorted list.
+
+        Raises:
+            TypeError: If *periods* is a single string rather than a collection.
+        """
+        if isinstance(periods, str):
             raise TypeError("Periods must be provided as a list of strings.")
-        combined = set(self._periods).union(periods)
-        sorted_periods = sorted(combined)
-        # Mutate in place to keep external references alive
-        self._periods.clear()
-        self._periods.extend(sorted_periods)
+        members = self._members
+        new = [period for period in dict.fromkeys(periods) if period not in members]
+        if not new:
+            return
+        if len(new) <= _INSORT_LIMIT:
+            for period in new:
+                bisect.insort(self._periods, period)
+        else:
+            # One merge sort; the existing run is already ordered
+            self._periods.extend(new)
+            self._periods.sort()
+        members.update(new)
+        self._snapshot = None
+        self._index = None
 
     # ------------------------------------------------------------------
     # Convenience helpers ------------------------------------------------
     # ------------------------------------------------------------------
     def contains(self, period: str) -> bool:
-        """Return ``True`` if *period* is already registered."""
-        return period in self._periods
+        """Return ``True`` if *period* is already registered (O(1))."""
+        return period in self._members
+
+    def __contains__(self, period: object) -> bool:
+        """Return ``True`` if *period* is already registered (O(1))."""
+        return period in self._members
+
+    def __len__(self) -> int:
+        """Return the number of registered periods."""
+        return len(self._periods)
 
     def clear(self) -> None:
         """Remove all registered periods."""
         self._periods.clear()
+        self._members.clear()
+        self._snapshot = ()
+        self._index = None
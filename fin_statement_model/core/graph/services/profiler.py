@@ -0,0 +1,220 @@
+"""Opt-in per-node evaluation profiler for the calculation engine.
+
+Node evaluation recurses inside the nodes themselves (a calculation node
+calls ``calculate`` on its inputs), so the engine alone only sees top-level
+requests. While profiling is enabled, EvaluationProfiler wraps the
+``calculate`` method of every node in the graph with a timing shim and
+records, per node, the call count, cache hits, self time and inclusive time,
+plus the self time of every distinct call stack. Disabling removes the shims
+again, so a graph that is not being profiled runs exactly the code it would
+without the profiler.
+
+Key responsibilities:
+    - Install and remove per-node ``calculate`` shims
+    - Attribute wall time to nodes (self vs. inclusive) and to call stacks
+    - Report per node or per calculation class as a pandas DataFrame
+    - Emit collapsed-stack text (``a;b;c <microseconds>``) for flamegraph tools
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023"])
+    >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+    >>> _ = g.add_calculation("Double", ["Revenue", "Revenue"], "addition")
+    >>> with g.profile() as profiler:
+    ...     _ = g.calculate("Double", "2023")
+    ...     _ = g.calculate("Double", "2023")
+    >>> frame = profiler.to_frame().set_index("node")
+    >>> row = frame.loc["Double"]
+    >>> row["calculation"], int(row["calls"]), int(row["cache_hits"])
+    ('AdditionCalculation', 2, 1)
+    >>> int(frame.loc["Revenue", "calls"])  # read twice by the first Double call
+    2
+    >>> sorted(line.split()[0] for line in profiler.collapsed_stacks().splitlines())
+    ['Double', 'Double;Revenue']
+"""
+
+from __future__ import annotations
+
+import logging
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable
+
+    from fin_statement_model.core.nodes import Node
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["EvaluationProfiler"]
+
+_COLUMNS = ["node", "node_type", "calculation", "calls", "cache_hits", "self_time", "inclusive_time"]
+
+
+class _NodeProfile:
+    """Mutable counters for one node."""
+
+    __slots__ = ("cache_hits", "calculation", "calls", "inclusive_time", "node_type", "self_time")
+
+    def __init__(self, node_type: str, calculation: str) -> None:
+        self.node_type = node_type
+        self.calculation = calculation
+        self.calls = 0
+        self.cache_hits = 0
+        self.self_time = 0.0
+        self.inclusive_time = 0.0
+
+
+class EvaluationProfiler:
+    """Collect per-node timings while installed on a graph's nodes.
+
+    Times are wall-clock seconds from :func:`time.perf_counter`. *Self* time
+    excludes time spent in instrumented inputs; *inclusive* time does not.
+    A call counts as a cache hit when the node's value for the period was
+    already cached before the call.
+
+    Args:
+        is_cached: Optional ``(node_name, period) -> bool`` probe used to
+            classify calls as cache hits. Without it no hits are recorded
+            by the shims.
+    """
+
+    def __init__(self, is_cached: Callable[[str, str], bool] | None = None) -> None:
+        """Create an empty profiler."""
+        self._is_cached = is_cached
+        self._profiles: dict[str, _NodeProfile] = {}
+        # Self time per call stack (tuple of node names, outermost first)
+        self._stacks: dict[tuple[str, ...], float] = {}
+        # One [time spent in instrumented children] cell per active call
+        self._frames: list[list[float]] = []
+        self._path: tuple[str, ...] = ()
+        # name -> node currently carrying a shim
+        self._instrumented: dict[str, Node] = {}
+
+    # ------------------------------------------------------------------
+    # Installation
+    # ------------------------------------------------------------------
+    def instrument(self, node: Node) -> bool:
+        """Wrap *node*'s ``calculate`` with a timing shim.
+
+        Returns:
+            True if a shim was installed, False if the node already carries one.
+        """
+        if node.calculate_shim is not None:
+            return False
+        original = node.calculate
+        profile = self._profile_for(node)
+
+        def calculate(period: str) -> float:
+            return self._timed(node.name, profile, original, period)
+
+        node.shim_calculate(calculate)
+        self._instrumented[node.name] = node
+        return True
+
+    def instrument_all(self, nodes: Iterable[Node]) -> None:
+        """Install shims on every node in *nodes*."""
+        for node in nodes:
+            self.instrument(node)
+
+    def release(self, node: Node) -> None:
+        """Remove the shim from *node*, if this profiler installed one."""
+        if self._instrumented.get(node.name) is node:
+            del self._instrumented[node.name]
+            node.unshim_calculate()
+
+    def release_all(self) -> None:
+        """Remove every shim this profiler installed."""
+        for node in list(self._instrumented.values()):
+            self.release(node)
+
+    @property
+    def instrumented(self) -> list[str]:
+        """Names of the nodes currently carrying a shim."""
+        return list(self._instrumented)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def _profile_for(self, node: Node) -> _NodeProfile:
+        profile = self._profiles.get(node.name)
+        if profile is None:
+            calculation = getattr(node, "calculation", None)
+            node_type = type(node).__name__
+            profile = _NodeProfile(node_type, type(calculation).__name__ if calculation is not None else node_type)
+            self._profiles[node.name] = profile
+        return profile
+
+    def _timed(self, name: str, profile: _NodeProfile, original: Callable[[str], float], period: str) -> float:
+        if self._is_cached is not None and self._is_cached(name, period):
+            profile.cache_hits += 1
+        parent_path = self._path
+        self._path = path = (*parent_path, name)
+        frame = [0.0]
+        self._frames.append(frame)
+        start = perf_counter()
+        try:
+            return original(period)
+        finally:
+            elapsed = perf_counter() - start
+            self._frames.pop()
+            self._path = parent_path
+            own = elapsed - frame[0]
+            profile.calls += 1
+            profile.self_time += own
+            profile.inclusive_time += elapsed
+            self._stacks[path] = self._stacks.get(path, 0.0) + own
+            if self._frames:
+                self._frames[-1][0] += elapsed
+
+    def record_hit(self, name: str) -> None:
+        """Count a request for *name* answered from the graph-level cache without calling the node."""
+        profile = self._profiles.get(name)
+        if profile is not None:
+            profile.calls += 1
+            profile.cache_hits += 1
+
+    def reset(self) -> None:
+        """Zero everything recorded so far (shims stay installed)."""
+        for profile in self._profiles.values():
+            profile.calls = profile.cache_hits = 0
+            profile.self_time = profile.inclusive_time = 0.0
+        self._stacks.clear()
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+    def to_frame(self) -> pd.DataFrame:
+        """Return one row per node that was called, sorted by self time (descending).
+
+        Columns: ``node``, ``node_type``, ``calculation``, ``calls``,
+        ``cache_hits``, ``self_time`` and ``inclusive_time`` (seconds).
+        """
+        rows = [
+            (name, p.node_type, p.calculation, p.calls, p.cache_hits, p.self_time, p.inclusive_time)
+            for name, p in self._profiles.items()
+            if p.calls
+        ]
+        frame = pd.DataFrame(rows, columns=_COLUMNS)
+        return frame.sort_values("self_time", ascending=False, kind="stable").reset_index(drop=True)
+
+    def by_calculation(self) -> pd.DataFrame:
+        """Aggregate :meth:`to_frame` per calculation class (node class for non-calculation nodes).
+
+        Inclusive times of nested calls to the same class are summed, so the
+        ``inclusive_time`` column can exceed the wall time of the run.
+        """
+        frame = self.to_frame()
+        grouped = frame.groupby("calculation", sort=False)[["calls", "cache_hits", "self_time", "inclusive_time"]].sum()
+        grouped.insert(0, "nodes", frame.groupby("calculation", sort=False)["node"].count())
+        return grouped.sort_values("self_time", ascending=False, kind="stable")
+
+    def collapsed_stacks(self) -> str:
+        """Return self time per call stack as collapsed-stack text.
+
+        One ``outer;inner;leaf <microseconds>`` line per distinct stack, the
+        input format of ``flamegraph.pl`` and compatible viewers.
+        """
+        return "\n".join(f"{';'.join(path)} {round(seconds * 1e6)}" for path, seconds in self._stacks.items())
@@ -0,0 +1,120 @@
+"""Evaluate several adjustment scenarios in one batched pass.
+
+Adjustments are grouped into scenarios by
+:class:`~fin_statement_model.core.adjustments.manager.AdjustmentManager`.
+``get_adjusted_value`` only adjusts a single node's final value, so comparing
+scenarios used to mean recomputing the graph once per scenario. Here every
+scenario's adjustments are applied to the *inputs* of a
+:class:`~fin_statement_model.core.graph.services.CompiledGraph` instead: each
+adjusted input becomes a ``scenario x period`` array and the program
+propagates the differences through all downstream calculations in one pass.
+Nodes that do not depend on an adjusted input are evaluated once and shared
+by every scenario.
+
+Key responsibilities:
+    - Apply each scenario's item-level adjustments to the compiled input values
+    - Hold ``scenario x node x period`` results (``ScenarioResults``)
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023"])
+    >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+    >>> _ = g.add_financial_statement_item("COGS", {"2023": 60.0})
+    >>> _ = g.add_calculation("GrossProfit", ["Revenue", "COGS"], "subtraction")
+    >>> _ = g.add_adjustment("Revenue", "2023", 20.0, reason="upside", scenario="bull")
+    >>> _ = g.add_adjustment("COGS", "2023", 1.5, reason="inflation", adj_type="multiplicative", scenario="bear")
+    >>> results = g.evaluate_scenarios(baseline="base")
+    >>> results.scenarios
+    ('base', 'bear', 'bull')
+    >>> results["GrossProfit"]["2023"].tolist()
+    [40.0, 10.0, 60.0]
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+
+from fin_statement_model.core.graph.services.entity_batch import BatchResults
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping, Sequence
+
+    from fin_statement_model.core.adjustments.manager import AdjustmentManager
+    from fin_statement_model.core.adjustments.models import Adjustment
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["ScenarioResults", "scenario_inputs"]
+
+
+def scenario_inputs(
+    manager: AdjustmentManager,
+    scenarios: Sequence[str],
+    input_values: Mapping[str, np.ndarray],
+    periods: Sequence[str],
+) -> tuple[dict[str, np.ndarray], list[Adjustment]]:
+    """Apply each scenario's adjustments to the inputs they target.
+
+    Row ``k`` of every returned array holds the input adjusted by the
+    adjustments of ``scenarios[k]`` (in the manager's priority / timestamp
+    order, exactly as :py:meth:`AdjustmentManager.apply_adjustments`);
+    scenarios without adjustments for an input keep its base values. A
+    scenario name that has no adjustments at all yields unadjusted rows.
+
+    Args:
+        manager: Source of the adjustments.
+        scenarios: Scenario names, one row each.
+        input_values: Base ``(periods,)`` value of every input.
+        periods: Period identifiers of the last axis.
+
+    Returns:
+        ``scenario x period`` arrays for every input adjusted in at least one
+        scenario, and the adjustments that were skipped because they target
+        a node that is not an input or a period outside *periods*.
+    """
+    rows = {scenario: k for k, scenario in enumerate(scenarios)}
+    columns = {period: j for j, period in enumerate(periods)}
+    arrays: dict[str, np.ndarray] = {}
+    skipped: list[Adjustment] = []
+    seen: set[tuple[str, str, str]] = set()
+
+    for adj in manager.get_all_adjustments():
+        key = (adj.scenario, adj.node_name, adj.period)
+        if adj.scenario not in rows or key in seen:
+            continue
+        seen.add(key)
+        base = input_values.get(adj.node_name)
+        column = columns.get(adj.period)
+        if base is None or column is None:
+            skipped.append(adj)
+            continue
+        array = arrays.get(adj.node_name)
+        if array is None:
+            array = arrays[adj.node_name] = np.tile(base, (len(rows), 1))
+        row = rows[adj.scenario]
+        adjustments = manager.get_adjustments(adj.node_name, adj.period, scenario=adj.scenario)
+        array[row, column] = manager.apply_adjustments(float(array[row, column]), adjustments)[0]
+
+    if skipped:
+        logger.warning(
+            "Skipped %d adjustments that do not target a compiled input and period (nodes: %s)",
+            len(skipped),
+            sorted({adj.node_name for adj in skipped}),
+        )
+    return arrays, skipped
+
+
+class ScenarioResults(BatchResults):
+    """Node values for several adjustment scenarios evaluated in one pass."""
+
+    __slots__ = ()
+
+    axis_name: ClassVar[str] = "scenario"
+
+    @property
+    def scenarios(self) -> tuple[str, ...]:
+        """Scenario names, in evaluation order."""
+        return self._labels
@@ -0,0 +1,102 @@
+"""Sensitivity (tornado) analysis of graph outputs to bumped inputs.
+
+Answering "what does +/-10% revenue do to EBIT" used to mean calling
+``set_value`` once per bump and recomputing the graph each time. A
+:class:`~fin_statement_model.core.graph.services.CompiledGraph` instead
+evaluates the baseline once and then, for every input, re-runs only the
+instructions downstream of that input - with all of its bumps as one batch
+axis - while every other node keeps its baseline result.
+
+Key responsibilities:
+    - Build the bumped ``bump x period`` values of one input
+    - Lay out ``input x bump x output x period`` results as a tidy DataFrame
+      (one row per cell) ready for tornado charts
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> g = Graph(periods=["2023"])
+    >>> _ = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+    >>> _ = g.add_financial_statement_item("COGS", {"2023": 60.0})
+    >>> _ = g.add_calculation("GrossProfit", ["Revenue", "COGS"], "subtraction")
+    >>> frame = g.sensitivity(["GrossProfit"], bumps=[-0.5, 0.5])
+    >>> frame.loc[0].to_dict()
+    {'input': 'Revenue', 'bump': -0.5, 'output': 'GrossProfit', 'period': '2023', 'base': 40.0, 'value': -10.0, 'delta': -50.0, 'pct_change': -1.25}
+    >>> frame.pivot_table(index="input", columns="bump", values="delta").to_dict("index")
+    {'COGS': {-0.5: 30.0, 0.5: -30.0}, 'Revenue': {-0.5: -50.0, 0.5: 50.0}}
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+__all__: list[str] = ["SENSITIVITY_COLUMNS", "bumped_values", "sensitivity_frame"]
+
+#: Columns of the frame returned by :py:func:`sensitivity_frame`
+SENSITIVITY_COLUMNS: tuple[str, ...] = (
+    "input",
+    "bump",
+    "output",
+    "period",
+    "base",
+    "value",
+    "delta",
+    "pct_change",
+)
+
+
+def bumped_values(base: np.ndarray, bumps: np.ndarray, *, relative: bool = True) -> np.ndarray:
+    """Return one bumped copy of *base* per bump as a ``bump x period`` array.
+
+    Args:
+        base: ``(periods,)`` baseline values of an input.
+        bumps: 1-D bump sizes.
+        relative: Scale by ``1 + bump`` when True, otherwise add ``bump``.
+    """
+    steps = bumps[:, np.newaxis]
+    return np.asarray(base * (1.0 + steps) if relative else base + steps, dtype=float)
+
+
+def sensitivity_frame(
+    base: np.ndarray,
+    values: np.ndarray,
+    *,
+    inputs: Sequence[str],
+    bumps: Sequence[float],
+    outputs: Sequence[str],
+    periods: Sequence[str],
+) -> pd.DataFrame:
+    """Lay out sensitivity results with one row per input, bump, output and period.
+
+    Args:
+        base: ``output x period`` baseline values.
+        values: ``input x bump x output x period`` bumped values.
+        inputs: Bumped inputs (first axis of *values*).
+        bumps: Bump sizes (second axis).
+        outputs: Output nodes (third axis).
+        periods: Period identifiers (last axis).
+
+    Returns:
+        DataFrame with the :py:data:`SENSITIVITY_COLUMNS`. ``delta`` is
+        ``value - base``; ``pct_change`` is ``delta / |base|`` (NaN where the
+        baseline is zero).
+    """
+    frame = pd.MultiIndex.from_product(
+        [list(inputs), [float(bump) for bump in bumps], list(outputs), list(periods)],
+        names=list(SENSITIVITY_COLUMNS[:4]),
+    ).to_frame(index=False)
+    base_column = np.broadcast_to(base, values.shape).ravel()
+    value_column = values.ravel()
+    delta = value_column - base_column
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_change = np.where(base_column == 0.0, np.nan, delta / np.abs(base_column))
+    frame["base"] = base_column
+    frame["value"] = value_column
+    frame["delta"] = delta
+    frame["pct_change"] = pct_change
+    return frame
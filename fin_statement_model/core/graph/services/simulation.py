@@ -0,0 +1,151 @@
+"""Monte Carlo simulation of statistical forecasts in one vectorized pass.
+
+A :class:`~fin_statement_model.core.nodes.StatisticalGrowthForecastNode`
+draws one growth rate per call, so the regular engine produces a single
+random path per evaluation. A
+:class:`~fin_statement_model.core.graph.services.CompiledGraph` can instead
+draw ``paths x forecast periods`` growth rates per stochastic node from one
+seeded :class:`numpy.random.Generator` and evaluate every path at once with
+the path as a leading batch axis. Nodes that do not depend on a stochastic
+forecast are evaluated once and shared by every path.
+
+Key responsibilities:
+    - Hold ``path x node x period`` simulation results (``SimulationResults``)
+    - Summarize each node and period as quantile bands and VaR-style risk
+      measures
+
+Examples:
+    >>> from fin_statement_model.core.graph import Graph
+    >>> from fin_statement_model.core.nodes import StatisticalGrowthForecastNode
+    >>> from fin_statement_model.forecasting.methods import StatisticalForecastMethod
+    >>> g = Graph(periods=["2023", "2024", "2025"])
+    >>> revenue = g.add_financial_statement_item("Revenue", {"2023": 100.0})
+    >>> _ = g.add_financial_statement_item("COGS", {"2023": 60.0, "2024": 60.0, "2025": 60.0})
+    >>> sampler = StatisticalForecastMethod().normalize_params(
+    ...     {"distribution": "normal", "params": {"mean": 0.05, "std": 0.1}}, ["2024", "2025"]
+    ... )["growth_params"]
+    >>> _ = g.add_node(StatisticalGrowthForecastNode(revenue, "2023", ["2024", "2025"], sampler))
+    >>> _ = g.add_calculation("GrossProfit", ["Revenue", "COGS"], "subtraction")
+    >>> results = g.simulate(10_000, seed=42)
+    >>> results["GrossProfit"].shape
+    (10000, 3)
+    >>> bands = results.quantiles([0.05, 0.5, 0.95], ["GrossProfit"])
+    >>> float(bands.loc[("GrossProfit", 0.5), "2023"])
+    40.0
+    >>> summary = results.summary(level=0.95)
+    >>> bool(summary.loc[("GrossProfit", "2025"), "var"] > 0)
+    True
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from fin_statement_model.core.graph.services.entity_batch import BatchResults
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+__all__: list[str] = ["SimulationResults"]
+
+#: Columns of :py:meth:`SimulationResults.summary`
+SUMMARY_COLUMNS: tuple[str, ...] = ("mean", "std", "q_low", "median", "q_high", "var", "es")
+
+
+def _path_quantiles(values: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Return ``quantile x period`` quantiles of a ``path x period`` array, ignoring NaN paths."""
+    if values.shape[0] and values.strides[0] == 0:
+        # Not affected by any draw: every path holds the same values
+        return np.repeat(values[:1], len(q), axis=0)
+    if not np.isnan(values).any():
+        return np.asarray(np.quantile(values, q, axis=0))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN periods stay NaN
+        return np.asarray(np.nanquantile(values, q, axis=0))
+
+
+class SimulationResults(BatchResults):
+    """Node values along Monte Carlo paths; the path number is the batch label."""
+
+    __slots__ = ()
+
+    axis_name: ClassVar[str] = "path"
+
+    @property
+    def n_paths(self) -> int:
+        """Number of simulated paths."""
+        return len(self._labels)
+
+    def quantiles(
+        self,
+        q: Sequence[float] = (0.05, 0.5, 0.95),
+        node_names: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """Return per-period quantile bands across paths.
+
+        Args:
+            q: Quantiles in ``[0, 1]``.
+            node_names: Nodes to include. Defaults to every simulated node.
+
+        Returns:
+            DataFrame with a ``(node, quantile)`` MultiIndex and periods as
+            columns. Paths with NaN values are ignored per period.
+        """
+        names = list(self.node_names if node_names is None else node_names)
+        levels = np.asarray(q, dtype=float)
+        data = np.empty((len(names) * len(levels), len(self._periods)))
+        for idx, name in enumerate(names):
+            data[idx * len(levels) : (idx + 1) * len(levels)] = _path_quantiles(self._values[name], levels)
+        return pd.DataFrame(
+            data,
+            index=pd.MultiIndex.from_product([names, levels.tolist()], names=["node", "quantile"]),
+            columns=pd.Index(self._periods, name="period"),
+        )
+
+    def summary(self, level: float = 0.95, node_names: Sequence[str] | None = None) -> pd.DataFrame:
+        """Summarize the simulated distribution of every node and period.
+
+        Columns:
+            - ``mean`` / ``std``: mean and sample standard deviation across paths
+            - ``q_low`` / ``median`` / ``q_high``: the ``1 - level``, 0.5 and
+              *level* quantiles
+            - ``var``: value at risk, ``mean - q_low`` - the shortfall below the
+              mean that is not exceeded with probability *level*
+            - ``es``: expected shortfall, ``mean`` minus the average of the
+              paths at or below ``q_low``
+
+        Args:
+            level: Confidence level in ``(0, 1)``.
+            node_names: Nodes to include. Defaults to every simulated node.
+
+        Returns:
+            DataFrame with a ``(node, period)`` MultiIndex and the columns above.
+
+        Raises:
+            ValueError: If *level* is not strictly between 0 and 1.
+        """
+        if not 0.0 < level < 1.0:
+            raise ValueError(f"Confidence level must be between 0 and 1, got {level}")
+        names = list(self.node_names if node_names is None else node_names)
+        levels = np.array([1.0 - level, 0.5, level])
+        blocks = []
+        with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN periods and single paths stay NaN
+            for name in names:
+                values = self._values[name]
+                low, median, high = _path_quantiles(values, levels)
+                mean = np.nanmean(values, axis=0)
+                std = np.nanstd(values, axis=0, ddof=1)
+                tail = values <= low
+                tail_mean = np.where(tail, values, 0.0).sum(axis=0) / tail.sum(axis=0)
+                blocks.append(np.column_stack([mean, std, low, median, high, mean - low, mean - tail_mean]))
+        data = np.concatenate(blocks) if blocks else np.empty((0, len(SUMMARY_COLUMNS)))
+        return pd.DataFrame(
+            data,
+            index=pd.MultiIndex.from_product([names, self._periods], names=["node", "period"]),
+            columns=list(SUMMARY_COLUMNS),
+        )
@@ -0,0 +1,374 @@
+"""Single, optionally bounded cache for calculated node values.
+
+Calculated results used to be stored twice: in the calculation engine's
+two-level ``node -> period -> value`` dictionary and again inside every
+caching node (``CalculationNode._values``, ``ForecastNode._cache``). The two
+copies could disagree after a node's calculation was changed or the node was
+replaced. ValueCache is the one store both now share: the graph binds each
+caching node to a :class:`CachedValues` view, so a node reading or writing
+its own cache reads or writes this store.
+
+Key responsibilities:
+    - Hold calculated values keyed by ``(node, period)``
+    - Optionally bound the number of entries, evicting least recently used
+      values first
+    - Count hits, misses and evictions, reported as :class:`CacheStats`
+    - Expose per-node ``period -> value`` views (:class:`CachedValues`) for
+      node-level caches and for code written against the former nested dict
+
+Examples:
+    >>> from fin_statement_model.core.graph.services.value_cache import ValueCache
+    >>> cache = ValueCache(max_entries=2)
+    >>> cache.put("GrossProfit", "2023", 40.0)
+    >>> cache.put("GrossProfit", "2024", 50.0)
+    >>> cache.lookup("GrossProfit", "2023")
+    40.0
+    >>> cache.put("Margin", "2023", 0.4)  # evicts GrossProfit/2024, the least recently used
+    >>> dict(cache["GrossProfit"])
+    {'2023': 40.0}
+    >>> stats = cache.stats()
+    >>> stats.hits, stats.evictions, stats.entries
+    (1, 1, 2)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, MutableMapping
+import logging
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["CacheStats", "CachedValues", "ValueCache"]
+
+
+class CacheStats(BaseModel):
+    """Immutable snapshot of a :class:`ValueCache`'s counters.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no value.
+        evictions: Values dropped to stay within ``max_entries``.
+        entries: Values currently held.
+        nodes: Distinct nodes with at least one value held.
+        max_entries: The entry bound, or ``None`` when unbounded.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    nodes: int = 0
+    max_entries: int | None = None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0.0 before the first lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ValueCache(Mapping[str, "CachedValues"]):
+    """Calculated values keyed by ``(node, period)`` with optional LRU bound.
+
+    Only the unadjusted results that nodes cache for themselves are held:
+    adjusted (scenario) values are recomputed from them on request, and a
+    :class:`~fin_statement_model.core.graph.overlay.GraphOverlay` keeps its
+    own cache. As a mapping, the cache is keyed by node name and yields the
+    node's :class:`CachedValues` view, so ``cache[name][period]`` reads like
+    the nested dictionary it replaces.
+
+    Values live in one ``period -> value`` dict per node (its *slot*) that
+    views read directly; recency is only tracked (in a separate key order)
+    when the cache is bounded.
+
+    Args:
+        max_entries: Maximum number of values held, or ``None`` for no bound.
+
+    Raises:
+        ValueError: If *max_entries* is not a positive integer or ``None``.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        """Create an empty cache holding at most *max_entries* values."""
+        self._max_entries = self._check_bound(max_entries)
+        # node -> period -> value; slot dicts are cleared in place, never replaced,
+        # so views can hold on to them
+        self._slots: dict[str, dict[str, float]] = {}
+        self._size = 0
+        # Recency order of (node, period), least recently used first; bounded caches only
+        self._order: OrderedDict[tuple[str, str], None] = OrderedDict()
+        # Names whose node cache is a view onto this store
+        self._bound: set[str] = set()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _check_bound(max_entries: int | None) -> int | None:
+        if max_entries is not None and (not isinstance(max_entries, int) or max_entries < 1):
+            raise ValueError(f"max_entries must be a positive integer or None, got {max_entries!r}")
+        return max_entries
+
+    # ------------------------------------------------------------------
+    # Bound & statistics
+    # ------------------------------------------------------------------
+    @property
+    def max_entries(self) -> int | None:
+        """The entry bound, or ``None`` when unbounded."""
+        return self._max_entries
+
+    def resize(self, max_entries: int | None) -> int:
+        """Change the entry bound, evicting least recently used values if needed.
+
+        Returns:
+            The number of values evicted.
+        """
+        max_entries = self._check_bound(max_entries)
+        if max_entries is not None and self._max_entries is None:
+            # Start tracking recency; existing values count as least recently used
+            self._order = OrderedDict(
+                ((node, period), None) for node, values in self._slots.items() for period in values
+            )
+        elif max_entries is None:
+            self._order.clear()
+        self._max_entries = max_entries
+        return self._evict()
+
+    def stats(self) -> CacheStats:
+        """Return the current counters as a :class:`CacheStats` snapshot."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=self._size,
+            nodes=len(self),
+            max_entries=self._max_entries,
+        )
+
+    def reset_stats(self) -> None:
+        """Zero the hit, miss and eviction counters."""
+        self._hits = self._misses = self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Keyed access
+    # ------------------------------------------------------------------
+    def _slot(self, node: str) -> dict[str, float]:
+        values = self._slots.get(node)
+        if values is None:
+            values = self._slots[node] = {}
+        return values
+
+    def lookup(self, node: str, period: str) -> float | None:
+        """Return the cached value (counted as a hit) or ``None`` (counted as a miss)."""
+        values = self._slots.get(node)
+        if values is None:
+            self._misses += 1
+            return None
+        return self._lookup(values, node, period)
+
+    def _lookup(self, values: dict[str, float], node: str, period: str) -> float | None:
+        value = values.get(period)
+        if value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        if self._max_entries is not None:
+            self._order.move_to_end((node, period))
+        return value
+
+    def peek(self, node: str, period: str) -> float | None:
+        """Return the cached value or ``None`` without touching counters or recency."""
+        return self._slots.get(node, {}).get(period)
+
+    def put(self, node: str, period: str, value: float) -> None:
+        """Store *value*, evicting the least recently used value if over the bound."""
+        self._put(self._slot(node), node, period, value)
+
+    def _put(self, values: dict[str, float], node: str, period: str, value: float) -> None:
+        if period not in values:
+            self._size += 1
+        values[period] = value
+        if self._max_entries is not None:
+            key = (node, period)
+            self._order[key] = None
+            self._order.move_to_end(key)
+            if self._size > self._max_entries:
+                self._evict()
+
+    def discard(self, node: str, period: str) -> bool:
+        """Drop one value; return True if it was cached."""
+        values = self._slots.get(node)
+        if values is None or values.pop(period, None) is None:
+            return False
+        self._size -= 1
+        if self._max_entries is not None:
+            del self._order[(node, period)]
+        return True
+
+    def invalidate(self, node: str, periods: Iterable[str] | None = None) -> int:
+        """Drop *node*'s values for *periods* (all when ``None``).
+
+        Returns:
+            The number of values dropped.
+        """
+        values = self._slots.get(node)
+        if not values:
+            return 0
+        drop = list(values) if periods is None else [period for period in periods if period in values]
+        for period in drop:
+            del values[period]
+            if self._max_entries is not None:
+                del self._order[(node, period)]
+        self._size -= len(drop)
+        return len(drop)
+
+    def clear(self) -> None:
+        """Drop every value (bindings and counters are kept)."""
+        for values in self._slots.values():
+            values.clear()
+        self._order.clear()
+        self._size = 0
+
+    def _evict(self) -> int:
+        if self._max_entries is None:
+            return 0
+        evicted = 0
+        while self._size > self._max_entries:
+            (node, period), _ = self._order.popitem(last=False)
+            del self._slots[node][period]
+            self._size -= 1
+            evicted += 1
+        if evicted:
+            self._evictions += evicted
+            logger.debug("Evicted %d cached values (bound %d)", evicted, self._max_entries)
+        return evicted
+
+    # ------------------------------------------------------------------
+    # Node bindings
+    # ------------------------------------------------------------------
+    def bind(self, node: str, values: Mapping[str, float] | None = None) -> CachedValues:
+        """Mark *node* as caching through this store, load *values* and return its view."""
+        self._bound.add(node)
+        view = CachedValues(self, node)
+        if values:
+            view.update(values)
+        return view
+
+    def release(self, node: str) -> dict[str, float]:
+        """Unbind *node*, forget all its values and return them as a dict."""
+        self._bound.discard(node)
+        snapshot = dict(self._slots.get(node, {}))
+        self.invalidate(node)
+        self._slots.pop(node, None)
+        return snapshot
+
+    def is_bound(self, node: str) -> bool:
+        """Return True if *node*'s own result cache is a view onto this store."""
+        return node in self._bound
+
+    def slot(self, node: str) -> Mapping[str, float]:
+        """Return *node*'s ``period -> value`` dict (read-only; empty if it has none)."""
+        return MappingProxyType(self._slots.get(node, {}))
+
+    # ------------------------------------------------------------------
+    # Mapping protocol (node name -> values view)
+    # ------------------------------------------------------------------
+    def _has_values(self, node: str) -> bool:
+        return bool(self._slots.get(node))
+
+    def __getitem__(self, node: str) -> CachedValues:
+        """Return the view of *node*'s values.
+
+        Raises:
+            KeyError: If nothing is cached for *node*.
+        """
+        if not self._has_values(node):
+            raise KeyError(node)
+        return CachedValues(self, node)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over nodes with at least one cached value."""
+        return iter([node for node in self._slots if self._has_values(node)])
+
+    def __len__(self) -> int:
+        """Return the number of nodes with at least one cached value."""
+        return sum(1 for node in self._slots if self._has_values(node))
+
+    def __repr__(self) -> str:
+        """Return a short summary of the cache state."""
+        return f"ValueCache(entries={self._size}, nodes={len(self)}, max_entries={self._max_entries})"
+
+
+class CachedValues(MutableMapping[str, float]):
+    """Mutable ``period → value`` view of one node's entries in a :class:`ValueCache`.
+
+    Caching nodes hold this view in place of their private ``dict``. Only
+    :py:meth:`get` counts towards the cache statistics and recency - it is
+    the lookup nodes use - while ``in`` and ``[]`` inspect without side
+    effects.
+    """
+
+    __slots__ = ("_cache", "_node", "_values")
+
+    def __init__(self, cache: ValueCache, node: str) -> None:
+        """Bind the view to *node*'s entries in *cache*."""
+        self._cache = cache
+        self._node = node
+        self._values = cache._slot(node)
+
+    @property
+    def cache(self) -> ValueCache:
+        """The store this view reads from."""
+        return self._cache
+
+    def get(self, period: str, default: Any = None) -> Any:
+        """Look up *period* (counted), returning *default* if nothing is cached."""
+        value = self._cache._lookup(self._values, self._node, period)
+        return default if value is None else value
+
+    def __getitem__(self, period: str) -> float:
+        """Return the cached value for *period*."""
+        return self._values[period]
+
+    def __contains__(self, period: object) -> bool:
+        """Return True if a value is cached for *period*."""
+        return period in self._values
+
+    def __setitem__(self, period: str, value: float) -> None:
+        """Cache *value* for *period*."""
+        self._cache._put(self._values, self._node, period, value)
+
+    def __delitem__(self, period: str) -> None:
+        """Drop the value cached for *period*."""
+        if not self._cache.discard(self._node, period):
+            raise KeyError(period)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over periods with a cached value."""
+        return iter(list(self._values))
+
+    def __len__(self) -> int:
+        """Return the number of periods with a cached value."""
+        return len(self._values)
+
+    def clear(self) -> None:
+        """Drop the node's cached values."""
+        self._cache.invalidate(self._node)
+
+    def copy(self) -> dict[str, float]:
+        """Return a detached ``dict`` snapshot."""
+        return dict(self._values)
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation."""
+        return f"CachedValues({self._node!r}, {self._values!r})"
@@ -0,0 +1,353 @@
+"""Graph-wide columnar storage for financial statement item values.
+
+By default every :class:`~fin_statement_model.core.nodes.FinancialStatementItemNode`
+keeps its own ``dict[str, float]``. For large models (thousands of items x
+hundreds of periods) that means millions of boxed floats plus one hash table
+per node. ColumnarValueStore is the opt-in alternative: a single NumPy
+``nodes x periods`` float matrix with a boolean validity mask. Item nodes
+attached to the store keep a ``values`` attribute, but it becomes a
+:class:`ColumnarValues` mapping facade - a view onto one row of the matrix -
+so existing code reading or writing ``node.values[period]`` keeps working.
+
+Key responsibilities:
+    - Allocate one matrix row per attached node and one column per period
+    - Distinguish "no data" from stored NaN through the validity mask
+    - Expose rows as mutable mapping views (``ColumnarValues``)
+    - Move data in bulk: gather/scatter arrays and DataFrame import/export
+
+Examples:
+    >>> from fin_statement_model.core.graph.services.value_store import ColumnarValueStore
+    >>> store = ColumnarValueStore()
+    >>> revenue = store.attach("Revenue", {"2023": 100.0})
+    >>> revenue["2024"] = 120.0
+    >>> dict(revenue)
+    {'2023': 100.0, '2024': 120.0}
+    >>> store.to_frame().loc["Revenue", "2024"]
+    np.float64(120.0)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Sequence
+
+logger = logging.getLogger(__name__)
+
+__all__: list[str] = ["ColumnarValueStore", "ColumnarValues"]
+
+_MIN_CAPACITY = 8
+
+
+class ColumnarValueStore:
+    """A ``nodes x periods`` float matrix with a validity mask.
+
+    Rows are addressed by node name, columns by period identifier. Columns
+    are appended in first-seen order (not sorted); callers that need the
+    graph's chronological order pass an explicit *periods* sequence to the
+    bulk helpers.
+
+    Args:
+        periods: Optional initial period columns.
+    """
+
+    def __init__(self, periods: Iterable[str] = ()) -> None:
+        """Create an empty store, optionally pre-allocating *periods*."""
+        self._periods: list[str] = []
+        self._column: dict[str, int] = {}
+        self._row: dict[str, int] = {}
+        self._free_rows: list[int] = []
+        self._data = np.zeros((_MIN_CAPACITY, _MIN_CAPACITY), dtype=float)
+        self._mask = np.zeros((_MIN_CAPACITY, _MIN_CAPACITY), dtype=bool)
+        self.add_periods(periods)
+
+    # ------------------------------------------------------------------
+    # Shape management
+    # ------------------------------------------------------------------
+    @property
+    def periods(self) -> tuple[str, ...]:
+        """Period columns in allocation order."""
+        return tuple(self._periods)
+
+    @property
+    def node_names(self) -> list[str]:
+        """Names of all attached rows."""
+        return list(self._row)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the value matrix and validity mask (allocated capacity)."""
+        return int(self._data.nbytes + self._mask.nbytes)
+
+    def __len__(self) -> int:
+        """Return the number of attached rows."""
+        return len(self._row)
+
+    def __contains__(self, name: object) -> bool:
+        """Return True if a row is attached under *name*."""
+        return name in self._row
+
+    def add_periods(self, periods: Iterable[str]) -> None:
+        """Ensure a column exists for every period in *periods*."""
+        for period in periods:
+            self._column_for(period)
+
+    def _column_for(self, period: str) -> int:
+        col = self._column.get(period)
+        if col is not None:
+            return col
+        if not isinstance(period, str):
+            raise TypeError(f"Period identifiers must be strings, got {type(period).__name__}")
+        col = len(self._periods)
+        if col >= self._data.shape[1]:
+            self._grow(columns=max(_MIN_CAPACITY, 2 * self._data.shape[1]))
+        self._periods.append(period)
+        self._column[period] = col
+        return col
+
+    def _grow(self, *, rows: int | None = None, columns: int | None = None) -> None:
+        n_rows = rows or self._data.shape[0]
+        n_cols = columns or self._data.shape[1]
+        data = np.zeros((n_rows, n_cols), dtype=float)
+        mask = np.zeros((n_rows, n_cols), dtype=bool)
+        old_rows, old_cols = self._data.shape
+        data[:old_rows, :old_cols] = self._data
+        mask[:old_rows, :old_cols] = self._mask
+        self._data, self._mask = data, mask
+
+    # ------------------------------------------------------------------
+    # Row lifecycle
+    # ------------------------------------------------------------------
+    def attach(self, name: str, values: Mapping[str, float] | None = None) -> ColumnarValues:
+        """Allocate (or reuse) the row for *name*, load *values* and return its view.
+
+        Attaching a name that already has a row overwrites that row's data.
+        """
+        snapshot = dict(values) if values is not None else {}
+        row = self._row.get(name)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = len(self._row)
+                if row >= self._data.shape[0]:
+                    self._grow(rows=2 * self._data.shape[0])
+            self._row[name] = row
+        self._mask[row, :] = False
+        view = ColumnarValues(self, row)
+        view.update(snapshot)
+        return view
+
+    def release(self, name: str) -> dict[str, float]:
+        """Free the row for *name* and return its data as a plain dictionary."""
+        row = self._row.pop(name, None)
+        if row is None:
+            return {}
+        snapshot = dict(ColumnarValues(self, row))
+        self._mask[row, :] = False
+        self._free_rows.append(row)
+        return snapshot
+
+    def rename(self, old: str, new: str) -> None:
+        """Re-key the row attached under *old* to *new*; its data and views are kept.
+
+        Raises:
+            KeyError: If no row is attached under *old*, or one already is under *new*.
+        """
+        if new in self._row:
+            raise KeyError(f"A row is already attached under {new!r}")
+        self._row[new] = self._row.pop(old)
+
+    def view(self, name: str) -> ColumnarValues:
+        """Return the mapping view for the row attached under *name*.
+
+        Raises:
+            KeyError: If no row is attached under *name*.
+        """
+        return ColumnarValues(self, self._row[name])
+
+    def clear(self) -> None:
+        """Drop all rows and columns."""
+        self.__init__()  # type: ignore[misc]
+
+    def copy(self) -> ColumnarValueStore:
+        """Return an independent store with the same rows, columns and data."""
+        clone = ColumnarValueStore.__new__(ColumnarValueStore)
+        clone._periods = list(self._periods)
+        clone._column = dict(self._column)
+        clone._row = dict(self._row)
+        clone._free_rows = list(self._free_rows)
+        clone._data = self._data.copy()
+        clone._mask = self._mask.copy()
+        return clone
+
+    # ------------------------------------------------------------------
+    # Bulk movement
+    # ------------------------------------------------------------------
+    def gather(
+        self,
+        names: Sequence[str],
+        periods: Sequence[str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(values, valid)`` arrays of shape ``(len(names), len(periods))``.
+
+        Cells without data hold NaN in *values* and ``False`` in *valid*.
+        """
+        rows = np.fromiter((self._row[name] for name in names), dtype=np.intp, count=len(names))
+        cols = np.fromiter((self._column.get(p, -1) for p in periods), dtype=np.intp, count=len(periods))
+        known = cols >= 0
+        valid = np.zeros((len(names), len(periods)), dtype=bool)
+        valid[:, known] = self._mask[np.ix_(rows, cols[known])]
+        values = np.full(valid.shape, np.nan)
+        values[:, known] = self._data[np.ix_(rows, cols[known])]
+        values[~valid] = np.nan
+        return values, valid
+
+    def scatter(
+        self,
+        names: Sequence[str],
+        periods: Sequence[str],
+        values: Any,
+        valid: Any = None,
+    ) -> None:
+        """Write a ``(len(names), len(periods))`` block of *values* in one operation.
+
+        Args:
+            names: Attached row names.
+            periods: Period columns (created on demand).
+            values: Array-like block of values.
+            valid: Optional boolean block; cells marked ``False`` are cleared.
+                Defaults to every non-NaN cell of *values*.
+        """
+        block = np.asarray(values, dtype=float)
+        if block.shape != (len(names), len(periods)):
+            raise ValueError(f"Expected a block of shape {(len(names), len(periods))}, got {block.shape}")
+        mask = ~np.isnan(block) if valid is None else np.asarray(valid, dtype=bool)
+        rows = np.fromiter((self._row[name] for name in names), dtype=np.intp, count=len(names))
+        cols = np.fromiter((self._column_for(p) for p in periods), dtype=np.intp, count=len(periods))
+        self._data[np.ix_(rows, cols)] = np.where(mask, block, 0.0)
+        self._mask[np.ix_(rows, cols)] = mask
+
+    def to_frame(
+        self,
+        names: Sequence[str] | None = None,
+        periods: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """Export rows as a DataFrame (node names as index, periods as columns, NaN for no data)."""
+        names = list(self._row) if names is None else list(names)
+        periods = list(self._periods) if periods is None else list(periods)
+        values, _ = self.gather(names, periods)
+        return pd.DataFrame(values, index=pd.Index(names, name="node"), columns=pd.Index(periods, name="period"))
+
+    def load_frame(self, frame: pd.DataFrame) -> None:
+        """Bulk-write a DataFrame shaped like :py:meth:`to_frame` output.
+
+        Rows must already be attached; NaN cells are treated as "no data".
+        """
+        names = [str(name) for name in frame.index]
+        missing = [name for name in names if name not in self._row]
+        if missing:
+            raise KeyError(f"Rows not attached to the value store: {missing}")
+        self.scatter(names, [str(p) for p in frame.columns], frame.to_numpy(dtype=float))
+
+    # ------------------------------------------------------------------
+    # Cell access used by ColumnarValues
+    # ------------------------------------------------------------------
+    def _get(self, row: int, period: str) -> float | None:
+        col = self._column.get(period)
+        if col is None or not self._mask[row, col]:
+            return None
+        return float(self._data[row, col])
+
+    def _set(self, row: int, period: str, value: float) -> None:
+        col = self._column_for(period)
+        self._data[row, col] = value
+        self._mask[row, col] = True
+
+    def _delete(self, row: int, period: str) -> bool:
+        col = self._column.get(period)
+        if col is None or not self._mask[row, col]:
+            return False
+        self._mask[row, col] = False
+        return True
+
+    def _row_periods(self, row: int) -> list[str]:
+        used = self._mask[row, : len(self._periods)]
+        return [self._periods[col] for col in np.flatnonzero(used)]
+
+    def _row_array(self, row: int, periods: Sequence[str]) -> np.ndarray:
+        cols = np.fromiter((self._column.get(p, -1) for p in periods), dtype=np.intp, count=len(periods))
+        safe = np.where(cols >= 0, cols, 0)
+        valid = (cols >= 0) & self._mask[row, safe]
+        return np.where(valid, self._data[row, safe], np.nan)
+
+
+class ColumnarValues(MutableMapping[str, float]):
+    """Mutable ``period → value`` mapping view onto one row of a :class:`ColumnarValueStore`.
+
+    Behaves like the ``dict`` it replaces on item nodes: iteration follows
+    column allocation order and ``copy()`` returns a detached ``dict``.
+    """
+
+    __slots__ = ("_row", "_store")
+
+    def __init__(self, store: ColumnarValueStore, row: int) -> None:
+        """Bind the view to *row* of *store*."""
+        self._store = store
+        self._row = row
+
+    @property
+    def store(self) -> ColumnarValueStore:
+        """The store this view reads from."""
+        return self._store
+
+    def __getitem__(self, period: str) -> float:
+        """Return the stored value for *period*."""
+        value = self._store._get(self._row, period)
+        if value is None:
+            raise KeyError(period)
+        return value
+
+    def get(self, period: str, default: Any = None) -> Any:
+        """Return the stored value for *period*, or *default* if there is none."""
+        value = self._store._get(self._row, period)
+        return default if value is None else value
+
+    def __contains__(self, period: object) -> bool:
+        """Return True if *period* has a stored value."""
+        return isinstance(period, str) and self._store._get(self._row, period) is not None
+
+    def __setitem__(self, period: str, value: float) -> None:
+        """Store *value* for *period*, creating the period column if needed."""
+        self._store._set(self._row, period, float(value))
+
+    def __delitem__(self, period: str) -> None:
+        """Remove the value stored for *period*."""
+        if not self._store._delete(self._row, period):
+            raise KeyError(period)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over periods that have a stored value."""
+        return iter(self._store._row_periods(self._row))
+
+    def __len__(self) -> int:
+        """Return the number of periods with a stored value."""
+        return int(self._store._mask[self._row].sum())
+
+    def copy(self) -> dict[str, float]:
+        """Return a detached ``dict`` snapshot of the row."""
+        return dict(self.items())
+
+    def as_array(self, periods: Sequence[str]) -> np.ndarray:
+        """Return the row's values for *periods* as a float array (NaN where missing)."""
+        return self._store._row_array(self._row, periods)
+
+    def __repr__(self) -> str:
+        """Represent the view like the equivalent dictionary."""
+        return repr(self.copy())
@@ -9,7 +9,11 @@ methods for:
     - General graph structure validation
 
 Unlike the manipulator, the traverser **never mutates** the graph; this makes it safe to call from
-anywhere, including within calculation routines.
+anywhere, including within calculation routines. Successor queries (``get_direct_successors``,
+``breadth_first_search``, reachability and cycle checks) read the graph's maintained dependency
+index, so they cost time proportional to the edges visited. Whole-graph cycle detection
+(``cycle_groups``, ``detect_cycles`` and ``validate``) finds strongly connected components with an
+iterative Tarjan pass, linear in nodes plus edges and independent of the recursion limit.
 
 Examples:
     >>> from fin_statement_model.core.graph import Graph
@@ -37,6 +41,7 @@ instantiating it directly.
 """
 
 from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
 import logging
 from typing import Any, cast
 
@@ -128,6 +133,9 @@ class GraphTraverser:
     def get_direct_successors(self, node_id: str) -> list[str]:
         """Get immediate successor node IDs for a given node.
 
+        Answered from the graph's maintained dependency index, so the cost is
+        proportional to the number of successors rather than to graph size.
+
         Args:
             node_id: The name of the node whose successors to retrieve.
 
@@ -137,18 +145,7 @@ class GraphTraverser:
         Examples:
             >>> traverser.get_direct_successors("Revenue")
         """
-        successors: list[str] = []
-        for other_id, node in self.nodes.items():
-            if hasattr(node, "inputs"):
-                input_nodes: list[Node] = []
-                if isinstance(node.inputs, list):
-                    input_nodes = node.inputs
-                elif isinstance(node.inputs, dict):
-                    input_nodes = list(node.inputs.values())
-
-                if any(inp.name == node_id for inp in input_nodes if hasattr(inp, "name")):
-                    successors.append(other_id)
-        return successors
+        return cast("list[str]", self.graph._dependency_index.dependents(node_id))
 
     def get_direct_predecessors(self, node_id: str) -> list[str]:
         """Get immediate predecessor node IDs (dependencies) for a given node.
@@ -175,6 +172,9 @@ class GraphTraverser:
     def topological_sort(self) -> list[str]:
         """Perform a topological sort of nodes based on dependencies.
 
+        The order is maintained incrementally by the graph's dependency index
+        as nodes are added, so this is a read rather than a full sort.
+
         Returns:
             A list of node IDs in topological order.
 
@@ -184,25 +184,7 @@ class GraphTraverser:
         Examples:
             >>> traverser.topological_sort()
         """
-        in_degree: dict[str, int] = dict.fromkeys(self.nodes, 0)
-        adjacency: dict[str, list[str]] = {n: [] for n in self.nodes}
-        for name, node in self.nodes.items():
-            if hasattr(node, "inputs"):
-                for inp in node.inputs:
-                    adjacency[inp.name].append(name)
-                    in_degree[name] += 1
-        queue: list[str] = [n for n, d in in_degree.items() if d == 0]
-        topo_order: list[str] = []
-        while queue:
-            current = queue.pop()
-            topo_order.append(current)
-            for nbr in adjacency[current]:
-                in_degree[nbr] -= 1
-                if in_degree[nbr] == 0:
-                    queue.append(nbr)
-        if len(topo_order) != len(self.nodes):
-            raise ValueError("Cycle detected in graph, can't do a valid topological sort.")
-        return topo_order
+        return cast("list[str]", self.graph._dependency_index.topological_order())
 
     def get_calculation_nodes(self) -> list[str]:
         """Identify all nodes in the graph that represent calculations.
@@ -257,8 +239,29 @@ class GraphTraverser:
                 dependencies[node_id] = []
         return dependencies
 
+    def cycle_groups(self) -> list[list[str]]:
+        """Return the groups of nodes that depend on each other in a cycle.
+
+        Each group is a strongly connected component of the dependency graph
+        with more than one node, or a single node that depends on itself.
+        Every node belongs to at most one group, so overlapping cycles are
+        reported once, together. Runs in time linear in nodes plus edges.
+
+        Returns:
+            The groups, each listing its members in graph order; groups are
+            ordered by their first member.
+
+        Examples:
+            >>> traverser.cycle_groups()
+        """
+        return _cyclic_components(self.nodes, self.get_dependency_graph())
+
     def detect_cycles(self) -> list[list[str]]:
-        """Detect all cycles present in the graph's dependency structure.
+        """Detect the cycles present in the graph's dependency structure.
+
+        One cycle is reported per :meth:`cycle_groups` group: a closed path
+        ``[a, b, ..., a]`` in which each node depends on the next, starting
+        at the group's first member.
 
         Returns:
             A list of cycles, each cycle is a list of node IDs forming the cycle.
@@ -267,43 +270,53 @@ class GraphTraverser:
             >>> traverser.detect_cycles()
         """
         dependency_graph = self.get_dependency_graph()
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
         cycles: list[list[str]] = []
-
-        def dfs_detect_cycles(n_id: str, path: list[str] | None = None) -> None:
-            if path is None:
-                path = []
-            if n_id in rec_stack:
-                cycle_start = path.index(n_id)
-                cycle = [*path[cycle_start:], n_id]
-                if cycle not in cycles:
-                    cycles.append(cycle)
-                return
-            if n_id in visited:
-                return
-            visited.add(n_id)
-            rec_stack.add(n_id)
-            path.append(n_id)
-            for dep in dependency_graph.get(n_id, []):
-                dfs_detect_cycles(dep, path[:])
-            rec_stack.remove(n_id)
-
-        for node_id in self.nodes:
-            if node_id not in visited:
-                dfs_detect_cycles(node_id)
+        for group in _cyclic_components(self.nodes, dependency_graph):
+            start = group[0]
+            members = set(group)
+            first = next(dep for dep in dependency_graph[start] if dep in members)
+            cycles.append(_cycle_through(start, first, members, dependency_graph))
         return cycles
 
     def validate(self) -> list[str]:
         """Perform validation checks on the graph structure.
 
+        Each cycle group is reported once, with one of its cycles. Groups whose
+        nodes all belong to one declared circular group are intentional and not
+        reported; for other groups the cycle shown leaves the declared groups.
+
         Returns:
             A list of validation error messages; empty list if graph is valid.
 
         Examples:
             >>> traverser.validate()
         """
-        errors: list[str] = [f"Circular dependency detected: {' -> '.join(cycle)}" for cycle in self.detect_cycles()]
+        membership = self.graph._circular_membership()
+        dependency_graph = self.get_dependency_graph()
+
+        def declared(name: str, dep: str) -> bool:
+            group = membership.get(name)
+            return group is not None and group is membership.get(dep)
+
+        errors: list[str] = []
+        for group in _cyclic_components(self.nodes, dependency_graph):
+            members = set(group)
+            edge = next(
+                (
+                    (name, dep)
+                    for name in group
+                    for dep in dependency_graph[name]
+                    if dep in members and not declared(name, dep)
+                ),
+                None,
+            )
+            if edge is None:
+                continue
+            cycle = _cycle_through(*edge, members, dependency_graph)
+            message = f"Circular dependency detected: {' -> '.join(cycle)}"
+            if len(group) > len(cycle) - 1:
+                message += f" (cycle group of {len(group)} nodes: {', '.join(group)})"
+            errors.append(message)
         errors.extend(
             f"Node '{node_id}' depends on non-existent node '{inp.name}'"
             for node_id, node in self.nodes.items()
@@ -369,14 +382,34 @@ class GraphTraverser:
         Returns:
             True if adding the node would create a cycle
         """
-        if not hasattr(new_node, "inputs") or not new_node.inputs:
-            return False
+        return self.find_insertion_cycle(new_node) is not None
+
+    def find_insertion_cycle(self, new_node: "Node") -> list[str] | None:
+        """Return the cycle that adding *new_node* would close, if any.
+
+        A cycle exists when one of the node's dependencies is already
+        reachable from the node's name. The check runs against the maintained
+        topological order, so dependencies ordered before the node are
+        dismissed without searching.
+
+        When the graph declares circular groups, cycles inside one group are
+        allowed and the check covers the group as a whole: the cycle
+        returned is one through the node's block that leaves its group,
+        with groups listed by name.
 
-        # For each input, check if new_node is reachable from it
-        for input_node in new_node.inputs:
-            if hasattr(input_node, "name") and self._is_reachable(input_node.name, new_node.name):
-                return True
-        return False
+        Args:
+            new_node: The node to be added.
+
+        Returns:
+            ``[new_node.name, ..., dependency, new_node.name]`` or ``None``.
+        """
+        dependencies = self.graph._dependency_names(new_node)
+        if self.graph._circular_groups:
+            return cast(
+                "list[str] | None",
+                self.graph._structural_cycle([new_node.name], {new_node.name: dependencies}),
+            )
+        return cast("list[str] | None", self.graph._dependency_index.cycle_path(new_node.name, dependencies))
 
     def _is_reachable(self, from_node: str, to_node: str) -> bool:
         """Check if to_node is reachable from from_node.
@@ -396,14 +429,7 @@ class GraphTraverser:
         if to_node not in self.graph._nodes:
             return False
 
-        try:
-            bfs_levels = self.breadth_first_search(start_node=from_node, direction="successors")
-            reachable_nodes = {n for level in bfs_levels for n in level}
-        except (ValueError, KeyError):
-            # Handle cases where BFS fails (e.g., invalid node)
-            return False
-        else:
-            return to_node in reachable_nodes
+        return cast("bool", self.graph._dependency_index.is_reachable(from_node, to_node))
 
     def find_cycle_path(self, from_node: str, to_node: str) -> list[str] | None:
         """Find the actual cycle path if one exists.
@@ -418,27 +444,83 @@ class GraphTraverser:
         if not self._is_reachable(from_node, to_node):
             return None
 
-        # Use DFS to find the actual path
-        visited = set()
-        path: list[str] = []
-
-        def dfs_find_path(current: str, target: str) -> bool:
-            if current == target and len(path) > 0:
-                return True
-            if current in visited:
-                return False
+        # Shortest successor path over the dependency index (iterative, no recursion limit)
+        return cast("list[str] | None", self.graph._dependency_index.path(from_node, to_node))
 
-            visited.add(current)
-            path.append(current)
 
-            # Get successors of current node
-            for successor in self.get_direct_successors(current):
-                if dfs_find_path(successor, target):
-                    return True
+def _cyclic_components(names: Iterable[str], dependency_graph: Mapping[str, list[str]]) -> list[list[str]]:
+    """Return the cyclic strongly connected components of *dependency_graph*.
 
-            path.pop()
-            return False
-
-        if dfs_find_path(from_node, to_node):
-            return [*path, to_node]  # Complete the cycle
-        return None
+    Iterative Tarjan: one pass over nodes and edges with an explicit stack,
+    so deep dependency chains cannot hit the recursion limit. A component is
+    cyclic when it has several members or a node depending on itself.
+    Members are listed in the order of *names*, components by first member.
+    """
+    position = {name: pos for pos, name in enumerate(names)}
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+    for root in position:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        # (node, iterator over its remaining dependencies)
+        work: list[tuple[str, Iterator[str]]] = [(root, iter(dependency_graph.get(root, ())))]
+        while work:
+            name, deps = work[-1]
+            for dep in deps:
+                if dep not in index:
+                    index[dep] = lowlink[dep] = len(index)
+                    stack.append(dep)
+                    on_stack.add(dep)
+                    work.append((dep, iter(dependency_graph.get(dep, ()))))
+                    break
+                if dep in on_stack:
+                    lowlink[name] = min(lowlink[name], index[dep])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[name])
+                if lowlink[name] != index[name]:
+                    continue
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == name:
+                        break
+                if len(component) > 1 or name in dependency_graph.get(name, ()):
+                    components.append(component)
+    # Names missing from the graph have no dependencies, so they are never in a cycle
+    for component in components:
+        component.sort(key=position.__getitem__)
+    components.sort(key=lambda component: position[component[0]])
+    return components
+
+
+def _cycle_through(start: str, first: str, members: set[str], dependency_graph: Mapping[str, list[str]]) -> list[str]:
+    """Return the cycle ``[start, first, ..., start]`` through the edge ``start -> first``.
+
+    Breadth-first search from *first* back to *start* within *members* (the
+    strongly connected component holding both), so the path is a shortest one.
+    """
+    previous: dict[str, str | None] = {first: None}
+    queue = deque([first])
+    while queue and start not in previous:
+        name = queue.popleft()
+        for dep in dependency_graph[name]:
+            if dep in members and dep not in previous:
+                previous[dep] = name
+                queue.append(dep)
+    path: list[str] = []
+    node: str | None = start
+    while node is not None:
+        path.append(node)
+        node = previous[node]
+    return [start, *reversed(path)]
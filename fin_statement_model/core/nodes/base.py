@@ -8,6 +8,11 @@ Features:
     - Abstract base class for all node types in the financial statement model graph.
     - Enforces implementation of calculation and serialization methods.
     - Provides attribute access, dependency inspection, and optional cache clearing.
+    - Optional vectorized hook (`calculate_vector`) for whole-timeline evaluation.
+    - Dependency-aware invalidation hooks (`invalidate_cache`, `is_period_local`).
+    - Cache binding hook (`bind_cache`) so a graph can hold node results in one shared store.
+    - Slotted instances (no per-node ``__dict__``); per-node ``calculate`` shims
+      (`shim_calculate`) swap in a cached, layout-compatible subclass instead.
     - Serialization contract: all nodes must implement `to_dict` and `from_dict`.
 
 Example:
@@ -29,7 +34,34 @@ Example:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Node class -> its subclass whose ``calculate`` delegates to the instance's shim
+_SHIMMED_CLASSES: dict[type["Node"], type["Node"]] = {}
+
+
+def _shimmed_calculate(self: "Node", period: str) -> float:
+    return self._calculate_shim(period)
+
+
+def _shimmed_class(cls: type["Node"]) -> type["Node"]:
+    """Return the cached subclass of *cls* that routes ``calculate`` through the instance shim."""
+    shimmed = _SHIMMED_CLASSES.get(cls)
+    if shimmed is None:
+        # Empty __slots__ keeps the instance layout identical, so __class__ can be swapped
+        namespace = {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "calculate": _shimmed_calculate,
+            "_unshimmed_class": cls,
+        }
+        shimmed = _SHIMMED_CLASSES[cls] = type(cls)(cls.__name__, (cls,), namespace)
+    return shimmed
 
 
 class Node(ABC):
@@ -46,6 +78,10 @@ class Node(ABC):
             (e.g., calculation, forecast, stat nodes) must use the `context` argument to resolve them.
             Data nodes may ignore `context`.
 
+    Node classes declare ``__slots__`` so large graphs do not pay for one
+    ``__dict__`` per node; subclasses that do not declare them get a
+    ``__dict__`` as usual.
+
     Attributes:
         name (str): Unique identifier for the node instance.
         values (dict[str, Any]): Optional mapping of period to value (for data nodes).
@@ -67,8 +103,14 @@ class Node(ABC):
         'Revenue'
     """
 
+    __slots__ = ("_calculate_shim", "name")
+
+    # Set on shimmed subclasses only (see :py:meth:`shim_calculate`)
+    _unshimmed_class: type["Node"] | None = None
+
     name: str
-    values: dict[str, Any]
+    values: MutableMapping[str, Any]
+    _calculate_shim: Callable[[str], float]
 
     def __init__(self, name: str):
         """Initialize the Node instance with a unique name.
@@ -119,6 +161,95 @@ class Node(ABC):
             2.0
         """
 
+    def calculate_vector(self, inputs: list["np.ndarray"], periods: Sequence[str]) -> "np.ndarray":
+        """Calculate the node's values for a whole timeline at once.
+
+        Vectorized counterpart of :py:meth:`calculate` used by the graph's
+        array evaluator. *inputs* holds the already evaluated values of the
+        nodes named by :py:meth:`get_dependencies` (same order); in every array
+        the last axis is aligned with *periods* and any leading axes are batch
+        dimensions. Cells that cannot be computed (missing data, division by
+        zero, …) are returned as NaN rather than raising.
+
+        Args:
+            inputs (list[np.ndarray]): Dependency values, one array per dependency.
+            periods (Sequence[str]): Period identifiers of the last array axis.
+
+        Returns:
+            np.ndarray: Values broadcastable to ``batch_shape + (len(periods),)``.
+
+        Raises:
+            NotImplementedError: If the node type has no vectorized implementation;
+                evaluators then fall back to per-period :py:meth:`calculate`.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support vectorized evaluation")
+
+    # ------------------------------------------------------------------
+    # Calculate shims
+    # ------------------------------------------------------------------
+    @property
+    def node_class(self) -> type["Node"]:
+        """The node's own class, whether or not a ``calculate`` shim is installed."""
+        return self._unshimmed_class or type(self)
+
+    @property
+    def calculate_shim(self) -> Callable[[str], float] | None:
+        """The callable currently standing in for ``calculate``, or ``None``."""
+        return self._calculate_shim if self._unshimmed_class is not None else None
+
+    def shim_calculate(self, shim: Callable[[str], float]) -> bool:
+        """Route calls of this node's ``calculate`` through *shim*.
+
+        The graph uses this for per-node instrumentation (profiling, circular
+        group solving) without an instance ``__dict__``: the node's class is
+        swapped for a cached subclass whose ``calculate`` calls *shim*. The
+        node's own logic stays reachable as ``node.node_class.calculate(node, period)``.
+
+        Args:
+            shim (Callable[[str], float]): Replacement taking the period.
+
+        Returns:
+            bool: True if installed, False if the node already carries a shim.
+
+        Example:
+            >>> class Dummy(Node):
+            ...     def calculate(self, period):
+            ...         return 1.0
+            ...
+            ...     def to_dict(self):
+            ...         return {"type": "dummy", "name": self.name}
+            ...
+            ...     @classmethod
+            ...     def from_dict(cls, data, context=None):
+            ...         return cls(data["name"])
+            >>> node = Dummy("Test")
+            >>> node.shim_calculate(lambda period: 2.0)
+            True
+            >>> node.calculate("2023"), isinstance(node, Dummy), node.node_class is Dummy
+            (2.0, True, True)
+            >>> node.unshim_calculate() is not None, node.calculate("2023")
+            (True, 1.0)
+        """
+        if self._unshimmed_class is not None:
+            return False
+        self._calculate_shim = shim
+        self.__class__ = _shimmed_class(type(self))
+        return True
+
+    def unshim_calculate(self) -> Callable[[str], float] | None:
+        """Remove the shim installed by :py:meth:`shim_calculate`.
+
+        Returns:
+            Callable[[str], float] | None: The removed shim, or ``None`` if there was none.
+        """
+        original = self._unshimmed_class
+        if original is None:
+            return None
+        shim = self._calculate_shim
+        self.__class__ = original
+        del self._calculate_shim
+        return shim
+
     def clear_cache(self) -> None:
         """Clear cached calculation results for this node.
 
@@ -144,6 +275,58 @@ class Node(ABC):
         # Default: no cache to clear
         return None
 
+    def bind_cache(self, cache: MutableMapping[str, float]) -> MutableMapping[str, float] | None:
+        """Replace the node's per-period result cache with *cache*.
+
+        The graph calls this to keep the results of caching nodes in its
+        single value cache instead of a private ``dict``. Nodes that cache
+        results override it; the default ignores *cache*.
+
+        Args:
+            cache (MutableMapping[str, float]): The ``period -> value`` mapping to cache into.
+
+        Returns:
+            MutableMapping[str, float] | None: The previous cache, or ``None`` if the
+            node keeps no result cache.
+        """
+        _ = cache
+        return None
+
+    def invalidate_cache(self, periods: Iterable[str] | None = None) -> int:
+        """Drop cached results for *periods* (all periods when ``None``).
+
+        Used by the graph for dependency-aware invalidation after an edit.
+        The default delegates to :py:meth:`clear_cache` and, not knowing the
+        cache size, reports 0; nodes with a per-period cache override it.
+
+        Args:
+            periods (Iterable[str] | None): Periods whose results may have changed.
+
+        Returns:
+            int: Number of cached period values removed.
+        """
+        _ = periods
+        self.clear_cache()
+        return 0
+
+    def is_period_local(self) -> bool:
+        """Return True if ``calculate(period)`` reads its inputs for *period* only.
+
+        Period-local nodes let the graph confine cache invalidation to the
+        edited periods. The default is ``False``, which is always safe.
+
+        Example:
+            >>> class Dummy(Node):
+            ...     def calculate(self, period):
+            ...         return 1.0
+            ...
+            ...     def to_dict(self):
+            ...         return {"type": "dummy", "name": self.name}
+            >>> Dummy("Test").is_period_local()
+            False
+        """
+        return False
+
     def has_attribute(self, attr_name: str) -> bool:
         """Check if the node has a specific attribute.
 
@@ -11,6 +11,7 @@ Features:
     - CustomCalculationNode allows arbitrary Python callables for custom logic.
     - All nodes support serialization to and from dictionary representations.
     - All nodes provide dependency inspection and cache clearing where appropriate.
+    - All nodes support whole-timeline evaluation over NumPy arrays via `calculate_vector`.
 
 Example:
     >>> from fin_statement_model.core.nodes.item_node import FinancialStatementItemNode
@@ -37,19 +38,47 @@ Example:
     30.0
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, MutableMapping, Sequence
+import logging
 from typing import Any, cast
 
+import numpy as np
+
 from fin_statement_model.core.calculations.calculation import (
     Calculation,
     FormulaCalculation,
 )
+from fin_statement_model.core.calculations.vectorized import apply_elementwise, mask_non_finite
 from fin_statement_model.core.errors import (
     CalculationError,
 )
 from fin_statement_model.core.node_factory.registries import node_type
 from fin_statement_model.core.nodes.base import Node
 
+logger = logging.getLogger(__name__)
+
+
+def _drop_cached(cache: MutableMapping[str, float], periods: Iterable[str] | None) -> int:
+    """Remove *periods* (all when ``None``) from a per-period result cache; return the count removed."""
+    if periods is None:
+        removed = len(cache)
+        cache.clear()
+        return removed
+    return sum(cache.pop(period, None) is not None for period in periods)
+
+
+def _registered_description(metric_name: str | None) -> str | None:
+    """Return the metric registry's description of *metric_name*, or ``None`` if it is not registered."""
+    if not metric_name:
+        return None
+    # Runtime import: the metrics package imports the node modules
+    from fin_statement_model.core.metrics.registry import metric_registry
+
+    if metric_name not in metric_registry:
+        return None
+    return metric_registry.get(metric_name).description
+
+
 # === CalculationNode ===
 
 
@@ -68,6 +97,10 @@ class CalculationNode(Node):
         name (str): Identifier for this node.
         inputs (List[Node]): A list of input nodes required by the calculation.
         calculation (Any): An object possessing a `calculate(inputs: List[Node], period: str) -> float` method.
+        metric_name (Optional[str]): Metric identifier from the registry, if any.
+        metric_description (Optional[str]): The metric's description, read from the
+            metric registry; only a description that differs from the registered
+            one is stored on the node.
         _values (Dict[str, float]): Internal cache for calculated results.
 
     Example:
@@ -84,7 +117,16 @@ class CalculationNode(Node):
         30.0
     """
 
-    def __init__(self, name: str, inputs: list[Node], calculation: Calculation, **kwargs: Any):
+    __slots__ = ("_metric_description", "_values", "calculation", "inputs", "metric_name")
+
+    def __init__(
+        self,
+        name: str,
+        inputs: list[Node],
+        calculation: Calculation,
+        metric_name: str | None = None,
+        metric_description: str | None = None,
+    ):
         """Initialize the CalculationNode.
 
         Args:
@@ -92,7 +134,9 @@ class CalculationNode(Node):
             inputs (List[Node]): List of input nodes needed by the calculation.
             calculation (Any): The calculation object implementing the calculation.
                 Must have a `calculate` method.
-            **kwargs: Additional attributes to store on the node (e.g., metric_name, metric_description).
+            metric_name (Optional[str]): Metric identifier from the registry, if any.
+            metric_description (Optional[str]): Description of the metric; not stored
+                when it matches the registered description.
 
         Raises:
             TypeError: If `inputs` is not a list of Nodes, or if `calculation`
@@ -117,11 +161,27 @@ class CalculationNode(Node):
 
         self.inputs = inputs
         self.calculation = calculation
-        self._values: dict[str, float] = {}  # Cache for calculated values
+        self._values: MutableMapping[str, float] = {}  # Cache for calculated values
+        self.metric_name = metric_name
+        self.metric_description = metric_description
 
-        # Store any additional attributes passed via kwargs
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+    @property
+    def metric_description(self) -> str | None:
+        """Description of the metric this node computes.
+
+        Referenced from the metric registry instead of being copied onto every
+        metric node; a description that differs from the registered one (or
+        belongs to an unregistered metric) is kept on the node.
+        """
+        if self._metric_description is not None:
+            return self._metric_description
+        return _registered_description(self.metric_name)
+
+    @metric_description.setter
+    def metric_description(self, description: str | None) -> None:
+        if description is not None and description == _registered_description(self.metric_name):
+            description = None
+        self._metric_description = description
 
     def calculate(self, period: str) -> float:
         """Calculate the node's value for a given period.
@@ -148,8 +208,9 @@ class CalculationNode(Node):
             >>> sum_node.calculate("2023")
             30.0
         """
-        if period in self._values:
-            return self._values[period]
+        cached = self._values.get(period)
+        if cached is not None:
+            return cached
 
         try:
             # Delegate to the calculation object's calculate method
@@ -173,6 +234,25 @@ class CalculationNode(Node):
                 },
             ) from e
 
+    def calculate_vector(self, inputs: list[np.ndarray], periods: Sequence[str]) -> np.ndarray:
+        """Calculate the node for a whole timeline via `calculation.calculate_vector`.
+
+        Args:
+            inputs (list[np.ndarray]): Values of `self.inputs`, in the same order.
+            periods (Sequence[str]): Period identifiers of the last array axis.
+
+        Returns:
+            np.ndarray: Calculated values; per-period failures are NaN.
+
+        Raises:
+            NotImplementedError: If the calculation object has no vectorized form.
+        """
+        _ = periods
+        calculate_vector = getattr(self.calculation, "calculate_vector", None)
+        if calculate_vector is None:
+            raise NotImplementedError(f"{type(self.calculation).__name__} does not support vectorized evaluation")
+        return cast("np.ndarray", calculate_vector(self.inputs, inputs))
+
     def set_calculation(self, calculation: Calculation) -> None:
         """Change the calculation object for the node.
 
@@ -216,6 +296,19 @@ class CalculationNode(Node):
         """
         self._values.clear()
 
+    def invalidate_cache(self, periods: Iterable[str] | None = None) -> int:
+        """Drop cached results for *periods* (all when ``None``) and return how many were removed."""
+        return _drop_cached(self._values, periods)
+
+    def bind_cache(self, cache: MutableMapping[str, float]) -> MutableMapping[str, float] | None:
+        """Cache results in *cache* from now on and return the previous cache."""
+        previous, self._values = self._values, cache
+        return previous
+
+    def is_period_local(self) -> bool:
+        """Return True if the calculation strategy declares itself period-local."""
+        return bool(getattr(self.calculation, "period_local", False))
+
     def get_dependencies(self) -> list[str]:
         """Return the names of input nodes used by the calculation.
 
@@ -287,11 +380,11 @@ class CalculationNode(Node):
             if calculation_args:
                 node_dict["calculation_args"] = calculation_args
 
-        # Add any additional attributes (like metric info)
-        if hasattr(self, "metric_name") and self.metric_name:
+        # Add metric info
+        if self.metric_name:
             node_dict["metric_name"] = self.metric_name
-        if hasattr(self, "metric_description") and self.metric_description:
-            node_dict["metric_description"] = self.metric_description
+        if description := self.metric_description:
+            node_dict["metric_description"] = description
 
         return node_dict
 
@@ -387,7 +480,8 @@ class FormulaCalculationNode(CalculationNode):
         inputs_dict (dict[str, Node]): Mapping of variable names to input nodes.
         formula (str): Mathematical expression to evaluate.
         metric_name (Optional[str]): Metric identifier from the registry, if any.
-        metric_description (Optional[str]): Description from the metric definition, if any.
+        metric_description (Optional[str]): Description from the metric definition, if any
+            (read from the metric registry, see :class:`CalculationNode`).
 
     Example:
         >>> from fin_statement_model.core.nodes.item_node import FinancialStatementItemNode
@@ -402,6 +496,8 @@ class FormulaCalculationNode(CalculationNode):
         40.0
     """
 
+    __slots__ = ("formula", "inputs_dict")
+
     def __init__(
         self,
         name: str,
@@ -436,10 +532,8 @@ class FormulaCalculationNode(CalculationNode):
         if not isinstance(inputs, dict) or not all(isinstance(n, Node) for n in inputs.values()):
             raise TypeError("FormulaCalculationNode inputs must be a dict of Node instances.")
 
-        # Store the formula and metric attributes
+        # Store the formula
         self.formula = formula
-        self.metric_name = metric_name
-        self.metric_description = metric_description
 
         # Extract variable names and input nodes in consistent order
         input_variable_names = list(inputs.keys())
@@ -448,8 +542,8 @@ class FormulaCalculationNode(CalculationNode):
         # Create FormulaCalculation strategy
         formula_calculation = FormulaCalculation(formula, input_variable_names)
 
-        # Initialize parent CalculationNode with the strategy
-        super().__init__(name, input_nodes, formula_calculation)
+        # Initialize parent CalculationNode with the strategy and metric attributes
+        super().__init__(name, input_nodes, formula_calculation, metric_name, metric_description)
 
         # Store the inputs dict for compatibility (separate from parent's inputs list)
         self.inputs_dict = inputs
@@ -584,6 +678,8 @@ class CustomCalculationNode(Node):
         15.0
     """
 
+    __slots__ = ("_values", "description", "formula_func", "inputs")
+
     def __init__(
         self,
         name: str,
@@ -621,7 +717,7 @@ class CustomCalculationNode(Node):
         self.inputs = inputs
         self.formula_func = formula_func
         self.description = description
-        self._values: dict[str, float] = {}  # Cache for calculated results
+        self._values: MutableMapping[str, float] = {}  # Cache for calculated results
 
     def calculate(self, period: str) -> float:
         """Compute the node's value for a given period.
@@ -647,8 +743,9 @@ class CustomCalculationNode(Node):
             >>> node.calculate("2023")
             15.0
         """
-        if period in self._values:
-            return self._values[period]
+        cached = self._values.get(period)
+        if cached is not None:
+            return cached
 
         try:
             # Get input values
@@ -678,6 +775,28 @@ class CustomCalculationNode(Node):
                 details={"function": self.formula_func.__name__, "error": str(e)},
             ) from e
 
+    def calculate_vector(self, inputs: list[np.ndarray], periods: Sequence[str]) -> np.ndarray:
+        """Apply `formula_func` to whole input arrays.
+
+        The function is called once with the input arrays; if it cannot handle
+        arrays it is called once per period (and batch cell) instead, with
+        failing cells reported as NaN.
+
+        Args:
+            inputs (list[np.ndarray]): Values of `self.inputs`, in the same order.
+            periods (Sequence[str]): Period identifiers of the last array axis.
+
+        Returns:
+            np.ndarray: Computed values.
+        """
+        shape = np.broadcast_shapes(*(np.shape(value) for value in inputs), (len(periods),))
+        try:
+            result = np.asarray(self.formula_func(*inputs), dtype=float)
+            return mask_non_finite(np.broadcast_to(result, shape))
+        except Exception as exc:  # noqa: BLE001 - arbitrary user code; retried cell by cell below
+            logger.debug("Custom function for node '%s' does not accept arrays (%s).", self.name, exc)
+        return apply_elementwise(self.formula_func, [np.broadcast_to(value, shape) for value in inputs])
+
     def clear_cache(self) -> None:
         """Clear cached calculation results for this node.
 
@@ -692,6 +811,19 @@ class CustomCalculationNode(Node):
         """
         self._values.clear()
 
+    def invalidate_cache(self, periods: Iterable[str] | None = None) -> int:
+        """Drop cached results for *periods* (all when ``None``) and return how many were removed."""
+        return _drop_cached(self._values, periods)
+
+    def bind_cache(self, cache: MutableMapping[str, float]) -> MutableMapping[str, float] | None:
+        """Cache results in *cache* from now on and return the previous cache."""
+        previous, self._values = self._values, cache
+        return previous
+
+    def is_period_local(self) -> bool:
+        """Return True: the function only receives the inputs' values for the requested period."""
+        return True
+
     def get_dependencies(self) -> list[str]:
         """Get names of nodes used by the function.
 
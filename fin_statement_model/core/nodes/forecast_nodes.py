@@ -14,6 +14,9 @@ Features:
     - AverageHistoricalGrowthForecastNode applies the average historical growth rate.
     - All nodes support serialization to and from dictionary representations (where possible).
     - All nodes provide dependency inspection and cache clearing.
+    - All nodes can project a whole (optionally batched) timeline over NumPy arrays.
+    - Nodes whose growth rate does not depend on the history (fixed, curve,
+      statistical) also project forward-mode derivatives (``project_dual``).
 
 Example:
     >>> from fin_statement_model.core.nodes.item_node import FinancialStatementItemNode
@@ -28,15 +31,22 @@ Example:
 """
 
 from abc import abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, MutableMapping, Sequence
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
+import numpy as np
+
+from fin_statement_model.core.calculations.dual import Dual
+from fin_statement_model.core.calculations.vectorized import apply_elementwise
 from fin_statement_model.core.node_factory.registries import forecast_type
 
 # Use absolute imports
 from fin_statement_model.core.nodes.base import Node
 
+if TYPE_CHECKING:
+    from fin_statement_model.core.graph.services.period_index import PeriodIndex
+
 logger = logging.getLogger(__name__)
 
 # Minimum historical data points required to compute growth rates
@@ -71,7 +81,13 @@ class ForecastNode(Node):
         121.28
     """
 
-    _cache: dict[str, float]
+    __slots__ = ("_base_period", "_cache", "_forecast_periods", "_timeline", "input_node", "values")
+
+    _cache: MutableMapping[str, float]
+
+    #: True when the growth rate does not depend on the history, so the
+    #: projection is linear in it (see `project_dual`).
+    linear_growth: ClassVar[bool] = False
 
     def __init__(self, input_node: Node, base_period: str, forecast_periods: list[str]):
         """Initialize a ForecastNode.
@@ -84,20 +100,61 @@ class ForecastNode(Node):
         # Initialize with a default name based on input node, but allow it to be overridden
         super().__init__(input_node.name)
         self.input_node = input_node
+        self._timeline: PeriodIndex | None = None
         self.base_period = base_period
         self.forecast_periods = forecast_periods
         self._cache = {}
 
         # Copy historical values from input node
         if hasattr(input_node, "values"):
-            self.values = input_node.values.copy()
+            self.values = dict(input_node.values)
         else:
             self.values = {}
 
+    @property
+    def base_period(self) -> str:
+        """Last historical period used as forecast base."""
+        return self._base_period
+
+    @base_period.setter
+    def base_period(self, period: str) -> None:
+        self._base_period = period
+        self._timeline = None
+
+    @property
+    def forecast_periods(self) -> list[str]:
+        """Future periods to project (assign a new list to change them)."""
+        return self._forecast_periods
+
+    @forecast_periods.setter
+    def forecast_periods(self, periods: list[str]) -> None:
+        self._forecast_periods = periods
+        self._timeline = None
+
+    @property
+    def timeline(self) -> "PeriodIndex":
+        """The base period followed by the forecast periods, as an interned period index.
+
+        Forecast periods keep the order they were given in, whatever their
+        labels: each one grows from the period at the previous ordinal, and
+        ordinal 0 (the base period) is history.
+        """
+        if self._timeline is None:
+            from fin_statement_model.core.graph.services.period_index import PeriodIndex
+
+            self._timeline = PeriodIndex.of(dict.fromkeys([self._base_period, *self._forecast_periods]))
+        return self._timeline
+
+    def _is_history(self, period: str) -> bool:
+        """Return ``True`` for the base period and for periods with data that are not forecast."""
+        ordinal = self.timeline.get(period)
+        return ordinal == 0 if ordinal is not None else period in self.values
+
     def calculate(self, period: str) -> float:
         """Calculate the node's value for a given period.
 
-        Returns historical values for periods up to `base_period`; computes forecast for later periods.
+        Returns historical values for the base period and other periods with data;
+        computes forecasts for the forecast periods.
 
         Args:
             period (str): Period identifier, historical or forecast.
@@ -108,9 +165,10 @@ class ForecastNode(Node):
         Raises:
             ValueError: If `period` is not a historical or forecast period.
         """
-        if period not in self._cache:
-            self._cache[period] = self._calculate_value(period)
-        return self._cache[period]
+        value = self._cache.get(period)
+        if value is None:
+            value = self._cache[period] = self._calculate_value(period)
+        return value
 
     def clear_cache(self) -> None:
         """Clear cached forecast values.
@@ -119,6 +177,18 @@ class ForecastNode(Node):
         """
         self._cache.clear()
 
+    def invalidate_cache(self, periods: Iterable[str] | None = None) -> int:
+        """Drop all cached forecast values; each forecast period depends on the previous ones."""
+        _ = periods
+        removed = len(self._cache)
+        self._cache.clear()
+        return removed
+
+    def bind_cache(self, cache: MutableMapping[str, float]) -> MutableMapping[str, float] | None:
+        """Cache forecast values in *cache* from now on and return the previous cache."""
+        previous, self._cache = self._cache, cache
+        return previous
+
     def get_dependencies(self) -> list[str]:
         """Get names of nodes that this forecast depends on.
 
@@ -145,16 +215,17 @@ class ForecastNode(Node):
             ValueError: If `period` is not valid for this node.
         """
         # For historical periods, return the actual value
-        if period <= self.base_period:
-            # Return historical value, ensuring float type
+        if self._is_history(period):
             return float(self.values.get(period, 0.0))
 
         # For forecast periods, calculate using growth rate
-        if period not in self.forecast_periods:
+        timeline = self.timeline
+        ordinal = timeline.get(period)
+        if ordinal is None:
             raise ValueError(f"Period '{period}' not in forecast periods for {self.name}")
 
         # Get the previous period's value
-        prev_period = self._get_previous_period(period)
+        prev_period = timeline[ordinal - 1]
         prev_value = self.calculate(prev_period)
 
         # Get the growth rate for this period
@@ -163,10 +234,143 @@ class ForecastNode(Node):
         # Calculate the new value
         return prev_value * (1 + growth_factor)
 
+    def calculate_vector(self, inputs: list[np.ndarray], periods: Sequence[str]) -> np.ndarray:
+        """Calculate historical and forecast values for a whole timeline.
+
+        As in :py:meth:`calculate`, historical values come from the node's own
+        snapshot of the input node's data (see :py:meth:`history_vector`), and
+        periods that are neither historical nor forecast periods are NaN.
+
+        Args:
+            inputs (list[np.ndarray]): Ignored; see above.
+            periods (Sequence[str]): Period identifiers to evaluate.
+
+        Returns:
+            np.ndarray: One float per period.
+        """
+        _ = inputs
+        return self._project_vector(self.history_vector(periods), periods)
+
+    def history_vector(self, periods: Sequence[str]) -> np.ndarray:
+        """Return the historical values aligned with *periods*.
+
+        A historical period without data (a base period missing from the
+        input node) is 0.0, as in :py:meth:`calculate`; every other cell is NaN.
+
+        Args:
+            periods (Sequence[str]): Period identifiers to retrieve.
+
+        Returns:
+            np.ndarray: One float per period.
+        """
+        return np.fromiter(
+            (self.values.get(p, 0.0) if self._is_history(p) else np.nan for p in periods),
+            dtype=float,
+            count=len(periods),
+        )
+
+    def _project_vector(
+        self,
+        history: np.ndarray,
+        periods: Sequence[str],
+        step: Callable[[str, str, np.ndarray], np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """Extend *history* (last axis aligned with *periods*) with forecast values.
+
+        Cells for forecast periods are replaced and all other cells are copied
+        from *history*; leading axes are treated as independent batch cells.
+        *step* replaces :py:meth:`_forecast_vector_step` for computing each
+        forecast period.
+        """
+        step = step or self._forecast_vector_step
+        history = np.asarray(history, dtype=float)
+        batch_shape = history.shape[:-1]
+        columns = {period: idx for idx, period in enumerate(periods)}
+        result = history.copy()
+
+        chain = self.timeline
+        chain_values: dict[str, np.ndarray] = {}
+        for pos, period in enumerate(chain):
+            if pos == 0:
+                col = columns.get(period)
+                value = history[..., col] if col is not None else np.full(batch_shape, self.values.get(period, 0.0))
+            else:
+                prev_period = chain[pos - 1]
+                value = step(period, prev_period, chain_values[prev_period])
+                if period in columns:
+                    result[..., columns[period]] = value
+            chain_values[period] = value
+        return result
+
+    def project_dual(self, history: Dual, periods: Sequence[str]) -> Dual:
+        """Project unbatched *history* forward together with its derivatives.
+
+        Each forecast cell is ``prev * (1 + growth)``; its derivative is
+        ``d_prev * (1 + growth)`` when the rate does not depend on the history
+        (`linear_growth`). Growth rates are taken once, so statistical draws
+        are shared by the value and its derivatives.
+
+        Args:
+            history (Dual): Values aligned with *periods*, with tangents.
+            periods (Sequence[str]): Period identifiers to evaluate.
+
+        Returns:
+            Dual: Historical and forecast values with their derivatives.
+
+        Raises:
+            NotImplementedError: If growth depends on the history or *history*
+                is batched.
+        """
+        if not self.linear_growth or history.value.ndim != 1:
+            raise NotImplementedError(f"{type(self).__name__} does not support forward-mode differentiation")
+        columns = {period: idx for idx, period in enumerate(periods)}
+        # History cells are copied; every forecast cell is overwritten below
+        value = np.array(history.value, dtype=float)
+        tangent = None if history.tangent is None else np.array(history.tangent, dtype=float)
+
+        chain = self.timeline
+        prev_value, prev_tangent = np.nan, None
+        for pos, period in enumerate(chain):
+            col = columns.get(period)
+            if pos == 0:
+                prev_value = value[col] if col is not None else self.values.get(period, 0.0)
+                prev_tangent = None if tangent is None or col is None else tangent[:, col]
+                continue
+            try:
+                growth = float(self._get_growth_factor_for_period(period, chain[pos - 1], float(prev_value)))
+            except Exception as exc:  # noqa: BLE001 - a failing period is reported as NaN
+                logger.debug("Growth factor for %s/%s failed: %s", self.name, period, exc)
+                growth = np.nan
+            prev_value = prev_value * (1 + growth)
+            prev_tangent = None if prev_tangent is None else prev_tangent * (1 + growth)
+            if col is not None:
+                value[col] = prev_value
+                if tangent is not None:
+                    tangent[:, col] = 0.0 if prev_tangent is None else prev_tangent
+        return Dual(value, tangent)
+
+    def _forecast_vector_step(self, period: str, prev_period: str, prev_value: np.ndarray) -> np.ndarray:
+        """Return the forecast for *period* given the (batched) previous value."""
+        if prev_value.ndim == 0:
+            # Unbatched: growth hooks receive a plain float exactly as in calculate()
+            try:
+                growth = self._get_growth_factor_for_period(period, prev_period, float(prev_value))
+            except Exception as exc:  # noqa: BLE001 - a failing period is reported as NaN
+                logger.debug("Growth factor for %s/%s failed: %s", self.name, period, exc)
+                return np.asarray(np.nan)
+            return np.asarray(prev_value * (1 + growth), dtype=float)
+        try:
+            growth = self._get_growth_factor_for_period(period, prev_period, prev_value)  # type: ignore[arg-type]
+            return np.asarray(prev_value * (1 + np.asarray(growth, dtype=float)), dtype=float)
+        except Exception:  # noqa: BLE001 - growth hook cannot take arrays; go cell by cell
+            return apply_elementwise(
+                lambda value: value * (1 + self._get_growth_factor_for_period(period, prev_period, value)),
+                [prev_value],
+            )
+
     def _get_previous_period(self, current_period: str) -> str:
-        all_periods = sorted([self.base_period, *self.forecast_periods])
-        idx = all_periods.index(current_period)
-        return all_periods[idx - 1]
+        timeline = self.timeline
+        return timeline[timeline.ordinal(current_period) - 1]
 
     @abstractmethod
     def _get_growth_factor_for_period(self, period: str, prev_period: str, prev_value: float) -> float:
@@ -239,6 +443,10 @@ class FixedGrowthForecastNode(ForecastNode):
         110.25
     """
 
+    __slots__ = ("growth_rate",)
+
+    linear_growth: ClassVar[bool] = True
+
     def __init__(
         self,
         input_node: Node,
@@ -363,6 +571,10 @@ class CurveGrowthForecastNode(ForecastNode):
         118.8
     """
 
+    __slots__ = ("growth_rates",)
+
+    linear_growth: ClassVar[bool] = True
+
     def __init__(
         self,
         input_node: Node,
@@ -494,6 +706,10 @@ class StatisticalGrowthForecastNode(ForecastNode):
         NotImplementedError: StatisticalGrowthForecastNode cannot be fully deserialized because the distribution_callable cannot be serialized. Manual reconstruction required.
     """
 
+    __slots__ = ("distribution_callable",)
+
+    linear_growth: ClassVar[bool] = True
+
     def __init__(
         self,
         input_node: Node,
@@ -516,6 +732,53 @@ class StatisticalGrowthForecastNode(ForecastNode):
         _ = (period, prev_period, prev_value)  # Parameters are intentionally unused
         return self.distribution_callable()
 
+    def draw_growth_rates(self, rng: np.random.Generator, n_paths: int) -> np.ndarray:
+        """Draw growth rates for *n_paths* simulated paths.
+
+        Distribution callables that expose ``sample(rng, size)`` (such as the
+        samplers built by the statistical forecast method) are drawn as one
+        array from *rng*; any other callable is called once per cell.
+
+        Args:
+            rng (np.random.Generator): Generator for array-capable samplers.
+            n_paths (int): Number of simulated paths.
+
+        Returns:
+            np.ndarray: Shape ``(n_paths, len(forecast_periods))``, columns in
+            chronological forecast period order.
+        """
+        size = (n_paths, len(self.forecast_periods))
+        sample = getattr(self.distribution_callable, "sample", None)
+        if callable(sample):
+            return np.asarray(sample(rng, size), dtype=float).reshape(size)
+        count = size[0] * size[1]
+        draws = np.fromiter((self.distribution_callable() for _ in range(count)), dtype=float, count=count)
+        return draws.reshape(size)
+
+    def project_paths(self, history: np.ndarray, periods: Sequence[str], growth_rates: np.ndarray) -> np.ndarray:
+        """Project *history* along pre-drawn growth-rate paths.
+
+        Args:
+            history (np.ndarray): Values aligned with *periods* on the last axis.
+            periods (Sequence[str]): Period identifiers to evaluate.
+            growth_rates (np.ndarray): Shape ``(..., len(forecast_periods))`` as
+                returned by :py:meth:`draw_growth_rates`.
+
+        Returns:
+            np.ndarray: Shape ``(..., len(periods))`` with one row per path.
+        """
+        rates = np.asarray(growth_rates, dtype=float)
+        history = np.asarray(history, dtype=float)
+        shape = (*np.broadcast_shapes(history.shape[:-1], rates.shape[:-1]), len(periods))
+        timeline = self.timeline
+        first = timeline.ordinal(self.base_period) + 1
+
+        def step(period: str, prev_period: str, prev_value: np.ndarray) -> np.ndarray:
+            _ = prev_period
+            return np.asarray(prev_value * (1 + rates[..., timeline.ordinal(period) - first]), dtype=float)
+
+        return self._project_vector(np.broadcast_to(history, shape), periods, step)
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize the node to a dictionary representation.
 
@@ -573,6 +836,8 @@ class CustomGrowthForecastNode(ForecastNode):
         NotImplementedError: CustomGrowthForecastNode cannot be fully deserialized because the growth_function cannot be serialized. Manual reconstruction required.
     """
 
+    __slots__ = ("growth_function",)
+
     def __init__(
         self,
         input_node: Node,
@@ -647,6 +912,8 @@ class AverageValueForecastNode(ForecastNode):
         105.0
     """
 
+    __slots__ = ("average_value",)
+
     def __init__(
         self,
         input_node: Node,
@@ -665,12 +932,12 @@ class AverageValueForecastNode(ForecastNode):
         logger.debug("Created AverageValueForecastNode with average value: %s", self.average_value)
 
     def _calculate_average_value(self) -> float:
-        """Calculate the average historical value up to the base period.
+        """Calculate the average of the historical (non-forecast) values.
 
         Returns:
             float: The average of historical values or 0.0 if none.
         """
-        values = [value for period, value in self.values.items() if period <= self.base_period]
+        values = [value for period, value in self.values.items() if self._is_history(period)]
         if not values:
             logger.warning("No historical values found for %s, using 0.0 as average", self.name)
             return 0.0
@@ -680,7 +947,7 @@ class AverageValueForecastNode(ForecastNode):
     def _calculate_value(self, period: str) -> float:
         """Calculate the value for a specific period using the computed average value."""
         # For historical periods, return the actual value
-        if period <= self.base_period:
+        if self._is_history(period):
             # Return historical value, ensuring float type
             return float(self.values.get(period, 0.0))
 
@@ -690,6 +957,11 @@ class AverageValueForecastNode(ForecastNode):
 
         return self.average_value
 
+    def _forecast_vector_step(self, period: str, prev_period: str, prev_value: np.ndarray) -> np.ndarray:
+        """Every forecast period takes the constant historical average."""
+        _ = (period, prev_period)
+        return np.full(prev_value.shape, self.average_value)
+
     def _get_growth_factor_for_period(self, period: str, prev_period: str, prev_value: float) -> float:
         """Not used for average value forecasts."""
         _ = (period, prev_period, prev_value)  # Parameters intentionally unused
@@ -777,6 +1049,8 @@ class AverageHistoricalGrowthForecastNode(ForecastNode):
         121.0
     """
 
+    __slots__ = ("avg_growth_rate",)
+
     def __init__(
         self,
         input_node: Node,
@@ -800,8 +1074,8 @@ class AverageHistoricalGrowthForecastNode(ForecastNode):
         Returns:
             float: The average growth rate or 0.0 if insufficient data.
         """
-        # Get historical periods up to base_period, sorted
-        historical_periods = sorted([p for p in self.values if p <= self.base_period])
+        # Get the historical periods in the order their values were recorded
+        historical_periods = [p for p in self.values if self._is_history(p)]
 
         if len(historical_periods) < MIN_HISTORICAL_PERIODS:
             logger.warning("Insufficient historical data for %s, using 0.0 as growth rate", self.name)
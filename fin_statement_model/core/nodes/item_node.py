@@ -6,6 +6,7 @@ for specific periods. It is typically used as a leaf node in the financial state
 Features:
     - Stores period-to-value mappings for reported financial data (e.g., revenue, COGS).
     - Supports value retrieval and mutation for specific periods.
+    - Provides its whole timeline as a NumPy array (NaN for missing periods).
     - Implements serialization to and from dictionary representations via `to_dict` and `from_dict`.
 
 Example:
@@ -26,9 +27,12 @@ Example:
     1200.0
 """
 
+from collections.abc import MutableMapping, Sequence
 import logging
 from typing import Any
 
+import numpy as np
+
 from fin_statement_model.core.node_factory.registries import node_type
 
 # Use absolute imports
@@ -51,7 +55,9 @@ class FinancialStatementItemNode(Node):
 
     Attributes:
         name (str): Unique identifier for the financial item.
-        values (dict[str, float]): Mapping from period identifiers to their values.
+        values (MutableMapping[str, float]): Mapping from period identifiers to their values.
+            A plain ``dict`` by default, or a row view of the graph's columnar
+            value store when that is enabled.
 
     Example:
         >>> from fin_statement_model.core.nodes.item_node import FinancialStatementItemNode
@@ -63,7 +69,9 @@ class FinancialStatementItemNode(Node):
         1200.0
     """
 
-    values: dict[str, float]
+    __slots__ = ("values",)
+
+    values: MutableMapping[str, float]
 
     def __init__(self, name: str, values: dict[str, float]):
         """Create a FinancialStatementItemNode.
@@ -100,6 +108,36 @@ class FinancialStatementItemNode(Node):
         """
         return self.values.get(period, 0.0)
 
+    def calculate_vector(self, inputs: list[np.ndarray], periods: Sequence[str]) -> np.ndarray:
+        """Return stored values for *periods* as an array.
+
+        Unlike :py:meth:`calculate`, periods without data are reported as NaN
+        instead of 0.0 so callers can tell missing data from a true zero.
+
+        Args:
+            inputs (list[np.ndarray]): Ignored; item nodes have no dependencies.
+            periods (Sequence[str]): Period identifiers to retrieve.
+
+        Returns:
+            np.ndarray: One float per period.
+
+        Example:
+            >>> node = FinancialStatementItemNode("Revenue", {"2023": 1000.0})
+            >>> node.calculate_vector([], ["2022", "2023"]).tolist()
+            [nan, 1000.0]
+        """
+        _ = inputs
+        values = self.values
+        # Rows of a graph-wide columnar value store gather directly from the matrix
+        as_array = getattr(values, "as_array", None)
+        if as_array is not None:
+            return np.asarray(as_array(periods), dtype=float)
+        return np.fromiter((values.get(period, np.nan) for period in periods), dtype=float, count=len(periods))
+
+    def is_period_local(self) -> bool:
+        """Return True: the value for a period is the value stored for that period."""
+        return True
+
     def set_value(self, period: str, value: float) -> None:
         """Set the value for a specific period.
 
@@ -130,7 +168,7 @@ class FinancialStatementItemNode(Node):
         return {
             "type": "financial_statement_item",
             "name": self.name,
-            "values": self.values.copy(),
+            "values": dict(self.values),
         }
 
     @classmethod
@@ -11,6 +11,8 @@ Features:
     - TwoPeriodAverageNode computes the average of two periods' values.
     - All nodes support serialization to and from dictionary representations.
     - All nodes provide dependency inspection and error handling.
+    - All nodes support array evaluation (`calculate_vector`); the statistic is
+      repeated across the evaluated timeline, as `calculate` ignores its period.
 
 Example:
     >>> from fin_statement_model.core.nodes.item_node import FinancialStatementItemNode
@@ -33,7 +35,7 @@ Example:
     11.0
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 import logging
 import math
 import statistics
@@ -41,6 +43,9 @@ import statistics
 # Use lowercase built-in types for annotations
 from typing import Any
 
+import numpy as np
+
+from fin_statement_model.core.calculations.vectorized import mask_non_finite, nan_divide
 from fin_statement_model.core.errors import CalculationError
 from fin_statement_model.core.node_factory.registries import node_type
 
@@ -54,6 +59,20 @@ Numeric = int | float
 StatFunc = Callable[..., Any]  # Widen callable type to accept any callable returning Numeric
 
 
+def _period_column(values: np.ndarray, periods: Sequence[str], period: str) -> np.ndarray:
+    """Return the cells of *values* for *period*, or NaN if it was not evaluated."""
+    try:
+        return values[..., list(periods).index(period)]
+    except ValueError:
+        return np.full(values.shape[:-1], np.nan)
+
+
+def _repeat_over_periods(result: np.ndarray, periods: Sequence[str]) -> np.ndarray:
+    """Broadcast a per-batch-cell statistic across the period axis."""
+    result = mask_non_finite(result)
+    return np.broadcast_to(result[..., np.newaxis], (*result.shape, len(periods)))
+
+
 @node_type("yoy_growth")
 class YoYGrowthNode(Node):
     """Compute year-over-year percentage growth.
@@ -82,6 +101,8 @@ class YoYGrowthNode(Node):
         0.2
     """
 
+    __slots__ = ("current_period", "input_node", "prior_period")
+
     def __init__(self, name: str, input_node: Node, prior_period: str, current_period: str):
         """Create a YoYGrowthNode.
 
@@ -157,6 +178,22 @@ class YoYGrowthNode(Node):
         else:
             return growth
 
+    def calculate_vector(self, inputs: list[np.ndarray], periods: Sequence[str]) -> np.ndarray:
+        """Compute the YoY growth rate from the input node's evaluated timeline.
+
+        Args:
+            inputs (list[np.ndarray]): Single-element list with the input node's values.
+            periods (Sequence[str]): Period identifiers of the last array axis.
+
+        Returns:
+            np.ndarray: The growth rate repeated for every period; NaN if the
+                prior value is zero, non-finite, or not part of *periods*.
+        """
+        values = np.asarray(inputs[0], dtype=float)
+        prior = _period_column(values, periods, self.prior_period)
+        current = _period_column(values, periods, self.current_period)
+        return _repeat_over_periods(nan_divide(current - prior, prior), periods)
+
     def get_dependencies(self) -> list[str]:
         """Get names of nodes this node depends on."""
         return [self.input_node.name]
@@ -254,6 +291,8 @@ class MultiPeriodStatNode(Node):
         11.5
     """
 
+    __slots__ = ("input_node", "periods", "stat_func")
+
     def __init__(
         self,
         name: str,
@@ -368,6 +407,34 @@ class MultiPeriodStatNode(Node):
                 },
             ) from e
 
+    def calculate_vector(self, inputs: list[np.ndarray], periods: Sequence[str]) -> np.ndarray:
+        """Compute the statistic from the input node's evaluated timeline.
+
+        Non-finite values are skipped exactly as in :py:meth:`calculate`; each
+        batch cell is reduced independently.
+
+        Args:
+            inputs (list[np.ndarray]): Single-element list with the input node's values.
+            periods (Sequence[str]): Period identifiers of the last array axis.
+
+        Returns:
+            np.ndarray: The statistic repeated for every period (NaN if it
+                cannot be computed).
+        """
+        values = np.asarray(inputs[0], dtype=float)
+        samples = np.stack([_period_column(values, periods, p) for p in self.periods], axis=-1)
+        result = np.full(samples.shape[:-1], np.nan)
+        for index in np.ndindex(result.shape):
+            cell = samples[index]
+            finite = [float(v) for v in cell[np.isfinite(cell)]]
+            if not finite:
+                continue
+            try:
+                result[index] = float(self.stat_func(finite))
+            except (statistics.StatisticsError, ValueError, TypeError) as stat_err:
+                logger.debug("MultiPeriodStatNode '%s': stat function failed (%s).", self.name, stat_err)
+        return _repeat_over_periods(result, periods)
+
     def get_dependencies(self) -> list[str]:
         """Get names of nodes this statistical node depends on."""
         return [self.input_node.name]
@@ -485,6 +552,8 @@ class TwoPeriodAverageNode(Node):
         10.5
     """
 
+    __slots__ = ("input_node", "period1", "period2")
+
     def __init__(self, name: str, input_node: Node, period1: str, period2: str):
         """Create a TwoPeriodAverageNode.
 
@@ -559,6 +628,22 @@ class TwoPeriodAverageNode(Node):
                 },
             ) from e
 
+    def calculate_vector(self, inputs: list[np.ndarray], periods: Sequence[str]) -> np.ndarray:
+        """Compute the two-period average from the input node's evaluated timeline.
+
+        Args:
+            inputs (list[np.ndarray]): Single-element list with the input node's values.
+            periods (Sequence[str]): Period identifiers of the last array axis.
+
+        Returns:
+            np.ndarray: The average repeated for every period; NaN if either
+                value is non-finite or not part of *periods*.
+        """
+        values = np.asarray(inputs[0], dtype=float)
+        first = _period_column(values, periods, self.period1)
+        second = _period_column(values, periods, self.period2)
+        return _repeat_over_periods((first + second) / 2.0, periods)
+
     def get_dependencies(self) -> list[str]:
         """Get names of nodes this average node depends on."""
         return [self.input_node.name]
@@ -12,6 +12,7 @@ Example:
 
 from __future__ import annotations
 
+from collections.abc import MutableMapping
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
@@ -128,7 +129,7 @@ def _forecast_node_mutating(
         growth_params=params["growth_params"],
     )
 
-    if not hasattr(node, "values") or not isinstance(node.values, dict):
+    if not hasattr(node, "values") or not isinstance(node.values, MutableMapping):
         logger.error("Node %s lacks a 'values' dict - cannot store forecast", node.name)
         raise ForecastNodeError(f"Node {node.name} lacks a 'values' dictionary.", node_id=node.name)
 
@@ -25,12 +25,13 @@ from .base import BaseForecastMethod, ForecastMethod
 from .curve import CurveForecastMethod
 from .historical_growth import HistoricalGrowthForecastMethod
 from .simple import SimpleForecastMethod
-from .statistical import StatisticalForecastMethod
+from .statistical import DistributionSampler, StatisticalForecastMethod
 
 __all__ = [
     "AverageForecastMethod",
     "BaseForecastMethod",
     "CurveForecastMethod",
+    "DistributionSampler",
     "ForecastMethod",
     "HistoricalGrowthForecastMethod",
     "SimpleForecastMethod",
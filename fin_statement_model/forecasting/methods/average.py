@@ -16,6 +16,7 @@ Example:
     True
 """
 
+from collections.abc import Mapping
 import logging
 from typing import Any
 
@@ -120,7 +121,7 @@ class AverageForecastMethod(BaseForecastMethod):
         if not hasattr(node, "calculate") or not callable(node.calculate):
             raise ValueError(f"Node {node.name} cannot be calculated for average method")
 
-        if not hasattr(node, "values") or not isinstance(node.values, dict):
+        if not hasattr(node, "values") or not isinstance(node.values, Mapping):
             raise ValueError(f"Node {node.name} does not have values dictionary for average method")
 
         # Extract historical values
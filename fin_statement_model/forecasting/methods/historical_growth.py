@@ -18,6 +18,7 @@ Example:
     True
 """
 
+from collections.abc import Mapping
 import logging
 from typing import Any
 
@@ -131,7 +132,7 @@ class HistoricalGrowthForecastMethod(BaseForecastMethod):
         if not hasattr(node, "calculate") or not callable(node.calculate):
             raise ValueError(f"Node {node.name} cannot be calculated for historical growth method")
 
-        if not hasattr(node, "values") or not isinstance(node.values, dict):
+        if not hasattr(node, "values") or not isinstance(node.values, Mapping):
             raise ValueError(f"Node {node.name} does not have values dictionary for historical growth method")
 
         # Extract historical values in chronological order
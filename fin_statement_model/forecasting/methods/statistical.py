@@ -32,6 +32,49 @@ from fin_statement_model.forecasting.types import StatisticalConfig
 from .base import BaseForecastMethod
 
 
+class DistributionSampler:
+    """Draw growth rates from a validated statistical distribution.
+
+    Calling the sampler returns one rate from its own random state, which is
+    the zero-argument callable ``StatisticalGrowthForecastNode`` expects.
+    :py:meth:`sample` draws whole arrays from a caller-supplied generator, so
+    Monte Carlo simulation (``Graph.simulate``) can draw every path at once.
+
+    Example:
+        >>> import numpy as np
+        >>> from fin_statement_model.forecasting.types import StatisticalConfig
+        >>> config = StatisticalConfig(distribution="uniform", params={"low": 0.0, "high": 0.1})
+        >>> sampler = DistributionSampler(config, np.random.default_rng(0))
+        >>> 0.0 <= sampler() <= 0.1
+        True
+        >>> sampler.sample(np.random.default_rng(0), (1000, 3)).shape
+        (1000, 3)
+    """
+
+    __slots__ = ("_rng", "config")
+
+    def __init__(
+        self, config: StatisticalConfig, rng: np.random.Generator | np.random.RandomState | None = None
+    ) -> None:
+        """Create a sampler for *config*, drawing single values from *rng*."""
+        self.config = config
+        self._rng = rng if rng is not None else np.random.default_rng()
+
+    def __call__(self) -> float:
+        """Generate a random growth rate from the specified distribution."""
+        return float(self.sample(self._rng, None))
+
+    def sample(self, rng: np.random.Generator | np.random.RandomState, size: int | tuple[int, ...] | None) -> Any:
+        """Draw growth rates of shape *size* (a scalar when *size* is None) from *rng*."""
+        params = self.config.params
+        if self.config.distribution == "normal":
+            return rng.normal(params["mean"], params["std"], size)
+        if self.config.distribution == "uniform":
+            return rng.uniform(params["low"], params["high"], size)
+        # This shouldn't happen due to validation, but just in case
+        raise ValueError(f"Unsupported distribution: {self.config.distribution}")
+
+
 class StatisticalForecastMethod(BaseForecastMethod):
     """Forecast future values by sampling from statistical distributions.
 
@@ -107,7 +150,8 @@ class StatisticalForecastMethod(BaseForecastMethod):
 
         Returns:
             Dict with 'forecast_type' and 'growth_params' keys.
-            The 'growth_params' value is a callable that generates random values.
+            The 'growth_params' value is a callable ``DistributionSampler``
+            that generates random values (and arrays of them for simulation).
 
         Example:
             >>> from fin_statement_model.forecasting.methods.statistical import StatisticalForecastMethod
@@ -123,19 +167,8 @@ class StatisticalForecastMethod(BaseForecastMethod):
         # Create validated config
         stat_config = StatisticalConfig(distribution=config["distribution"], params=config["params"])
 
-        # Seed RNG if configured
+        # Seed RNG if configured; scalar draws keep the legacy RandomState stream
+        # so a given seed still produces the same forecasts
         seed = cfg("forecasting.random_seed")
         rng = np.random.RandomState(seed) if seed is not None else np.random.RandomState()
-
-        # Create generator function based on distribution
-        def generator() -> float:
-            """Generate a random growth rate from the specified distribution."""
-            if stat_config.distribution == "normal":
-                return float(rng.normal(stat_config.params["mean"], stat_config.params["std"]))
-            elif stat_config.distribution == "uniform":
-                return float(rng.uniform(stat_config.params["low"], stat_config.params["high"]))
-            else:
-                # This shouldn't happen due to validation, but just in case
-                raise ValueError(f"Unsupported distribution: {stat_config.distribution}")
-
-        return {"forecast_type": self.internal_type, "growth_params": generator}
+        return {"forecast_type": self.internal_type, "growth_params": DistributionSampler(stat_config, rng)}
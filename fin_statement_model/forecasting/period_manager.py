@@ -23,6 +23,7 @@ Example:
     ['2025']
 """
 
+from collections.abc import Mapping
 import logging
 from typing import Any, cast
 
@@ -155,7 +156,7 @@ class PeriodManager:
             and preferred_period
             and preferred_period in historical_periods
             and hasattr(node, "values")
-            and isinstance(getattr(node, "values", {}), dict)
+            and isinstance(getattr(node, "values", {}), Mapping)
             and preferred_period in getattr(node, "values", {})
         ):
             return preferred_period
@@ -164,7 +165,7 @@ class PeriodManager:
         if (
             strategy in ("preferred_then_most_recent", "most_recent")
             and hasattr(node, "values")
-            and isinstance(getattr(node, "values", None), dict)
+            and isinstance(getattr(node, "values", None), Mapping)
         ):
             values_dict = node.values
             available_periods = [p for p in historical_periods if p in values_dict]
@@ -18,6 +18,7 @@ Example:
     # No exception means validation passed
 """
 
+from collections.abc import Mapping
 import logging
 from typing import Any
 
@@ -141,7 +142,7 @@ class ForecastValidator:
             method,
         )
 
-        if not hasattr(node, "values") or not isinstance(node.values, dict):
+        if not hasattr(node, "values") or not isinstance(node.values, Mapping):
             raise ForecastNodeError(
                 f"Node {node.name} is not forecastable (missing 'values' dict)",
                 node_id=node.name,
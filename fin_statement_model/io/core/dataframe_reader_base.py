@@ -206,26 +206,27 @@ class DataFrameReaderBase(  # pylint: disable=too-many-public-methods
 
         validator = ValidationResultCollector()
         grouped = df.groupby(item_col)
-        for raw_name, group in grouped:
-            ok, item_name = self.validate_node_name(raw_name)
-            if not ok or item_name is None:
-                continue
-            node_name = self._apply_mapping(item_name, mapping)
-            period_values: dict[str, float] = {}
-            for _, row in group.iterrows():
-                per = row[period_col]
-                val_raw = row[value_col]
-                ok_val, num = self.validate_numeric_value(
-                    val_raw,
-                    item_name,
-                    per,
-                    validator,
-                    allow_conversion=self.allow_conversion,
-                )
-                if ok_val and num is not None:
-                    period_values[str(per)] = float(num)
-            if period_values:
-                graph.add_node(FinancialStatementItemNode(name=node_name, values=period_values))
+        with graph.batch():
+            for raw_name, group in grouped:
+                ok, item_name = self.validate_node_name(raw_name)
+                if not ok or item_name is None:
+                    continue
+                node_name = self._apply_mapping(item_name, mapping)
+                period_values: dict[str, float] = {}
+                for _, row in group.iterrows():
+                    per = row[period_col]
+                    val_raw = row[value_col]
+                    ok_val, num = self.validate_numeric_value(
+                        val_raw,
+                        item_name,
+                        per,
+                        validator,
+                        allow_conversion=self.allow_conversion,
+                    )
+                    if ok_val and num is not None:
+                        period_values[str(per)] = float(num)
+                if period_values:
+                    graph.add_node(FinancialStatementItemNode(name=node_name, values=period_values))
 
         if validator.has_errors():
             raise ReadError(
@@ -265,29 +266,30 @@ class DataFrameReaderBase(  # pylint: disable=too-many-public-methods
 
         validator = ValidationResultCollector()
         nodes_added = 0
-        for _, row in df.iterrows():
-            raw_item = row.iloc[items_col_idx0]
-            ok, item_name = self.validate_node_name(raw_item)
-            if not ok or item_name is None:
-                continue
-            node_name = self._apply_mapping(item_name, mapping)
-            period_values: dict[str, float] = {}
-            for col_idx, period in enumerate(df.columns):
-                if col_idx <= items_col_idx0:
+        with graph.batch():
+            for _, row in df.iterrows():
+                raw_item = row.iloc[items_col_idx0]
+                ok, item_name = self.validate_node_name(raw_item)
+                if not ok or item_name is None:
                     continue
-                val_raw = row[period]
-                ok_val, num = self.validate_numeric_value(
-                    val_raw,
-                    item_name,
-                    str(period),
-                    validator,
-                    allow_conversion=self.allow_conversion,
-                )
-                if ok_val and num is not None:
-                    period_values[str(period)] = float(num)
-            if period_values:
-                graph.add_node(FinancialStatementItemNode(name=node_name, values=period_values))
-                nodes_added += 1
+                node_name = self._apply_mapping(item_name, mapping)
+                period_values: dict[str, float] = {}
+                for col_idx, period in enumerate(df.columns):
+                    if col_idx <= items_col_idx0:
+                        continue
+                    val_raw = row[period]
+                    ok_val, num = self.validate_numeric_value(
+                        val_raw,
+                        item_name,
+                        str(period),
+                        validator,
+                        allow_conversion=self.allow_conversion,
+                    )
+                    if ok_val and num is not None:
+                        period_values[str(period)] = float(num)
+                if period_values:
+                    graph.add_node(FinancialStatementItemNode(name=node_name, values=period_values))
+                    nodes_added += 1
 
         if validator.has_errors():
             raise ReadError(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -23,7 +24,7 @@ class ValueExtractionMixin:
     def extract_node_value(self, node: Any, period: str, *, calculate: bool = True) -> float | None:
         """Extract a numeric value from a graph node for a specific period."""
         try:
-            if hasattr(node, "values") and isinstance(node.values, dict):
+            if hasattr(node, "values") and isinstance(node.values, Mapping):
                 val = node.values.get(period)
                 if isinstance(val, int | float):
                     return float(val)
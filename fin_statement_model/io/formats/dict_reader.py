@@ -130,14 +130,16 @@ class DictReader(DataReader, ValidationMixin, ConfigurationMixin):
 
         graph = Graph(periods=graph_periods)
 
-        for node_name, period_values in source.items():
-            # Skip nodes that failed validation earlier
-            if collector.get_items_with_errors() and node_name in collector.get_items_with_errors():
-                continue
+        items_with_errors = set(collector.get_items_with_errors())
+        with graph.batch():
+            for node_name, period_values in source.items():
+                # Skip nodes that failed validation earlier
+                if node_name in items_with_errors:
+                    continue
 
-            filtered_values = {p: v for p, v in period_values.items() if p in graph_periods}
-            if filtered_values:
-                graph.add_node(FinancialStatementItemNode(name=node_name, values=filtered_values.copy()))
+                filtered_values = {p: v for p, v in period_values.items() if p in graph_periods}
+                if filtered_values:
+                    graph.add_node(FinancialStatementItemNode(name=node_name, values=filtered_values.copy()))
 
         logger.info("Created graph with %s nodes from dictionary.", len(graph.nodes))
         return graph
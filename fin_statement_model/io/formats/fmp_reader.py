@@ -330,10 +330,11 @@ class FmpReader(DataReader, ConfigurationMixin, MappingAwareMixin):
         graph = Graph(periods=periods)
         import numpy as np
 
-        for node_name, period_values in item_matrix.items():
-            valid_values = {p: v for p, v in period_values.items() if not np.isnan(v)}
-            if valid_values:
-                graph.add_node(FinancialStatementItemNode(name=node_name, values=valid_values))
+        with graph.batch():
+            for node_name, period_values in item_matrix.items():
+                valid_values = {p: v for p, v in period_values.items() if not np.isnan(v)}
+                if valid_values:
+                    graph.add_node(FinancialStatementItemNode(name=node_name, values=valid_values))
         return graph
 
     # ------------------------------------------------------------------
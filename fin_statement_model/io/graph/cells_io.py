@@ -57,7 +57,8 @@ def import_from_cells(cells_info: list[dict[str, Any]]) -> Graph:
     # Create data nodes directly; avoids older convenience wrappers
     from fin_statement_model.core.nodes import FinancialStatementItemNode
 
-    for name, values in items.items():
-        graph.add_node(FinancialStatementItemNode(name=name, values=values))
+    with graph.batch():
+        for name, values in items.items():
+            graph.add_node(FinancialStatementItemNode(name=name, values=values))
 
     return graph
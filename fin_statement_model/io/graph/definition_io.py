@@ -197,11 +197,10 @@ class GraphDefinitionReader(DataReader):
 
             # First pass - create all stub nodes so dependencies can be resolved regardless of order
             for node_name in nodes_dict:
-                temp_node = GraphDefinitionReader._TempNode(node_name)
-                temp_graph.add_node(temp_node)
-                from_nodes[node_name] = temp_node
+                from_nodes[node_name] = GraphDefinitionReader._TempNode(node_name)
 
-            # Second pass - wire up the inputs attribute based on serialized dependencies
+            # Second pass - wire up the inputs attribute based on serialized dependencies,
+            # then register all stubs in one batch so the graph indexes their edges
             for node_name, node_def in nodes_dict.items():
                 dep_names = self._get_node_dependencies(node_name, node_def)
                 try:
@@ -211,6 +210,9 @@ class GraphDefinitionReader(DataReader):
                         message=f"Dependency '{missing.args[0]}' for node '{node_name}' not found in definitions.",
                         source="graph_definition_dict",
                     ) from None
+            with temp_graph.batch():
+                for temp_node in from_nodes.values():
+                    temp_graph.add_node(temp_node)
 
             # Delegate ordering to GraphTraverser ----------------------------------------
             try:
@@ -222,11 +224,11 @@ class GraphDefinitionReader(DataReader):
                 ) from e
 
             # Create and add real nodes in topological order -----------------------------
-            for node_name in sorted_names:
-                node_def = nodes_dict[node_name]
-                existing_nodes = {name: graph.nodes[name] for name in graph.nodes}
-                node = NodeFactory.create_from_dict(node_def, context=existing_nodes)
-                graph.add_node(node)
+            with graph.batch():
+                for node_name in sorted_names:
+                    node_def = nodes_dict[node_name]
+                    node = NodeFactory.create_from_dict(node_def, context=graph.nodes)
+                    graph.add_node(node)
 
             # 3. Load Adjustments --------------------------------------------------------
             self._load_adjustments(graph, source.get("adjustments"))
@@ -560,7 +560,7 @@ class TemplateRegistry:
     # Public API - instantiation (clone + optional transforms)
     # ------------------------------------------------------------------
     @classmethod
-    def instantiate(  # noqa: C901
+    def instantiate(
         cls,
         template_id: str,
         *,
@@ -649,9 +649,10 @@ class TemplateRegistry:
                 raise
 
         # ------------------------------------------------------------------
-        # 2. Deep-clone to decouple from in-memory caches (safety & perf)
+        # 2. Deep-clone to decouple from in-memory caches (safety & perf);
+        #    the freshly read graph is discarded, so its values can be shared
         # ------------------------------------------------------------------
-        graph = graph.clone(deep=True)
+        graph = graph.clone(deep=True, copy_on_write=True)
 
         # ------------------------------------------------------------------
         # 3. Extend periods if requested
@@ -675,20 +676,9 @@ class TemplateRegistry:
                 if new_name in graph.nodes:
                     raise ValueError(f"Target node name '{new_name}' already exists in graph.")
 
-            # Perform the rename ------------------------------------------------
+            # Perform the rename (dependents keep their node references) -----
             for old_name, new_name in rename_map.items():
-                node = graph.nodes.pop(old_name)
-                node.name = new_name
-                graph.nodes[new_name] = node
-
-            # Refresh calculation nodes' input references ----------------------
-            try:
-                graph.manipulator._update_calculation_nodes()  # pylint: disable=protected-access
-            except AttributeError:
-                # Fallback - update input_names manually where present
-                for nd in graph.nodes.values():
-                    if hasattr(nd, "input_names") and isinstance(nd.input_names, list):
-                        nd.input_names = [rename_map.get(n, n) for n in nd.input_names]
+                graph.rename_node(old_name, new_name)
 
         # ------------------------------------------------------------------
         # 5. Apply preprocessing pipeline if declared
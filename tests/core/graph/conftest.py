@@ -0,0 +1,115 @@
+"""Shared graph builders for the graph tests.
+
+Each fixture returns a factory, so a test can build several graphs (e.g. a
+baseline and a bumped copy) from the same recipe.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.nodes import FixedGrowthForecastNode, YoYGrowthNode
+
+
+def _series_graph(
+    items: Mapping[str, Sequence[float] | Mapping[str, float]], periods: Sequence[str], **graph_kwargs: object
+) -> Graph:
+    g = Graph(periods=list(periods), **graph_kwargs)  # type: ignore[arg-type]
+    for name, series in items.items():
+        values = series if isinstance(series, Mapping) else dict(zip(periods, series, strict=True))
+        g.add_financial_statement_item(name, dict(values))
+    return g
+
+
+def _layered_graph(
+    width: int,
+    depth: int,
+    periods: Sequence[str],
+    *,
+    first_value: float = 0.0,
+    operations: Sequence[str] = ("addition",),
+    **graph_kwargs: object,
+) -> Graph:
+    g = Graph(periods=list(periods), **graph_kwargs)  # type: ignore[arg-type]
+    with g.batch():
+        for j in range(width):
+            g.add_financial_statement_item(f"item_{j}", dict.fromkeys(periods, first_value + j))
+        previous = [f"item_{j}" for j in range(width)]
+        for layer in range(depth):
+            current = [f"l{layer}_{j}" for j in range(width)]
+            operation = operations[layer % len(operations)]
+            for j, name in enumerate(current):
+                g.add_calculation(name, [previous[j], previous[(j + 1) % width]], operation)
+            previous = current
+    return g
+
+
+def _chain_graph(size: int, periods: Sequence[str] = ("2024",), *, fan_in: bool = False) -> Graph:
+    g = Graph(periods=list(periods))
+    with g.batch():
+        g.add_financial_statement_item("seed", dict.fromkeys(periods, 1.0))
+        previous = "seed"
+        for j in range(size):
+            g.add_calculation(f"calc_{j}", [previous, "seed"] if fan_in else [previous], "addition")
+            previous = f"calc_{j}"
+    return g
+
+
+def _margin_model(**graph_kwargs: object) -> Graph:
+    g = _series_graph(
+        {"revenue": {"2022": 100.0, "2023": 120.0}, "cogs": {"2022": 60.0, "2023": 70.0}},
+        ["2022", "2023", "2024"],
+        **graph_kwargs,
+    )
+    g.add_calculation("gross_profit", ["revenue", "cogs"], "subtraction")
+    g.add_calculation("margin", ["gross_profit", "revenue"], "formula", formula="gross_profit / revenue")
+    g.add_custom_calculation("double_gp", lambda gp: 2 * gp, ["gross_profit"])
+    g.add_node(FixedGrowthForecastNode(g.get_node("revenue"), "2023", ["2024"], 0.1))
+    g.add_node(YoYGrowthNode("revenue_growth", g.get_node("revenue"), "2022", "2023"))
+    return g
+
+
+@pytest.fixture()
+def series_graph() -> Callable[..., Graph]:
+    """Build a graph with one item node per entry of *items*.
+
+    A series is either a list aligned with *periods* or a period -> value
+    mapping (for items with gaps); extra keyword arguments go to ``Graph``.
+    """
+    return _series_graph
+
+
+@pytest.fixture()
+def layered_graph() -> Callable[..., Graph]:
+    """Build *width* items ``item_j`` feeding *depth* layers of ``l{layer}_{j}`` calculations.
+
+    Each node combines its two neighbours ``j`` and ``j + 1`` (wrapping) from
+    the layer below, with the layers cycling through *operations* (additions
+    only by default); item ``j`` holds ``first_value + j`` in every period.
+    Extra keyword arguments go to ``Graph``.
+    """
+    return _layered_graph
+
+
+@pytest.fixture()
+def chain_graph() -> Callable[..., Graph]:
+    """Build a ``seed`` item (1.0 in every period) followed by *size* chained ``calc_j`` additions.
+
+    With ``fan_in=True`` every link also adds the seed, so ``calc_j`` is ``j + 2``.
+    """
+    return _chain_graph
+
+
+@pytest.fixture()
+def margin_model() -> Callable[..., Graph]:
+    """Build a small margin model over 2022-2024 with one node of each common kind.
+
+    ``revenue`` and ``cogs`` have data for 2022-2023; ``revenue`` is forecast
+    to 2024 at 10%. ``gross_profit`` (subtraction), ``margin`` (formula),
+    ``double_gp`` (custom) and ``revenue_growth`` (YoY) are derived from them.
+    Keyword arguments go to ``Graph``.
+    """
+    return _margin_model
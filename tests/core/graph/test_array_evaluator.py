@@ -0,0 +1,161 @@
+"""Tests for whole-timeline evaluation: Graph.calculate_series / calculate_frame."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fin_statement_model.core.errors import CalculationError, NodeError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.nodes import (
+    CalculationNode,
+    FixedGrowthForecastNode,
+    MultiPeriodStatNode,
+    TwoPeriodAverageNode,
+    YoYGrowthNode,
+)
+
+
+@pytest.fixture()
+def model(series_graph: Callable[..., Graph]) -> Graph:
+    g = series_graph(
+        {
+            "rev": [100.0, 120.0, 150.0, 160.0],
+            "cogs": [60.0, 70.0, 80.0, 90.0],
+            "opex": [10.0, 12.0, 15.0, 16.0],
+        },
+        ["2021", "2022", "2023", "2024"],
+    )
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("total_cost", ["cogs", "opex"], "addition")
+    g.add_calculation("double_rev", ["rev", "rev"], "multiplication")
+    g.add_calculation("margin", ["gp", "rev"], "division")
+    g.add_calculation("blend", ["rev", "cogs"], "weighted_average", weights=[0.25, 0.75])
+    g.add_calculation("ebit", ["gp", "opex"], "formula", formula="gp - opex")
+    g.add_calculation("flag", ["rev", "cogs"], "formula", formula="rev > 110 and cogs < 80")
+    g.add_custom_calculation("spread", lambda a, b: a - 2 * b, ["rev", "opex"])
+    g.add_custom_calculation("capped", lambda a: a if a < 130 else 130.0, ["rev"])
+    rev = g.get_node("rev")
+    g.add_node(YoYGrowthNode("rev_yoy", rev, "2021", "2022"))
+    g.add_node(MultiPeriodStatNode("rev_mean", rev, g.periods, statistics.mean))
+    g.add_node(TwoPeriodAverageNode("rev_avg", rev, "2021", "2024"))
+    return g
+
+
+def test_frame_matches_scalar_calculate(model: Graph) -> None:
+    g = model
+    frame = g.calculate_frame()
+
+    assert list(frame.index) == list(g.nodes)
+    assert list(frame.columns) == g.periods
+    for name in g.nodes:
+        for period in g.periods:
+            assert frame.loc[name, period] == pytest.approx(g.calculate(name, period)), (name, period)
+
+
+def test_calculate_series_returns_period_indexed_series(model: Graph) -> None:
+    series = model.calculate_series("margin")
+
+    assert isinstance(series, pd.Series)
+    assert series.name == "margin"
+    assert list(series.index) == model.periods
+    assert series["2021"] == pytest.approx(0.4)
+
+
+def test_division_by_zero_and_missing_inputs_are_nan() -> None:
+    g = Graph(periods=["2023", "2024", "2025"])
+    g.add_financial_statement_item("num", {"2023": 10.0, "2024": 10.0, "2025": 10.0})
+    g.add_financial_statement_item("den", {"2023": 2.0, "2024": 0.0})
+    g.add_calculation("ratio", ["num", "den"], "division")
+    g.add_calculation("formula_ratio", ["num", "den"], "formula", formula="num / den")
+
+    frame = g.calculate_frame(["ratio", "formula_ratio", "den"])
+
+    assert frame.loc["ratio"].tolist()[0] == 5.0
+    assert frame.loc["formula_ratio"].tolist()[0] == 5.0
+    assert frame.loc[["ratio", "formula_ratio"], ["2024", "2025"]].isna().all().all()
+    assert math.isnan(frame.loc["den", "2025"])
+    # The scalar API still raises for the same cell
+    with pytest.raises(CalculationError):
+        g.calculate("ratio", "2024")
+
+
+def test_requested_periods_subset_order_and_unknown_periods(model: Graph) -> None:
+    g = model
+    frame = g.calculate_frame(["gp", "rev_yoy"], periods=["2023", "2021", "2030"])
+
+    assert list(frame.columns) == ["2023", "2021", "2030"]
+    assert frame.loc["gp", "2023"] == 70.0
+    assert math.isnan(frame.loc["gp", "2030"])
+    # Nodes reading other periods still see the full graph timeline
+    assert frame.loc["rev_yoy", "2030"] == pytest.approx(0.2)
+
+
+def test_forecast_node_series_matches_scalar() -> None:
+    g = Graph(periods=["2022", "2023", "2024", "2025"])
+    rev = g.add_financial_statement_item("rev", {"2022": 100.0, "2023": 110.0})
+    # Self-forecast: the forecast node replaces the item under the same name
+    g.add_node(FixedGrowthForecastNode(rev, "2023", ["2024", "2025"], 0.1))
+    series = g.calculate_series("rev")
+
+    assert series.tolist() == pytest.approx([g.calculate("rev", p) for p in g.periods])
+
+
+def test_calculation_without_vector_support_falls_back_per_period(model: Graph) -> None:
+    class LegacySum:
+        def calculate(self, inputs, period):
+            return sum(node.calculate(period) for node in inputs)
+
+    g = model
+    g.add_node(CalculationNode("legacy", [g.get_node("rev"), g.get_node("cogs")], LegacySum()))
+
+    assert g.calculate_series("legacy").tolist() == [160.0, 190.0, 230.0, 250.0]
+
+
+def test_structural_errors_raise(model: Graph) -> None:
+    g = model
+    g.add_calculation("bad", ["rev"], "formula", formula="rev +", formula_variable_names=["rev"])
+
+    with pytest.raises(CalculationError) as exc_info:
+        g.calculate_series("bad")
+    assert exc_info.value.node_id == "bad"
+    with pytest.raises(NodeError):
+        g.calculate_frame(["missing"])
+
+
+def test_evaluation_order_is_topological(model: Graph) -> None:
+    g = model
+    order = g._array_evaluator.evaluation_order(["ebit"])
+
+    assert order.index("rev") < order.index("gp") < order.index("ebit")
+    assert order.index("opex") < order.index("ebit")
+    assert set(order) == {"rev", "cogs", "opex", "gp", "ebit"}
+
+
+def test_empty_graph_frame() -> None:
+    frame = Graph().calculate_frame()
+    assert frame.shape == (0, 0)
+
+
+@pytest.mark.perf
+def test_vectorized_frame_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """Compare a full-timeline frame with the per-node/per-period scalar loop."""
+    periods = [f"{year}" for year in range(1990, 2030)]
+    g = layered_graph(50, 8, periods, first_value=1.0)
+
+    start = time.perf_counter()
+    scalar = {name: [g.calculate(name, p) for p in periods] for name in g.nodes}
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = g.calculate_frame()
+    vector_time = time.perf_counter() - start
+
+    np.testing.assert_allclose(frame.to_numpy(), np.array([scalar[name] for name in frame.index]))
+    assert vector_time < scalar_time
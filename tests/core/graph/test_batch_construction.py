@@ -0,0 +1,136 @@
+"""Tests for bulk graph construction via Graph.batch() / Graph.add_nodes()."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from fin_statement_model.core.calculations import AdditionCalculation
+from fin_statement_model.core.errors import CircularDependencyError, NodeError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.nodes import CalculationNode, FinancialStatementItemNode
+from fin_statement_model.io.graph.cells_io import import_from_cells
+
+
+def item(name: str, value: float, period: str = "2023") -> FinancialStatementItemNode:
+    return FinancialStatementItemNode(name, {period: value})
+
+
+def test_add_nodes_accepts_inputs_in_any_order() -> None:
+    g = Graph()
+    rev, cogs = item("rev", 100.0), item("cogs", 60.0, "2024")
+    total = CalculationNode("total", inputs=[rev, cogs], calculation=AdditionCalculation())
+
+    added = g.add_nodes([total, rev, cogs])
+
+    assert [n.name for n in added] == ["total", "rev", "cogs"]
+    assert g.periods == ["2023", "2024"]
+    assert g.topological_sort().index("total") == 2
+    assert g.traverser.get_direct_successors("rev") == ["total"]
+    assert g.calculate("total", "2023") == 100.0
+
+
+def test_missing_input_rolls_back_whole_batch() -> None:
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("rev", {"2023": 1.0})
+    ghost = item("ghost", 0.0)
+    calc = CalculationNode("calc", inputs=[ghost], calculation=AdditionCalculation())
+
+    with pytest.raises(NodeError, match="ghost"):
+        g.add_nodes([item("other", 2.0), calc])
+
+    assert sorted(g.nodes) == ["rev"]
+    assert g.topological_sort() == ["rev"]
+
+
+def test_cycle_rolls_back_and_restores_displaced_node() -> None:
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("a", {"2023": 1.0})
+    g.add_calculation("b", ["a", "a"], "addition")
+    original_a = g.get_node("a")
+    looping_a = CalculationNode("a", inputs=[g.get_node("b")], calculation=AdditionCalculation())
+
+    with pytest.raises(CircularDependencyError) as excinfo:
+        g.add_nodes([looping_a])
+
+    assert excinfo.value.cycle[0] == excinfo.value.cycle[-1]
+    assert g.get_node("a") is original_a
+    assert g.topological_sort() == ["a", "b"]
+    assert g.calculate("b", "2023") == 2.0
+
+
+def test_exception_inside_block_discards_staged_nodes() -> None:
+    g = Graph(periods=["2023"])
+    with pytest.raises(RuntimeError), g.batch():
+        g.add_financial_statement_item("temp", {"2023": 1.0})
+        raise RuntimeError("abort")
+    assert g.nodes == {}
+    assert g._batch is None
+
+
+def test_nested_batches_commit_once_and_replacement_rewires_dependents() -> None:
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("rev", {"2023": 100.0})
+    g.add_calculation("double", ["rev", "rev"], "addition")
+    assert g.calculate("double", "2023") == 200.0
+    store = g.enable_columnar_values()
+
+    with g.batch():
+        g.add_node(item("rev", 10.0))
+        with g.batch():
+            g.add_financial_statement_item("cost", {"2025": 5.0})
+        # Inner exit does not commit: the graph still has the old period list
+        assert "2025" not in g.periods
+
+    assert g.periods == ["2023", "2025"]
+    assert g.get_node("double").inputs[0] is g.get_node("rev")
+    assert g.calculate("double", "2023") == 20.0
+    assert sorted(store.node_names) == ["cost", "rev"]
+
+
+def test_periods_come_only_from_nodes_still_staged_at_commit() -> None:
+    g = Graph()
+    with g.batch():
+        g.add_nodes([item("rev", 1.0, "2019")])
+        g.add_nodes([item("rev", 2.0, "2023")])  # replaces the 2019 node
+        g.add_nodes([item("tmp", 3.0, "2020")])
+        g.remove_node("tmp")
+
+    assert g.periods == ["2023"]
+    assert g.calculate("rev", "2023") == 2.0
+
+
+def test_readers_build_through_batch() -> None:
+    cells = [{"row_name": f"item_{i}", "column_name": "2023", "value": float(i)} for i in range(50)]
+    g = import_from_cells(cells)
+    assert len(g.nodes) == 50
+    assert len(g.topological_sort()) == 50
+    assert g.calculate("item_7", "2023") == 7.0
+
+
+@pytest.mark.perf
+def test_bulk_ingest_benchmark() -> None:
+    """50k item nodes with a long period axis: batch bookkeeping vs. one-at-a-time insertion."""
+    periods = [f"{year}-{month:02d}" for year in range(2010, 2025) for month in range(1, 13)]
+    n = 50_000
+
+    def make_nodes() -> list[FinancialStatementItemNode]:
+        return [FinancialStatementItemNode(f"item_{i}", {periods[i % len(periods)]: float(i)}) for i in range(n)]
+
+    nodes = make_nodes()
+    g = Graph()
+    start = time.perf_counter()
+    g.add_nodes(nodes)
+    bulk = time.perf_counter() - start
+
+    nodes = make_nodes()
+    single_graph = Graph()
+    start = time.perf_counter()
+    for node in nodes:
+        single_graph.add_financial_statement_item(node.name, dict(node.values))
+    single = time.perf_counter() - start
+
+    assert g.periods == single_graph.periods == periods
+    assert len(g.topological_sort()) == n
+    assert bulk < single
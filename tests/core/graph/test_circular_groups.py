@@ -0,0 +1,214 @@
+"""Tests for declared circular groups solved by fixed-point iteration."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from fin_statement_model.core.errors import CalculationError, CircularDependencyError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import CircularGroup, ConvergenceReport
+
+PERIODS = ["2024", "2025", "2026"]
+RATE = [0.10, 0.08, 0.12]
+OPENING = [1000.0, 800.0, 600.0]
+CFADS = [200.0, 250.0, 150.0]
+LOOP = ["interest", "avg_debt", "closing_debt", "sweep"]
+
+
+def expected_interest() -> np.ndarray:
+    # interest = r * (2 * D0 - CFADS + interest) / 2
+    r, d0, c = (np.array(v) for v in (RATE, OPENING, CFADS))
+    return r * (2 * d0 - c) / 2 / (1 - r / 2)
+
+
+def build_lbo(*, declare: bool = True, **settings: object) -> Graph:
+    g = Graph(periods=PERIODS)
+    for name, values in {"rate": RATE, "opening_debt": OPENING, "cfads": CFADS}.items():
+        g.add_financial_statement_item(name, dict(zip(PERIODS, values, strict=True)))
+    g.add_financial_statement_item("interest", dict.fromkeys(PERIODS, 0.0))  # placeholder
+    g.add_calculation("sweep", ["cfads", "interest"], "subtraction")
+    g.add_calculation("closing_debt", ["opening_debt", "sweep"], "subtraction")
+    g.add_calculation(
+        "avg_debt", ["opening_debt", "closing_debt"], "formula", formula="(opening_debt + closing_debt) / 2"
+    )
+    if declare:
+        g.declare_circular(LOOP, name="debt", **settings)  # type: ignore[arg-type]
+    g.add_calculation("interest", ["rate", "avg_debt"], "multiplication")
+    g.add_calculation("net_income", ["cfads", "interest"], "subtraction")
+    return g
+
+
+def build_bonus(share: float, **settings: object) -> Graph:
+    g = Graph(periods=["2024"])
+    g.add_financial_statement_item("base", {"2024": 100.0})
+    g.add_financial_statement_item("bonus", {"2024": 0.0})
+    g.add_calculation("profit", ["base", "bonus"], "subtraction")
+    g.declare_circular(["bonus", "profit"], name="bonus", **settings)  # type: ignore[arg-type]
+    g.add_calculation("bonus", ["profit"], "formula", formula=f"{share} * profit")
+    return g
+
+
+def test_loop_is_rejected_without_a_declaration() -> None:
+    with pytest.raises(CircularDependencyError) as excinfo:
+        build_lbo(declare=False)
+    assert excinfo.value.cycle[0] == "interest"
+
+
+def test_declared_loop_solves_every_period() -> None:
+    g = build_lbo()
+
+    interest = [g.calculate("interest", p) for p in PERIODS]
+
+    np.testing.assert_allclose(interest, expected_interest(), rtol=1e-9)
+    for idx, period in enumerate(PERIODS):
+        sweep = CFADS[idx] - interest[idx]
+        assert g.calculate("sweep", period) == pytest.approx(sweep)
+        assert g.calculate("avg_debt", period) == pytest.approx(OPENING[idx] - sweep / 2)
+        assert g.calculate("net_income", period) == pytest.approx(sweep)
+    report = g.circular_groups["debt"].last_report
+    assert isinstance(report, ConvergenceReport)
+    assert report.converged
+    assert report.periods == tuple(PERIODS)
+    assert report.max_residual <= 1e-9
+    assert 0 < report.iterations < 10
+    assert g.traverser.validate() == []
+
+
+def test_acyclic_inputs_are_evaluated_once_per_period() -> None:
+    g = Graph(periods=PERIODS)
+    g.add_financial_statement_item("rate", dict(zip(PERIODS, RATE, strict=True)))
+    g.add_financial_statement_item("opening_debt", dict(zip(PERIODS, OPENING, strict=True)))
+    g.add_financial_statement_item("cash", dict(zip(PERIODS, CFADS, strict=True)))
+    calls: list[float] = []
+
+    def cfads(cash: float) -> float:
+        calls.append(cash)
+        return cash
+
+    g.add_custom_calculation("cfads", cfads, ["cash"])
+    g.add_financial_statement_item("interest", dict.fromkeys(PERIODS, 0.0))
+    g.add_calculation("sweep", ["cfads", "interest"], "subtraction")
+    g.add_calculation("closing_debt", ["opening_debt", "sweep"], "subtraction")
+    g.add_calculation(
+        "avg_debt", ["opening_debt", "closing_debt"], "formula", formula="(opening_debt + closing_debt) / 2"
+    )
+    g.declare_circular(LOOP, name="debt")
+    g.add_calculation("interest", ["rate", "avg_debt"], "multiplication")
+    g.add_calculation("net_income", ["cfads", "interest"], "subtraction")
+
+    report = g.recalculate_all()
+
+    assert not report.failures
+    assert sorted(calls) == sorted(CFADS)
+    np.testing.assert_allclose([g.calculate("interest", p) for p in PERIODS], expected_interest(), rtol=1e-9)
+
+
+def test_anderson_acceleration_beats_plain_sweeps() -> None:
+    accelerated = build_bonus(0.9, tolerance=1e-10)
+    plain = build_bonus(0.9, tolerance=1e-10, method="gauss_seidel", max_iterations=1000)
+
+    assert accelerated.calculate("profit", "2024") == pytest.approx(100 / 1.9)
+    assert plain.calculate("profit", "2024") == pytest.approx(100 / 1.9)
+    assert accelerated.circular_groups["bonus"].last_report.iterations < 10
+    assert plain.circular_groups["bonus"].last_report.iterations > 100
+
+
+def test_divergent_iteration_reports_failure() -> None:
+    g = build_bonus(2.0, method="gauss_seidel", max_iterations=50)
+
+    with pytest.raises(CalculationError, match="did not converge"):
+        g.calculate("profit", "2024")
+    report = g.circular_groups["bonus"].last_report
+    assert not report.converged
+    assert report.unconverged == ("2024",)
+
+    # Anderson mixing solves the same (linear) loop
+    assert build_bonus(2.0).calculate("profit", "2024") == pytest.approx(100 / 3)
+
+
+def test_recalc_reports_unconverged_members() -> None:
+    g = build_lbo(method="gauss_seidel", max_iterations=2, tolerance=1e-14)
+
+    report = g.recalculate_all()
+
+    failed = {(f.node_name, f.period) for f in report.failures}
+    assert {(name, p) for name in LOOP for p in PERIODS} <= failed
+    assert ("net_income", "2024") in failed
+    assert g.circular_groups["debt"].last_report.iterations == 2
+
+
+def test_failed_input_fails_only_its_period() -> None:
+    g = build_lbo()
+    g.add_financial_statement_item("days", {"2024": 1.0, "2025": 0.0, "2026": 1.0})
+    g.add_calculation("rate_per_day", ["rate", "days"], "division")
+    g.add_calculation("interest", ["rate_per_day", "avg_debt"], "multiplication")
+
+    assert g.calculate("interest", "2024") == pytest.approx(expected_interest()[0])
+    with pytest.raises(CalculationError, match="did not converge"):
+        g.calculate("interest", "2025")
+    report = g.circular_groups["debt"].last_report
+    assert report.unconverged == ("2025",)
+    assert np.isnan(report.residuals["2025"])
+    assert g.calculate("sweep", "2026") == pytest.approx(CFADS[2] - expected_interest()[2])
+
+
+def test_set_value_resolves_from_the_previous_solution() -> None:
+    g = build_lbo()
+    first = g.calculate("interest", "2025")
+    cold = g.circular_groups["debt"].last_report.iterations
+
+    g.set_value("cfads", "2025", 260.0)
+    second = g.calculate("interest", "2025")
+
+    assert second < first
+    r, d0 = RATE[1], OPENING[1]
+    assert second == pytest.approx(r * (2 * d0 - 260.0) / 2 / (1 - r / 2))
+    assert g.circular_groups["debt"].last_report.iterations <= cold
+
+
+def test_calculate_frame_matches_scalar_results() -> None:
+    g = build_lbo()
+
+    frame = g.calculate_frame(["interest", "net_income", "rate"])
+
+    np.testing.assert_allclose(frame.loc["interest"].to_numpy(), expected_interest(), rtol=1e-9)
+    np.testing.assert_allclose(frame.loc["net_income"].to_numpy(), np.array(CFADS) - expected_interest(), rtol=1e-9)
+    with pytest.raises(CircularDependencyError, match="Cannot compile circular group 'debt'"):
+        g.compile()
+
+
+def test_cycles_leaving_a_group_are_rejected() -> None:
+    g = build_bonus(0.1)
+    g.add_financial_statement_item("tax", {"2024": 0.0})
+    g.add_calculation("profit", ["base", "bonus", "tax"], "formula", formula="base - bonus - tax")
+
+    # tax is outside the group, so profit -> tax -> profit is not allowed
+    with pytest.raises(CircularDependencyError) as excinfo:
+        g.add_calculation("tax", ["profit"], "formula", formula="0.2 * profit")
+    assert "bonus" in excinfo.value.cycle
+
+    # A batch closing the same cycle is rolled back
+    with pytest.raises(CircularDependencyError), g.batch():
+        g.add_calculation("tax", ["profit"], "formula", formula="0.2 * profit")
+    assert g.calculate("tax", "2024") == 0.0
+    assert g.calculate("profit", "2024") == pytest.approx(100 / 1.1)
+
+
+def test_declaration_and_removal() -> None:
+    g = build_bonus(0.5)
+    with pytest.raises(ValueError, match="already belong"):
+        g.declare_circular(["profit"])
+    with pytest.raises(ValueError, match="Unknown fixed-point method"):
+        g.declare_circular(["base"], method="newton")
+    with pytest.raises(CircularDependencyError):
+        g.remove_circular("bonus")
+
+    g.add_financial_statement_item("fixed_bonus", {"2024": 10.0})
+    g.replace_node("bonus", g.get_node("fixed_bonus").__class__("bonus", {"2024": 10.0}))
+    removed = g.remove_circular("bonus")
+
+    assert isinstance(removed, CircularGroup)
+    assert g.circular_groups == {}
+    assert g.get_node("profit").calculate_shim is None
+    assert g.calculate("profit", "2024") == 90.0
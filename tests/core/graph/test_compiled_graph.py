@@ -0,0 +1,198 @@
+"""Differential tests: Graph.compile() against the regular evaluation engine."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+import statistics
+import time
+
+import numpy as np
+import pytest
+
+from fin_statement_model.core.errors import CalculationError, CircularDependencyError, NodeError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.nodes import (
+    CalculationNode,
+    FixedGrowthForecastNode,
+    MultiPeriodStatNode,
+    TwoPeriodAverageNode,
+    YoYGrowthNode,
+)
+
+PERIODS = ["2021", "2022", "2023", "2024", "2025"]
+
+
+def by_period(values: list[float], scale: float = 1.0) -> dict[str, float]:
+    return {period: scale * value for period, value in zip(PERIODS, values, strict=True)}
+
+
+def build_graph(scale: float = 1.0) -> Graph:
+    g = Graph(periods=PERIODS)
+    g.add_financial_statement_item("rev", by_period([100.0, 120.0, 150.0, 160.0, 90.0], scale))
+    g.add_financial_statement_item("cogs", by_period([60.0, 0.0, 80.0, 90.0, 50.0], scale))
+    g.add_financial_statement_item("opex", by_period([10.0, 12.0, 15.0, 16.0, 11.0]))
+    units = g.add_financial_statement_item("units", {"2021": 5.0, "2022": 6.0, "2023": 7.0 * scale})
+    g.add_node(FixedGrowthForecastNode(units, "2023", ["2024", "2025"], 0.1))
+    hires = g.add_financial_statement_item("hires", {"2021": 3.0})  # no value in its base period
+    g.add_node(FixedGrowthForecastNode(hires, "2022", ["2023", "2024"], 0.5))
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("total_cost", ["cogs", "opex", "units"], "addition")
+    g.add_calculation("scaled", ["rev", "units"], "multiplication")
+    g.add_calculation("markup", ["rev", "cogs"], "division")
+    g.add_calculation("blend", ["rev", "cogs"], "weighted_average", weights=[0.25, 0.75])
+    g.add_calculation("ebit", ["gp", "opex"], "formula", formula="gp - opex")
+    g.add_calculation("ratio", ["ebit", "cogs"], "formula", formula="ebit / cogs")
+    g.add_custom_calculation("spread", lambda a, b: a - 2 * b, ["rev", "opex"])
+    g.add_custom_calculation("capped", lambda a: a if a < 130 else 130.0, ["rev"])
+    g.add_node(YoYGrowthNode("gp_yoy", g.get_node("gp"), "2022", "2023"))
+    g.add_node(MultiPeriodStatNode("ebit_mean", g.get_node("ebit"), PERIODS, statistics.mean))
+    g.add_node(TwoPeriodAverageNode("units_avg", g.get_node("units"), "2023", "2025"))
+    return g
+
+
+def engine_value(g: Graph, name: str, period: str) -> float:
+    """The regular engine's value for one cell; cells it refuses to compute are NaN."""
+    try:
+        return float(g.calculate(name, period))
+    except CalculationError:
+        return math.nan
+
+
+def assert_matches_engine(results: dict[str, np.ndarray], g: Graph) -> None:
+    for name, values in results.items():
+        for idx, period in enumerate(PERIODS):
+            expected = engine_value(g, name, period)
+            if math.isnan(expected):
+                assert math.isnan(values[idx]), (name, period)
+            else:
+                assert values[idx] == pytest.approx(expected, rel=1e-12), (name, period)
+
+
+def test_compiled_program_matches_engine_and_array_evaluator() -> None:
+    g = build_graph()
+    program = g.compile()
+
+    assert set(program.node_names) == set(g.nodes)
+    assert set(program.input_names) == {"rev", "cogs", "opex", "units", "hires"}
+    assert len(program) == len(g.nodes) - 3
+    results = program.evaluate()
+    assert_matches_engine(results, g)
+
+    frame = program.frame()
+    expected = g.calculate_frame(list(program.node_names))
+    np.testing.assert_array_equal(frame.to_numpy(), expected.to_numpy())
+    assert not results["gp"].flags.writeable
+    assert results["hires"].tolist()[:4] == [3.0, 0.0, 0.0, 0.0]  # missing base is 0.0, as in the engine
+
+
+def test_new_input_vectors_match_a_graph_built_from_them() -> None:
+    program = build_graph().compile()
+    other = build_graph(scale=2.0)
+
+    results = program.evaluate(other.compile().input_values)
+
+    assert_matches_engine(results, other)
+
+
+def test_batched_inputs_evaluate_each_row_independently() -> None:
+    g = build_graph()
+    program = g.compile()
+    base = program.input_values
+    rev = np.stack([base["rev"], 2.0 * base["rev"], np.full(len(PERIODS), 50.0)])
+
+    batched = program.evaluate({"rev": rev}, outputs=["gp", "markup", "ebit_mean", "units"])
+
+    assert batched["gp"].shape == (3, len(PERIODS))
+    assert batched["units"].shape == (3, len(PERIODS))
+    for row in range(3):
+        single = program.evaluate({"rev": rev[row]}, outputs=list(batched))
+        for name, values in batched.items():
+            np.testing.assert_array_equal(values[row], single[name])
+    # Scalars broadcast over the period axis
+    assert program.evaluate({"opex": 0.0}, outputs=["ebit"])["ebit"].tolist() == pytest.approx(
+        (base["rev"] - base["cogs"]).tolist()
+    )
+
+
+def test_program_is_a_snapshot_of_the_graph() -> None:
+    g = build_graph()
+    program = g.compile(["gp"])
+
+    assert program.node_names == ("rev", "cogs", "gp")
+    g.set_value("rev", "2021", 1000.0)
+    g.change_calculation_method("gp", "addition")
+
+    assert program.evaluate()["gp"][0] == 40.0
+    with pytest.raises(ValueError, match="read-only"):
+        program.input_values["rev"][0] = 1.0
+
+
+def test_invalid_inputs_and_structural_errors() -> None:
+    g = build_graph()
+    program = g.compile()
+
+    with pytest.raises(NodeError):
+        program.evaluate({"gp": [1.0] * len(PERIODS)})
+    with pytest.raises(NodeError):
+        program.evaluate(outputs=["missing"])
+    with pytest.raises(ValueError, match="last axis"):
+        program.evaluate({"rev": [1.0, 2.0]})
+    with pytest.raises(ValueError, match="unbatched"):
+        program.frame({"rev": np.ones((2, len(PERIODS)))})
+
+    g.add_calculation("bad", ["rev"], "formula", formula="rev +", formula_variable_names=["rev"])
+    with pytest.raises(CalculationError) as exc_info:
+        g.compile(["bad"]).evaluate()
+    assert exc_info.value.node_id == "bad"
+
+    g.manipulator.add_node(CalculationNode("rev", inputs=[g.get_node("gp")], calculation=g.get_node("gp").calculation))
+    with pytest.raises(CircularDependencyError):
+        g.compile(["gp"])
+
+
+def test_calculation_without_vector_support_is_compiled_per_period() -> None:
+    class LegacySum:
+        def calculate(self, inputs, period):
+            return sum(node.calculate(period) for node in inputs)
+
+    g = build_graph()
+    g.add_node(CalculationNode("legacy", [g.get_node("rev"), g.get_node("opex")], LegacySum()))
+
+    program = g.compile(["legacy", "cogs"])
+    assert program.evaluate()["legacy"].tolist() == [110.0, 132.0, 165.0, 176.0, 101.0]
+    # Inputs it does not depend on can still be overridden
+    assert program.evaluate({"cogs": 0.0})["legacy"].tolist() == [110.0, 132.0, 165.0, 176.0, 101.0]
+
+    # The per-period path reads the graph, so it refuses inputs it would silently ignore
+    with pytest.raises(CalculationError) as exc_info:
+        program.evaluate({"rev": np.ones((2, len(PERIODS)))})
+    assert exc_info.value.node_id == "legacy"
+    assert "no array kernel" in exc_info.value.details["original_error"]
+    with pytest.raises(CalculationError):
+        program.sensitivity(["legacy"], ["rev"])
+    with pytest.raises(CalculationError):
+        program.gradient("legacy", ["rev"])
+    with pytest.raises(CalculationError):
+        program.goal_seek("legacy", 200.0, "rev")
+
+
+@pytest.mark.perf
+def test_compiled_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """Re-evaluating a static graph: the compiled program beats calculate_frame."""
+    g = layered_graph(200, 10, [str(year) for year in range(2000, 2030)], first_value=1.0)
+
+    def best_of(func: object, repeat: int = 3) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()  # type: ignore[operator]
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    program = g.compile()
+    compiled = best_of(program.evaluate)
+    frame = best_of(g.calculate_frame)
+
+    np.testing.assert_allclose(program.frame().to_numpy(), g.calculate_frame().to_numpy())
+    assert compiled < frame
@@ -0,0 +1,91 @@
+"""Tests for strongly-connected-component cycle detection in GraphTraverser."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+import sys
+
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.traverser import _cyclic_components
+
+
+def close_loop(g: Graph, name: str, *inputs: str) -> None:
+    """Wire extra inputs into an existing calculation, bypassing insertion checks."""
+    g.get_node(name).inputs.extend(g.get_node(inp) for inp in inputs)
+
+
+def test_overlapping_cycles_are_reported_once_per_group() -> None:
+    g = Graph(periods=["2024"])
+    g.add_financial_statement_item("seed", {"2024": 1.0})
+    for name in ("a", "b", "c", "d", "e"):
+        g.add_calculation(name, ["seed"], "addition")
+    close_loop(g, "a", "b")
+    close_loop(g, "b", "a", "c")
+    close_loop(g, "c", "b", "a")  # a <-> b <-> c: three overlapping cycles, one group
+    close_loop(g, "d", "d")
+    close_loop(g, "e", "a")  # reaches the group but is not part of it
+
+    assert g.cycle_groups() == [["a", "b", "c"], ["d"]]
+    assert g.detect_cycles() == [["a", "b", "a"], ["d", "d"]]
+    errors = g.validate()
+    assert errors == [
+        "Circular dependency detected: a -> b -> a (cycle group of 3 nodes: a, b, c)",
+        "Circular dependency detected: d -> d",
+    ]
+
+
+def test_validate_reports_only_cycles_leaving_a_declared_group() -> None:
+    g = Graph(periods=["2024"])
+    g.add_financial_statement_item("base", {"2024": 100.0})
+    g.add_financial_statement_item("bonus", {"2024": 0.0})
+    g.add_calculation("profit", ["base", "bonus"], "subtraction")
+    g.declare_circular(["bonus", "profit"], name="bonus")
+    g.add_calculation("bonus", ["profit"], "formula", formula="0.1 * profit")
+    g.add_calculation("tax", ["bonus"], "addition")
+    assert g.cycle_groups() == [["bonus", "profit"]]
+    assert g.validate() == []
+
+    close_loop(g, "profit", "tax")
+
+    assert g.cycle_groups() == [["bonus", "profit", "tax"]]
+    assert g.validate() == ["Circular dependency detected: profit -> tax -> bonus -> profit"]
+
+
+def test_deep_chains_do_not_hit_the_recursion_limit(chain_graph: Callable[..., Graph]) -> None:
+    depth = sys.getrecursionlimit() * 5
+    g = chain_graph(depth)
+    assert g.detect_cycles() == []
+
+    close_loop(g, "calc_0", f"calc_{depth - 1}")
+
+    (cycle,) = g.detect_cycles()
+    assert cycle[0] == cycle[-1] == "calc_0"
+    assert len(cycle) == depth + 1
+    assert len(g.validate()) == 1
+
+
+@pytest.mark.perf
+def test_cycle_detection_reads_each_node_a_bounded_number_of_times(chain_graph: Callable[..., Graph]) -> None:
+    """Cycle detection stays linear: no node's dependencies are read more than twice, at any size."""
+
+    class CountingGraph(dict[str, list[str]]):
+        def get(self, key: str, default: object = None) -> object:
+            lookups[key] += 1
+            return super().get(key, default)
+
+    for size in (1_000, 100_000):
+        g = chain_graph(size)
+        for j in range(0, size, 100):  # one 10-node cycle group per 100 nodes
+            close_loop(g, f"calc_{j}", f"calc_{j + 9}")
+        lookups: Counter[str] = Counter()
+
+        groups = _cyclic_components(g.nodes, CountingGraph(g.get_dependency_graph()))
+
+        assert len(groups) == size // 100
+        assert {len(group) for group in groups} == {10}
+        assert len(lookups) == size + 1
+        assert max(lookups.values()) <= 2
+        assert len(g.validate()) == size // 100
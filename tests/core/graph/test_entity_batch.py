@@ -0,0 +1,120 @@
+"""Tests for evaluating one graph structure over many entities (Graph.evaluate_entities)."""
+
+from __future__ import annotations
+
+import math
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import EntityResults
+from fin_statement_model.core.nodes import FixedGrowthForecastNode, TwoPeriodAverageNode, YoYGrowthNode
+
+PERIODS = ["2021", "2022", "2023", "2024"]
+ITEMS = ["rev", "cogs", "opex"]
+
+
+def build_template(values: dict[str, dict[str, float]] | None = None) -> Graph:
+    values = values or {}
+    g = Graph(periods=PERIODS)
+    for item in ITEMS:
+        g.add_financial_statement_item(item, values.get(item, {}))
+    g.add_financial_statement_item("tax_rate", dict.fromkeys(PERIODS, 0.25))
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("ebit", ["gp", "opex"], "formula", formula="gp - opex")
+    g.add_calculation("tax", ["ebit", "tax_rate"], "multiplication")
+    g.add_calculation("margin", ["ebit", "rev"], "division")
+    g.add_node(YoYGrowthNode("rev_yoy", g.get_node("rev"), "2021", "2022"))
+    g.add_node(TwoPeriodAverageNode("gp_avg", g.get_node("gp"), "2021", "2022"))
+    g.add_node(FixedGrowthForecastNode(g.get_node("opex"), "2022", ["2023", "2024"], 0.05))
+    return g
+
+
+def long_frame(n_entities: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = [
+        (f"co_{e}", item, period, float(rng.integers(0, 50)) if item == "cogs" else float(rng.integers(50, 200)))
+        for e in range(n_entities)
+        for item in ITEMS
+        for period in PERIODS
+    ]
+    return pd.DataFrame(rows, columns=["entity", "item", "period", "value"])
+
+
+def per_entity_values(data: pd.DataFrame, entity: str) -> dict[str, dict[str, float]]:
+    rows = data[data["entity"] == entity]
+    return {item: dict(zip(group["period"], group["value"], strict=True)) for item, group in rows.groupby("item")}
+
+
+def test_batched_results_match_one_graph_per_entity() -> None:
+    data = long_frame(6)
+    data.loc[(data["entity"] == "co_2") & (data["item"] == "rev") & (data["period"] == "2023"), "value"] = 0.0
+
+    results = build_template().evaluate_entities(data)
+
+    assert isinstance(results, EntityResults)
+    assert results.entities == tuple(f"co_{e}" for e in range(6))
+    assert results.to_array().shape == (6, len(results.node_names), len(PERIODS))
+    for entity in results.entities:
+        expected = build_template(per_entity_values(data, entity)).calculate_frame(list(results.node_names))
+        for name in results.node_names:
+            np.testing.assert_allclose(results[name].loc[entity].to_numpy(), expected.loc[name].to_numpy())
+    assert math.isnan(results["margin"].loc["co_2", "2023"])
+
+
+def test_missing_rows_unknown_items_and_defaults() -> None:
+    data = pd.DataFrame({
+        "company": ["A", "A", "A", "B", "B"],
+        "line": ["rev", "cogs", "unknown", "rev", "rev"],
+        "year": [2021, 2021, 2021, 2021, 2030],
+        "amount": [100.0, 40.0, 1.0, 50.0, 9.0],
+    })
+
+    results = build_template().evaluate_entities(
+        data, ["gp", "tax_rate"], entity_col="company", item_col="line", period_col="year", value_col="amount"
+    )
+
+    assert results.node_names == ("gp", "tax_rate")
+    assert results["gp"]["2021"].tolist()[0] == 60.0
+    assert math.isnan(results["gp"].loc["B", "2021"])  # B has no cogs row
+    # tax_rate is not in the data: every entity keeps the template's value
+    assert results["tax_rate"].to_numpy().tolist() == [[0.25] * 4, [0.25] * 4]
+
+    frame = results.to_frame()
+    assert frame.index.names == ["entity", "node"]
+    assert frame.loc[("A", "gp"), "2021"] == 60.0
+    assert frame.shape == (4, len(PERIODS))
+
+
+def test_invalid_entity_data() -> None:
+    program = build_template().compile()
+    data = long_frame(2)
+
+    with pytest.raises(ValueError, match="missing columns"):
+        program.evaluate_entities(data.drop(columns="value"))
+    with pytest.raises(ValueError, match="duplicate"):
+        program.evaluate_entities(pd.concat([data, data.iloc[:1]]))
+
+
+@pytest.mark.perf
+def test_entity_batch_benchmark() -> None:
+    """One structural graph over N entities vs. building and evaluating N graphs."""
+    n_entities = 300
+    data = long_frame(n_entities)
+
+    start = time.perf_counter()
+    per_graph = {}
+    for entity, rows in data.groupby("entity", sort=False):
+        per_graph[entity] = build_template(per_entity_values(rows, str(entity))).calculate_frame()
+    looped = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = build_template().evaluate_entities(data)
+    batched = time.perf_counter() - start
+
+    expected = per_graph["co_17"]
+    np.testing.assert_allclose(results.to_frame().loc["co_17"].loc[expected.index].to_numpy(), expected.to_numpy())
+    assert batched < looped
@@ -0,0 +1,164 @@
+"""Tests for batched goal seeking (Graph.goal_seek)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fin_statement_model.core.errors import CalculationError, NodeError, PeriodError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services.goal_seek import bisect, newton, secant
+from fin_statement_model.core.nodes import FixedGrowthForecastNode
+
+PERIODS = ["2022", "2023", "2024"]
+ITEMS = {
+    "ebitda": [100.0, 120.0, 90.0],
+    "debt": [500.0, 450.0, 400.0],
+    "rate": [0.05, 0.06, 0.07],
+    "amortization": [40.0, 40.0, 50.0],
+    "cash": [30.0, 20.0, 10.0],
+}
+
+
+@pytest.fixture()
+def build_graph(series_graph: Callable[..., Graph]) -> Callable[..., Graph]:
+    """Build the model from ``ITEMS``, with *values* replacing some of the series."""
+
+    def build(values: dict[str, list[float]] | None = None) -> Graph:
+        g = series_graph({**ITEMS, **(values or {})}, PERIODS)
+        g.add_calculation("interest", ["debt", "rate"], "multiplication")
+        g.add_calculation("debt_service", ["interest", "amortization"], "addition")
+        g.add_calculation("dscr", ["ebitda", "debt_service"], "division")
+        g.add_calculation("leverage", ["debt", "cash", "ebitda"], "formula", formula="(debt - cash) / ebitda")
+        g.add_calculation("stress", ["ebitda", "debt"], "formula", formula="ebitda ** 2 / debt")
+        return g
+
+    return build
+
+
+@pytest.mark.parametrize("method", ["secant", "newton", "bisect"])
+def test_solutions_reach_the_target_in_every_period(build_graph: Callable[..., Graph], method: str) -> None:
+    g = build_graph()
+    bracket = (1.0, 5000.0) if method == "bisect" else None
+
+    debt = g.goal_seek("dscr", 1.25, "debt", method=method, bracket=bracket)
+
+    assert isinstance(debt, pd.Series)
+    assert debt.index.tolist() == PERIODS
+    assert debt.name == "debt"
+    expected = [
+        (e / 1.25 - a) / r for e, a, r in zip(ITEMS["ebitda"], ITEMS["amortization"], ITEMS["rate"], strict=True)
+    ]
+    np.testing.assert_allclose(debt.to_numpy(), expected, rtol=1e-8)
+    solved = build_graph({"debt": debt.tolist()}).calculate_frame().loc["dscr"]
+    np.testing.assert_allclose(solved.to_numpy(), 1.25, rtol=1e-8)
+    # The graph is not modified
+    assert g.calculate("debt", "2022") == 500.0
+
+
+def test_per_period_targets_and_nonlinear_formulas(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+
+    ebitda = g.goal_seek("stress", [10.0, 20.0, 30.0], "ebitda", method="newton")
+    np.testing.assert_allclose(ebitda.to_numpy(), np.sqrt(np.array([10.0, 20.0, 30.0]) * ITEMS["debt"]), rtol=1e-9)
+
+    cap = g.goal_seek("leverage", 3.0, "debt", "2023")
+    assert cap == pytest.approx(3.0 * 120.0 + 20.0)
+
+
+def test_forecast_base_period_is_solved_through_the_projection(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    units = g.add_financial_statement_item("units", {"2022": 10.0})
+    g.add_node(FixedGrowthForecastNode(units, "2022", ["2023", "2024"], 0.1))
+
+    for method in ("secant", "newton"):
+        base = g.goal_seek("units", 242.0, "units", "2024", input_period="2022", method=method)
+        assert base == pytest.approx(200.0)
+
+
+def test_only_nodes_between_input_and_target_are_recomputed(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    calls: list[int] = []
+
+    def haircut(values: dict[str, float]) -> float:
+        calls.append(1)
+        return values["cash"] * 0.5
+
+    g.add_calculation("haircut_cash", ["cash"], "custom_formula", formula_function=haircut)
+    g.add_calculation("coverage", ["ebitda", "haircut_cash"], "division")
+
+    program = g.compile(["coverage"])
+    calls.clear()
+    solved = program.goal_seek("coverage", 4.0, "ebitda", method="bisect", bracket=(0.0, 1000.0))
+
+    assert solved.tolist() == pytest.approx([60.0, 40.0, 20.0])
+    assert len(calls) <= len(PERIODS)  # evaluated once for the baseline, never per iteration
+
+
+def test_failures_are_reported(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    program = g.compile()
+
+    with pytest.raises(CalculationError) as excinfo:
+        program.goal_seek("dscr", 1.25, "cash")  # dscr does not depend on cash
+    assert excinfo.value.details["periods"] == PERIODS
+    with pytest.raises(ValueError, match="sign change"):
+        program.goal_seek("dscr", 1.25, "debt", method="bisect", bracket=(1.0, 2.0))
+    with pytest.raises(ValueError, match="bracket"):
+        program.goal_seek("dscr", 1.25, "debt", method="bisect")
+    with pytest.raises(ValueError, match="Unknown goal seek method"):
+        program.goal_seek("dscr", 1.25, "debt", method="brent")
+    with pytest.raises(NodeError):
+        program.goal_seek("dscr", 1.25, "interest")
+    with pytest.raises(PeriodError):
+        program.goal_seek("dscr", 1.25, "debt", ["2030"])
+    with pytest.raises(PeriodError):
+        program.goal_seek("dscr", 1.25, "debt", input_period="2030")
+
+
+def test_root_finders_solve_each_problem_independently() -> None:
+    targets = np.array([2.0, 9.0, -1.0])
+
+    def f(x: np.ndarray) -> np.ndarray:
+        return x**3 - targets
+
+    by_bisection = bisect(f, np.full(3, -10.0), np.full(3, 10.0), tol=1e-12)
+    by_secant = secant(f, np.ones(3), tol=1e-12)
+    by_newton = newton(lambda x: (f(x), 3 * x**2), np.ones(3), tol=1e-12)
+    for result in (by_bisection, by_secant, by_newton):
+        assert result.converged.all()
+        np.testing.assert_allclose(result.x, np.cbrt(targets), rtol=1e-9)
+    # Problems that are already solved stop iterating
+    assert by_newton.iterations[0] < by_bisection.iterations[0]
+    flat = newton(lambda x: (np.zeros_like(x) + 1.0, np.zeros_like(x)), np.zeros(2))
+    assert not flat.converged.any()
+
+
+@pytest.mark.perf
+def test_goal_seek_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """Back-solve one input in 30 periods of a 2k-node graph vs. a set_value/calculate bisection loop."""
+    periods = [str(year) for year in range(2000, 2030)]
+    g = layered_graph(200, 10, periods, first_value=1.0, operations=("addition", "multiplication"))
+    target = "l9_0"
+    goal = 2 * g.calculate(target, periods[0])
+
+    start = time.perf_counter()
+    solved = g.goal_seek(target, goal, "item_0", method="bisect", bracket=(0.0, 1e6))
+    batched = time.perf_counter() - start
+
+    # The external loop: set_value + calculate per iteration, one period at a time
+    start = time.perf_counter()
+    lo, hi, iterations = 0.0, 1e6, 0
+    while hi - lo > 1e-9 * hi and iterations < 60:
+        mid = 0.5 * (lo + hi)
+        g.set_value("item_0", periods[0], mid)
+        lo, hi = (mid, hi) if g.calculate(target, periods[0]) < goal else (lo, mid)
+        iterations += 1
+    looped = (time.perf_counter() - start) * len(periods)
+
+    assert solved.iloc[0] == pytest.approx(lo, rel=1e-6)
+    assert batched < looped
@@ -0,0 +1,174 @@
+"""Tests for forward-mode gradients over compiled graphs (Graph.gradient)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fin_statement_model.core.calculations.dual import Dual
+from fin_statement_model.core.errors import NodeError, PeriodError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.nodes import FixedGrowthForecastNode, YoYGrowthNode
+
+PERIODS = ["2022", "2023", "2024"]
+ITEMS = {
+    "debt": [300.0, 280.0, 260.0],
+    "cash": [100.0, 80.0, 60.0],
+    "ebitda": [50.0, 0.0, 70.0],
+    "rev": [200.0, 220.0, 250.0],
+    "capex": [20.0, 25.0, 30.0],
+}
+
+
+@pytest.fixture()
+def build_graph(series_graph: Callable[..., Graph]) -> Callable[..., Graph]:
+    """Build the model from ``ITEMS``, with *values* replacing some of the series."""
+
+    def build(values: dict[str, list[float]] | None = None) -> Graph:
+        g = series_graph({**ITEMS, **(values or {})}, PERIODS)
+        g.add_calculation("net_debt", ["debt", "cash"], "subtraction")
+        g.add_calculation("net_leverage", ["net_debt", "ebitda"], "division")
+        g.add_calculation("margin", ["ebitda", "rev"], "formula", formula="ebitda / rev")
+        g.add_calculation(
+            "score",
+            ["margin", "capex", "cash"],
+            "formula",
+            formula="(margin * 100) ** 2 / capex + cash % 7 - (capex - cash) // 7",
+        )
+        g.add_calculation("blend", ["debt", "cash", "rev"], "weighted_average", weights=[0.5, 0.3, 0.2])
+        g.add_calculation("product", ["rev", "capex"], "multiplication")
+        g.add_calculation(
+            "clamped",
+            ["rev", "capex"],
+            "custom_formula",
+            formula_function=lambda d: d["rev"] - d["capex"] if d["rev"] > d["capex"] else 0.0,
+        )
+        g.add_calculation("plain", ["rev", "capex"], "custom_formula", formula_function=lambda d: d["rev"] * d["capex"])
+        return g
+
+    return build
+
+
+def finite_difference(
+    build_graph: Callable[..., Graph], output: str, name: str, period: str | None = None, h: float = 1e-5
+) -> np.ndarray:
+    """Central difference of *output* for a shift of *name* (in every period, or one period)."""
+
+    def shifted(sign: float) -> np.ndarray:
+        series = [v + sign * h if period in (None, p) else v for v, p in zip(ITEMS[name], PERIODS, strict=True)]
+        return build_graph({name: series}).calculate_frame().loc[output].to_numpy()
+
+    return (shifted(1.0) - shifted(-1.0)) / (2 * h)
+
+
+def test_matches_analytic_and_finite_difference_partials(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+
+    leverage = g.gradient("net_leverage", period="2022")
+    assert isinstance(leverage, pd.Series)
+    assert leverage.name == "net_leverage"
+    assert leverage.to_dict() == pytest.approx({"debt": 1 / 50, "cash": -1 / 50, "ebitda": -200 / 50**2})
+
+    base = g.calculate_frame()
+    for output in ("net_leverage", "score", "blend", "product", "plain", "clamped"):
+        frame = g.gradient(output)
+        assert isinstance(frame, pd.DataFrame)
+        assert list(frame.columns) == PERIODS
+        defined = np.isfinite(base.loc[output].to_numpy())
+        for name in frame.index:
+            actual = frame.loc[name].to_numpy()
+            expected = finite_difference(build_graph, output, name)
+            assert np.isnan(actual[~defined]).all(), (output, name)
+            np.testing.assert_allclose(actual[defined], expected[defined], rtol=1e-5, atol=1e-6, err_msg=name)
+    # The graph itself is untouched
+    assert g.calculate("net_leverage", "2022") == 4.0
+
+
+def test_division_by_zero_has_nan_derivatives(build_graph: Callable[..., Graph]) -> None:
+    frame = build_graph().gradient("net_leverage", ["ebitda", "debt", "rev"])
+
+    assert frame.index.tolist() == ["ebitda", "debt", "rev"]
+    assert frame["2023"].isna().all()
+    assert frame.loc["debt", "2024"] == pytest.approx(1 / 70)
+    assert frame.loc["rev", ["2022", "2024"]].tolist() == [0.0, 0.0]
+
+
+def test_single_period_seeds(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    units = g.add_financial_statement_item("units", {"2022": 10.0, "2023": 12.0})
+    g.add_node(FixedGrowthForecastNode(units, "2023", ["2024"], 0.1))
+    g.add_node(YoYGrowthNode("units_growth", units, "2022", "2023"))
+    g.add_calculation("units_per_capex", ["units", "capex"], "division")
+
+    cell = g.gradient("units_per_capex", ["units", "capex"], "2024", wrt_period="2023")
+    assert cell.to_dict() == pytest.approx({"units": 1.1 / 30, "capex": 0.0})
+    shift = g.gradient("units_per_capex", ["units", "capex"], "2024")
+    assert shift.to_dict() == pytest.approx({"units": 1.1 / 30, "capex": -13.2 / 30**2})
+    # The forecast cell of the history is not read by the projection
+    assert g.gradient("units", ["units"], "2024", wrt_period="2024")["units"] == 0.0
+    # Nodes without a derivative rule are differentiated numerically
+    growth = g.gradient("units_growth", ["units"], wrt_period="2023")
+    assert growth.loc["units"].tolist() == pytest.approx([0.1] * 3)
+
+
+def test_dual_arithmetic() -> None:
+    x = Dual.seed(np.array([2.0, 0.0]), index=0, size=2)
+    y = Dual.seed(np.array([3.0, 5.0]), index=1, size=2)
+
+    quotient = x / (y - 5.0)
+    assert quotient.value[0] == pytest.approx(-1.0)
+    assert math.isnan(quotient.value[1])
+    assert np.isnan(quotient.tangent[:, 1]).all()  # type: ignore[index]
+    power = 2.0**x * y
+    np.testing.assert_allclose(power.tangent[:, 0], [4 * 3 * math.log(2.0), 4.0])  # type: ignore[index]
+    assert (x + 1.0 - x).tangent[:, 0].tolist() == [0.0, 0.0]  # type: ignore[index]
+    assert Dual.constant([1.0]).gradient(3).shape == (3, 1)
+    assert (x < y).tolist() == [True, True]
+    with pytest.raises(TypeError, match="not differentiable"):
+        bool(x)
+
+
+def test_invalid_gradient_requests(build_graph: Callable[..., Graph]) -> None:
+    program = build_graph().compile()
+
+    with pytest.raises(NodeError):
+        program.gradient("net_leverage", ["net_debt"])
+    with pytest.raises(NodeError):
+        program.gradient("missing")
+    with pytest.raises(PeriodError):
+        program.gradient("net_leverage", period="2030")
+    with pytest.raises(PeriodError):
+        program.gradient("net_leverage", wrt_period="2030")
+    with pytest.raises(ValueError, match="distinct"):
+        program.gradient("net_leverage", ["debt", "debt"])
+
+
+@pytest.mark.perf
+def test_gradient_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """200 partials of a 2k-node graph in one pass vs. a recalculation."""
+    periods = [str(year) for year in range(2000, 2030)]
+    width = 200
+    g = layered_graph(width, 10, periods, first_value=1.0, operations=("addition", "division"))
+    g.add_calculation("total", [f"l9_{j}" for j in range(width)], "addition")
+    inputs = [f"item_{j}" for j in range(width)]
+
+    start = time.perf_counter()
+    g.clear_all_caches()
+    g.recalculate_all()
+    recalc = time.perf_counter() - start
+
+    program = g.compile(["total"])
+    start = time.perf_counter()
+    gradient = program.gradient("total", inputs, periods[-1])
+    forward = time.perf_counter() - start
+
+    bumped = program.sensitivity(["total"], inputs, bumps=[-1e-6, 1e-6], relative=False)
+    last = bumped[bumped["period"] == periods[-1]].pivot_table(index="input", columns="bump", values="value")
+    numeric = (last[1e-6] - last[-1e-6]) / 2e-6
+    np.testing.assert_allclose(gradient.to_numpy(), numeric.loc[inputs].to_numpy(), rtol=1e-4, atol=1e-6)
+    assert forward < 3 * recalc
@@ -0,0 +1,139 @@
+"""Tests for the structural (serialisation-free) Graph.clone."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+
+import pytest
+
+from fin_statement_model.core.adjustments.models import Adjustment
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import SharedValues
+from fin_statement_model.core.nodes import Node
+
+PERIODS = ["2022", "2023", "2024"]
+
+
+@pytest.fixture()
+def build_graph(margin_model: Callable[..., Graph]) -> Callable[..., Graph]:
+    return lambda *, columnar=False: margin_model(columnar_values=columnar, cache_max_entries=500)
+
+
+def references(node: Node) -> list[Node]:
+    return [*getattr(node, "inputs", []), *filter(None, [getattr(node, "input_node", None)])]
+
+
+def results(g: Graph) -> dict[tuple[str, str], float]:
+    return {(name, p): g.calculate(name, p) for name in g.nodes for p in PERIODS[:2]} | {
+        ("revenue", "2024"): g.calculate("revenue", "2024")
+    }
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_clone_rewires_inputs_to_its_own_nodes(build_graph: Callable[..., Graph], copy_on_write: bool) -> None:
+    g = build_graph()
+    expected = results(g)
+
+    twin = g.clone(copy_on_write=copy_on_write)
+
+    assert results(twin) == expected
+    assert twin.periods == g.periods
+    assert twin.cache_stats().max_entries == 500
+    assert twin.traverser.topological_sort() == g.traverser.topological_sort()
+    for name, node in g.nodes.items():
+        copy = twin.get_node(name)
+        assert copy is not node and type(copy) is type(node)
+        for source_input, copied_input in zip(references(node), references(copy), strict=True):
+            assert copied_input is not source_input
+            if g.nodes.get(source_input.name) is source_input:
+                assert copied_input is twin.get_node(source_input.name)
+    # The history node the forecast replaced is copied too, not shared
+    assert twin.get_node("revenue").input_node is not g.get_node("revenue").input_node
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_clone_and_source_stay_independent(build_graph: Callable[..., Graph], copy_on_write: bool) -> None:
+    g = build_graph()
+    g.calculate("margin", "2023")
+    twin = g.clone(copy_on_write=copy_on_write)
+
+    twin.set_value("cogs", "2023", 20.0)
+    g.set_value("cogs", "2022", 50.0)
+
+    assert twin.calculate("gross_profit", "2023") == 100.0
+    assert twin.calculate("gross_profit", "2022") == 40.0
+    assert g.calculate("gross_profit", "2023") == 50.0
+    assert g.calculate("gross_profit", "2022") == 50.0
+    twin.add_financial_statement_item("opex", {"2023": 5.0})
+    assert not g.has_node("opex")
+
+
+def test_copy_on_write_shares_values_until_written(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    twin = g.clone(copy_on_write=True)
+    source, copied = g.get_node("cogs").values, twin.get_node("cogs").values
+
+    assert isinstance(source, SharedValues) and isinstance(copied, SharedValues)
+    assert source.shared and copied.shared
+
+    twin.set_value("cogs", "2023", 20.0)
+
+    assert not copied.shared and source.shared
+    assert dict(source) == {"2022": 60.0, "2023": 70.0}
+    # A second clone of a partly written graph shares again
+    third = twin.clone(copy_on_write=True)
+    assert copied.shared
+    assert third.calculate("cogs", "2023") == 20.0
+
+
+def test_clone_keeps_columnar_store_groups_and_adjustments(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph(columnar=True)
+    g.add_adjustment("revenue", "2023", 10.0, "one-off")
+    g.add_financial_statement_item("bonus", {"2023": 0.0})
+    g.add_calculation("profit", ["gross_profit", "bonus"], "subtraction")
+    g.declare_circular(["bonus", "profit"], name="bonus_loop")
+    g.add_calculation("bonus", ["profit"], "formula", formula="0.1 * profit")
+
+    twin = g.clone()
+
+    assert twin.value_store is not None and twin.value_store is not g.value_store
+    twin.set_value("cogs", "2022", 0.0)
+    assert g.value_store.view("cogs")["2022"] == 60.0
+    assert list(twin.circular_groups) == ["bonus_loop"]
+    assert twin.calculate("profit", "2023") == pytest.approx(50 / 1.1)
+    adjustments = twin.list_all_adjustments()
+    assert [adj.value for adj in adjustments] == [10.0]
+    assert isinstance(adjustments[0], Adjustment)
+    assert adjustments[0] is not g.list_all_adjustments()[0]
+
+
+def test_clone_drops_instrumentation_and_cached_values(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    with g.profile():
+        g.calculate("margin", "2023")
+        twin = g.clone()
+    assert all(node.calculate_shim is None for node in twin.nodes.values())
+    assert twin.cache_stats().entries == 0
+    assert twin.calculate("margin", "2023") == pytest.approx(50 / 120)
+
+
+@pytest.mark.perf
+def test_clone_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """A 2,000-node graph clones several times faster than the IO round-trip it replaces."""
+    from fin_statement_model.io import read_data, write_data
+
+    g = layered_graph(1000, 1, [str(year) for year in range(2015, 2030)], first_value=1.0)
+
+    def best(run: object) -> float:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            run()  # type: ignore[operator]
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    round_trip = best(lambda: read_data("graph_definition_dict", write_data("graph_definition_dict", g, target=None)))
+    deep = best(g.clone)
+    assert deep < round_trip
+    assert deep < 0.25
@@ -215,11 +215,15 @@ class _Adder:  # Simple calculation strategy
         return sum(n.calculate(period) for n in inputs)
 
 
+class _UnslottedCalculationNode(CalculationNode):
+    """Subclass without __slots__, so it accepts ad-hoc attributes."""
+
+
 def test_update_inputs_real_calculation_node():
     g, m = _fresh_graph()
     a = DummyDataNode("A", 1)
     b = DummyDataNode("B", 2)
-    calc = CalculationNode("C", inputs=[a, b], calculation=_Adder())
+    calc = _UnslottedCalculationNode("C", inputs=[a, b], calculation=_Adder())
     # Inject input_names attr expected by manipulator
     calc.input_names = ["A", "B"]
     # Overwrite inputs to empty to ensure update repopulates
@@ -231,3 +235,33 @@ def test_update_inputs_real_calculation_node():
     m._update_calculation_nodes()
 
     assert [n.name for n in calc.inputs] == ["A", "B"]  # successfully resolved
+
+
+def test_rename_node_rebinds_the_cache_under_the_new_name():
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("rev", {"2023": 100.0})
+    g.add_calculation("gp", ["rev", "rev"], "addition")
+    g.add_calculation("double_gp", ["gp", "gp"], "addition")
+    assert g.calculate("double_gp", "2023") == 400.0
+
+    g.rename_node("gp", "gross")
+    g.rename_node("rev", "sales")
+    g.add_financial_statement_item("rev", {"2023": 7.0})
+    g.add_calculation("gp", ["rev", "rev"], "addition")
+
+    assert g.calculate("gp", "2023") == 14.0
+    assert g.calculate("gross", "2023") == 200.0
+    assert g.get_dependencies("gross") == ["sales", "sales"]
+    assert g.get_direct_successors("gross") == ["double_gp"]
+    g.set_value("sales", "2023", 1.0)
+    assert g.calculate("double_gp", "2023") == 4.0
+
+
+def test_rename_node_rejects_missing_and_taken_names():
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("a", {"2023": 1.0})
+    g.add_financial_statement_item("b", {"2023": 2.0})
+    with pytest.raises(NodeError):
+        g.rename_node("missing", "c")
+    with pytest.raises(ValueError, match="already exists"):
+        g.rename_node("a", "b")
@@ -22,12 +22,12 @@ def test_period_service_basic_add_and_clear() -> None:
     ps = PeriodService()
     # Add unsorted & duplicate periods - service should deduplicate + sort
     ps.add_periods(["c", "a", "b", "a"])
-    assert ps.periods == ["a", "b", "c"]
+    assert ps.periods == ("a", "b", "c")
     # contains helper
     assert ps.contains("b") and not ps.contains("z")
     # Clear resets periods list
     ps.clear()
-    assert ps.periods == []
+    assert ps.periods == ()
 
 
 # ---------------------------------------------------------------------------
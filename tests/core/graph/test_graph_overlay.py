@@ -0,0 +1,217 @@
+"""Tests for copy-on-write scenario overlays (Graph.overlay)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import gc
+import tracemalloc
+
+import pytest
+
+from fin_statement_model.core.errors import CircularDependencyError, GraphError, NodeError
+from fin_statement_model.core.graph import Graph, GraphOverlay
+from fin_statement_model.core.nodes import YoYGrowthNode
+
+PERIODS = ["2022", "2023", "2024"]
+
+
+def test_overlay_shadows_only_nodes_downstream_of_overrides(margin_model: Callable[..., Graph]) -> None:
+    g = margin_model()
+    overlay = g.overlay("cheap_inputs")
+
+    overlay.set_value("cogs", "2023", 20.0)
+
+    assert isinstance(overlay, GraphOverlay)
+    assert set(overlay.owned_nodes) == {"cogs", "gross_profit", "margin", "double_gp"}
+    assert overlay.calculate("gross_profit", "2023") == 100.0
+    assert overlay.calculate("double_gp", "2023") == 200.0
+    assert overlay.calculate("margin", "2022") == pytest.approx(0.4)
+    assert overlay.calculate("revenue_growth", "2023") == pytest.approx(0.2)
+    assert overlay.overrides == {"cogs": {"2023": 20.0}}
+    # The base is untouched, and its unaffected nodes are shared, not copied
+    assert g.calculate("gross_profit", "2023") == 50.0
+    assert g.get_node("cogs").values == {"2022": 60.0, "2023": 70.0}
+    assert overlay.get_node("revenue") is g.get_node("revenue")
+    assert overlay.get_node("gross_profit") is not g.get_node("gross_profit")
+    assert overlay.get_node("gross_profit").inputs[1] is overlay.get_node("cogs")
+
+
+def test_overlay_edits_invalidate_only_its_downstream_results(margin_model: Callable[..., Graph]) -> None:
+    g = margin_model()
+    overlay = g.overlay("s")
+    overlay.set_value("cogs", "2023", 20.0)
+    for name in ("gross_profit", "margin", "double_gp"):
+        for period in PERIODS[:2]:
+            overlay.calculate(name, period)
+    base_stats = g.cache_stats()
+
+    overlay.set_value("cogs", "2023", 30.0)
+    hits = overlay.cache_stats().hits
+    assert overlay.calculate("margin", "2022") == pytest.approx(0.4)
+    assert overlay.cache_stats().hits == hits + 1
+    assert overlay.calculate("margin", "2023") == pytest.approx(90 / 120)
+    assert overlay.calculate("double_gp", "2023") == 180.0
+    # Overlay edits never touch the base cache
+    assert g.cache_stats().entries == base_stats.entries
+
+
+def test_base_value_edits_reach_overlays(margin_model: Callable[..., Graph]) -> None:
+    g = margin_model()
+    overlay = g.overlay("s")
+    overlay.set_value("cogs", "2023", 20.0)
+    assert overlay.calculate("gross_profit", "2022") == 40.0
+    assert overlay.calculate("gross_profit", "2023") == 100.0
+
+    g.set_value("cogs", "2022", 50.0)
+    g.set_value("cogs", "2023", 0.0)
+
+    assert overlay.calculate("gross_profit", "2022") == 50.0
+    # The overlay's own value still wins
+    assert overlay.calculate("gross_profit", "2023") == 100.0
+    g.clear_calculation_cache()
+    assert overlay.cache_stats().entries == 0
+
+
+def test_base_invalidation_of_a_multi_period_node_widens_in_overlays() -> None:
+    g = Graph(periods=PERIODS)
+    g.add_financial_statement_item("sales", {"2022": 100.0, "2023": 120.0})
+    g.add_node(YoYGrowthNode("sales_growth", g.get_node("sales"), "2022", "2023"))
+    overlay = g.overlay("s")
+    overlay.set_value("sales", "2023", 200.0)
+    assert overlay.calculate("sales_growth", "2023") == pytest.approx(1.0)
+    entries = overlay.cache_stats().entries
+
+    # YoY growth reads two periods, so a change for 2022 also drops its 2023 result
+    g.invalidate_dependents("sales_growth", ["2022"])
+
+    assert overlay.cache_stats().entries == entries - 1
+
+
+def test_overlay_adds_and_replaces_nodes(margin_model: Callable[..., Graph]) -> None:
+    g = margin_model()
+    overlay = g.overlay("restructured")
+
+    overlay.add_financial_statement_item("opex", {"2022": 10.0, "2023": 15.0})
+    overlay.add_calculation("ebit", ["gross_profit", "opex"], "subtraction")
+    overlay.add_calculation("cogs", ["revenue"], "formula", formula="0.5 * revenue")
+
+    assert overlay.calculate("ebit", "2023") == 45.0
+    assert overlay.calculate("margin", "2022") == pytest.approx(0.5)
+    assert overlay.has_node("ebit") and not g.has_node("ebit")
+    assert set(overlay.nodes) == set(g.nodes) | {"opex", "ebit"}
+    assert g.calculate("gross_profit", "2023") == 50.0
+
+    overlay.revert("cogs")
+    assert overlay.calculate("ebit", "2023") == 35.0
+    assert "cogs" not in overlay.owned_nodes
+
+
+def test_overlay_follows_base_structure_changes(margin_model: Callable[..., Graph]) -> None:
+    g = margin_model()
+    overlay = g.overlay("s")
+    overlay.set_value("cogs", "2023", 20.0)
+    assert overlay.calculate("double_gp", "2023") == 200.0
+
+    g.add_calculation("triple_gp", ["gross_profit"], "formula", formula="3 * gross_profit")
+    g.add_financial_statement_item("cogs", {"2022": 1.0, "2023": 2.0, "2024": 3.0})
+
+    assert overlay.calculate("triple_gp", "2023") == 300.0
+    assert overlay.calculate("gross_profit", "2022") == 99.0
+    assert overlay.calculate("cogs", "2024") == 3.0
+    assert g.calculate("triple_gp", "2023") == pytest.approx(354.0)
+
+
+def test_revert_single_period_and_errors(margin_model: Callable[..., Graph]) -> None:
+    g = margin_model()
+    overlay = g.overlay("s")
+    overlay.set_value("cogs", "2022", 0.0)
+    overlay.set_value("cogs", "2023", 0.0)
+
+    overlay.revert("cogs", "2022")
+    assert overlay.calculate("cogs", "2022") == 60.0
+    assert overlay.calculate("cogs", "2023") == 0.0
+    overlay.revert("cogs", "2023")
+    assert overlay.overrides == {}
+    assert not overlay.owned_nodes
+
+    with pytest.raises(ValueError, match="not in graph periods"):
+        overlay.set_value("cogs", "2030", 1.0)
+    with pytest.raises(NodeError):
+        overlay.set_value("missing", "2022", 1.0)
+    with pytest.raises(TypeError):
+        overlay.set_value("gross_profit", "2022", 1.0)
+    with pytest.raises(NodeError):
+        overlay.calculate("missing", "2022")
+    with pytest.raises(NodeError):
+        overlay.revert("cogs")
+    with pytest.raises(CircularDependencyError):
+        overlay.add_calculation("cogs", ["margin"], "formula", formula="margin")
+    # The failed edit left the overlay unchanged
+    assert overlay.calculate("margin", "2022") == pytest.approx(0.4)
+    assert not overlay.owned_nodes
+
+
+def test_overlay_refuses_to_shadow_circular_groups(margin_model: Callable[..., Graph]) -> None:
+    g = margin_model()
+    g.add_financial_statement_item("bonus", {"2023": 0.0})
+    g.add_calculation("profit", ["gross_profit", "bonus"], "subtraction")
+    g.declare_circular(["bonus", "profit"], name="bonus_loop")
+    g.add_calculation("bonus", ["profit"], "formula", formula="0.1 * profit")
+    overlay = g.overlay("s")
+
+    with pytest.raises(GraphError, match="circular groups"):
+        overlay.set_value("cogs", "2023", 20.0)
+    assert overlay.overrides == {}
+    assert overlay.calculate("profit", "2023") == pytest.approx(50 / 1.1)
+
+
+def test_to_graph_materialises_the_scenario(margin_model: Callable[..., Graph]) -> None:
+    g = margin_model()
+    overlay = g.overlay("s")
+    overlay.set_value("cogs", "2023", 20.0)
+    overlay.add_financial_statement_item("opex", {"2023": 5.0})
+    overlay.add_calculation("ebit", ["gross_profit", "opex"], "subtraction")
+
+    standalone = overlay.to_graph()
+
+    for name in ("gross_profit", "margin", "double_gp", "ebit", "revenue_growth"):
+        assert standalone.calculate(name, "2023") == pytest.approx(overlay.calculate(name, "2023"))
+    assert standalone.get_node("ebit").inputs[0] is standalone.get_node("gross_profit")
+    assert not g.has_node("ebit")
+    assert g.calculate("gross_profit", "2023") == 50.0
+
+
+def test_overlay_memory_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """Twenty scenarios over a 5,000-node base cost a fraction of the base, unlike clones."""
+    periods = [str(year) for year in range(2015, 2030)]
+
+    def build() -> Graph:
+        return layered_graph(2500, 1, periods, first_value=1.0)
+
+    def measure(run: object) -> tuple[int, object]:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = run()  # type: ignore[operator]
+            size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return size, result
+
+    base_size, g = measure(build)
+
+    def scenarios(make: object) -> list[object]:
+        views = []
+        for s in range(20):
+            view = make(f"scenario_{s}")  # type: ignore[operator]
+            for k in range(5):
+                view.set_value(f"item_{s * 100 + k}", "2025", 0.0)
+                view.calculate(f"l0_{s * 100 + k}", "2025")
+            views.append(view)
+        return views
+
+    overlay_size, overlays = measure(lambda: scenarios(g.overlay))
+    clone_size, _ = measure(lambda: scenarios(lambda _: g.clone()))
+    assert overlays[0].calculate("l0_4", "2025") == 6.0
+    assert overlay_size < 0.05 * base_size
+    assert overlay_size < 0.01 * clone_size
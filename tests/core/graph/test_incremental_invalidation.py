@@ -0,0 +1,170 @@
+"""Tests for dependency-aware cache invalidation after GraphManipulator.set_value."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import DependencyIndex, InvalidationReport
+from fin_statement_model.core.nodes import FinancialStatementItemNode, YoYGrowthNode
+
+
+@pytest.fixture()
+def model(series_graph: Callable[..., Graph]) -> Graph:
+    g = series_graph(
+        {"rev": [100.0, 120.0, 150.0], "cogs": [60.0, 70.0, 80.0], "opex": [10.0, 12.0, 15.0]},
+        ["2022", "2023", "2024"],
+    )
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("ebit", ["gp", "opex"], "formula", formula="gp - opex")
+    g.add_custom_calculation("opex_x2", lambda x: 2 * x, ["opex"])
+    g.add_node(YoYGrowthNode("gp_yoy", g.get_node("gp"), "2022", "2023"))
+    return g
+
+
+def warm(g: Graph) -> None:
+    for name in g.nodes:
+        for period in g.periods:
+            g.calculate(name, period)
+
+
+def test_only_dependents_and_edited_period_are_invalidated(model: Graph) -> None:
+    g = model
+    warm(g)
+    cache = g._calc_engine.cache
+
+    g.set_value("cogs", "2023", 75.0)
+
+    # Unrelated nodes keep every cached period
+    assert set(cache["opex"]) == set(g.periods)
+    assert set(cache["opex_x2"]) == set(g.periods)
+    # Period-local dependents lose only the edited period
+    for name in ("cogs", "gp", "ebit"):
+        assert set(cache[name]) == {"2022", "2024"}, name
+    assert "2023" not in g.get_node("gp")._values
+    # The cross-period growth node is dropped entirely
+    assert "gp_yoy" not in cache
+
+    assert g.calculate("gp", "2023") == 45.0
+    assert g.calculate("ebit", "2023") == 33.0
+    assert g.calculate("gp_yoy", "2024") == pytest.approx(45.0 / 40.0 - 1)
+
+
+def test_invalidation_counters(model: Graph) -> None:
+    g = model
+    warm(g)
+
+    g.set_value("opex", "2024", 20.0)
+    report = g.manipulator.last_invalidation
+    assert isinstance(report, InvalidationReport)
+    assert report.node_name == "opex"
+    assert report.periods == ("2024",)
+    assert report.nodes_invalidated == 3  # opex, ebit, opex_x2
+    # One shared cache entry each for opex/ebit/opex_x2 (node caches are views onto it)
+    assert report.entries_invalidated == 3
+
+    g.set_value("rev", "2022", 1.0)
+    totals = g.manipulator.invalidation_totals
+    assert totals["mutations"] == 2
+    assert totals["entries"] == report.entries_invalidated + g.manipulator.last_invalidation.entries_invalidated
+
+
+def test_index_follows_structural_changes(model: Graph) -> None:
+    g = model
+    index = g._dependency_index
+    assert index.dependents("gp") == ["ebit", "gp_yoy"]
+
+    g.remove_node("gp_yoy")
+    assert index.dependents("gp") == ["ebit"]
+
+    g.replace_node("opex", FinancialStatementItemNode("opex", {"2022": 1.0}))
+    assert index.dependents("opex") == ["ebit", "opex_x2"]
+    warm(g)
+    g.set_value("opex", "2022", 2.0)
+    assert g.calculate("opex", "2022") == 2.0
+    assert g.manipulator.last_invalidation.nodes_invalidated == 3
+
+    g.clear()
+    assert index.dependents("gp") == []
+
+
+def test_affected_widens_scope_when_reached_through_cross_period_node() -> None:
+    index = DependencyIndex()
+    index.add("b", ["a"])
+    index.add("growth", ["a"])
+    index.add("c", ["b", "growth"])
+    local = {"a", "b", "c"}
+
+    scopes = index.affected("a", ["2023"], is_period_local=local.__contains__)
+
+    assert scopes["b"] == {"2023"}
+    assert scopes["growth"] is None
+    assert scopes["c"] is None  # reached through the cross-period node as well
+
+
+def test_rename_rekeys_only_the_renamed_node() -> None:
+    index = DependencyIndex()
+    index.add("a", [])
+    index.add("b", ["a"])
+    index.add("c", ["b", "a"])
+    index.add("d", ["ghost"])  # dangling reference to a name not yet registered
+    index.rebuild = None  # type: ignore[assignment,method-assign]  # a rename must not fall back to it
+
+    index.rename("b", "bee")
+    index.rename("a", "ghost")
+
+    assert index.dependencies("bee") == ("ghost",)
+    assert index.dependencies("c") == ("bee", "ghost")
+    assert index.dependents("ghost") == ["d", "bee", "c"]
+    assert index.dependents("bee") == ["c"]
+    assert index.dependents("a") == []
+    order = index.topological_order()
+    assert order.index("ghost") < order.index("bee") < order.index("c")
+    assert order.index("ghost") < order.index("d")
+    with pytest.raises(ValueError, match="already registered"):
+        index.rename("c", "d")
+
+
+def test_engine_invalidate_counts_entries(model: Graph) -> None:
+    g = model
+    warm(g)
+    engine = g._calc_engine
+
+    assert engine.invalidate("rev", ["2022", "1999"]) == 1
+    assert engine.invalidate("rev") == 2
+    assert engine.invalidate("rev") == 0
+
+
+def test_one_edit_recomputes_only_the_edited_cell(series_graph: Callable[..., Graph]) -> None:
+    """After one edit a full recompute evaluates one calculation, against every cell after a cache clear."""
+    periods = [str(year) for year in range(2000, 2020)]
+    calls: Counter[str] = Counter()
+
+    def double(x: float) -> float:
+        calls["double"] += 1
+        return 2 * x
+
+    g = series_graph({f"item_{i}": [float(i)] * len(periods) for i in range(200)}, periods)
+    for i in range(200):
+        g.add_custom_calculation(f"calc_{i}", double, [f"item_{i}"])
+
+    def recompute() -> int:
+        calls.clear()
+        for name in g.nodes:
+            for period in periods:
+                g.calculate(name, period)
+        return calls["double"]
+
+    assert recompute() == 200 * len(periods)
+    assert recompute() == 0
+
+    g.set_value("item_0", "2010", 1.0)
+    assert g.manipulator.last_invalidation.entries_invalidated == 2
+    assert recompute() == 1
+    assert g.calculate("calc_0", "2010") == 2.0
+
+    g.clear_all_caches()
+    assert recompute() == 200 * len(periods)
@@ -0,0 +1,93 @@
+"""Tests for the incrementally maintained topological order and insertion-time cycle checks."""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from fin_statement_model.core.errors import CircularDependencyError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import DependencyIndex
+
+
+def assert_valid_order(index: DependencyIndex) -> None:
+    order = index.topological_order()
+    rank = {name: i for i, name in enumerate(order)}
+    for name in order:
+        for dep in index.dependencies(name):
+            if dep in rank:
+                assert rank[dep] < rank[name], (dep, name)
+
+
+def test_random_insertions_keep_a_valid_order() -> None:
+    rng = random.Random(7)
+    index = DependencyIndex()
+    names = [f"n{i}" for i in range(60)]
+    rng.shuffle(names)
+    for step, name in enumerate(names):
+        # Only accept edges the index says are safe; check it against brute force
+        candidates = rng.sample(names, 4)
+        deps = [dep for dep in candidates if index.cycle_path(name, [dep]) is None]
+        for dep in set(candidates) - set(deps):
+            assert dep == name or index.is_reachable(name, dep)
+        index.add(name, deps)
+        if step % 10 == 0 and step:
+            index.remove(rng.choice(names[:step]))
+        assert_valid_order(index)
+
+
+def test_order_recovers_after_forced_cycle_is_removed() -> None:
+    index = DependencyIndex()
+    index.add("a", [])
+    index.add("b", ["a"])
+    index.add("a", ["b"])  # unvalidated insert closes a -> b -> a
+
+    with pytest.raises(ValueError, match="Cycle detected"):
+        index.topological_order()
+    assert index.cycle_path("c", ["b"]) is None
+    assert index.cycle_path("a", ["b"]) == ["a", "b", "a"]
+
+    index.add("a", [])
+    assert index.topological_order() == ["a", "b"]
+    index.add("c", ["b"])
+    assert index.topological_order() == ["a", "b", "c"]
+
+
+def test_graph_rejects_cycle_with_path_and_sorts_from_maintained_order() -> None:
+    g = Graph(periods=["2023"])
+    # Insert the dependent before re-declaring its input to force a reorder
+    g.add_financial_statement_item("cogs", {"2023": 60.0})
+    g.add_financial_statement_item("rev", {"2023": 100.0})
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("margin", ["gp", "rev"], "division")
+    g.add_calculation("rev", ["cogs"], "multiplication")  # replaces the item, stays acyclic
+
+    order = g.topological_sort()
+    assert sorted(order) == sorted(g.nodes)
+    assert order.index("cogs") < order.index("rev") < order.index("gp") < order.index("margin")
+
+    with pytest.raises(CircularDependencyError) as excinfo:
+        g.add_calculation("cogs", ["margin"], "addition")
+    assert excinfo.value.cycle == ["cogs", "gp", "margin", "cogs"]
+    assert g.get_node("cogs").name == "cogs"
+    assert g.topological_sort() == order
+
+
+@pytest.mark.perf
+def test_cycle_check_benchmark() -> None:
+    """Validated insertion cost stays flat as the graph grows (no per-insert BFS over the graph)."""
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("seed", {"2023": 1.0})
+    n = 20_000
+    timings: list[float] = []
+    for block in range(4):
+        start = time.perf_counter()
+        for i in range(block * n // 4, (block + 1) * n // 4):
+            # Every new node fans in from the seed, the worst case for the old successor BFS
+            g.add_calculation(f"calc_{i}", ["seed", f"calc_{i - 1}" if i else "seed"], "addition")
+        timings.append(time.perf_counter() - start)
+
+    assert len(g.topological_sort()) == n + 1
+    assert timings[-1] < 5 * timings[0] + 0.5
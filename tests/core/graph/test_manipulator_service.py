@@ -50,7 +50,10 @@ def test_set_value_clears_node_cache(monkeypatch) -> None:
     m = GraphManipulator(g)
     g.add_financial_statement_item("Z", {"2023": 5.0})
     # Custom node with per-node cache
-    node = FinancialStatementItemNode("Y", {"2023": 10.0})
+    class PatchableItemNode(FinancialStatementItemNode):
+        """Subclass without __slots__, so methods can be patched per instance."""
+
+    node = PatchableItemNode("Y", {"2023": 10.0})
     g.add_node(node)
 
     # Patch clear_cache on node
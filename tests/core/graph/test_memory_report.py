@@ -0,0 +1,129 @@
+"""Tests for Graph.memory_report and the `fsm graph memory` CLI command."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+import pytest
+
+from fin_statement_model.cli import fsm
+from fin_statement_model.core.adjustments.models import Adjustment
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import MemoryReport, deep_sizeof
+from fin_statement_model.core.nodes import FixedGrowthForecastNode
+from fin_statement_model.io import write_data
+
+PERIODS = [str(year) for year in range(2015, 2025)]
+
+
+@pytest.fixture()
+def build_graph(layered_graph: Callable[..., Graph]) -> Callable[..., Graph]:
+    """Build *size* items and one layer of additions, with ``item_0`` forecast to 2025 unless disabled."""
+
+    def build(size: int = 200, *, forecast: bool = True) -> Graph:
+        g = layered_graph(size, 1, PERIODS)
+        if forecast:
+            g.add_node(FixedGrowthForecastNode(g.get_node("item_0"), "2024", ["2025"], 0.1))
+        return g
+
+    return build
+
+
+def test_report_breaks_down_bytes_by_component_and_node_type(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    report = g.memory_report()
+
+    assert isinstance(report, MemoryReport)
+    rows = report.by_node_type
+    assert {name: row.count for name, row in rows.items()} == {
+        "CalculationNode": 200,
+        "FinancialStatementItemNode": 199,
+        "FixedGrowthForecastNode": 1,
+    }
+    assert rows["FinancialStatementItemNode"].values > rows["FinancialStatementItemNode"].nodes
+    assert rows["CalculationNode"].values == 0
+    assert report.nodes == sum(row.nodes for row in rows.values())
+    assert report.values >= sum(row.values for row in rows.values())
+    assert report.periods > 0 and report.adjustments > 0
+    assert report.total == sum(v for k, v in report.summary().items() if k != "total")
+
+    frame = report.to_frame()
+    assert list(frame.columns) == ["count", "nodes", "values", "caches", "total"]
+    assert frame["total"].is_monotonic_decreasing
+
+
+def test_report_follows_caches_adjustments_and_columnar_values(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    before = g.memory_report()
+
+    g.recalculate_all()
+    filled = g.memory_report()
+    assert filled.by_node_type["CalculationNode"].caches > before.by_node_type["CalculationNode"].caches
+    assert filled.caches - before.caches > 200 * len(PERIODS) * 8
+
+    g.clear_calculation_cache()
+    assert g.memory_report().by_node_type["CalculationNode"].caches < filled.by_node_type["CalculationNode"].caches
+
+    g.adjustment_manager.add_adjustment(
+        Adjustment(node_name="item_1", period="2020", value=5.0, reason="audit", scenario="default")
+    )
+    assert g.memory_report().adjustments > before.adjustments
+
+    g.enable_columnar_values()
+    columnar = g.memory_report()
+    assert (
+        columnar.by_node_type["FinancialStatementItemNode"].values
+        < before.by_node_type["FinancialStatementItemNode"].values
+    )
+    assert columnar.values > 0
+
+
+def test_deep_sizeof_counts_shared_objects_once() -> None:
+    shared = [float(i) for i in range(1000)]
+    seen: set[int] = set()
+
+    first = deep_sizeof({"a": shared}, seen)
+    second = deep_sizeof({"b": shared}, seen)
+
+    assert first > deep_sizeof(shared) > second
+    assert deep_sizeof(shared, seen) == 0
+
+
+def test_memory_report_scales_with_the_graph(build_graph: Callable[..., Graph]) -> None:
+    small, large = build_graph(100).memory_report(), build_graph(1000).memory_report()
+
+    assert large.total / small.total == pytest.approx(10, rel=0.2)
+
+
+@pytest.mark.parametrize("out_format", ["table", "json"])
+def test_cli_reports_memory_of_a_saved_definition(
+    build_graph: Callable[..., Graph], tmp_path: Path, out_format: str
+) -> None:
+    definition = tmp_path / "graph.json"
+    definition.write_text(
+        json.dumps(write_data("graph_definition_dict", build_graph(50, forecast=False), None)), encoding="utf-8"
+    )
+
+    result = CliRunner().invoke(fsm, ["graph", "memory", str(definition), "--recalculate", "--format", out_format])
+
+    assert result.exit_code == 0, result.output
+    if out_format == "json":
+        payload = json.loads(result.output)
+        assert payload["by_node_type"]["CalculationNode"]["count"] == 50
+        assert payload["total"] == sum(payload[key] for key in ("nodes", "values", "caches", "adjustments", "periods"))
+    else:
+        assert result.output.splitlines()[0].split() == ["COMPONENT", "BYTES"]
+        assert "CalculationNode" in result.output
+
+
+def test_cli_rejects_an_invalid_definition(tmp_path: Path) -> None:
+    definition = tmp_path / "broken.json"
+    definition.write_text(json.dumps({"nodes": {}}), encoding="utf-8")
+
+    result = CliRunner().invoke(fsm, ["graph", "memory", str(definition)])
+
+    assert result.exit_code != 0
+    assert "Failed to read graph definition" in result.output
@@ -0,0 +1,180 @@
+"""Tests for vectorized Monte Carlo simulation of statistical forecasts (Graph.simulate)."""
+
+from __future__ import annotations
+
+import math
+import time
+
+import numpy as np
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import SimulationResults
+from fin_statement_model.core.nodes import (
+    CurveGrowthForecastNode,
+    FixedGrowthForecastNode,
+    StatisticalGrowthForecastNode,
+)
+from fin_statement_model.forecasting.methods import StatisticalForecastMethod
+
+PERIODS = ["2021", "2022", "2023", "2024", "2025"]
+FORECAST = ["2024", "2025"]
+
+
+def sampler(distribution: str, **params: float) -> object:
+    config = {"distribution": distribution, "params": params}
+    return StatisticalForecastMethod().normalize_params(config, FORECAST)["growth_params"]
+
+
+def build_graph(growth: dict[str, object] | None = None) -> Graph:
+    """Model with stochastic rev / opex forecasts; *growth* swaps in fixed rate curves."""
+    growth = growth or {}
+    g = Graph(periods=PERIODS)
+    rev = g.add_financial_statement_item("rev", {"2021": 100.0, "2022": 110.0, "2023": 120.0})
+    opex = g.add_financial_statement_item("opex", {"2021": 20.0, "2022": 21.0, "2023": 25.0})
+    g.add_financial_statement_item("cogs", dict.fromkeys(PERIODS, 50.0))
+    units = g.add_financial_statement_item("units", {"2023": 10.0})
+    for node, distribution in (
+        (rev, sampler("normal", mean=0.05, std=0.1)),
+        (opex, sampler("uniform", low=-0.1, high=0.3)),
+    ):
+        rates = growth.get(node.name)
+        if rates is None:
+            g.add_node(StatisticalGrowthForecastNode(node, "2023", FORECAST, distribution))  # type: ignore[arg-type]
+        else:
+            g.add_node(CurveGrowthForecastNode(node, "2023", FORECAST, list(rates)))  # type: ignore[arg-type]
+    g.add_node(FixedGrowthForecastNode(units, "2023", FORECAST, 0.1))
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("ebit", ["gp", "opex"], "formula", formula="gp - opex")
+    g.add_calculation("margin", ["ebit", "rev"], "division")
+    g.add_calculation("cost_per_unit", ["cogs", "units"], "division")
+    return g
+
+
+def test_every_path_matches_a_graph_with_the_drawn_rates() -> None:
+    g = build_graph()
+    program = g.compile()
+    assert program.stochastic_nodes == ("rev", "opex")
+    assert "rev" in program.input_names
+
+    results = program.simulate(50, seed=11)
+
+    assert isinstance(results, SimulationResults)
+    assert results.n_paths == 50
+    assert results.to_array().shape == (50, len(program.node_names), len(PERIODS))
+    rng = np.random.default_rng(11)
+    draws = {name: node.draw_growth_rates(rng, 50) for name, (node, _) in program._draws.items()}
+    for path in (0, 17, 49):
+        expected = build_graph({name: rates[path] for name, rates in draws.items()}).calculate_frame()
+        for name in results.node_names:
+            np.testing.assert_allclose(results[name].loc[path].to_numpy(), expected.loc[name].to_numpy())
+
+
+def test_simulation_is_reproducible_and_shares_deterministic_nodes() -> None:
+    g = build_graph()
+
+    first = g.simulate(200, seed=5)
+    np.testing.assert_array_equal(first.to_array(), g.simulate(200, seed=5).to_array())
+    assert not np.array_equal(first["rev"].to_numpy(), g.simulate(200, seed=6)["rev"].to_numpy())
+
+    # History is not drawn; nodes without a stochastic input are computed once
+    assert set(first["rev"]["2023"]) == {120.0}
+    assert first["rev"]["2025"].std() > 0
+    assert first._values["cost_per_unit"].strides[0] == 0
+    # Regular evaluation still draws one scalar path per call
+    assert g.compile().evaluate()["rev"].shape == (len(PERIODS),)
+
+
+def test_plain_callables_are_sampled_per_cell() -> None:
+    g = build_graph()
+    rev = g.get_node("rev").input_node  # type: ignore[attr-defined]
+    calls = []
+
+    def constant() -> float:
+        calls.append(1)
+        return 0.1
+
+    g.add_node(StatisticalGrowthForecastNode(rev, "2023", FORECAST, constant))
+
+    results = g.simulate(30, ["gp"], seed=1)
+
+    assert len(calls) == 30 * len(FORECAST)
+    assert results.node_names == ("gp",)
+    assert results["gp"]["2025"].tolist() == pytest.approx([120.0 * 1.1 * 1.1 - 50.0] * 30)
+
+
+def test_quantiles_and_risk_summary() -> None:
+    paths = np.arange(1.0, 101.0)
+    values = {
+        "x": np.column_stack([paths, 2 * paths]),
+        "flat": np.broadcast_to(np.array([7.0, math.nan]), (100, 2)),
+    }
+    results = SimulationResults(range(100), ["2024", "2025"], values)
+
+    bands = results.quantiles([0.05, 0.5, 0.95])
+    assert bands.index.names == ["node", "quantile"]
+    assert bands.loc[("x", 0.5)].tolist() == pytest.approx([50.5, 101.0])
+    assert bands.loc[("flat", 0.95), "2024"] == 7.0
+    assert math.isnan(bands.loc[("flat", 0.05), "2025"])
+
+    summary = results.summary(level=0.9)
+    row = summary.loc[("x", "2024")]
+    low = np.quantile(paths, 0.1)
+    assert row["mean"] == pytest.approx(50.5)
+    assert row["std"] == pytest.approx(paths.std(ddof=1))
+    assert row["q_low"] == pytest.approx(low)
+    assert row["var"] == pytest.approx(50.5 - low)
+    assert row["es"] == pytest.approx(50.5 - paths[paths <= low].mean())
+    assert summary.loc[("flat", "2024"), "var"] == 0.0
+    assert math.isnan(summary.loc[("flat", "2025"), "mean"])
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        results.summary(level=1.0)
+
+
+def test_invalid_simulation_requests() -> None:
+    program = build_graph().compile()
+
+    with pytest.raises(ValueError, match="positive"):
+        program.simulate(0)
+    with pytest.raises(ValueError, match="unbatched"):
+        program.simulate(10, inputs={"cogs": np.ones((2, len(PERIODS)))})
+    overridden = program.simulate(10, ["gp"], seed=2, inputs={"cogs": 0.0})
+    np.testing.assert_array_equal(overridden["gp"].to_numpy(), program.simulate(10, ["rev"], seed=2)["rev"].to_numpy())
+
+
+@pytest.mark.perf
+def test_monte_carlo_benchmark() -> None:
+    """10k paths over a ~500 node model in one pass vs. one scalar evaluation per path."""
+    periods = [str(year) for year in range(2015, 2030)]
+    forecast = [p for p in periods if p > "2024"]
+    history = [p for p in periods if p <= "2024"]
+    g = Graph(periods=periods)
+    width, depth, n_paths = 50, 9, 10_000
+    with g.batch():
+        for j in range(width):
+            item = g.add_financial_statement_item(f"item_{j}", dict.fromkeys(history, float(j + 1)))
+            growth = sampler("normal", mean=0.03, std=0.05) if j % 2 else sampler("uniform", low=-0.02, high=0.08)
+            g.add_node(StatisticalGrowthForecastNode(item, "2024", forecast, growth))  # type: ignore[arg-type]
+        previous = [f"item_{j}" for j in range(width)]
+        for layer in range(depth):
+            current = [f"l{layer}_{j}" for j in range(width)]
+            operation = ("addition", "multiplication", "subtraction")[layer % 3]
+            for j, name in enumerate(current):
+                g.add_calculation(name, [previous[j], previous[(j + 1) % width]], operation)
+            previous = current
+
+    n_scalar = 5
+    start = time.perf_counter()
+    for _ in range(n_scalar):
+        g.clear_all_caches()
+        g.calculate_frame()
+    per_path = (time.perf_counter() - start) / n_scalar
+
+    start = time.perf_counter()
+    results = g.simulate(n_paths, seed=0)
+    simulated = time.perf_counter() - start
+    summary = results.summary(node_names=previous)
+
+    assert results.to_array(previous[:1]).shape == (n_paths, 1, len(periods))
+    assert summary.shape == (width * len(periods), 7)
+    assert simulated < per_path * n_paths
@@ -0,0 +1,97 @@
+"""Tests for the interned PeriodIndex and its use by the graph and forecast nodes."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from fin_statement_model.core.errors import PeriodError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import PeriodIndex, PeriodService
+from fin_statement_model.core.nodes import (
+    AverageHistoricalGrowthForecastNode,
+    FinancialStatementItemNode,
+    FixedGrowthForecastNode,
+)
+
+
+def test_period_index_translates_labels_and_ordinals() -> None:
+    index = PeriodIndex.of(["2021", "2022", "2023", "2024"])
+
+    assert index.ordinal("2021") == 0 and index.get("2030") is None
+    assert index.label(3) == "2024" and index[1:3] == ("2022", "2023")
+    assert index.ordinals(["2024", "2022"]) == [3, 1]
+    assert index.shift("2022", 2) == "2024"
+    assert index.shift("2022", -2) is None
+    assert index.previous("2021") is None and index.next("2023") == "2024"
+    assert index.span("2022", "2023") == ("2022", "2023")
+    assert index.span(end="2022") == ("2021", "2022")
+    assert index.index("2023") == 2 and "2023" in index and "2030" not in index
+    assert list(index) == ["2021", "2022", "2023", "2024"] and len(index) == 4
+
+    with pytest.raises(PeriodError):
+        index.ordinal("2030")
+    with pytest.raises(PeriodError):
+        index.label(4)
+    with pytest.raises(ValueError, match="unique"):
+        PeriodIndex.of(["2021", "2021"])
+
+
+def test_period_indexes_are_interned() -> None:
+    index = PeriodIndex.of(["2022", "2023"])
+
+    assert PeriodIndex.of(("2022", "2023")) is index
+    assert PeriodIndex.of(["2023", "2022"]) is not index
+    assert index == PeriodIndex(["2022", "2023"]) and hash(index) == hash(PeriodIndex(["2022", "2023"]))
+
+
+def test_graph_period_index_follows_its_periods() -> None:
+    g = Graph(periods=["2023", "2021"])
+    first = g.period_index
+
+    g.add_periods(["2022"])
+
+    assert first.labels == ("2021", "2023")
+    assert g.period_index.labels == ("2021", "2022", "2023")
+    assert g.period_index.ordinal("2022") == 1
+    assert g.clone().period_index is g.period_index
+
+    service = PeriodService()
+    service.add_periods(["2024"])
+    assert service.contains("2024") and service.index.labels == ("2024",)
+    service.clear()
+    assert len(service.index) == 0
+
+
+def test_forecast_nodes_walk_their_timeline_by_ordinal() -> None:
+    history = FinancialStatementItemNode("revenue", {"FY8": 90.0, "FY9": 100.0})
+    # "FY10" sorts before "FY9" as a string; the given order wins
+    forecast = FixedGrowthForecastNode(history, "FY9", ["FY10", "FY11"], 0.1)
+
+    assert forecast.timeline.labels == ("FY9", "FY10", "FY11")
+    assert forecast.calculate("FY8") == 90.0
+    assert forecast.calculate("FY10") == pytest.approx(110.0)
+    assert forecast.calculate("FY11") == pytest.approx(121.0)
+    with pytest.raises(ValueError, match="not in forecast periods"):
+        forecast.calculate("FY12")
+    projected = forecast.calculate_vector([], ["FY8", "FY9", "FY10", "FY11"])
+    np.testing.assert_allclose(projected, [90.0, 100.0, 110.0, 121.0])
+
+    averaged = AverageHistoricalGrowthForecastNode(history, "FY9", ["FY10"])
+    assert averaged.calculate("FY10") == pytest.approx(100.0 * (1 + 10 / 90))
+
+    forecast.forecast_periods = ["FY10", "FY11", "FY12"]
+    forecast.clear_cache()
+    assert forecast.timeline.labels == ("FY9", "FY10", "FY11", "FY12")
+    assert forecast.calculate("FY12") == pytest.approx(133.1)
+
+
+def test_compiled_graph_shares_the_graph_period_index() -> None:
+    g = Graph(periods=["2022", "2023"])
+    g.add_financial_statement_item("revenue", {"2022": 1.0, "2023": 2.0})
+    g.add_calculation("double", ["revenue"], "formula", formula="2 * revenue")
+
+    compiled = g.compile()
+
+    assert compiled.period_index is g.period_index
+    assert compiled.periods == ("2022", "2023")
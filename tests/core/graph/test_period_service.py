@@ -0,0 +1,76 @@
+"""Tests for the sorted-set PeriodService and its cached snapshots."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import PeriodService
+
+
+def test_snapshots_are_cached_until_the_periods_change() -> None:
+    ps = PeriodService()
+    ps.add_periods(["2023", "2021"])
+    snapshot, index = ps.periods, ps.index
+
+    ps.add_periods(["2021", "2023"])
+    assert ps.periods is snapshot and ps.index is index
+
+    ps.add_periods(["2022"])
+    assert ps.periods == ("2021", "2022", "2023") and ps.periods is not snapshot
+    assert snapshot == ("2021", "2023")
+    assert ps.index.ordinal("2022") == 1
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 50])
+def test_incremental_inserts_keep_periods_sorted_and_unique(chunk: int) -> None:
+    rng = random.Random(7)
+    labels = [f"{year}-{month:02d}" for year in range(2000, 2010) for month in range(1, 13)]
+    shuffled = labels * 2
+    rng.shuffle(shuffled)
+    ps = PeriodService()
+
+    for start in range(0, len(shuffled), chunk):
+        ps.add_periods(shuffled[start : start + chunk])
+
+    assert ps.periods == tuple(sorted(labels))
+    assert len(ps) == len(labels)
+    assert all(ps.contains(label) and label in ps for label in labels)
+    assert "1999-12" not in ps
+
+
+def test_add_periods_rejects_a_bare_string_and_clear_resets() -> None:
+    ps = PeriodService()
+    with pytest.raises(TypeError):
+        ps.add_periods("2023")
+    ps.add_periods(("2023",))
+    ps.clear()
+    assert ps.periods == () and len(ps.index) == 0 and not ps.contains("2023")
+
+
+def test_graph_membership_does_not_copy_the_period_list() -> None:
+    g = Graph(periods=["2023", "2024"])
+    g.add_financial_statement_item("revenue", {"2023": 1.0})
+
+    assert g.has_period("2024") and not g.has_period("2025")
+    assert g.periods == ["2023", "2024"]
+    g.periods.append("2099")  # a copy: the graph is unaffected
+    assert g.periods == ["2023", "2024"]
+    with pytest.raises(ValueError, match="not in graph periods"):
+        g.set_value("revenue", "2025", 2.0)
+
+
+def test_adding_known_periods_changes_nothing() -> None:
+    """Registering the periods of many item nodes leaves the list and its snapshots alone once they are known."""
+    periods = [str(year) for year in range(2000, 2030)]
+    ps = PeriodService()
+    ps.add_periods(periods)
+    snapshot, index = ps.periods, ps.index
+
+    for _ in range(10_000):
+        ps.add_periods(periods[-10:])
+
+    assert ps.periods is snapshot
+    assert ps.index is index
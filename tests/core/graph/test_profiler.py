@@ -0,0 +1,96 @@
+"""Tests for the opt-in evaluation profiler exposed as Graph.profile()."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.nodes import FinancialStatementItemNode
+
+
+@pytest.fixture()
+def model(series_graph: Callable[..., Graph]) -> Graph:
+    g = series_graph({"rev": [100.0, 120.0], "cogs": [60.0, 70.0]}, ["2023", "2024"])
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("margin", ["gp", "rev"], "division")
+    return g
+
+
+def test_profile_records_calls_hits_and_times(model: Graph) -> None:
+    g = model
+    with g.profile() as profiler:
+        g.calculate("margin", "2023")
+        g.calculate("margin", "2023")
+        g.calculate("rev", "2023")
+        g.calculate("rev", "2023")  # answered by the graph-level cache
+
+    frame = profiler.to_frame().set_index("node")
+    assert list(frame.columns) == ["node_type", "calculation", "calls", "cache_hits", "self_time", "inclusive_time"]
+    assert frame.loc["margin", "calculation"] == "DivisionCalculation"
+    assert frame.loc["rev", "calculation"] == "FinancialStatementItemNode"
+    assert (frame.loc["margin", "calls"], frame.loc["margin", "cache_hits"]) == (2, 1)
+    assert (frame.loc["gp", "calls"], frame.loc["gp", "cache_hits"]) == (1, 0)
+    assert (frame.loc["rev", "calls"], frame.loc["rev", "cache_hits"]) == (4, 1)
+    assert (frame["self_time"] <= frame["inclusive_time"] + 1e-12).all()
+    assert frame.loc["margin", "inclusive_time"] >= frame.loc["gp", "inclusive_time"]
+
+    stacks = dict(line.rsplit(" ", 1) for line in profiler.collapsed_stacks().splitlines())
+    assert set(stacks) == {"margin", "margin;gp", "margin;gp;rev", "margin;gp;cogs", "margin;rev", "rev"}
+    assert all(value.isdigit() for value in stacks.values())
+
+    by_calc = profiler.by_calculation()
+    assert by_calc.loc["FinancialStatementItemNode", "nodes"] == 2
+    assert by_calc["calls"].sum() == frame["calls"].sum()
+
+
+def test_shims_follow_graph_structure_and_are_removed(model: Graph) -> None:
+    g = model
+    rev = g.get_node("rev")
+
+    with g.profile() as profiler, g.profile() as inner:
+        assert inner is profiler
+        assert rev.calculate_shim is not None
+        g.add_calculation("gp_x2", ["gp", "gp"], "addition")
+        g.replace_node("cogs", FinancialStatementItemNode("cogs", {"2023": 50.0, "2024": 60.0}))
+        g.recalculate_all()
+        assert sorted(profiler.instrumented) == sorted(g.nodes)
+
+    assert g._calc_engine.profiler is None
+    assert all(node.calculate_shim is None for node in g.nodes.values())
+    frame = profiler.to_frame().set_index("node")
+    assert frame.loc["gp_x2", "calls"] == 2
+    assert g.calculate("gp_x2", "2024") == 120.0
+
+    profiler.reset()
+    assert profiler.to_frame().empty
+    assert profiler.collapsed_stacks() == ""
+
+
+@pytest.mark.perf
+def test_profiler_overhead_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """Disabled profiling leaves evaluation untouched."""
+    periods = [str(year) for year in range(2000, 2030)]
+    g = layered_graph(200, 1, periods)
+    with g.batch():
+        for i in range(200):
+            g.add_calculation(f"ratio_{i}", [f"l0_{i}", f"item_{i}"], "division")
+
+    def timed() -> float:
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            g.recalculate_all()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    before = timed()
+    with g.profile() as profiler:
+        g.recalculate_all()
+    after = timed()
+
+    assert profiler.by_calculation().loc["DivisionCalculation", "nodes"] == 200
+    assert all(node.calculate_shim is None for node in g.nodes.values())
+    assert after < 2 * before + 0.05
@@ -0,0 +1,83 @@
+"""Tests for the single-pass, dependency-ordered Graph.recalculate_all()."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+import sys
+
+from fin_statement_model.core.calculations import AdditionCalculation
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import RecalcReport
+from fin_statement_model.core.nodes import CalculationNode
+
+
+def test_report_separates_root_failures_from_blocked_cells() -> None:
+    g = Graph(periods=["2023", "2024"])
+    g.add_financial_statement_item("rev", {"2023": 100.0, "2024": 0.0})
+    g.add_financial_statement_item("cost", {"2023": 40.0, "2024": 10.0})
+    g.add_calculation("ratio", ["cost", "rev"], "division")
+    g.add_calculation("double", ["ratio", "ratio"], "addition")
+    g.add_calculation("total", ["double", "rev"], "addition")
+
+    report = g.recalculate_all()
+
+    assert isinstance(report, RecalcReport)
+    assert report.periods == ("2023", "2024")
+    assert report.nodes_evaluated == 5
+    assert report.cells_computed == 7
+    assert not report.ok
+    assert [(f.node_name, f.root_cause) for f in report.failures] == [
+        ("ratio", None),
+        ("double", "ratio"),
+        ("total", "ratio"),
+    ]
+    assert {f.period for f in report.failures} == {"2024"}
+    assert report.root_failures == report.failures[:1]
+    assert report.failures[2].error_type == report.failures[0].error_type
+    assert g._cache["total"] == {"2023": 100.8}
+    assert "2024" not in g._cache["ratio"]
+
+
+def test_cycle_is_reported_without_evaluating_its_members() -> None:
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("a", {"2023": 1.0})
+    g.add_calculation("b", ["a", "a"], "addition")
+    g.add_calculation("c", ["b", "b"], "addition")
+    # Unvalidated insert closes a -> b -> a; c sits downstream of the loop
+    g.manipulator.add_node(CalculationNode("a", inputs=[g.get_node("b")], calculation=AdditionCalculation()))
+
+    report = g.recalculate_all("2023")
+
+    assert report.cells_computed == 0
+    root = report.root_failures
+    assert len(root) == 1
+    assert root[0].error_type == "CircularDependencyError"
+    by_node = {f.node_name: f for f in report.failures}
+    assert set(by_node) == {"a", "b", "c"}
+    assert by_node["c"].root_cause is not None
+
+
+def test_chain_longer_than_recursion_limit(chain_graph: Callable[..., Graph]) -> None:
+    n = 3 * sys.getrecursionlimit()
+    g = chain_graph(n, ["2023", "2024"], fan_in=True)
+
+    report = g.recalculate_all()
+
+    assert report.ok
+    assert report.cells_computed == 2 * (n + 1)
+    assert g._cache[f"calc_{n - 1}"] == {"2023": float(n + 1), "2024": float(n + 1)}
+    assert g.calculate(f"calc_{n - 1}", "2024") == float(n + 1)
+
+
+def test_recalc_wide_layered_graph(layered_graph: Callable[..., Graph]) -> None:
+    """One ordered pass computes every cell of a wide, layered graph exactly once."""
+    periods = [str(year) for year in range(2000, 2030)]
+    g = layered_graph(200, 10, periods)
+
+    report = g.recalculate_all()
+
+    assert report.ok
+    assert report.cells_computed == len(g.nodes) * len(periods)
+    # Ten layers of pairwise sums weight item k by C(10, k)
+    assert g.calculate("l9_0", "2010") == sum(math.comb(10, k) * k for k in range(11))
@@ -0,0 +1,128 @@
+"""Tests for evaluating adjustment scenarios as a batch axis (Graph.evaluate_scenarios)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import time
+
+import numpy as np
+import pytest
+
+from fin_statement_model.core.adjustments.models import AdjustmentType
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import ScenarioResults
+
+PERIODS = ["2023", "2024", "2025"]
+
+
+def build_graph() -> Graph:
+    g = Graph(periods=PERIODS)
+    g.add_financial_statement_item("rev", {"2023": 100.0, "2024": 110.0, "2025": 120.0})
+    g.add_financial_statement_item("cogs", {"2023": 60.0, "2024": 64.0, "2025": 70.0})
+    g.add_financial_statement_item("rent", {"2023": 5.0, "2024": 5.0, "2025": 5.0})
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("ebit", ["gp", "rent"], "formula", formula="gp - rent")
+    g.add_calculation("margin", ["ebit", "rev"], "division")
+    g.add_calculation("rent_x2", ["rent", "rent"], "addition")
+    return g
+
+
+def add_scenarios(g: Graph) -> None:
+    g.add_adjustment("rev", "2024", 20.0, reason="upside", scenario="bull")
+    g.add_adjustment(
+        "rev", "2024", 1.1, reason="price", adj_type=AdjustmentType.MULTIPLICATIVE, scenario="bull", priority=1
+    )
+    g.add_adjustment("cogs", "2025", 1.5, reason="inflation", adj_type=AdjustmentType.MULTIPLICATIVE, scenario="bear")
+    g.add_adjustment("rev", "2023", 0.0, reason="lost client", adj_type=AdjustmentType.REPLACEMENT, scenario="bear")
+
+
+def scenario_graph(scenario: str) -> Graph:
+    """Rebuild the graph with one scenario's adjustments written into the item values."""
+    source = build_graph()
+    add_scenarios(source)
+    g = build_graph()
+    for name in ("rev", "cogs", "rent"):
+        for period in PERIODS:
+            adjustments = source.get_adjustments(name, period, scenario=scenario)
+            if adjustments:
+                base = source.calculate(name, period)
+                value, _ = source._adjustment_service.apply_adjustments(base, adjustments)
+                g.set_value(name, period, value)
+    return g
+
+
+def test_each_scenario_matches_a_graph_with_adjusted_items() -> None:
+    g = build_graph()
+    add_scenarios(g)
+
+    results = g.evaluate_scenarios(baseline="base")
+
+    assert isinstance(results, ScenarioResults)
+    assert results.scenarios == ("base", "bear", "bull")
+    assert results.to_array().shape == (3, len(results.node_names), len(PERIODS))
+    expected = {"base": build_graph(), "bear": scenario_graph("bear"), "bull": scenario_graph("bull")}
+    for scenario, graph in expected.items():
+        frame = graph.calculate_frame(list(results.node_names))
+        np.testing.assert_allclose(results.to_frame().loc[scenario].loc[frame.index].to_numpy(), frame.to_numpy())
+    # 110 + 20, then x1.1 (priority order)
+    assert results["rev"].loc["bull", "2024"] == pytest.approx(143.0)
+    assert np.isnan(results["margin"].loc["bear", "2023"])
+
+
+def test_unaffected_nodes_are_computed_once() -> None:
+    g = build_graph()
+    add_scenarios(g)
+
+    results = g.evaluate_scenarios(["bull", "bear", "default"])
+
+    assert results.scenarios == ("bull", "bear", "default")
+    shared = results._values["rent_x2"]
+    assert shared.strides[0] == 0
+    assert results._values["gp"].strides[0] != 0
+    assert results["rent_x2"]["2023"].tolist() == [10.0, 10.0, 10.0]
+    # A scenario without adjustments is the unadjusted graph
+    np.testing.assert_array_equal(results["gp"].loc["default"].to_numpy(), [40.0, 46.0, 50.0])
+
+
+def test_non_input_adjustments_are_skipped(caplog: pytest.LogCaptureFixture) -> None:
+    g = build_graph()
+    g.add_adjustment("gp", "2023", 5.0, reason="top-down", scenario="mgmt")
+    g.add_adjustment("rev", "2030", 5.0, reason="out of range", scenario="mgmt")
+
+    with caplog.at_level(logging.WARNING):
+        results = g.evaluate_scenarios(node_names=["gp"])
+
+    assert results.node_names == ("gp",)
+    assert results["gp"].loc["mgmt"].tolist() == [40.0, 46.0, 50.0]
+    assert "Skipped 2 adjustments" in caplog.text
+    with pytest.raises(ValueError, match="also a scenario"):
+        g.evaluate_scenarios(baseline="mgmt")
+
+
+@pytest.mark.perf
+def test_scenario_batch_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """K scenarios in one batched pass vs. one full evaluation per scenario."""
+    periods = [str(year) for year in range(2000, 2030)]
+    width, n_scenarios = 200, 20
+    g = layered_graph(width, 10, periods, first_value=1.0)
+    for k in range(n_scenarios):
+        for j in range(0, width, 10):
+            g.add_adjustment(f"item_{j}", periods[k], 1.0 + k / 10, reason="shock", scenario=f"s{k:02d}")
+
+    program = g.compile()
+    manager = g._adjustment_service.manager
+
+    start = time.perf_counter()
+    looped = {}
+    for k in range(n_scenarios):
+        single = program.evaluate_scenarios(manager, [f"s{k:02d}"])
+        looped[f"s{k:02d}"] = single.to_array()[0]
+    per_scenario = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = program.evaluate_scenarios(manager)
+    batched = time.perf_counter() - start
+
+    np.testing.assert_allclose(results.to_array()[7], looped["s07"])
+    assert batched < per_scenario
@@ -0,0 +1,151 @@
+"""Tests for batched sensitivity / tornado analysis (Graph.sensitivity)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import math
+import time
+
+import numpy as np
+import pytest
+
+from fin_statement_model.core.errors import NodeError
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services.sensitivity import SENSITIVITY_COLUMNS
+from fin_statement_model.core.nodes import FixedGrowthForecastNode
+
+PERIODS = ["2022", "2023", "2024"]
+ITEMS = {
+    "rev": [100.0, 120.0, 150.0],
+    "cogs": [60.0, 0.0, 80.0],
+    "opex": [10.0, 12.0, 15.0],
+    "debt_service": [20.0, 25.0, 0.0],
+    "rent": [5.0, 5.0, 5.0],
+}
+
+
+@pytest.fixture()
+def build_graph(series_graph: Callable[..., Graph]) -> Callable[..., Graph]:
+    """Build the model from ``ITEMS``, with *values* replacing some of the series."""
+
+    def build(values: dict[str, list[float]] | None = None) -> Graph:
+        g = series_graph({**ITEMS, **(values or {})}, PERIODS)
+        g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+        g.add_calculation("ebitda", ["gp", "opex"], "formula", formula="gp - opex")
+        g.add_calculation("dscr", ["ebitda", "debt_service"], "division")
+        g.add_calculation("margin", ["gp", "rev"], "division")
+        g.add_calculation("rent_x2", ["rent", "rent"], "addition")
+        return g
+
+    return build
+
+
+def test_matches_graphs_built_from_bumped_values(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    bumps = [-0.1, 0.05, 0.2]
+
+    frame = g.sensitivity(["dscr", "margin", "rent_x2"], bumps=bumps)
+
+    assert tuple(frame.columns) == SENSITIVITY_COLUMNS
+    assert frame["input"].unique().tolist() == ["rev", "cogs", "opex", "debt_service", "rent"]
+    assert len(frame) == 5 * len(bumps) * 3 * len(PERIODS)
+    indexed = frame.set_index(["input", "bump", "output", "period"])
+    for name in ITEMS:
+        for bump in bumps:
+            expected = build_graph({name: [v * (1 + bump) for v in ITEMS[name]]}).calculate_frame()
+            for output in ("dscr", "margin", "rent_x2"):
+                for period in PERIODS:
+                    value = indexed.loc[(name, bump, output, period), "value"]
+                    reference = expected.loc[output, period]
+                    if math.isnan(reference):
+                        assert math.isnan(value), (name, bump, output, period)
+                    else:
+                        assert value == pytest.approx(reference, rel=1e-12), (name, bump, output, period)
+    # The graph itself is untouched
+    assert g.calculate("rev", "2022") == 100.0
+
+
+def test_deltas_inputs_and_absolute_bumps(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+
+    frame = g.sensitivity(["margin"], bumps=[10.0], relative=False)
+
+    # Only inputs that feed the output are bumped by default
+    assert set(frame["input"]) == {"rev", "cogs"}
+    row = frame[(frame["input"] == "cogs") & (frame["period"] == "2022")].iloc[0]
+    assert row["base"] == pytest.approx(0.4)
+    assert row["value"] == pytest.approx(0.3)
+    assert row["delta"] == pytest.approx(-0.1)
+    assert row["pct_change"] == pytest.approx(-0.25)
+
+    unaffected = g.sensitivity(["rent_x2", "gp"], ["rent", "opex"], bumps=[0.5])
+    deltas = unaffected.groupby(["input", "output"])["delta"].sum()
+    assert deltas[("rent", "rent_x2")] == pytest.approx(3 * 5.0)
+    assert deltas[("opex", "rent_x2")] == 0.0
+    assert deltas[("rent", "gp")] == 0.0
+
+
+def test_only_downstream_instructions_are_rerun(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    program = g.compile()
+    needed = program._instructions_for(["dscr", "rent_x2"])
+
+    assert [ins[0] for ins in needed] == ["gp", "ebitda", "dscr", "rent_x2"]
+    affected = program._instructions_reading(program._inputs["opex"], needed)
+    assert [ins[0] for ins in affected] == ["ebitda", "dscr"]
+
+
+def test_forecast_history_is_bumped_through_the_projection(build_graph: Callable[..., Graph]) -> None:
+    g = build_graph()
+    units = g.add_financial_statement_item("units", {"2022": 10.0})
+    g.add_node(FixedGrowthForecastNode(units, "2022", ["2023", "2024"], 0.1))
+
+    frame = g.sensitivity(["units"], bumps=[0.5])
+
+    assert frame["value"].tolist() == pytest.approx([15.0, 16.5, 18.15])
+
+
+def test_invalid_sensitivity_requests(build_graph: Callable[..., Graph]) -> None:
+    program = build_graph().compile()
+
+    with pytest.raises(NodeError):
+        program.sensitivity(["dscr"], ["gp"])
+    with pytest.raises(NodeError):
+        program.sensitivity(["missing"])
+    with pytest.raises(ValueError, match="at least one output"):
+        program.sensitivity([])
+    with pytest.raises(ValueError, match="flat sequence"):
+        program.sensitivity(["dscr"], bumps=[[0.1]])  # type: ignore[list-item]
+
+
+@pytest.mark.perf
+def test_sensitivity_benchmark(layered_graph: Callable[..., Graph]) -> None:
+    """40 inputs x 5 bumps on a 2k-node graph vs. a full recalculation."""
+    periods = [str(year) for year in range(2000, 2030)]
+    width = 200
+    g = layered_graph(width, 10, periods, first_value=1.0, operations=("addition", "division"))
+    outputs = [f"l9_{j}" for j in range(20)]
+    inputs = [f"item_{j}" for j in range(0, width, 5)]
+    bumps = [-0.2, -0.1, 0.05, 0.1, 0.2]
+
+    start = time.perf_counter()
+    g.clear_all_caches()
+    g.recalculate_all()
+    recalc = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = g.sensitivity(outputs, inputs, bumps)
+    batched = time.perf_counter() - start
+
+    # The old workflow for a single bump: set_value on every period, then recompute the outputs
+    original = g.get_node(inputs[0]).values.copy()  # type: ignore[attr-defined]
+    for period in periods:
+        g.set_value(inputs[0], period, original[period] * 1.1)
+    expected = {name: g.calculate(name, periods[-1]) for name in outputs}
+    for period in periods:
+        g.set_value(inputs[0], period, original[period])
+
+    assert len(frame) == len(inputs) * len(bumps) * len(outputs) * len(periods)
+    rows = frame[(frame["input"] == inputs[0]) & (frame["bump"] == 0.1) & (frame["period"] == periods[-1])]
+    np.testing.assert_allclose(rows["value"].to_numpy(), [expected[name] for name in rows["output"]])
+    assert batched < 3 * recalc
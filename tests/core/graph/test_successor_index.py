@@ -0,0 +1,89 @@
+"""Tests for GraphTraverser successor queries backed by the maintained dependency index."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.nodes import CalculationNode, FinancialStatementItemNode
+from fin_statement_model.io.graph.definition_io import GraphDefinitionReader, GraphDefinitionWriter
+
+
+@pytest.fixture()
+def model(series_graph: Callable[..., Graph]) -> Graph:
+    g = series_graph({"rev": [100.0], "cogs": [60.0]}, ["2023"])
+    g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+    g.add_calculation("margin", ["gp", "rev"], "division")
+    return g
+
+
+def scan_successors(g: Graph, name: str) -> set[str]:
+    """Reference implementation: scan every node's inputs."""
+    return {other for other, node in g.nodes.items() if any(inp.name == name for inp in getattr(node, "inputs", []))}
+
+
+def test_successor_queries_match_full_scan(model: Graph) -> None:
+    g = model
+    for name in g.nodes:
+        assert set(g.traverser.get_direct_successors(name)) == scan_successors(g, name), name
+    assert g.traverser.breadth_first_search("cogs") == [["cogs"], ["gp"], ["margin"]]
+    assert g.traverser._is_reachable("cogs", "margin")
+    assert not g.traverser._is_reachable("margin", "cogs")
+    assert g.traverser.find_cycle_path("cogs", "margin") == ["cogs", "gp", "margin"]
+
+
+def test_index_consistent_after_remove_and_replace(model: Graph) -> None:
+    g = model
+
+    g.remove_node("margin")
+    assert g.traverser.get_direct_successors("gp") == []
+    assert g.traverser.get_direct_successors("rev") == ["gp"]
+
+    new_rev = FinancialStatementItemNode("rev", {"2023": 200.0})
+    g.replace_node("rev", new_rev)
+    assert g.traverser.get_direct_successors("rev") == ["gp"]
+    # Dependents are re-pointed at the replacement instance
+    assert g.get_node("gp").inputs[0] is new_rev
+    assert g.calculate("gp", "2023") == 140.0
+
+
+def test_cycle_path_found_through_index(model: Graph) -> None:
+    g = model
+    gp = g.get_node("gp")
+    # Unvalidated insert closes the loop rev -> gp -> rev
+    g.manipulator.add_node(CalculationNode("rev", inputs=[gp], calculation=gp.calculation))
+
+    assert g.traverser.get_direct_successors("gp") == ["margin", "rev"]
+    assert g.traverser.find_cycle_path("rev", "rev") == ["rev", "gp", "rev"]
+    assert g.traverser.find_cycle_path("margin", "rev") is None
+
+
+def test_definition_round_trip_uses_indexed_stub_graph(model: Graph) -> None:
+    g = model
+    data = GraphDefinitionWriter().write(g)
+    restored = GraphDefinitionReader().read(data)
+    assert restored.traverser.topological_sort().index("gp") < restored.traverser.topological_sort().index("margin")
+    assert restored.calculate("margin", "2023") == pytest.approx(0.4)
+
+
+@pytest.mark.perf
+def test_large_chained_graph_round_trips_and_checks_cycles() -> None:
+    """A 20k-node chained graph builds, round-trips and answers a reachability query."""
+    n = 10_000
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("root", {"2023": 1.0})
+    previous = "root"
+    for i in range(n):
+        g.add_financial_statement_item(f"item_{i}", {"2023": 1.0})
+        g.add_calculation(f"calc_{i}", [previous, f"item_{i}"], "addition")
+        previous = f"calc_{i}"
+
+    restored = GraphDefinitionReader().read(GraphDefinitionWriter().write(g))
+    looping = CalculationNode("root", inputs=[g.get_node(previous)], calculation=g.get_node(previous).calculation)
+
+    assert g.traverser.would_create_cycle(looping)
+    assert len(restored.nodes) == 2 * n + 1
+    assert restored.recalculate_all().ok
+    assert restored.calculate(previous, "2023") == n + 1
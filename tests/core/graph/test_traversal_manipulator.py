@@ -5,8 +5,9 @@ from __future__ import annotations
 import math
 import pytest
 
+from fin_statement_model.core.errors import CircularDependencyError
 from fin_statement_model.core.graph import Graph
-from fin_statement_model.core.nodes import FinancialStatementItemNode
+from fin_statement_model.core.nodes import CalculationNode, FinancialStatementItemNode
 
 
 @pytest.fixture()
@@ -69,14 +70,14 @@ def test_manipulator_replace_and_set_value(sample_graph: Graph) -> None:
     # C should now recalc with new value
     sample_graph.clear_all_caches()
     val = sample_graph.calculate("C", "2022")
-    # replace_node did not update calculation inputs, so still uses old B=5
-    assert math.isclose(val, 15.0)
+    # replace_node re-points C at the new B=7
+    assert math.isclose(val, 17.0)
 
     # set_value should invalidate caches implicitly via manipulator
     man.set_value("A", "2022", 11.0)
     val2 = sample_graph.calculate("C", "2022")
-    # set_value changes A to 11; B remains 5 => C = 11 + 5 = 16
-    assert math.isclose(val2, 16.0)
+    # set_value changes A to 11; B is 7 => C = 11 + 7 = 18
+    assert math.isclose(val2, 18.0)
 
 
 # ---------------------------------------------------------------------------
@@ -100,13 +101,18 @@ def test_cycle_detection() -> None:
         formula="input_0",
         formula_variable_names=["input_0"],
     )
-    g.add_calculation(
-        name="Y",
-        input_names=["X_calc"],
-        operation_type="formula",
-        formula="input_0",
-        formula_variable_names=["input_0"],
-    )
+    # Validated insertion refuses to close the loop ...
+    with pytest.raises(CircularDependencyError):
+        g.add_calculation(
+            name="Y",
+            input_names=["X_calc"],
+            operation_type="formula",
+            formula="input_0",
+            formula_variable_names=["input_0"],
+        )
+    # ... while an unvalidated insert still can, and is then reported
+    x_calc = g.get_node("X_calc")
+    g.add_node(CalculationNode("Y", inputs=[x_calc], calculation=x_calc.calculation))
 
     cycles = g.detect_cycles()
     assert cycles  # at least one cycle detected
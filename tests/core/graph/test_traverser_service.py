@@ -1,8 +1,10 @@
 """Tests for GraphTraverser traversal and validation helpers."""
 
+from fin_statement_model.core.calculations import AdditionCalculation
+from fin_statement_model.core.errors import CircularDependencyError
 from fin_statement_model.core.graph import Graph
 from fin_statement_model.core.graph.traverser import GraphTraverser
-from fin_statement_model.core.nodes import FinancialStatementItemNode
+from fin_statement_model.core.nodes import CalculationNode, FinancialStatementItemNode
 import pytest
 
 
@@ -52,8 +54,12 @@ def test_detect_and_find_cycle():
     g.add_node(x)
     g.add_node(y)
     g.add_calculation("X_calc", ["Y"], "addition")
-    # rename Y calculation to match node name collision
-    g.add_calculation("Y", ["X_calc"], "addition")
+    # Validated insertion rejects the loop Y -> X_calc -> Y
+    with pytest.raises(CircularDependencyError) as excinfo:
+        g.add_calculation("Y", ["X_calc"], "addition")
+    assert excinfo.value.cycle == ["Y", "X_calc", "Y"]
+    # rename Y calculation to match node name collision (unvalidated insert keeps the cycle)
+    g.add_node(CalculationNode("Y", inputs=[g.get_node("X_calc")], calculation=AdditionCalculation()))
     trav = GraphTraverser(g)
     cycles = trav.detect_cycles()
     assert any(isinstance(cycle, list) for cycle in cycles)
@@ -78,7 +84,10 @@ def test_would_create_cycle():
     g.add_calculation("AB", ["A", "B"], "addition")
     trav = g.traverser
     # adding dependency B->AB would create cycle
-    fake_node = FinancialStatementItemNode("Fake", {"2022": 0.0})
+    class FakeNode(FinancialStatementItemNode):
+        """Subclass without __slots__, so it accepts an ad-hoc ``inputs`` attribute."""
+
+    fake_node = FakeNode("Fake", {"2022": 0.0})
     fake_node.inputs = [g.get_node("AB")]
     # No cycle expected for this new_node configuration
     assert trav.would_create_cycle(fake_node) is False
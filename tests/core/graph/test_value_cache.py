@@ -0,0 +1,106 @@
+"""Tests for the graph's single, bounded value cache and Graph.cache_stats()."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import CachedValues, ValueCache
+from fin_statement_model.core.nodes import FinancialStatementItemNode
+
+
+@pytest.fixture()
+def build_model(series_graph: Callable[..., Graph]) -> Callable[..., Graph]:
+    def build(**graph_kwargs: object) -> Graph:
+        g = series_graph({"rev": [100.0, 120.0], "cogs": [60.0, 70.0]}, ["2023", "2024"], **graph_kwargs)
+        g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+        g.add_calculation("gp_x2", ["gp", "gp"], "addition")
+        return g
+
+    return build
+
+
+def test_engine_and_node_caches_are_one_store(build_model: Callable[..., Graph]) -> None:
+    g = build_model()
+    gp = g.get_node("gp")
+    assert isinstance(gp._values, CachedValues)
+
+    assert g.calculate("gp_x2", "2023") == 80.0
+    # The node computed gp while evaluating gp_x2; the engine sees that value
+    assert g._calc_engine.cache["gp"] == {"2023": 40.0}
+    assert g.cache_stats().entries == 2
+
+    g.change_calculation_method("gp", "addition")
+    assert g.calculate("gp_x2", "2023") == 320.0
+
+    g.replace_node("rev", FinancialStatementItemNode("rev", {"2023": 10.0, "2024": 12.0}))
+    assert g.calculate("gp_x2", "2023") == 140.0
+
+
+def test_removed_node_gets_private_cache_back(build_model: Callable[..., Graph]) -> None:
+    g = build_model()
+    g.calculate("gp_x2", "2024")
+    node = g.get_node("gp_x2")
+
+    g.remove_node("gp_x2")
+
+    assert type(node._values) is dict
+    assert node._values == {"2024": 100.0}
+    assert "gp_x2" not in g._calc_engine.cache
+    assert not g._cache.is_bound("gp_x2")
+
+
+def test_lru_bound_and_stats(build_model: Callable[..., Graph]) -> None:
+    g = build_model(cache_max_entries=3)
+    for period in g.periods:
+        g.calculate("gp_x2", period)
+
+    stats = g.cache_stats()
+    assert stats.entries == 3
+    assert stats.evictions == 1
+    assert stats.max_entries == 3
+    # gp/2023 was the least recently used entry
+    assert "2023" not in g._calc_engine.cache["gp"]
+
+    assert g.calculate("gp_x2", "2024") == 100.0
+    assert g.cache_stats().hits == stats.hits + 1
+    assert 0.0 < g.cache_stats().hit_rate < 1.0
+
+    assert g.set_cache_limit(1) == 2
+    assert g.cache_stats().entries == 1
+    assert g.calculate("gp_x2", "2023") == 80.0
+    assert g.set_cache_limit(None) == 0
+
+    with pytest.raises(ValueError, match="positive integer"):
+        g.set_cache_limit(0)
+
+
+def test_slot_is_a_read_only_view_of_one_node() -> None:
+    cache = ValueCache()
+    cache.put("gp", "2023", 40.0)
+    cache.put("gp", "2024", 45.0)
+    slot = cache.slot("gp")
+
+    assert slot == {"2023": 40.0, "2024": 45.0}
+    with pytest.raises(TypeError):
+        slot["2023"] = 1.0  # type: ignore[index]
+    assert cache.invalidate("gp", ["2023", "2030"]) == 1
+    assert dict(slot) == {"2024": 45.0}
+    assert cache.slot("missing") == {}
+
+
+@pytest.mark.perf
+def test_bound_caps_entries_across_many_graphs(layered_graph: Callable[..., Graph]) -> None:
+    """Many long-lived graphs in one process: a bound caps the total cached values."""
+    periods = [str(year) for year in range(2000, 2030)]
+
+    def cached_entries(bound: int | None) -> int:
+        graphs = [layered_graph(100, 1, periods, cache_max_entries=bound) for _ in range(20)]
+        for g in graphs:
+            g.recalculate_all()
+        return sum(g.cache_stats().entries for g in graphs)
+
+    assert cached_entries(500) == 20 * 500
+    assert cached_entries(None) == 20 * 200 * len(periods)
@@ -0,0 +1,193 @@
+"""Tests for the opt-in columnar value store backing item nodes."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import gc
+import math
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.graph.services import ColumnarValues, ColumnarValueStore
+from fin_statement_model.core.nodes import FinancialStatementItemNode
+
+
+@pytest.fixture()
+def build_model(series_graph: Callable[..., Graph]) -> Callable[..., Graph]:
+    def build(*, columnar: bool) -> Graph:
+        g = series_graph(
+            {"rev": [100.0, 120.0, 150.0], "cogs": {"2022": 60.0, "2023": 70.0}},
+            ["2022", "2023", "2024"],
+            columnar_values=columnar,
+        )
+        g.add_calculation("gp", ["rev", "cogs"], "subtraction")
+        g.add_calculation("margin", ["gp", "rev"], "formula", formula="gp / rev")
+        return g
+
+    return build
+
+
+def test_view_behaves_like_a_dict() -> None:
+    store = ColumnarValueStore()
+    view = store.attach("rev", {"2023": 1.0, "2022": 0.0})
+    view["2024"] = 2.5
+
+    assert isinstance(view, ColumnarValues)
+    assert view == {"2023": 1.0, "2022": 0.0, "2024": 2.5}
+    assert list(view) == ["2023", "2022", "2024"]
+    assert "2022" in view and "2030" not in view
+    assert view.get("2030") is None and view.get("2030", 0.0) == 0.0
+    assert view.copy() == dict(view) and isinstance(view.copy(), dict)
+    del view["2023"]
+    assert len(view) == 2
+    with pytest.raises(KeyError):
+        view["2023"]
+    with pytest.raises(KeyError):
+        del view["2023"]
+    # A stored NaN is a value, not "missing"
+    view["2025"] = float("nan")
+    assert "2025" in view and math.isnan(view["2025"])
+
+
+def test_rows_and_columns_grow_and_rows_are_reused() -> None:
+    store = ColumnarValueStore()
+    for i in range(20):
+        store.attach(f"n{i}", {str(2000 + j): float(i * j) for j in range(12)})
+    assert len(store) == 20
+    assert store.view("n7")["2011"] == 77.0
+
+    assert store.release("n3") == {str(2000 + j): float(3 * j) for j in range(12)}
+    assert "n3" not in store
+    fresh = store.attach("new", {})
+    assert len(fresh) == 0  # the recycled row starts empty
+    assert len(store) == 20
+
+
+def test_bulk_frame_round_trip() -> None:
+    store = ColumnarValueStore(["2023", "2024"])
+    store.attach("a", {"2023": 1.0})
+    store.attach("b", {"2024": 2.0})
+
+    frame = store.to_frame()
+    assert frame.index.name == "node" and frame.columns.name == "period"
+    assert math.isnan(frame.loc["a", "2024"]) and frame.loc["b", "2024"] == 2.0
+
+    store.load_frame(pd.DataFrame({"2024": [5.0, np.nan], "2025": [6.0, 7.0]}, index=["a", "b"]))
+    assert store.view("a") == {"2023": 1.0, "2024": 5.0, "2025": 6.0}
+    assert store.view("b") == {"2025": 7.0}
+    with pytest.raises(KeyError):
+        store.load_frame(pd.DataFrame({"2024": [1.0]}, index=["missing"]))
+
+    values, valid = store.gather(["b", "a"], ["2025", "1999"])
+    assert values[:, 0].tolist() == [7.0, 6.0]
+    assert not valid[:, 1].any()
+
+
+def test_columnar_graph_matches_dict_graph(build_model: Callable[..., Graph]) -> None:
+    plain = build_model(columnar=False)
+    columnar = build_model(columnar=True)
+
+    assert isinstance(columnar.get_node("rev").values, ColumnarValues)
+    assert columnar.value_store is not None and plain.value_store is None
+    for name in plain.nodes:
+        for period in ["2022", "2023"]:
+            assert columnar.calculate(name, period) == plain.calculate(name, period)
+    pd.testing.assert_frame_equal(columnar.calculate_frame(), plain.calculate_frame())
+
+
+def test_mutations_go_through_the_store(build_model: Callable[..., Graph]) -> None:
+    g = build_model(columnar=True)
+    store = g.value_store
+    assert store is not None
+
+    g.set_value("cogs", "2024", 80.0)
+    assert g.calculate("gp", "2024") == 70.0
+    assert store.view("cogs")["2024"] == 80.0
+
+    g.update_financial_statement_item("rev", {"2024": 200.0}, replace_existing=True)
+    assert g.get_node("rev").values == {"2024": 200.0}
+    assert store.view("rev") == {"2024": 200.0}
+    assert g.calculate_series("rev").tolist()[2] == 200.0
+
+
+def test_remove_replace_and_clear_release_rows(build_model: Callable[..., Graph]) -> None:
+    g = build_model(columnar=True)
+    store = g.value_store
+    assert store is not None
+    rev = g.get_node("rev")
+
+    g.remove_node("rev")
+    assert "rev" not in store
+    # The detached node keeps its data as a plain dict
+    assert type(rev.values) is dict and rev.values["2024"] == 150.0
+
+    replacement = FinancialStatementItemNode("cogs", {"2022": 1.0})
+    g.replace_node("cogs", replacement)
+    assert isinstance(replacement.values, ColumnarValues)
+    assert store.view("cogs") == {"2022": 1.0}
+    assert len(store) == 1
+
+    g.clear()
+    assert type(replacement.values) is dict
+    assert g.value_store is not None and len(g.value_store) == 0
+
+
+def test_rename_moves_the_row_with_the_node(build_model: Callable[..., Graph]) -> None:
+    g = build_model(columnar=True)
+    store = g.value_store
+    assert store is not None
+    view = g.get_node("rev").values
+
+    g.rename_node("rev", "sales")
+    assert g.get_node("sales").values is view  # same row, nothing copied
+    assert "rev" not in store and store.view("sales") == {"2022": 100.0, "2023": 120.0, "2024": 150.0}
+
+    g.add_financial_statement_item("rev", {"2022": 1.0})
+    assert g.get_node("sales").values == {"2022": 100.0, "2023": 120.0, "2024": 150.0}
+    assert g.get_node("rev").values == {"2022": 1.0}
+    assert g.calculate("gp", "2022") == 40.0  # still reads the renamed node
+    with pytest.raises(KeyError, match="already attached"):
+        store.rename("sales", "rev")
+
+
+def test_enable_and_disable_on_existing_graph(build_model: Callable[..., Graph]) -> None:
+    g = build_model(columnar=False)
+    store = g.enable_columnar_values()
+    assert g.enable_columnar_values() is store
+    assert len(store) == 2
+    assert g.clone().value_store is not None
+
+    g.disable_columnar_values()
+    assert g.value_store is None
+    assert g.get_node("cogs").values == {"2022": 60.0, "2023": 70.0}
+    assert type(g.get_node("cogs").values) is dict
+
+
+@pytest.mark.perf
+def test_columnar_memory_benchmark() -> None:
+    """Compare the memory held by per-node dicts with the columnar matrix."""
+    n_items, n_periods = 2000, 120
+    periods = [f"P{i:03d}" for i in range(n_periods)]
+    matrix = np.random.default_rng(0).uniform(1, 100, (n_items, n_periods))
+
+    def build(columnar: bool) -> tuple[Graph, int]:
+        gc.collect()
+        tracemalloc.start()
+        g = Graph(periods=periods, columnar_values=columnar)
+        for i, row in enumerate(matrix):
+            # Fresh float objects per item, as a reader parsing a file would create
+            g.add_financial_statement_item(f"item_{i}", dict(zip(periods, row.tolist())))
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return g, size
+
+    plain, dict_bytes = build(False)
+    columnar, columnar_bytes = build(True)
+
+    assert columnar.calculate("item_17", "P042") == plain.calculate("item_17", "P042")
+    assert columnar_bytes * 3 < dict_bytes
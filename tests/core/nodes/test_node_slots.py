@@ -0,0 +1,138 @@
+"""Tests for slotted node classes, calculate shims and registry-backed metric metadata."""
+
+from __future__ import annotations
+
+import gc
+import statistics
+import tracemalloc
+
+import pytest
+
+from fin_statement_model.core.calculations import AdditionCalculation
+from fin_statement_model.core.graph import Graph
+from fin_statement_model.core.metrics import metric_registry
+from fin_statement_model.core.nodes import (
+    AverageHistoricalGrowthForecastNode,
+    AverageValueForecastNode,
+    CalculationNode,
+    CurveGrowthForecastNode,
+    CustomCalculationNode,
+    CustomGrowthForecastNode,
+    FinancialStatementItemNode,
+    FixedGrowthForecastNode,
+    FormulaCalculationNode,
+    MultiPeriodStatNode,
+    StatisticalGrowthForecastNode,
+    TwoPeriodAverageNode,
+    YoYGrowthNode,
+)
+
+
+def test_built_in_nodes_have_no_instance_dict() -> None:
+    item = FinancialStatementItemNode("revenue", {"2022": 100.0, "2023": 110.0})
+    nodes = [
+        item,
+        CalculationNode("total", [item, item], AdditionCalculation()),
+        FormulaCalculationNode("double", {"r": item}, "2 * r"),
+        CustomCalculationNode("custom", [item], lambda r: r),
+        YoYGrowthNode("growth", item, "2022", "2023"),
+        MultiPeriodStatNode("mean", item, ["2022", "2023"], statistics.mean),
+        TwoPeriodAverageNode("avg", item, "2022", "2023"),
+        FixedGrowthForecastNode(item, "2023", ["2024"], 0.1),
+        CurveGrowthForecastNode(item, "2023", ["2024"], [0.1]),
+        StatisticalGrowthForecastNode(item, "2023", ["2024"], lambda: 0.1),
+        CustomGrowthForecastNode(item, "2023", ["2024"], lambda *_: 0.1),
+        AverageValueForecastNode(item, "2023", ["2024"]),
+        AverageHistoricalGrowthForecastNode(item, "2023", ["2024"]),
+    ]
+
+    for node in nodes:
+        assert not hasattr(node, "__dict__"), type(node).__name__
+    with pytest.raises(AttributeError):
+        item.note = "ad-hoc"  # type: ignore[attr-defined]
+
+
+def test_calculate_shims_swap_the_class_and_restore_it() -> None:
+    item = FinancialStatementItemNode("revenue", {"2023": 10.0})
+
+    assert item.shim_calculate(lambda period: 99.0)
+    assert not item.shim_calculate(lambda period: 0.0)
+    assert item.calculate("2023") == 99.0
+    assert isinstance(item, FinancialStatementItemNode)
+    assert type(item).__name__ == "FinancialStatementItemNode"
+    assert item.node_class is FinancialStatementItemNode
+    assert item.node_class.calculate(item, "2023") == 10.0
+
+    assert item.unshim_calculate() is not None
+    assert type(item) is FinancialStatementItemNode and item.calculate_shim is None
+    assert item.unshim_calculate() is None
+
+
+def test_metric_description_is_referenced_from_the_registry() -> None:
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("current_assets", {"2023": 200.0})
+    g.add_financial_statement_item("current_liabilities", {"2023": 100.0})
+    g.add_metric("current_ratio")
+    node = g.get_node("current_ratio")
+    registered = metric_registry.get("current_ratio").description
+
+    assert node.metric_name == "current_ratio"
+    assert node.metric_description is registered
+    assert node._metric_description is None  # nothing copied onto the node
+    assert node.to_dict()["metric_description"] == registered
+    assert g.get_metric_info("current_ratio")["description"] == registered
+
+    # A description that differs from the registry (or has no registry entry) is kept
+    item = g.get_node("current_assets")
+    custom = CalculationNode("ratio", [item], AdditionCalculation(), "current_ratio", "House definition")
+    unregistered = FormulaCalculationNode("x", {"a": item}, "a", "house_metric", "Only here")
+    assert custom.metric_description == "House definition"
+    assert unregistered.metric_description == "Only here"
+    assert FormulaCalculationNode("y", {"a": item}, "a").metric_description is None
+
+
+def test_node_memory_benchmark() -> None:
+    """Slotted nodes use far fewer bytes per node than the same classes with an instance ``__dict__``."""
+    periods = [str(year) for year in range(2015, 2025)]
+    count = 20_000
+
+    class DictItemNode(FinancialStatementItemNode):
+        """Unslotted subclass: instances carry a ``__dict__`` like the old nodes."""
+
+    class DictCalculationNode(CalculationNode):
+        """Unslotted subclass that copies the metric metadata, as the old nodes did."""
+
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            super().__init__(*args)  # type: ignore[arg-type]
+            self.__dict__.update(kwargs)
+
+    description = metric_registry.get("current_ratio").description
+    values = dict.fromkeys(periods, 1.0)
+
+    def per_node(item_cls: type, calc_cls: type) -> float:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            nodes = []
+            for j in range(count // 2):
+                item = item_cls(f"item_{j}", values)
+                nodes.append(item)
+                nodes.append(
+                    calc_cls(
+                        f"calc_{j}",
+                        [item],
+                        AdditionCalculation(),
+                        metric_name="current_ratio",
+                        metric_description=description,
+                    )
+                )
+            size = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        assert len(nodes) == count
+        return size / count
+
+    slotted = per_node(FinancialStatementItemNode, CalculationNode)
+    with_dict = per_node(DictItemNode, DictCalculationNode)
+    assert slotted < 0.8 * with_dict
@@ -0,0 +1,114 @@
+"""Tests for compile-once formula evaluation in FormulaCalculation."""
+
+import time
+
+import numpy as np
+import pytest
+
+from fin_statement_model.core.calculations import FormulaCalculation
+from fin_statement_model.core.calculations.compiled_formula import CompiledFormula
+from fin_statement_model.core.errors import CalculationError, StrategyError
+
+
+class DummyNode:
+    def __init__(self, value: float):
+        self._value = value
+        self.calls = 0
+
+    def calculate(self, period: str) -> float:
+        self.calls += 1
+        return self._value
+
+
+def test_formula_is_compiled_once_and_reused() -> None:
+    calc = FormulaCalculation("(rev - cogs) / rev", ["rev", "cogs"])
+    compiled = calc._compiled
+    for period in ("2022", "2023", "2024"):
+        assert calc.calculate([DummyNode(200.0), DummyNode(50.0)], period) == pytest.approx(0.75)
+    assert calc._compiled is compiled
+
+
+@pytest.mark.parametrize(
+    ("formula", "expected"),
+    [
+        ("a + b * 2", 5.0),
+        ("-a ** 2", -1.0),
+        ("a // b + a % b", 1.0),
+        ("(a < b) + (a == 1)", 2.0),
+        ("a and b", 2.0),
+    ],
+)
+def test_supported_operators(formula: str, expected: float) -> None:
+    calc = FormulaCalculation(formula, ["a", "b"])
+    assert calc.calculate([DummyNode(1.0), DummyNode(2.0)], "2023") == expected
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "abs(a)",
+        "__import__('os').system('echo hi')",
+        "a.real",
+        "[a, b]",
+        "a if b else 0",
+        "lambda: a",
+        "'text'",
+        "unknown + a",
+        "a +",
+        "2 ** 100000",
+    ],
+)
+def test_rejected_formulas_raise_calculation_error_on_evaluation(formula: str) -> None:
+    # Construction never raises - the problem is surfaced per evaluation as before
+    calc = FormulaCalculation(formula, ["a", "b"])
+    with pytest.raises(CalculationError):
+        calc.calculate([DummyNode(1.0), DummyNode(2.0)], "2023")
+
+
+def test_division_by_zero_is_calculation_error() -> None:
+    calc = FormulaCalculation("a / b", ["a", "b"])
+    with pytest.raises(CalculationError):
+        calc.calculate([DummyNode(1.0), DummyNode(0.0)], "2023")
+
+
+def test_input_count_mismatch_is_strategy_error() -> None:
+    calc = FormulaCalculation("a + b", ["a", "b"])
+    with pytest.raises(StrategyError):
+        calc.calculate([DummyNode(1.0)], "2023")
+
+
+def test_compiled_formula_accepts_arrays() -> None:
+    compiled = CompiledFormula("a * 2 - b", ["a", "b"])
+    result = compiled.evaluate([np.array([1.0, 2.0]), np.array([0.5, 0.5])])
+    assert result.tolist() == [1.5, 3.5]
+
+
+@pytest.mark.perf
+def test_compiled_formula_benchmark() -> None:
+    """Compare per-evaluation cost of the compiled path with the legacy asteval path."""
+    from asteval import Interpreter
+
+    formula = "(revenue - cogs - opex) / revenue"
+    names = ["revenue", "cogs", "opex"]
+    nodes = [DummyNode(1000.0), DummyNode(400.0), DummyNode(250.0)]
+    calc = FormulaCalculation(formula, names)
+    iterations = 2000
+
+    def legacy_once() -> float:
+        # What FormulaCalculation.calculate did before: a fresh interpreter per call
+        ae = Interpreter(symtable={}, minimal=True, no_print=True, use_numpy=False)
+        ae.symtable.update({n: node.calculate("2023") for n, node in zip(names, nodes)})
+        return float(ae(formula))
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        legacy_once()
+    legacy = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        calc.calculate(nodes, "2023")
+    compiled = (time.perf_counter() - start) / iterations
+
+    assert legacy_once() == calc.calculate(nodes, "2023")
+    assert compiled < legacy
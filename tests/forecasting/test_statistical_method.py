@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import numpy as np
 import pytest
 
 from fin_statement_model.forecasting.methods.statistical import (
@@ -49,3 +50,28 @@ def test_normalize_params_generates_callable(
     val = gen()
     # Ensure value within expected range
     assert 0.0 <= val <= 1.0
+
+
+def test_seeded_scalar_draws_keep_the_legacy_stream(method: StatisticalForecastMethod, monkeypatch) -> None:
+    from fin_statement_model.forecasting.methods import statistical as stat_module
+
+    monkeypatch.setattr(stat_module, "cfg", lambda path, *_, **__: 1234, raising=True)
+
+    cfg = {"distribution": "normal", "params": {"mean": 0.05, "std": 0.02}}
+    sampler = method.normalize_params(cfg, ["2024"])["growth_params"]
+
+    legacy = np.random.RandomState(1234)
+    assert [sampler() for _ in range(3)] == [float(legacy.normal(0.05, 0.02)) for _ in range(3)]
+
+
+def test_sampler_draws_arrays_for_simulation(method: StatisticalForecastMethod) -> None:
+    cfg = {"distribution": "normal", "params": {"mean": 0.05, "std": 0.02}}
+    sampler = method.normalize_params(cfg, ["2024"])["growth_params"]
+
+    draws = sampler.sample(np.random.default_rng(3), (20_000, 2))
+    assert draws.shape == (20_000, 2)
+    assert draws.mean() == pytest.approx(0.05, abs=1e-3)
+    assert draws.std() == pytest.approx(0.02, rel=0.05)
+    # Same generator seed, same draws
+    np.testing.assert_array_equal(draws, sampler.sample(np.random.default_rng(3), (20_000, 2)))
+    assert isinstance(sampler(), float)
@@ -54,4 +54,18 @@ def test_instantiate_with_periods_and_rename(tmp_registry_path):  # noqa: WPS442
 
     # Renamed node exists and computes correctly
     assert instantiated.calculate("GP", "2023") == 50.0
-    assert not instantiated.has_node("GrossProfit") 
\ No newline at end of file
+    assert not instantiated.has_node("GrossProfit") 
+
+def test_renamed_nodes_do_not_leak_cached_values_to_new_nodes(tmp_registry_path):  # noqa: WPS442
+    g = Graph(periods=["2023"])
+    g.add_financial_statement_item("rev", {"2023": 100.0})
+    g.add_calculation("gp", ["rev", "rev"], "addition")
+    template_id = TemplateRegistry.register_graph(g, name="rename.model")
+
+    instantiated = TemplateRegistry.instantiate(template_id, rename_map={"gp": "gross", "rev": "sales"})
+    assert instantiated.calculate("gross", "2023") == 200.0
+    instantiated.add_financial_statement_item("rev", {"2023": 7.0})
+    instantiated.add_calculation("gp", ["rev", "rev"], "addition")
+
+    assert instantiated.calculate("gp", "2023") == 14.0
+    assert instantiated.calculate("gross", "2023") == 200.0